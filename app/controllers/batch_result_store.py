@@ -0,0 +1,112 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+
+@dataclass
+class BatchResultRow:
+    """
+    일괄 검증 결과 표의 한 행 (문서 1개)
+
+    Attributes:
+        index: 처리 순번 (1부터 시작)
+        file_name: 파일명
+        status: 검증 상태 ("OK", "DEFICIENT", "ERROR")
+        deficient_count: 미흡 항목 수
+        message: 요약 메시지
+        output_path: 저장된 결과 PDF 경로 (없으면 None)
+        processing_time: 문서 검증에 걸린 시간 (초)
+        template_name: 검증에 사용한 템플릿 (자동 인식 시 문서마다 다를 수 있음)
+    """
+    index: int
+    file_name: str
+    status: str
+    deficient_count: int = 0
+    message: str = ""
+    output_path: Optional[str] = None
+    processing_time: Optional[float] = None
+    template_name: str = ""
+
+
+class BatchResultStore:
+    """
+    일괄 검증 결과를 메모리에 보관하고, 상태 필터/정렬이 적용된 '보기'를 제공하는 저장소.
+    결과 표(View)는 화면에 보이는 구간만 get_rows()로 가져가므로 행 수와 무관하게 가볍습니다.
+    """
+    SORT_KEYS = {
+        "index": lambda row: row.index,
+        "file_name": lambda row: row.file_name.lower(),
+        "status": lambda row: row.status,
+        "deficient_count": lambda row: row.deficient_count,
+        "processing_time": lambda row: row.processing_time or 0.0,
+    }
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._rows: List[BatchResultRow] = []
+        self._status_counts: Dict[str, int] = {}
+        self._status_filter: Optional[str] = None
+        self._sort_column: Optional[str] = None
+        self._sort_descending = False
+        self._view: Optional[List[int]] = []
+
+    def add(self, row: BatchResultRow) -> None:
+        """결과 행을 추가합니다. 정렬이 없으면 보기 목록에 바로 이어 붙여 재계산을 피합니다."""
+        self._rows.append(row)
+        self._status_counts[row.status] = self._status_counts.get(row.status, 0) + 1
+
+        if self._view is not None and self._sort_column is None:
+            if self._matches(row):
+                self._view.append(len(self._rows) - 1)
+        else:
+            self._view = None
+
+    def set_filter(self, status: Optional[str]) -> None:
+        """상태 필터 설정 (None이면 전체)"""
+        if status != self._status_filter:
+            self._status_filter = status
+            self._view = None
+
+    def toggle_sort(self, column: str) -> None:
+        """같은 열을 다시 누르면 오름차순/내림차순을 전환합니다."""
+        if column not in self.SORT_KEYS:
+            return
+        if self._sort_column == column:
+            self._sort_descending = not self._sort_descending
+        else:
+            self._sort_column = column
+            self._sort_descending = False
+        self._view = None
+
+    @property
+    def sort_state(self):
+        return self._sort_column, self._sort_descending
+
+    @property
+    def total_count(self) -> int:
+        return len(self._rows)
+
+    def status_counts(self) -> Dict[str, int]:
+        return dict(self._status_counts)
+
+    def visible_count(self) -> int:
+        """필터가 적용된 행 개수"""
+        return len(self._get_view())
+
+    def get_rows(self, start: int, count: int) -> List[BatchResultRow]:
+        """필터/정렬이 적용된 보기에서 [start, start + count) 구간의 행을 반환합니다."""
+        view = self._get_view()
+        return [self._rows[i] for i in view[max(0, start):start + count]]
+
+    def _matches(self, row: BatchResultRow) -> bool:
+        return self._status_filter is None or row.status == self._status_filter
+
+    def _get_view(self) -> List[int]:
+        if self._view is None:
+            view = [i for i, row in enumerate(self._rows) if self._matches(row)]
+            if self._sort_column:
+                key = self.SORT_KEYS[self._sort_column]
+                view.sort(key=lambda i: key(self._rows[i]), reverse=self._sort_descending)
+            self._view = view
+        return self._view
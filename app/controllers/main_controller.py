@@ -1,36 +1,40 @@
+import threading
 import tkinter as tk
 
-# Infrastructure Layer - 외부 기술 및 데이터 구현체
-from infrastructure.repositories.json_template_repository import JsonTemplateRepository
-from infrastructure.services.vision_service import VisionService
-from infrastructure.repositories.file_document_repository import FileDocumentRepository
-from infrastructure.services.validation_vision_service import ValidationVisionService
+from shared.constants import STARTUP_PREWARM_DELAY_MS, STARTUP_PREWARM_MODULES
+from shared.profiling import ProfilingOptions
 
-# Domain Layer - 핵심 비즈니스 로직 및 규칙
-from domain.services.template_service import TemplateService
-from domain.services.validation_service import ValidationService
-
-# Application Layer - 이 파일 자신
-from app.controllers.template_controller import TemplateController
-from app.controllers.validation_controller import ValidationController
-
-# Presentation Layer - 사용자 인터페이스
-from app.gui.template_editor_window import TemplateEditorWindow
-from app.gui.validation_window import ValidationWindow
+# 이 모듈은 메뉴 창을 띄우기 전에 import되므로 무거운 의존성(OpenCV, PyMuPDF, Tesseract,
+# scikit-image, PIL)을 끌어오는 계층별 모듈은 각 도구 창을 여는 메서드 안에서 import합니다.
+# 메뉴 창이 표시된 뒤에는 start_prewarm()이 같은 모듈들을 백그라운드에서 미리 import해 둡니다.
+# (tests/performance/test_import_budget.py가 시작 import 그래프를 검사)
 
 class MainController:
     """
     애플리케이션의 최상위 컨트롤러.
     메인 윈도우의 이벤트를 받아 각 기능 모듈을 초기화하고 실행하는 역할을 담당.
     """
-    def __init__(self, root):
+    def __init__(self, root, profiling=None, tracing=False):
         self.root = root
+        self.profiling = profiling or ProfilingOptions() # '디버그' 메뉴 또는 --profile로 켜짐
+        self.set_tracing(tracing) # '디버그' 메뉴 또는 --trace로 켜짐
+        self._configure_metrics()
+        self._local_validation_service = None  # 검증 창을 다시 열어도 같은 서비스(캐시 포함)를 재사용
+        self._preview_cache = None  # 검증 창들이 함께 쓰는 디스크 미리보기 캐시 (처음 열 때 생성)
+        self._worker_pool = self._start_worker_pool()
 
     def open_template_editor(self):
         """
         '템플릿 생성 및 편집' 기능을 위한 새로운 창을 열고,
         해당 기능에 필요한 모든 객체를 생성하여 주입(Dependency Injection)합니다.
         """
+        # Infrastructure / Domain / Application / Presentation 계층 객체 (처음 열 때 import)
+        from infrastructure.repositories.json_template_repository import JsonTemplateRepository
+        from infrastructure.services.vision_service import VisionService
+        from domain.services.template_service import TemplateService
+        from app.controllers.template_controller import TemplateController
+        from app.gui.template_editor_window import TemplateEditorWindow
+
         # 1. 새 Toplevel 창 생성
         editor_window = tk.Toplevel(self.root)
         editor_window.transient(self.root)
@@ -63,6 +67,15 @@ class MainController:
         '검증 도구 실행' 기능을 위한 새로운 창을 열고,
         해당 기능에 필요한 모든 객체를 생성하여 주입합니다.
         """
+        # Infrastructure / Domain / Application / Presentation 계층 객체 (처음 열 때 import)
+        from infrastructure.config.settings import settings
+        from infrastructure.repositories.file_document_repository import FileDocumentRepository
+        from infrastructure.repositories.json_template_repository import JsonTemplateRepository
+        from infrastructure.services.template_fingerprint_index import TemplateFingerprintIndex
+        from domain.services.template_service import TemplateService
+        from app.controllers.validation_controller import ValidationController
+        from app.gui.validation_window import ValidationWindow
+
         # 1. 새 Toplevel 창 생성
         validator_window = tk.Toplevel(self.root)
         validator_window.transient(self.root)
@@ -71,18 +84,26 @@ class MainController:
         # --- 의존성 주입 (Validation Tool에 필요한 객체들 조립) ---
         # 2. Infrastructure Layer 객체 생성
         doc_repo = FileDocumentRepository()
-        validation_vision_service = ValidationVisionService()
         template_repo = JsonTemplateRepository()
+        template_index = TemplateFingerprintIndex(template_repo) # 자동 인식용 (실제 계산은 첫 사용 시)
 
         # 3. Domain Layer 객체 생성
         template_service = TemplateService(template_repo, vision_service=None)
-        validation_service = ValidationService(doc_repo, validation_vision_service)
+        validation_service = self._select_validation_service()
+        batch_scheduler = self._create_batch_scheduler(doc_repo)
 
         # 4. Application & Presentation Layer 객체 생성
         controller = ValidationController(
             view=None,
             validation_service=validation_service,
-            template_service=template_service
+            template_service=template_service,
+            batch_scheduler=batch_scheduler,
+            profiling=self.profiling,
+            template_index=template_index,
+            review_mode=settings.storage.review_output_mode,
+            report_formats=settings.storage.batch_report_formats,
+            report_rois=settings.storage.batch_report_include_rois,
+            preview_cache=self._get_preview_cache()
         )
         view = ValidationWindow(validator_window, controller)
 
@@ -92,3 +113,130 @@ class MainController:
         # 6. View가 완전히 준비된 후, Controller의 View 관련 초기화 로직 실행
         controller.initialize_view()
 
+    def start_prewarm(self):
+        """
+        메뉴 창이 표시된 뒤 도구 창에 필요한 무거운 모듈을 백그라운드 스레드에서 미리 import합니다.
+        사용자가 그 전에 버튼을 누르면 해당 import가 끝날 때까지만 기다리게 됩니다.
+        """
+        from infrastructure.config.settings import settings
+
+        if not settings.ui.prewarm_on_startup:
+            return
+        self.root.after(STARTUP_PREWARM_DELAY_MS, lambda: threading.Thread(
+            target=_prewarm_modules, args=(STARTUP_PREWARM_MODULES,), name="import-prewarm", daemon=True
+        ).start())
+
+    def set_profiling(self, enabled, trace_memory=None):
+        """'디버그' 메뉴에서 검증 프로파일링을 켜고 끕니다. 이미 열린 검증 창에도 바로 반영됩니다."""
+        self.profiling.enabled = enabled
+        if trace_memory is not None:
+            self.profiling.trace_memory = trace_memory
+
+    @property
+    def tracing(self):
+        from shared.tracing import tracer
+        return tracer.enabled
+
+    def set_tracing(self, enabled):
+        """'디버그' 메뉴에서 구간 추적을 켜고 끕니다. 검증 작업이 끝날 때마다 traces/에 저장됩니다."""
+        from shared.tracing import tracer
+        tracer.enabled = enabled
+        tracer.process_name = "pdf-validator"
+
+    def _configure_metrics(self):
+        """설정에 따라 메트릭 기록을 켜거나 끕니다 (꺼져 있으면 기록 호출은 플래그 확인만 하고 반환)."""
+        from infrastructure.config.settings import settings
+        from shared.metrics import registry
+
+        registry.enabled = settings.validation.enable_metrics
+
+    def _get_preview_cache(self):
+        """
+        검증 뷰어의 디스크 미리보기 타일 캐시. 설정에서 끄거나 캐시 폴더를 만들 수 없으면 None (메모리 캐시만 사용).
+        """
+        from infrastructure.config.settings import settings
+
+        if not settings.ui.preview_cache_enabled:
+            return None
+        if self._preview_cache is None:
+            from infrastructure.services.preview_tile_cache import PreviewTileCache
+            try:
+                self._preview_cache = PreviewTileCache(max_bytes=settings.ui.preview_cache_max_mb * 1024 * 1024)
+            except OSError:
+                return None
+        return self._preview_cache
+
+    def _select_validation_service(self):
+        """상주 작업자 풀 → 로컬 검증 서버 → 로컬 ValidationService 순으로 검증 백엔드를 고릅니다."""
+        from infrastructure.repositories.file_document_repository import FileDocumentRepository
+        from infrastructure.services.validation_vision_service import ValidationVisionService
+        from infrastructure.services.warm_worker_pool import PooledValidationService
+        from domain.services.validation_service import ValidationService
+
+        if self._local_validation_service is None:
+            self._local_validation_service = ValidationService(FileDocumentRepository(), ValidationVisionService())
+        local_service = self._local_validation_service
+
+        if self._worker_pool is not None:
+            return PooledValidationService(local_service, self._worker_pool)
+        return self._connect_validation_server(local_service)
+
+    def _start_worker_pool(self):
+        """
+        설정에서 상주 작업자 풀이 켜져 있으면 앱 시작 시 바로 띄웁니다.
+        작업자 예열(모듈 import, 템플릿 읽기)은 별도 프로세스에서 진행되므로 UI를 막지 않습니다.
+        """
+        from infrastructure.config.settings import settings
+        from infrastructure.services.warm_worker_pool import get_shared_pool
+
+        if not settings.validation.use_worker_pool:
+            return None
+        return get_shared_pool(
+            size=settings.validation.worker_pool_size,
+            max_jobs_per_worker=settings.validation.worker_max_jobs,
+            templates_file=settings.storage.templates_file,
+            tesseract_cmd=settings.tesseract.executable_path,
+            tessdata_path=settings.tesseract.tessdata_path,
+            languages=settings.tesseract.languages,
+            metrics_enabled=settings.validation.enable_metrics
+        )
+
+    def _connect_validation_server(self, local_service):
+        """
+        설정에서 로컬 검증 서버 사용이 켜져 있고 서버가 응답하면 원격 클라이언트를,
+        그렇지 않으면 로컬 ValidationService를 그대로 반환합니다.
+        """
+        from infrastructure.config.settings import settings
+        from infrastructure.services.remote_validation_service import RemoteValidationService
+
+        if not settings.validation.use_validation_server:
+            return local_service
+
+        remote = RemoteValidationService(
+            local_service,
+            host=settings.validation.server_host,
+            port=settings.validation.server_port
+        )
+        return remote if remote.is_available() else local_service
+
+    def _create_batch_scheduler(self, doc_repo):
+        """설정의 메모리 예산/동시 처리 수로 일괄 검증 스케줄러를 만듭니다."""
+        from infrastructure.config.settings import settings
+        from domain.services.batch_scheduler import BatchScheduler
+
+        return BatchScheduler(
+            doc_repo,
+            memory_budget_mb=settings.validation.batch_memory_budget_mb,
+            max_concurrent=settings.validation.max_concurrent_validations
+        )
+
+
+def _prewarm_modules(module_names):
+    """모듈을 차례로 import합니다. 실패(선택 의존성 없음 등)는 실제로 창을 열 때 드러나도록 무시합니다."""
+    import importlib
+
+    for module_name in module_names:
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            pass
@@ -1,7 +1,12 @@
 import fitz
 from PIL import Image
+import math
 import os
 
+from infrastructure.services.page_render_cache import PageRenderCache
+from shared.constants import EDITOR_ZOOM_BUCKET, VIEWER_RESIZE_DEBOUNCE_MS, ROI_CLICK_TOLERANCE_PX
+from shared.spatial_index import GridIndex
+
 class TemplateController:
     """
     TemplateEditorWindow(View)와 TemplateService(Domain)를 연결하는 컨트롤러.
@@ -17,6 +22,17 @@ class TemplateController:
         self.current_page_num = 0
         self.current_template_rois = {}
 
+        # 페이지별 ROI/앵커 사각형 공간 색인 (PDF 좌표): 클릭 선택과 겹침 검사에 사용
+        # 키는 (ROI 이름, "roi" | "anchor")
+        self._roi_index = {}
+
+        # 페이지 렌더링 캐시: (문서, 페이지, 배율 구간) 단위로 재사용
+        # 배율을 구간으로 내림하므로 크기 재조정 없이 정확히 일치하는 항목만 사용합니다.
+        self.render_cache = PageRenderCache(resize_tolerance=0, name="editor")
+        self._doc_generation = 0
+        self._displayed_key = None
+        self._resize_after_id = None
+
     def initialize_view(self):
         """
         View가 완전히 생성되고 준비된 후 MainController에 의해 호출됩니다.
@@ -29,40 +45,115 @@ class TemplateController:
     def _render_current_page(self):
         """현재 페이지를 이미지로 변환하고 화면 업데이트를 View에 요청합니다."""
         if not self.pdf_doc:
+            self._displayed_key = None
             self.view.update_page_display(None, 0, 0, {})
             return
 
-        page = self.pdf_doc[self.current_page_num]
-
         # 1. 현재 캔버스 크기에 맞는 변환 매트릭스 계산
         mat = self._get_display_matrix()
+        self._displayed_key = (self._doc_generation, self.current_page_num, mat.a)
 
-        # 2. PyMuPDF를 사용하여 페이지를 PIL 이미지로 렌더링
-        pix = page.get_pixmap(matrix=mat, alpha=False)
-        page_image = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-
-        # 3. 현재 페이지에 속한 ROI들의 PDF 좌표를 화면(스크린) 좌표로 변환
-        rois_on_page = {}
-        for name, roi_data in self.current_template_rois.items():
-            if roi_data.get('page') == self.current_page_num:
-                pdf_coords = roi_data['coords']
-                screen_coords = self._pdf_to_screen_coords(pdf_coords, mat)
-
-                anchor_screen_coords = None
-                if 'anchor_coords' in roi_data:
-                    anchor_pdf_coords = roi_data['anchor_coords']
-                    anchor_screen_coords = self._pdf_to_screen_coords(anchor_pdf_coords, mat)
-
-                rois_on_page[name] = {**roi_data, 'screen_coords': screen_coords, 'anchor_screen_coords': anchor_screen_coords}
+        # 2. 캐시에 없을 때만 PyMuPDF로 페이지를 PIL 이미지로 렌더링
+        page_image = self.render_cache.get_or_render(
+            self._doc_generation, self.current_page_num, (mat.a, mat.d),
+            lambda: self._rasterize_page(self.current_page_num, mat)
+        )
 
-        # 4. 최종적으로 가공된 데이터를 View에 전달하여 화면 업데이트 요청
+        # 3. 최종적으로 가공된 데이터를 View에 전달하여 화면 업데이트 요청
         self.view.update_page_display(
             page_image,
             self.current_page_num,
             len(self.pdf_doc),
-            rois_on_page
+            self._get_rois_on_page(mat)
         )
 
+    def _refresh_roi_overlays(self):
+        """페이지 이미지는 그대로 두고 ROI 오버레이(캔버스 도형)만 다시 그립니다."""
+        if not self.pdf_doc:
+            return
+        self.view.update_roi_overlays(self._get_rois_on_page(self._get_display_matrix()))
+
+    def _rasterize_page(self, page_num, mat):
+        pix = self.pdf_doc[page_num].get_pixmap(matrix=mat, alpha=False)
+        return Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+
+    def _get_rois_on_page(self, mat):
+        """
+        현재 페이지에 속한 ROI들의 PDF 좌표를 화면(스크린) 좌표로 변환합니다.
+        전체 ROI를 훑지 않고 페이지 색인에 있는 ROI만 처리하며, 다른 ROI와 겹치면 'overlaps'에 이름을 담습니다.
+        """
+        index = self._roi_index.get(self.current_page_num)
+        if index is None:
+            return {}
+
+        rois_on_page = {}
+        for name, kind in index.keys():
+            if kind != "roi":
+                continue
+            roi_data = self.current_template_rois[name]
+            screen_coords = self._pdf_to_screen_coords(roi_data['coords'], mat)
+
+            anchor_screen_coords = None
+            if 'anchor_coords' in roi_data:
+                anchor_screen_coords = self._pdf_to_screen_coords(roi_data['anchor_coords'], mat)
+
+            overlaps = sorted(other for other, other_kind in index.overlapping((name, "roi")) if other_kind == "roi")
+            rois_on_page[name] = {
+                **roi_data, 'screen_coords': screen_coords,
+                'anchor_screen_coords': anchor_screen_coords, 'overlaps': overlaps
+            }
+        return rois_on_page
+
+    # --- ROI 공간 색인 ---
+    def _rebuild_roi_index(self):
+        """템플릿 ROI 전체로 페이지별 색인을 다시 만듭니다 (PDF 열기/템플릿 불러오기 시)."""
+        self._roi_index = {}
+        for name, roi_data in self.current_template_rois.items():
+            self._index_roi(name, roi_data)
+
+    def _index_roi(self, name, roi_data):
+        index = self._roi_index.setdefault(roi_data.get('page', 0), GridIndex())
+        index.insert((name, "roi"), roi_data['coords'])
+        if roi_data.get('anchor_coords'):
+            index.insert((name, "anchor"), roi_data['anchor_coords'])
+
+    def _unindex_roi(self, name, roi_data):
+        index = self._roi_index.get(roi_data.get('page', 0))
+        if index is None:
+            return
+        index.remove((name, "roi"))
+        index.remove((name, "anchor"))
+        if not len(index):
+            del self._roi_index[roi_data.get('page', 0)]
+
+    def find_roi_at(self, x, y):
+        """
+        화면 좌표의 ROI 이름을 찾습니다. 여러 ROI(또는 앵커)가 겹쳐 있으면 가장 작은 것을,
+        해당 위치에 없으면 ROI_CLICK_TOLERANCE_PX 안에서 가장 가까운 것을 반환합니다.
+        """
+        index = self._roi_index.get(self.current_page_num)
+        if not self.pdf_doc or index is None:
+            return None
+        mat = self._get_display_matrix()
+        point = fitz.Point(x, y) * ~mat
+        hits = index.query_point(point.x, point.y)
+        if hits:
+            return hits[0][0]
+        nearest = index.nearest(point.x, point.y, max_distance=ROI_CLICK_TOLERANCE_PX / mat.a)
+        return nearest[0][0] if nearest else None
+
+    def select_roi_at(self, x, y):
+        """캔버스 클릭 위치의 ROI를 목록과 캔버스에서 선택합니다."""
+        name = self.find_roi_at(x, y)
+        self.view.select_roi(name)
+        return name
+
+    def _reset_document_cache(self):
+        """열린 PDF가 바뀌면 이전 문서의 렌더링 캐시를 버립니다."""
+        self._doc_generation += 1
+        self._displayed_key = None
+        self.render_cache.clear()
+
     # --- 좌표 변환 유틸리티 메서드 ---
     def _get_display_matrix(self):
         if not self.pdf_doc or self.view.canvas.winfo_width() < 10:
@@ -72,6 +163,8 @@ class TemplateController:
             self.view.canvas.winfo_width() / page.rect.width,
             self.view.canvas.winfo_height() / page.rect.height
         )
+        # 배율을 구간 단위로 내림: 작은 창 크기 변화에는 같은 렌더링 결과(캐시)를 재사용
+        zoom = max(EDITOR_ZOOM_BUCKET, round(math.floor(zoom / EDITOR_ZOOM_BUCKET) * EDITOR_ZOOM_BUCKET, 4))
         return fitz.Matrix(zoom, zoom)
 
     def _screen_to_pdf_coords(self, x1, y1, x2, y2, mat):
@@ -86,7 +179,20 @@ class TemplateController:
 
     # --- View로부터 전달받는 이벤트 핸들러 ---
     def on_window_resize(self):
-        if self.pdf_doc:
+        """창 크기 변경 이벤트. 연속된 이벤트는 마지막 한 번만 처리합니다."""
+        if not self.pdf_doc:
+            return
+        if self._resize_after_id is not None:
+            self.view.root.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.view.root.after(VIEWER_RESIZE_DEBOUNCE_MS, self._on_resize_settled)
+
+    def _on_resize_settled(self):
+        self._resize_after_id = None
+        if not self.pdf_doc:
+            return
+        # 배율 구간이 그대로면 페이지도 ROI 화면 좌표도 바뀌지 않으므로 다시 그릴 필요가 없음
+        mat = self._get_display_matrix()
+        if self._displayed_key != (self._doc_generation, self.current_page_num, mat.a):
             self._render_current_page()
 
     def open_pdf_file(self):
@@ -102,6 +208,8 @@ class TemplateController:
             self.current_pdf_path = path
             self.current_page_num = 0
             self.current_template_rois = {}
+            self._rebuild_roi_index()
+            self._reset_document_cache()
             self._render_current_page()
         except Exception as e:
             self.view.show_error("Error", f"Failed to open PDF:\n{e}")
@@ -143,7 +251,8 @@ class TemplateController:
             )
 
             self.current_template_rois[name] = new_roi_data
-            self._render_current_page()
+            self._index_roi(name, new_roi_data)
+            self._refresh_roi_overlays()
         except Exception as e:
             self.view.show_error("Anchor Error", str(e))
 
@@ -153,8 +262,8 @@ class TemplateController:
             return
 
         if self.view.ask_yes_no("Confirm Delete", f"Delete ROI '{roi_name}'?"):
-            del self.current_template_rois[roi_name]
-            self._render_current_page()
+            self._unindex_roi(roi_name, self.current_template_rois.pop(roi_name))
+            self._refresh_roi_overlays()
 
     def save_template(self):
         if not self.current_template_rois or not self.current_pdf_path:
@@ -195,7 +304,9 @@ class TemplateController:
             self.current_pdf_path = pdf_path
             self.current_template_rois = template_data['rois']
             self.current_page_num = 0
+            self._rebuild_roi_index()
 
+            self._reset_document_cache()
             self._render_current_page()
 
         except Exception as e:
@@ -1,27 +1,84 @@
 from tkinter import filedialog
 import os
 import datetime
+import threading
+import time
+from collections import Counter
+
+from app.controllers.validation_job import ValidationJob
+from app.controllers.batch_result_store import BatchResultRow, BatchResultStore
+from domain.entities.document import Document
+from domain.entities.validation_result import ValidationResult
+from domain.services.batch_scheduler import BatchOutcome, DocumentAdmission
+from infrastructure.services.page_render_cache import PageRenderCache, PagePrefetcher
+from infrastructure.services.preview_tile_cache import file_content_key, content_key
+from shared.constants import (
+    JOB_POLL_INTERVAL_MS, JOB_MAX_EVENTS_PER_TICK, VIEWER_RESIZE_DEBOUNCE_MS, METRICS_OUTPUT_DIR, DEFAULT_OUTPUT_DIR,
+    TRACE_OUTPUT_DIR, REVIEW_OUTPUT_FULL, REVIEW_OUTPUT_BUNDLE, REVIEW_OUTPUT_MODES,
+    REVIEW_BUNDLE_PATTERN, BATCH_REPORT_FORMATS, BATCH_REPORT_INCLUDE_ROIS, BATCH_REPORT_PATTERN, PREVIEW_PREWARM_PAGES
+)
+from shared.exceptions import ValidationCancelledError, TemplateNotIdentifiedError
+from shared.metrics import registry
+from shared.profiling import profile_document
+from shared.tracing import tracer, document_label
+
+_BATCH_DOCUMENTS = registry.counter("batch_documents_total", "일괄 검증에서 처리한 문서 수", labels=("status",))
+_BATCH_THROUGHPUT = registry.gauge("batch_documents_per_second", "마지막 일괄 검증의 초당 처리 문서 수")
 
 class ValidationController:
     """
     ValidationWindow(View)와 ValidationService(Domain)를 연결하는 컨트롤러.
     사용자 입력을 받아 서비스에 처리를 요청하고, 그 결과를 뷰에 전달합니다.
     """
-    def __init__(self, view, validation_service, template_service):
+    def __init__(self, view, validation_service, template_service, batch_scheduler=None, profiling=None,
+                 template_index=None, review_mode=REVIEW_OUTPUT_FULL, report_formats=BATCH_REPORT_FORMATS,
+                 report_rois=BATCH_REPORT_INCLUDE_ROIS, preview_cache=None):
         self.view = view
         self.validation_service = validation_service
         self.template_service = template_service
+        self.batch_scheduler = batch_scheduler # '폴더' 모드의 메모리 기반 동시 처리 (없으면 순차 처리)
+        self.profiling = profiling # ProfilingOptions (None이거나 꺼져 있으면 프로파일링하지 않음)
+        self.template_index = template_index # TemplateFingerprintIndex (없으면 자동 인식 불가)
 
         # UI/비즈니스 로직 상태를 관리하는 변수
         self.mode = "파일"  # 기본 모드는 '파일'
         self.selected_template = None
         self.target_path = None
+        self.auto_identify = False # 문서마다 템플릿 자동 인식
+        self.split_batches = False # '폴더' 모드 + 자동 인식에서 여러 양식이 이어 붙은 PDF를 양식별로 나눠 검증
+        self.review_mode = review_mode if review_mode in REVIEW_OUTPUT_MODES else REVIEW_OUTPUT_FULL # 미흡 문서 결과 PDF 저장 방식
+        self.report_formats = tuple(report_formats) # '폴더' 모드 보고서 형식 (비어 있으면 만들지 않음)
+        self.report_rois = report_rois # 보고서에 ROI별 행도 기록
+
+        # 자동 인식 시 문서별로 불러온 템플릿 (작업 스레드들이 공유)
+        self._template_cache = {}
+        self._template_cache_lock = threading.Lock()
 
         # '파일' 모드에서 사용될 PDF 뷰어 관련 상태 변수
         self.original_doc = None
         self.annotated_doc = None
         self.current_page_num = 0
 
+        # 뷰어 렌더링 캐시 (LRU) 및 인접 페이지 프리페치
+        # 문서가 바뀔 때마다 세대(generation)를 올려 이전 문서의 캐시 키와 섞이지 않게 합니다.
+        # preview_cache(PreviewTileCache)가 있으면 디스크 타일을 2단계로 써서 같은 문서를 다시 열 때 재렌더링을 생략합니다.
+        self.preview_cache = preview_cache
+        self.render_cache = PageRenderCache(disk_cache=preview_cache)
+        self.prefetcher = PagePrefetcher(self.render_cache)
+        self._viewer_generation = 0
+        self._viewer_keys = {} # 뷰어 문서별 내용 키 ("original"/"annotated" -> 디스크 타일 키)
+        self._resize_after_id = None
+        self._render_after_id = None
+
+        # 백그라운드 검증 작업 (ValidationJob)
+        # 창이 닫힌 뒤에는 예약된 폴링/렌더링이 파괴된 위젯에 접근하지 않도록 after id를 보관했다가 취소합니다.
+        self.job = None
+        self._poll_after_id = None
+        self._closed = False
+
+        # '폴더' 모드 결과 표의 데이터 저장소 (View의 결과 표가 참조)
+        self.result_store = BatchResultStore()
+
         # __init__에서는 View의 위젯에 직접 접근하는 코드를 실행하지 않습니다.
         # View가 완전히 생성된 후에 initialize_view()가 호출됩니다.
 
@@ -50,6 +107,20 @@ class ValidationController:
         except Exception as e:
             self.view.log(f"'{name}' 템플릿 로드 실패: {e}")
 
+    def set_auto_identify(self, enabled):
+        """'자동 인식' 체크 시 템플릿 선택 없이 문서마다 가장 가까운 템플릿으로 검증합니다."""
+        self.auto_identify = bool(enabled) and self.template_index is not None
+        self._update_ui_state()
+
+    def set_split_batches(self, enabled):
+        """'다중 양식 분할' 체크 시 폴더의 PDF마다 양식 경계를 찾아 구간별로 검증합니다 (자동 인식 필요)."""
+        self.split_batches = bool(enabled)
+
+    def set_review_mode(self, mode):
+        """'폴더' 모드에서 미흡 문서의 결과 PDF 저장 방식 (문서 전체 / 미흡 페이지만 / 한 파일로 묶기)을 정합니다."""
+        if mode in REVIEW_OUTPUT_MODES:
+            self.review_mode = mode
+
     def switch_mode(self, mode):
         """'파일'/'폴더' 검증 모드를 전환합니다."""
         self.mode = mode
@@ -72,115 +143,632 @@ class ValidationController:
 
     def _update_ui_state(self):
         """현재 상태(템플릿, 대상 경로)에 따라 UI(버튼 등)를 업데이트합니다."""
-        is_ready = self.selected_template and self.target_path
+        has_template = self.selected_template or self.auto_identify
+        is_ready = has_template and self.target_path and not (self.job and self.job.is_running)
         self.view.update_button_state(is_ready)
 
     def run_validation(self):
-        """'검사 실행' 버튼 클릭 시 호출되며, 모드에 따라 적절한 검증을 시작합니다."""
+        """
+        '검사 실행' 버튼 클릭 시 호출되며, 모드에 따라 적절한 검증을 백그라운드 작업으로 시작합니다.
+        검증은 작업 스레드에서 실행되고, 진행 상황은 이벤트 큐를 통해 메인 스레드로 전달됩니다.
+        """
+        if self.job and self.job.is_running:
+            return
+
+        template_name = self.view.template_var.get()
+        template = self.selected_template
         self.view.clear_log()
-        self.view.log(f"'{self.view.template_var.get()}' 템플릿으로 검증을 시작합니다.")
+        self.result_store.clear()
+        self.view.refresh_results()
+        if self.auto_identify:
+            # template이 None이면 작업 스레드에서 문서마다 템플릿을 인식합니다.
+            template, template_name = None, ""
+            self.view.log("문서마다 템플릿을 자동 인식하여 검증을 시작합니다.")
+        else:
+            self.view.log(f"'{template_name}' 템플릿으로 검증을 시작합니다.")
 
+        # 작업 스레드는 Tk 위젯/변수에 접근하면 안 되므로 필요한 값을 미리 복사해서 넘깁니다.
         if self.mode == "파일":
-            self._run_single_file_validation()
+            viewer_size = (self.view.left_canvas.winfo_width(), self.view.left_canvas.winfo_height())
+            self.job = ValidationJob(self._single_file_job, template, self.target_path, template_name, viewer_size)
         else:
-            self._run_folder_validation()
-
-    def _run_single_file_validation(self):
-        """단일 파일 검증을 수행합니다."""
-        try:
-            # 1. Service에 문서 검증을 요청하고 결과를 받습니다.
-            results = self.validation_service.validate_document(
-                self.selected_template,
-                self.target_path,
-                progress_callback=self._progress_callback
+            split_batches = self.auto_identify and self.split_batches
+            if split_batches:
+                self.view.log("PDF마다 양식 경계를 찾아 여러 양식이 이어 붙은 묶음을 나눠 검증합니다.")
+            self.job = ValidationJob(
+                self._folder_job, template, self.target_path, template_name, split_batches, self.review_mode
             )
-            self.view.log("="*50 + "\n상세 검증 결과:")
-            self._log_results(results)
 
-            # 2. Service를 통해 결과 PDF(주석 추가)를 메모리에 생성합니다.
-            annotated_pdf_bytes = self.validation_service.create_annotated_pdf(self.target_path, results)
+        self.view.set_job_running(True)
+        self.job.start()
+        self._schedule_poll()
 
-            # 3. Service를 통해 뷰어에 표시할 문서들을 로드합니다.
-            self.original_doc, self.annotated_doc = self.validation_service.load_docs_for_viewer(
-                self.selected_template['original_pdf_path'], annotated_pdf_bytes
-            )
-            self.current_page_num = 0
-            self.render_docs() # 뷰어 렌더링 시작
+    def toggle_pause(self):
+        """'일시정지/재개' 버튼 클릭 시 호출됩니다."""
+        if not self.job or not self.job.is_running:
+            return
+        if self.job.is_paused:
+            self.job.resume()
+        else:
+            self.job.pause()
+        self.view.set_paused(self.job.is_paused)
+
+    def cancel_validation(self):
+        """'취소' 버튼 클릭 시 호출됩니다. 현재 ROI(또는 파일) 처리가 끝나는 즉시 중단됩니다."""
+        if self.job and self.job.is_running:
+            self.job.cancel()
+            self.view.log("취소 요청됨. 현재 항목 처리 후 중단합니다...")
+
+    def on_close(self):
+        """검증 창이 닫힐 때 실행 중인 작업을 취소하고 예약된 폴링/렌더링 콜백을 모두 취소합니다."""
+        self._closed = True
+        if self.job and self.job.is_running:
+            self.job.cancel()
+        for attr in ("_poll_after_id", "_resize_after_id", "_render_after_id"):
+            after_id = getattr(self, attr)
+            if after_id is not None:
+                self.view.root.after_cancel(after_id)
+                setattr(self, attr, None)
+
+    def _schedule_poll(self):
+        self._poll_after_id = self.view.root.after(JOB_POLL_INTERVAL_MS, self._poll_job_events)
+
+    def _poll_job_events(self):
+        """작업 이벤트 큐를 비우고 View에 반영합니다. 작업이 끝날 때까지 root.after로 반복됩니다."""
+        self._poll_after_id = None
+        job = self.job
+        if job is None or self._closed:
+            return
 
-        except Exception as e:
-            self.view.log(f"🔥 검증 중 심각한 오류 발생: {e}")
+        finished = False
+        last_progress = None
+        results_changed = False
+        for kind, payload in job.drain(JOB_MAX_EVENTS_PER_TICK):
+            if kind == "log":
+                self.view.log(payload[0])
+            elif kind == "progress":
+                last_progress = payload  # 진행 바는 마지막 값만 반영
+            elif kind == "file_result":
+                self.result_store.add(payload[0])
+                results_changed = True
+            elif kind == "viewer":
+                self.original_doc, self.annotated_doc, self._viewer_keys = payload
+                self.current_page_num = 0
+                self._reset_render_cache()
+                self.render_docs() # 뷰어 렌더링 시작
+            elif kind == "cancelled":
+                self.view.log("⏹ 검증이 취소되었습니다.")
+                finished = True
+            elif kind == "error":
+                self.view.log(f"🔥 검증 중 심각한 오류 발생: {payload[0]}")
+                finished = True
+            elif kind == "done":
+                finished = True
+
+        if last_progress:
+            self.view.update_progress(*last_progress)
+        if results_changed:
+            self.view.refresh_results()
+
+        if finished or (not job.is_running and job.events.empty()):
+            self.view.set_job_running(False)
+            self._update_ui_state()
+            return
+        self._schedule_poll()
+
+    # --- 아래 메서드들은 작업 스레드에서 실행됩니다 (View 직접 접근 금지) ---
 
-    def _run_folder_validation(self):
-        """폴더 내 모든 PDF 파일에 대한 일괄 검증을 수행합니다."""
-        pdf_files = [f for f in os.listdir(self.target_path) if f.lower().endswith('.pdf')]
+    def _single_file_job(self, job, template, target_path, template_name="", viewer_size=None):
+        """단일 파일 검증을 수행합니다."""
+        try:
+            self._validate_single_file(job, template, target_path, template_name, viewer_size)
+        finally:
+            self._export_trace(job)
+
+    def _validate_single_file(self, job, template, target_path, template_name, viewer_size=None):
+        # 0. 자동 인식: 가장 가까운 템플릿을 찾습니다.
+        if template is None:
+            self._sync_template_index(job)
+            match, template = self._identify_template(target_path)
+            template_name = match.template_name
+            job.log(f"🔎 템플릿 자동 인식: {match.describe()}")
+
+        # 1. Service에 문서 검증을 요청하고 결과를 받습니다.
+        started = time.perf_counter()
+        label = f"{os.path.splitext(os.path.basename(target_path))[0]}_{datetime.datetime.now().strftime('%H%M%S')}"
+        with profile_document(self.profiling, label, DEFAULT_OUTPUT_DIR) as session:
+            results = self._service_for(session).validate_document(
+                template,
+                target_path,
+                progress_callback=lambda message, current, total: self._progress_callback(job, message, current, total),
+                checkpoint=job.checkpoint,
+                streaming=session is not None
+            )
+        self._log_profile(job, session)
+        document_result = ValidationResult.from_results(
+            Document(target_path), template_name, results, time.perf_counter() - started
+        )
+        job.log("="*50 + "\n상세 검증 결과:")
+        self._log_results(job, results)
+        job.log(self._format_timings(document_result.total_processing_time, document_result.get_stage_timings()))
+
+        # 2. Service를 통해 결과 PDF(주석 추가)를 메모리에 생성합니다.
+        annotated_pdf_bytes = self.validation_service.create_annotated_pdf(target_path, results)
+
+        # 3. Service를 통해 뷰어에 표시할 문서들을 로드합니다. (렌더링은 메인 스레드에서)
+        original_doc, annotated_doc = self.validation_service.load_docs_for_viewer(
+            template['original_pdf_path'], annotated_pdf_bytes
+        )
+        viewer_keys = {}
+        if self.preview_cache is not None:
+            # 결과 PDF는 만들 때마다 주석 시각이 달라지므로 원본 내용과 검증 결과로 키를 만듭니다.
+            viewer_keys = {
+                "original": file_content_key(template['original_pdf_path']),
+                "annotated": content_key("annotated", file_content_key(target_path), *(
+                    (r['field_name'], r['page'], r.get('coords'), r['status']) for r in results
+                )),
+            }
+            # 문서를 뷰어(메인 스레드)로 넘기기 전이라 이 스레드에서 렌더링해도 안전합니다.
+            self._prewarm_previews(job, ((original_doc, viewer_keys["original"]),
+                                         (annotated_doc, viewer_keys["annotated"])), viewer_size)
+        job.post("viewer", original_doc, annotated_doc, viewer_keys)
+
+    def _prewarm_previews(self, job, docs, viewer_size):
+        """뷰어가 처음 보여줄 앞쪽 페이지를 디스크 타일 캐시에 미리 채웁니다 (이미 있으면 건너뜀)."""
+        if viewer_size is None or min(viewer_size) < 10:
+            return
+        tile_size = self.preview_cache.tile_size(viewer_size)
+        for doc, key in docs:
+            for page_num in range(min(PREVIEW_PREWARM_PAGES, len(doc))):
+                job.checkpoint()
+                if self.preview_cache.get(key, page_num, tile_size) is None:
+                    image = self.validation_service.render_page_to_image(doc, page_num, tile_size)
+                    self.preview_cache.put(key, page_num, tile_size, image)
+
+    def _folder_job(self, job, template, target_dir, template_name, split_batches=False, review_mode=REVIEW_OUTPUT_FULL):
+        """
+        폴더 내 모든 PDF 파일에 대한 일괄 검증을 수행합니다.
+        template이 None이면 문서마다 템플릿을 자동 인식하고, 결과는 output/<템플릿 이름>에 나눠 저장합니다.
+        split_batches이면 (자동 인식 시) PDF마다 양식 경계를 찾아 구간 하나를 문서 하나처럼 검증합니다.
+        review_mode가 REVIEW_OUTPUT_BUNDLE이면 미흡 페이지를 모두 output/review_bundle_<시각>.pdf 하나에 모읍니다.
+        문서마다 결과 한 행을 같은 폴더의 report_<시각>.jsonl/.csv에 바로 덧붙입니다 (BatchReportWriter).
+        """
+        pdf_files = [f for f in os.listdir(target_dir) if f.lower().endswith('.pdf')]
         if not pdf_files:
-            self.view.log("폴더에 검증할 PDF 파일이 없습니다.")
+            job.log("폴더에 검증할 PDF 파일이 없습니다.")
             return
 
-        output_dir = os.path.join("output", self.view.template_var.get())
-        os.makedirs(output_dir, exist_ok=True)
-        self.view.log(f"결과는 '{os.path.abspath(output_dir)}' 폴더에 저장됩니다.")
+        auto_identify = template is None
+        if auto_identify:
+            self._sync_template_index(job)
+            job.log(f"결과는 '{os.path.abspath('output')}' 아래 인식된 템플릿별 폴더에 저장됩니다.")
+        else:
+            output_dir = os.path.join("output", template_name)
+            os.makedirs(output_dir, exist_ok=True)
+            job.log(f"결과는 '{os.path.abspath(output_dir)}' 폴더에 저장됩니다.")
+
+        batch_dir = "output" if auto_identify else output_dir # 일괄 검증 하나당 한 개씩 만드는 파일의 위치
+        timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+        bundle = None
+        if review_mode == REVIEW_OUTPUT_BUNDLE:
+            from infrastructure.services.review_bundle_writer import ReviewBundleWriter
+            bundle = ReviewBundleWriter(os.path.join(batch_dir, REVIEW_BUNDLE_PATTERN.format(timestamp=timestamp)))
+        report = None
+        if self.report_formats:
+            from infrastructure.services.batch_report_writer import BatchReportWriter
+            report = BatchReportWriter(batch_dir, BATCH_REPORT_PATTERN.format(timestamp=timestamp),
+                                       self.report_formats, include_rois=self.report_rois)
 
         success, fail = 0, 0
-        total = len(pdf_files)
-
-        for i, filename in enumerate(pdf_files):
-            filepath = os.path.join(self.target_path, filename)
-            self.view.update_progress(i + 1, total)
-            self.view.log(f"[{i+1}/{total}] '{filename}' 검증 중...")
+        scanned_docs = 0
+        stage_totals = {}
+        template_counts = Counter()
+        started = time.perf_counter()
+        # 검증 항목: (파일 경로, 표시 이름, 양식 구간, 페이지 구간). 분할하지 않으면 파일 하나가 항목 하나
+        entries = [(os.path.join(target_dir, filename), filename, None, None) for filename in pdf_files]
+        if auto_identify and split_batches:
+            entries = self._split_batch_files(job, entries)
+        total = len(entries)
+        filepaths = [entry[0] for entry in entries]
+        page_ranges = [entry[3] for entry in entries]
+
+        def process(admission):
+            _, filename, segment, _ = entries[admission.index]
+            mode = " (대용량: 페이지 단위 처리)" if admission.streaming else ""
+            job.log(f"[{admission.index + 1}/{total}] '{filename}' 검증 중...{mode}")
+            if not auto_identify:
+                return self._validate_folder_file(
+                    job, template, template_name, admission, filename, output_dir, review_mode, bundle
+                )
+
+            if segment is None:
+                match, doc_template = self._identify_template(admission.file_path)
+            else:
+                if segment.template_name is None:
+                    raise TemplateNotIdentifiedError(filename, segment.match.describe())
+                match, doc_template = segment.match, self._load_identified_template(segment.template_name)
+            doc_output_dir = os.path.join("output", match.template_name)
+            os.makedirs(doc_output_dir, exist_ok=True)
+            row, document_result = self._validate_folder_file(
+                job, doc_template, match.template_name, admission, filename, doc_output_dir, review_mode, bundle
+            )
+            row.message = f"[{match.template_name} {match.confidence:.0%}] {row.message}".rstrip()
+            return row, document_result
 
-            try:
-                # 각 파일에 대해 검증 수행
-                results = self.validation_service.validate_document(self.selected_template, filepath)
-                deficient_count = sum(1 for r in results if r['status'] != 'OK')
+        if self.batch_scheduler:
+            outcomes = self.batch_scheduler.run(filepaths, process, checkpoint=job.checkpoint, page_ranges=page_ranges)
+        else:
+            outcomes = self._run_sequential(filepaths, process, job.checkpoint, page_ranges)
 
-                if deficient_count > 0:
+        done = 0
+        try:
+            for outcome in outcomes:
+                done += 1
+                job.post("progress", done, total)
+                filepath, filename, _, page_range = entries[outcome.admission.index]
+                if isinstance(outcome.error, ValidationCancelledError):
+                    raise outcome.error
+                if outcome.error is not None:
                     fail += 1
-                    self.view.log(f"  -> ❌ 미흡 ({deficient_count}개 항목).")
-                    # 미흡한 경우에만 결과 PDF를 파일로 저장
-                    annotated_pdf_bytes = self.validation_service.create_annotated_pdf(filepath, results)
-                    out_name = f"review_{os.path.splitext(filename)[0]}_{datetime.datetime.now().strftime('%H%M%S')}.pdf"
-                    with open(os.path.join(output_dir, out_name), "wb") as f:
-                        f.write(annotated_pdf_bytes)
-                else:
+                    _BATCH_DOCUMENTS.inc(status="ERROR")
+                    if isinstance(outcome.error, TemplateNotIdentifiedError):
+                        template_counts["(미인식)"] += 1
+                    job.log(f"  -> 🔥 '{filename}' 오류 발생: {outcome.error}")
+                    row = BatchResultRow(outcome.admission.index + 1, filename, "ERROR", message=str(outcome.error))
+                    if report is not None:
+                        report.write_document(self._report_record(row, None, filepath, page_range))
+                    job.post("file_result", row)
+                    continue
+
+                row, document_result = outcome.result
+                _BATCH_DOCUMENTS.inc(status=row.status)
+                template_counts[row.template_name] += 1
+                scanned_docs += document_result.has_scanned_pages
+                for stage, seconds in document_result.get_stage_timings().items():
+                    stage_totals[stage] = stage_totals.get(stage, 0.0) + seconds
+                if row.status == "OK":
                     success += 1
-                    self.view.log("  -> ✅ 통과.")
-            except Exception as e:
-                fail += 1
-                self.view.log(f"  -> 🔥 오류 발생: {e}")
-
-        self.view.log("="*50 + f"\n일괄 검증 완료! (성공: {success}, 실패/오류: {fail})")
-
-    def _progress_callback(self, message, current, total):
-        """Service에서 진행 상황을 View에 전달하기 위한 콜백 함수입니다."""
-        self.view.log(message)
-        self.view.update_progress(current, total)
+                    job.log(f"  -> ✅ '{filename}' 통과. ({row.processing_time:.2f}초)")
+                else:
+                    fail += 1
+                    job.log(f"  -> ❌ '{filename}' 미흡 ({row.deficient_count}개 항목, {row.processing_time:.2f}초).")
+                if report is not None:
+                    report.write_document(self._report_record(row, document_result, filepath, page_range),
+                                          self._report_roi_rows(document_result) if self.report_rois else None)
+                job.post("file_result", row)
+        except ValidationCancelledError:
+            job.log(f"일괄 검증 중단 (성공: {success}, 실패/오류: {fail}, 미처리: {total - success - fail})")
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            if done and elapsed > 0:
+                _BATCH_THROUGHPUT.set(done / elapsed)
+            self._close_review_bundle(job, bundle)
+            self._close_report(job, report)
+            self._export_metrics(job)
+            self._export_trace(job)
+
+        job.log("="*50 + f"\n일괄 검증 완료! (성공: {success}, 실패/오류: {fail}, 스캔 문서: {scanned_docs})")
+        job.log(self._format_timings(elapsed, stage_totals))
+        if auto_identify:
+            job.log("템플릿별 문서 수: " + ", ".join(f"{name} {count}" for name, count in template_counts.most_common()))
+
+    def _validate_folder_file(self, job, template, template_name, admission, filename, output_dir,
+                              review_mode=REVIEW_OUTPUT_FULL, bundle=None):
+        """폴더 모드에서 파일 하나를 검증하고 (결과 행, 문서 검증 결과)를 반환합니다. 작업 스레드에서 실행됩니다."""
+        filepath = admission.file_path
+        page_range = admission.page_range
+        stem = os.path.splitext(os.path.basename(filepath))[0]
+        if page_range is not None:
+            # 묶음의 한 구간이면 결과 파일 이름에 원본 페이지 번호(1부터)를 붙임
+            stem += f"_p{page_range.start + 1:04d}-{page_range.stop:04d}"
+        started = time.perf_counter()
+        label = f"{admission.index + 1:04d}_{stem}"
+        with profile_document(self.profiling, label, output_dir, admission.index) as session:
+            results = self._service_for(session).validate_document(
+                template, filepath, checkpoint=job.checkpoint, streaming=admission.streaming or session is not None,
+                page_range=page_range
+            )
+        elapsed = time.perf_counter() - started
+        self._log_profile(job, session)
+        document_result = ValidationResult.from_results(Document(filepath), template_name, results, elapsed)
+        deficient_count = sum(1 for r in results if r['status'] != 'OK')
+
+        if deficient_count == 0:
+            row = BatchResultRow(admission.index + 1, filename, "OK", processing_time=elapsed, template_name=template_name)
+            return row, document_result
+
+        # 미흡한 경우에만 결과 PDF를 저장 (발췌/묶음 방식이면 미흡 ROI가 있는 페이지만)
+        annotated_pdf_bytes, bundle_page = None, None
+        if review_mode != REVIEW_OUTPUT_FULL:
+            annotated_pdf_bytes = self.validation_service.create_review_excerpt(filepath, results, page_range)
+        if annotated_pdf_bytes is not None and bundle is not None:
+            bundle_page = bundle.add(f"{filename} ({template_name}, 미흡 {deficient_count}개)",
+                                     annotated_pdf_bytes, self._failed_fields_by_page(results),
+                                     label_prefix=os.path.splitext(os.path.basename(filepath))[0])
+            out_path = bundle.path
+        else:
+            if annotated_pdf_bytes is None:  # 전체 사본 방식이거나 발췌할 페이지가 없음
+                annotated_pdf_bytes = self.validation_service.create_annotated_pdf(filepath, results, page_range)
+            out_name = f"review_{stem}_{datetime.datetime.now().strftime('%H%M%S')}.pdf"
+            out_path = os.path.join(output_dir, out_name)
+            with tracer.span("write", document=document_label(filepath), size=len(annotated_pdf_bytes)):
+                with open(out_path, "wb") as f:
+                    f.write(annotated_pdf_bytes)
+        failed_fields = ", ".join(r['field_name'] for r in results if r['status'] != 'OK')
+        if bundle_page is not None:
+            failed_fields += f" (묶음 {bundle_page}쪽)"
+        status = "ERROR" if all(r['status'] == 'ERROR' for r in results if r['status'] != 'OK') else "DEFICIENT"
+        row = BatchResultRow(admission.index + 1, filename, status, deficient_count, failed_fields, out_path, elapsed,
+                             template_name)
+        return row, document_result
+
+    @staticmethod
+    def _failed_fields_by_page(results):
+        """발췌 페이지 순서(페이지 번호 순)대로 각 페이지의 미흡 항목 이름 (묶음 목차용)"""
+        fields = {}
+        for result in results:
+            if result['status'] != 'OK':
+                fields.setdefault(result['page'], []).append(result['field_name'])
+        return [", ".join(fields[page]) for page in sorted(fields)]
 
-    def _log_results(self, results):
-        """검증 결과 리스트를 로그 창에 보기 좋게 출력합니다."""
+    @staticmethod
+    def _close_review_bundle(job, bundle):
+        if bundle is None:
+            return
+        pages = bundle.page_count
+        with tracer.span("write", document=document_label(bundle.path), pages=pages):
+            path = bundle.close()
+        if path:
+            job.log(f"검토용 묶음 PDF 저장: {os.path.abspath(path)} (문서 {bundle.documents}개, {pages}쪽)")
+
+    @staticmethod
+    def _report_record(row, document_result, filepath, page_range):
+        """보고서의 문서 한 행 (오류로 검증 결과가 없으면 결과 표의 행 정보만)"""
+        record = {
+            "index": row.index, "file_name": row.file_name, "template_name": row.template_name,
+            "status": row.status, "deficient_count": row.deficient_count, "processing_time": round(row.processing_time, 4) if row.processing_time is not None else None,
+            "message": row.message, "output_path": row.output_path, "file_path": filepath,
+            "first_page": page_range.start + 1 if page_range is not None else None,
+            "last_page": page_range.stop if page_range is not None else None,
+        }
+        if document_result is not None:
+            summary = document_result.get_summary()
+            record.update(
+                error_count=summary["error_count"], roi_count=summary["total_count"],
+                scanned_page_count=summary["scanned_page_count"], failed_rois=summary["failed_rois"],
+                validated_at=summary["validated_at"],
+                stage_timings={stage: round(seconds, 4) for stage, seconds in summary["stage_timings"].items()},
+                # ROI별 측정값: 임계값만 바꿔 다시 판정할 때 사용 (infrastructure.services.batch_rescorer)
+                measurements={
+                    result.roi_name: {"status": result.status.value, **result.details.get("measurements", {})}
+                    for result in document_result.roi_results
+                },
+            )
+        return record
+
+    @staticmethod
+    def _report_roi_rows(document_result):
+        """보고서의 ROI 행들"""
+        return [
+            {
+                "roi_name": result.roi_name, "status": result.status.value, "page": result.details.get("page"),
+                "source_page": result.details.get("source_page"), "processing_time": result.processing_time,
+                "message": result.message,
+                **result.details.get("measurements", {}),
+            }
+            for result in document_result.roi_results
+        ]
+
+    @staticmethod
+    def _close_report(job, report):
+        if report is None:
+            return
+        summary = report.close()
+        timing = summary["processing_time"]
+        job.log(f"보고서 저장: {', '.join(os.path.abspath(path) for path in summary['files'].values())}")
+        if timing["count"]:
+            job.log(f"문서당 처리 시간: 평균 {timing['mean']:.2f}초, p50 {timing['p50']:.2f}초, "
+                    f"p95 {timing['p95']:.2f}초, 최대 {timing['max']:.2f}초")
+
+    # --- 템플릿 자동 인식 ---
+    def _sync_template_index(self, job):
+        """작업 시작 시 템플릿 색인을 템플릿 저장소와 맞춥니다 (바뀐 템플릿만 다시 계산)."""
+        if self.template_index is None:
+            raise TemplateNotIdentifiedError(self.target_path or "", "템플릿 색인을 사용할 수 없습니다")
+        with tracer.span("template_index_sync"):
+            stats = self.template_index.sync()
+        changed = ", ".join(f"{key} {count}" for key, count in stats.items() if count)
+        job.log(f"템플릿 색인: {len(self.template_index)}개" + (f" ({changed})" if changed else ""))
+        with self._template_cache_lock:
+            self._template_cache.clear()
+
+    def _identify_template(self, filepath):
+        """문서에 가장 가까운 템플릿을 찾아 (TemplateMatch, 템플릿 데이터)를 반환합니다. 작업 스레드에서 실행됩니다."""
+        with tracer.span("identify", document=document_label(filepath)) as span:
+            match = self.template_index.identify(filepath)
+            span.set(template=match.template_name, confidence=round(match.confidence, 3))
+        if not match.is_confident:
+            raise TemplateNotIdentifiedError(os.path.basename(filepath), match.describe())
+        return match, self._load_identified_template(match.template_name)
+
+    def _load_identified_template(self, template_name):
+        """인식된 템플릿을 불러옵니다 (작업 중에는 같은 템플릿을 한 번만 읽음)."""
+        with self._template_cache_lock:
+            template = self._template_cache.get(template_name)
+            if template is None:
+                template = self.template_service.load_template(template_name)
+                self._template_cache[template_name] = template
+        return template
+
+    def _split_batch_files(self, job, entries):
+        """
+        각 PDF를 양식 단위 구간으로 나눠 (파일 경로, 표시 이름, DocumentSegment, 페이지 구간) 목록을 만듭니다.
+        양식이 하나뿐인 파일은 분할하지 않은 경우와 똑같이 파일 전체를 검증하고(페이지 구간 None),
+        여러 개면 'batch.pdf [p.3-4]'처럼 원본 페이지를 이름에 붙입니다.
+        """
+        from infrastructure.services.document_splitter import DocumentSplitter
+        splitter = DocumentSplitter(self.template_index)
+        split_entries = []
+        for number, (filepath, filename, _, _) in enumerate(entries, start=1):
+            job.post("progress", number, len(entries))
+            try:
+                with tracer.span("split", document=document_label(filepath)) as span:
+                    segments = splitter.split(filepath, checkpoint=job.checkpoint)
+                    span.set(segments=len(segments))
+            except ValidationCancelledError:
+                raise
+            except Exception as e:
+                # 분할하지 못한 파일은 통째로 검증 단계에 넘겨 오류가 결과 표에 남도록 함
+                job.log(f"  -> '{filename}' 양식 분할 실패, 파일 전체를 한 문서로 검증합니다: {e}")
+                split_entries.append((filepath, filename, None, None))
+                continue
+            if not segments:  # 페이지가 없는 파일: 검증 단계에서 오류로 보고
+                split_entries.append((filepath, filename, None, None))
+                continue
+            if len(segments) > 1:
+                summary = ", ".join(f"{s.label} {s.template_name or '(미인식)'}" for s in segments)
+                job.log(f"'{filename}': 양식 {len(segments)}개로 분할 ({summary})")
+            for segment in segments:
+                if len(segments) == 1:
+                    split_entries.append((filepath, filename, segment, None))
+                else:
+                    split_entries.append((filepath, f"{filename} [{segment.label}]", segment, segment.page_range))
+        return split_entries
+
+    def _run_sequential(self, filepaths, process, checkpoint, page_ranges=None):
+        """스케줄러가 없을 때 파일을 하나씩 처리합니다 (BatchScheduler.run과 같은 형태의 결과를 생성)."""
+        for index, filepath in enumerate(filepaths):
+            checkpoint()
+            admission = DocumentAdmission(index, filepath, 0.0, page_range=page_ranges[index] if page_ranges else None)
+            try:
+                yield BatchOutcome(admission, process(admission))
+            except Exception as e:
+                yield BatchOutcome(admission, error=e)
+
+    def _progress_callback(self, job, message, current, total):
+        """Service에서 진행 상황을 작업 이벤트 큐로 전달하기 위한 콜백 함수입니다."""
+        job.log(message)
+        job.post("progress", current, total)
+
+    def _service_for(self, session):
+        """
+        프로파일링 중에는 현재 프로세스/스레드에서 검증해야 결과가 의미 있으므로
+        원격 서버나 작업자 풀 대신 그 안의 로컬 ValidationService를 사용합니다.
+        """
+        if session is None:
+            return self.validation_service
+        return getattr(self.validation_service, 'local', self.validation_service)
+
+    @staticmethod
+    def _log_profile(job, session):
+        if session is not None:
+            job.log(f"🔬 프로파일 저장: {', '.join(os.path.abspath(p) for p in session.paths)}")
+
+    @staticmethod
+    def _export_metrics(job):
+        """일괄 검증이 끝날 때마다 메트릭을 Prometheus 텍스트/JSON 스냅샷으로 저장합니다."""
+        if not registry.enabled:
+            return
+        try:
+            prom_path, _ = registry.export(METRICS_OUTPUT_DIR)
+            job.log(f"메트릭 저장: {os.path.abspath(prom_path)}")
+        except OSError as e:
+            job.log(f"메트릭 저장 실패: {e}")
+
+    @staticmethod
+    def _export_trace(job):
+        """추적이 켜져 있으면 작업 하나의 구간 기록을 Chrome trace-event JSON으로 저장하고 비웁니다."""
+        if not tracer.enabled or not len(tracer):
+            return
+        path = os.path.join(TRACE_OUTPUT_DIR, f"trace_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        try:
+            tracer.export(path)
+            job.log(f"추적 저장: {os.path.abspath(path)} (https://ui.perfetto.dev 에서 열기)")
+        except OSError as e:
+            job.log(f"추적 저장 실패: {e}")
+
+    @staticmethod
+    def _format_timings(total_seconds, stage_timings):
+        """처리 시간 요약 한 줄 (단계별 시간은 ROI 처리 시간의 합)"""
+        stages = ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in stage_timings.items())
+        return f"⏱ 처리 시간: {total_seconds:.2f}초" + (f" (단계별 합계: {stages})" if stages else "")
+
+    def _log_results(self, job, results):
+        """검증 결과 리스트를 로그 이벤트로 보기 좋게 출력합니다."""
         for result in results:
             icon = "✅" if result['status'] == 'OK' else "❌"
-            self.view.log(f"  {icon} [{result['field_name']}]: {result['message']}")
+            elapsed = f" ({result['processing_time'] * 1000:.0f}ms)" if result.get('processing_time') is not None else ""
+            job.log(f"  {icon} [{result['field_name']}]: {result['message']}{elapsed}")
 
     # --- PDF Viewer Control Methods ---
     def render_docs(self):
         """뷰어에 현재 페이지의 원본/결과 이미지를 렌더링합니다."""
-        if not self.original_doc or not self.annotated_doc:
+        if self._render_after_id is not None:
+            self.view.root.after_cancel(self._render_after_id) # 직접 호출되면 대기 중인 재시도는 필요 없음
+            self._render_after_id = None
+        if self._closed or not self.original_doc or not self.annotated_doc:
             return
 
         # View(Canvas)의 현재 크기를 가져옴
         w, h = self.view.left_canvas.winfo_width(), self.view.left_canvas.winfo_height()
         if w < 10 or h < 10: # 창이 완전히 그려지기 전이면 잠시 대기
-            self.view.root.after(50, self.render_docs)
+            self._render_after_id = self.view.root.after(50, self._on_render_retry)
             return
 
-        # Service에 페이지 이미지 렌더링을 요청
-        original_img = self.validation_service.render_page_to_image(self.original_doc, self.current_page_num, (w,h))
-        annotated_img = self.validation_service.render_page_to_image(self.annotated_doc, self.current_page_num, (w,h))
+        # 캐시에 없을 때만 Service에 페이지 이미지 렌더링을 요청
+        original_img = self._get_page_image("original", self.original_doc, self.current_page_num, (w, h))
+        annotated_img = self._get_page_image("annotated", self.annotated_doc, self.current_page_num, (w, h))
 
         # 렌더링된 이미지를 View에 전달하여 화면 업데이트
         self.view.update_viewer(original_img, annotated_img, self.current_page_num, len(self.original_doc))
 
+        # 이전/다음 페이지를 백그라운드에서 미리 렌더링
+        self._prefetch_neighbors((w, h))
+
+    def _on_render_retry(self):
+        self._render_after_id = None
+        self.render_docs()
+
+    def on_viewer_resize(self):
+        """뷰어 캔버스 크기 변경 시 호출됩니다. 연속된 이벤트는 마지막 한 번만 다시 그립니다."""
+        if self._closed or not self.original_doc:
+            return
+        if self._resize_after_id is not None:
+            self.view.root.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.view.root.after(VIEWER_RESIZE_DEBOUNCE_MS, self._on_resize_settled)
+
+    def _on_resize_settled(self):
+        self._resize_after_id = None
+        self.render_docs()
+
+    def _get_page_image(self, role, doc, page_num, size):
+        doc_id = (self._viewer_generation, role)
+        return self.render_cache.get_or_render(
+            doc_id, page_num, size,
+            lambda render_size=size: self.validation_service.render_page_to_image(doc, page_num, render_size),
+            self._viewer_keys.get(role)
+        )
+
+    def _prefetch_neighbors(self, size):
+        tasks = []
+        for page_num in (self.current_page_num + 1, self.current_page_num - 1):
+            if not 0 <= page_num < len(self.original_doc):
+                continue
+            for role, doc in (("original", self.original_doc), ("annotated", self.annotated_doc)):
+                if page_num >= len(doc):
+                    continue
+                render_fn = (lambda render_size=size, d=doc, p=page_num:
+                             self.validation_service.render_page_to_image(d, p, render_size))
+                tasks.append(((self._viewer_generation, role), page_num, size, render_fn, self._viewer_keys.get(role)))
+        self.prefetcher.request(tasks)
+
+    def _reset_render_cache(self):
+        """뷰어 문서가 바뀌면 이전 문서의 캐시와 대기 중인 프리페치를 버립니다."""
+        self._viewer_generation += 1
+        self.prefetcher.cancel_pending()
+        self.render_cache.clear()
+
     def prev_page(self):
         """'이전 페이지' 버튼 클릭 시 호출됩니다."""
         if self.current_page_num > 0:
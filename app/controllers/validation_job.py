@@ -0,0 +1,82 @@
+import queue
+import threading
+
+from shared.exceptions import ValidationCancelledError
+
+
+class ValidationJob:
+    """
+    검증 작업을 Tk 메인 스레드 밖(작업 스레드)에서 실행하는 작업 단위.
+    역할:
+    - 작업 함수는 View에 직접 접근하지 않고 post()로 진행 이벤트를 큐에 쌓습니다.
+    - Controller는 root.after로 주기적으로 drain()하여 이벤트를 View에 반영합니다.
+    - 일시정지/취소는 작업 함수가 checkpoint()를 호출하는 지점(ROI 사이, 파일 사이)에서 반영됩니다.
+    """
+    def __init__(self, target, *args):
+        self.events = queue.Queue()
+        self._target = target
+        self._args = args
+        self._cancel_event = threading.Event()
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        self._thread = threading.Thread(target=self._run, name="validation-job", daemon=True)
+
+    # --- Controller(메인 스레드)에서 호출하는 메서드 ---
+    def start(self):
+        self._thread.start()
+
+    def pause(self):
+        self._resume_event.clear()
+        self.post("paused")
+
+    def resume(self):
+        self._resume_event.set()
+        self.post("resumed")
+
+    def cancel(self):
+        self._cancel_event.set()
+        self._resume_event.set()  # 일시정지 중이라도 즉시 깨워서 취소가 반영되도록 함
+
+    @property
+    def is_paused(self):
+        return not self._resume_event.is_set()
+
+    @property
+    def is_cancelled(self):
+        return self._cancel_event.is_set()
+
+    @property
+    def is_running(self):
+        return self._thread.is_alive()
+
+    def drain(self, max_events):
+        """큐에 쌓인 이벤트를 최대 max_events개까지 꺼내 (종류, 데이터) 리스트로 반환합니다."""
+        drained = []
+        for _ in range(max_events):
+            try:
+                drained.append(self.events.get_nowait())
+            except queue.Empty:
+                break
+        return drained
+
+    # --- 작업 스레드에서 호출하는 메서드 ---
+    def post(self, kind, *payload):
+        self.events.put((kind, payload))
+
+    def log(self, message):
+        self.post("log", message)
+
+    def checkpoint(self):
+        """일시정지 상태면 재개될 때까지 대기하고, 취소되었으면 ValidationCancelledError를 발생시킵니다."""
+        self._resume_event.wait()
+        if self._cancel_event.is_set():
+            raise ValidationCancelledError()
+
+    def _run(self):
+        try:
+            self._target(self, *self._args)
+            self.post("done")
+        except ValidationCancelledError:
+            self.post("cancelled")
+        except Exception as e:
+            self.post("error", e)
@@ -0,0 +1,62 @@
+import collections
+import tkinter as tk
+
+from shared.constants import LOG_MAX_LINES, LOG_FLUSH_INTERVAL_MS
+
+
+class ThrottledLog:
+    """
+    텍스트 위젯에 로그를 모아서 일정 주기(기본 10Hz)로만 반영하는 링 버퍼 로그.
+    - append()는 메모리 버퍼에만 쌓으므로 메시지가 아무리 많아도 위젯 삽입은 주기당 1회입니다.
+    - 위젯에는 최근 max_lines 줄만 남기고 오래된 줄은 지웁니다.
+    """
+    def __init__(self, root, text_widget, max_lines=LOG_MAX_LINES, interval_ms=LOG_FLUSH_INTERVAL_MS):
+        self.root = root
+        self.text = text_widget
+        self.max_lines = max_lines
+        self.interval_ms = interval_ms
+        self._pending = collections.deque(maxlen=max_lines)
+        self._dropped = 0
+        self._line_count = 0
+        self._flush_id = None
+
+    def append(self, message):
+        if len(self._pending) == self._pending.maxlen:
+            self._dropped += 1 # 한 주기 안에 버퍼보다 많은 로그가 쌓이면 가장 오래된 것부터 버림
+        self._pending.append(message)
+        if self._flush_id is None:
+            self._flush_id = self.root.after(self.interval_ms, self.flush)
+
+    def cancel(self):
+        """예약된 반영을 취소합니다. 창을 닫기 전에 호출해 파괴된 위젯에 쓰지 않게 합니다."""
+        if self._flush_id is not None:
+            self.root.after_cancel(self._flush_id)
+            self._flush_id = None
+        self._pending.clear()
+
+    def clear(self):
+        self._pending.clear()
+        self._dropped = 0
+        self._line_count = 0
+        self.text.delete('1.0', tk.END)
+
+    def flush(self):
+        self._flush_id = None
+        if not self._pending:
+            return
+
+        lines = list(self._pending)
+        self._pending.clear()
+        if self._dropped:
+            lines.insert(0, f"... (로그 {self._dropped}줄 생략)")
+            self._dropped = 0
+
+        chunk = "\n".join(lines) + "\n"
+        self.text.insert(tk.END, chunk)
+        self._line_count += chunk.count("\n")
+
+        excess = self._line_count - self.max_lines
+        if excess > 0:
+            self.text.delete('1.0', f'{excess + 1}.0')
+            self._line_count -= excess
+        self.text.see(tk.END) # 스크롤을 항상 맨 아래로 이동
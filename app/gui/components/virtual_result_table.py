@@ -0,0 +1,155 @@
+import tkinter as tk
+from tkinter import ttk
+
+from shared.constants import RESULT_TABLE_REFRESH_MS
+
+
+class VirtualResultTable(ttk.Frame):
+    """
+    일괄 검증 결과 표 (가상화).
+    - Treeview에는 화면에 보이는 행 수만큼만 항목을 만들어 두고, 스크롤 시 값만 바꿔 끼웁니다.
+    - 데이터는 BatchResultStore가 보관하며 정렬(열 제목 클릭)/상태 필터를 지원합니다.
+    - refresh 요청은 합쳐서 최대 10Hz로만 반영합니다.
+    """
+    COLUMNS = (
+        ("index", "#", 60),
+        ("file_name", "파일명", 360),
+        ("status", "상태", 100),
+        ("deficient_count", "미흡 항목", 90),
+        ("processing_time", "처리 시간", 90),
+        ("message", "메시지", 400),
+    )
+    STATUS_LABELS = {"OK": "✅ 통과", "DEFICIENT": "❌ 미흡", "ERROR": "🔥 오류"}
+    FILTER_OPTIONS = (("전체", None), ("통과", "OK"), ("미흡", "DEFICIENT"), ("오류", "ERROR"))
+
+    def __init__(self, parent, store, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.store = store
+        self._offset = 0
+        self._visible_rows = 1
+        self._refresh_id = None
+
+        self._setup_ui()
+
+    def _setup_ui(self):
+        self.rowconfigure(1, weight=1)
+        self.columnconfigure(0, weight=1)
+
+        # 상태 필터 + 건수 요약
+        filter_frame = ttk.Frame(self)
+        filter_frame.grid(row=0, column=0, columnspan=2, sticky="ew", pady=(0, 3))
+        ttk.Label(filter_frame, text="상태 필터:").pack(side=tk.LEFT)
+        self.filter_var = tk.StringVar(value=self.FILTER_OPTIONS[0][0])
+        filter_combo = ttk.Combobox(
+            filter_frame, textvariable=self.filter_var, state="readonly", width=8,
+            values=[label for label, _ in self.FILTER_OPTIONS]
+        )
+        filter_combo.pack(side=tk.LEFT, padx=5)
+        filter_combo.bind('<<ComboboxSelected>>', lambda e: self._on_filter_changed())
+        self.summary_label = ttk.Label(filter_frame, text="")
+        self.summary_label.pack(side=tk.LEFT, padx=10)
+
+        self.tree = ttk.Treeview(self, columns=[c[0] for c in self.COLUMNS], show="headings", selectmode="browse")
+        for column, title, width in self.COLUMNS:
+            self.tree.heading(column, text=title, command=lambda c=column: self._on_heading_click(c))
+            self.tree.column(column, width=width, stretch=(column == "message"))
+        self.tree.grid(row=1, column=0, sticky="nsew")
+
+        # 스크롤바는 Treeview가 아닌 전체 데이터 기준으로 직접 관리
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.grid(row=1, column=1, sticky="ns")
+
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self._scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda e: self._scroll_by(3))
+
+    # --- 외부(View)에서 호출 ---
+    def schedule_refresh(self):
+        """데이터가 바뀌었음을 알립니다. 실제 갱신은 주기당 한 번만 수행됩니다."""
+        if self._refresh_id is None:
+            self._refresh_id = self.after(RESULT_TABLE_REFRESH_MS, self.refresh)
+
+    def cancel_refresh(self):
+        """예약된 갱신을 취소합니다. 창을 닫기 전에 호출해 파괴된 위젯에 쓰지 않게 합니다."""
+        if self._refresh_id is not None:
+            self.after_cancel(self._refresh_id)
+            self._refresh_id = None
+
+    def refresh(self):
+        self._refresh_id = None
+        total = self.store.visible_count()
+        self._offset = max(0, min(self._offset, total - self._visible_rows))
+
+        rows = self.store.get_rows(self._offset, self._visible_rows)
+        items = self.tree.get_children()
+
+        # 보이는 행 수만큼의 항목만 유지 (부족하면 만들고 남으면 지움)
+        for _ in range(len(rows) - len(items)):
+            self.tree.insert("", tk.END, values=())
+        for item in items[len(rows):]:
+            self.tree.delete(item)
+
+        for item, row in zip(self.tree.get_children(), rows):
+            self.tree.item(item, values=(
+                row.index, row.file_name, self.STATUS_LABELS.get(row.status, row.status),
+                row.deficient_count,
+                f"{row.processing_time:.2f}s" if row.processing_time is not None else "",
+                row.message
+            ))
+
+        self._update_scrollbar(total)
+        self._update_summary()
+
+    # --- 내부 이벤트 처리 ---
+    def _on_filter_changed(self):
+        status = dict(self.FILTER_OPTIONS).get(self.filter_var.get())
+        self.store.set_filter(status)
+        self._offset = 0
+        self.refresh()
+
+    def _on_heading_click(self, column):
+        self.store.toggle_sort(column)
+        sort_column, descending = self.store.sort_state
+        for c, title, _ in self.COLUMNS:
+            arrow = (" ▼" if descending else " ▲") if c == sort_column else ""
+            self.tree.heading(c, text=title + arrow)
+        self.refresh()
+
+    def _on_resize(self, event):
+        row_height = ttk.Style().lookup("Treeview", "rowheight") or 20
+        header_height = 25
+        visible = max(1, (event.height - header_height) // int(row_height))
+        if visible != self._visible_rows:
+            self._visible_rows = visible
+            self.tree.configure(height=visible)
+            self.schedule_refresh()
+
+    def _on_mousewheel(self, event):
+        self._scroll_by(-3 if event.delta > 0 else 3)
+
+    def _on_scrollbar(self, action, value, unit=None):
+        total = self.store.visible_count()
+        if action == tk.MOVETO:
+            self._offset = int(float(value) * total)
+        elif action == tk.SCROLL:
+            step = self._visible_rows if unit == tk.PAGES else 1
+            self._offset += int(value) * step
+        self.refresh()
+
+    def _scroll_by(self, rows):
+        self._offset += rows
+        self.refresh()
+
+    def _update_scrollbar(self, total):
+        if total <= self._visible_rows:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self._offset / total, (self._offset + self._visible_rows) / total)
+
+    def _update_summary(self):
+        counts = self.store.status_counts()
+        self.summary_label.config(text=(
+            f"전체 {self.store.total_count}건 | "
+            f"통과 {counts.get('OK', 0)} · 미흡 {counts.get('DEFICIENT', 0)} · 오류 {counts.get('ERROR', 0)}"
+        ))
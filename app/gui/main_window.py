@@ -23,8 +23,35 @@ class MainWindow:
         self.root.geometry(f'{window_width}x{window_height}+{center_x}+{center_y}')
         self.root.resizable(False, False)
 
+        self._setup_menu()
         self._setup_ui()
 
+    def _setup_menu(self):
+        """'디버그' 메뉴: 검증 프로파일링 / 구간 추적 켜기/끄기"""
+        menubar = tk.Menu(self.root)
+        debug_menu = tk.Menu(menubar, tearoff=False)
+        self.profile_var = tk.BooleanVar(value=self.controller.profiling.enabled)
+        self.profile_memory_var = tk.BooleanVar(value=self.controller.profiling.trace_memory)
+        debug_menu.add_checkbutton(
+            label="검증 프로파일링 (output/.../profiles)", variable=self.profile_var,
+            command=self._on_profiling_toggled
+        )
+        debug_menu.add_checkbutton(
+            label="메모리 할당 추적 (tracemalloc)", variable=self.profile_memory_var,
+            command=self._on_profiling_toggled
+        )
+        debug_menu.add_separator()
+        self.trace_var = tk.BooleanVar(value=self.controller.tracing)
+        debug_menu.add_checkbutton(
+            label="구간 추적 기록 (traces/, Perfetto)", variable=self.trace_var,
+            command=lambda: self.controller.set_tracing(self.trace_var.get())
+        )
+        menubar.add_cascade(label="디버그", menu=debug_menu)
+        self.root.config(menu=menubar)
+
+    def _on_profiling_toggled(self):
+        self.controller.set_profiling(self.profile_var.get(), trace_memory=self.profile_memory_var.get())
+
     def _setup_ui(self):
         main_frame = ttk.Frame(self.root, padding=20)
         main_frame.pack(expand=True, fill=tk.BOTH)
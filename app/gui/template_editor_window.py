@@ -17,12 +17,14 @@ class TemplateEditorWindow:
 
         # UI 상태 변수
         self.tk_image = None
+        self._displayed_image = None # tk_image의 원본 PIL 이미지 (같은 이미지면 PhotoImage 재생성 생략)
         self.start_x = 0
         self.start_y = 0
         self.current_rect = None
+        self._rois_on_page = {}
 
         self._setup_ui()
-        self.root.bind("<Configure>", lambda e: self.controller.on_window_resize())
+        self.root.bind("<Configure>", self._on_root_configure)
 
     def _setup_ui(self):
         # --- Top Frame ---
@@ -60,8 +62,18 @@ class TemplateEditorWindow:
         self.roi_listbox = tk.Listbox(roi_frame, width=40)
         self.roi_listbox.pack(fill=tk.BOTH, expand=True)
         self.roi_listbox.bind("<Double-1>", lambda e: self.controller.delete_selected_roi())
+        self.roi_listbox.bind("<<ListboxSelect>>", lambda e: self._highlight_roi(self.get_selected_roi_name()))
+
+        # 겹치는 ROI 경고 (대화상자 대신 목록 아래에 표시)
+        self.overlap_label = ttk.Label(right_panel, text="", foreground="dark orange", wraplength=280, justify=tk.LEFT)
+        self.overlap_label.pack(fill=tk.X, pady=(5, 0))
 
     # --- Event Handlers (Calls Controller) ---
+    def _on_root_configure(self, event):
+        # 루트에 바인딩하면 모든 자식 위젯의 Configure 이벤트도 전달되므로 루트 자신의 이벤트만 처리
+        if event.widget is self.root:
+            self.controller.on_window_resize()
+
     def _start_drag(self, event):
         self.start_x = self.canvas.canvasx(event.x)
         self.start_y = self.canvas.canvasy(event.y)
@@ -86,6 +98,9 @@ class TemplateEditorWindow:
         self.current_rect = None
 
         if abs(x1 - x2) < 5 or abs(y1 - y2) < 5:
+            # 드래그 없이 클릭만 한 경우: 클릭 위치의 ROI 선택
+            if abs(x1 - x2) < 5 and abs(y1 - y2) < 5:
+                self.controller.select_roi_at(x2, y2)
             return
 
         # UI는 좌표만 전달, 처리는 Controller가 담당
@@ -93,14 +108,25 @@ class TemplateEditorWindow:
 
     # --- UI Update Methods (Called by Controller) ---
     def update_page_display(self, page_image, page_num, total_pages, rois_on_page):
-        if page_image:
+        if page_image is None:
+            self._displayed_image = None
+            self.canvas.delete("all")
+        elif page_image is not self._displayed_image:
             self.tk_image = ImageTk.PhotoImage(page_image)
+            self._displayed_image = page_image
             self.canvas.delete("all")
-            self.canvas.create_image(0, 0, anchor=tk.NW, image=self.tk_image)
-            self._draw_rois(rois_on_page)
+            self.canvas.create_image(0, 0, anchor=tk.NW, image=self.tk_image, tags="page")
 
         self.page_label.config(text=f"Page: {page_num + 1}/{total_pages}")
+        self.update_roi_overlays(rois_on_page)
+
+    def update_roi_overlays(self, rois_on_page):
+        """페이지 이미지는 유지하고 ROI 도형과 목록만 다시 그립니다."""
+        self._rois_on_page = rois_on_page
+        self.canvas.delete("roi")
+        self._draw_rois(rois_on_page)
         self.update_roi_listbox(rois_on_page)
+        self._update_overlap_warning(rois_on_page)
 
     def update_roi_listbox(self, rois_on_page):
         self.roi_listbox.delete(0, tk.END)
@@ -111,6 +137,35 @@ class TemplateEditorWindow:
         selection = self.roi_listbox.curselection()
         return self.roi_listbox.get(selection[0]) if selection else None
 
+    def select_roi(self, name):
+        """ROI를 목록에서 선택하고 캔버스에 강조 표시합니다 (None이면 선택 해제)."""
+        self.roi_listbox.selection_clear(0, tk.END)
+        names = self.roi_listbox.get(0, tk.END)
+        if name in names:
+            index = names.index(name)
+            self.roi_listbox.selection_set(index)
+            self.roi_listbox.see(index)
+        self._highlight_roi(name)
+
+    def _highlight_roi(self, name):
+        self.canvas.delete("selection")
+        data = self._rois_on_page.get(name) if name else None
+        if not data or not data.get('screen_coords'):
+            return
+        x0, y0, x1, y1 = data['screen_coords']
+        self.canvas.create_rectangle(x0 - 3, y0 - 3, x1 + 3, y1 + 3, outline="lime green", width=3,
+                                     tags=("roi", "selection"))
+
+    def _update_overlap_warning(self, rois_on_page):
+        pairs = sorted({tuple(sorted((name, other)))
+                        for name, data in rois_on_page.items() for other in data.get('overlaps', ())})
+        if not pairs:
+            self.overlap_label.config(text="")
+            return
+        shown = ", ".join(f"{a} ↔ {b}" for a, b in pairs[:5])
+        more = f" 외 {len(pairs) - 5}쌍" if len(pairs) > 5 else ""
+        self.overlap_label.config(text=f"⚠ 겹치는 ROI: {shown}{more}")
+
     def _draw_rois(self, rois_on_page):
         for name, data in rois_on_page.items():
             screen_coords = data.get('screen_coords')
@@ -119,17 +174,19 @@ class TemplateEditorWindow:
 
             x0, y0, x1, y1 = screen_coords
             color = 'blue' if data.get('method') == "ocr" else 'red'
-            self.canvas.create_rectangle(x0, y0, x1, y1, outline=color, width=2, tags=name)
-            self.canvas.create_text(x0, y0 - 5, text=name, anchor=tk.SW, fill=color, tags=name)
+            if data.get('overlaps'):
+                color = 'dark orange'
+            self.canvas.create_rectangle(x0, y0, x1, y1, outline=color, width=2, tags=("roi", name))
+            self.canvas.create_text(x0, y0 - 5, text=name, anchor=tk.SW, fill=color, tags=("roi", name))
 
             anchor_screen_coords = data.get('anchor_screen_coords')
             if anchor_screen_coords:
                 ax0, ay0, ax1, ay1 = anchor_screen_coords
-                self.canvas.create_rectangle(ax0, ay0, ax1, ay1, outline="cyan", width=2, dash=(5, 3), tags=name)
+                self.canvas.create_rectangle(ax0, ay0, ax1, ay1, outline="cyan", width=2, dash=(5, 3), tags=("roi", name))
                 self.canvas.create_line(
                     (x0 + x1) / 2, (y0 + y1) / 2,
                     (ax0 + ax1) / 2, (ay0 + ay1) / 2,
-                    fill="yellow", dash=(2, 2), tags=name
+                    fill="yellow", dash=(2, 2), tags=("roi", name)
                 )
 
     def get_roi_creation_info(self):
@@ -2,6 +2,17 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext
 from PIL import Image, ImageTk
 
+from app.gui.components.throttled_log import ThrottledLog
+from app.gui.components.virtual_result_table import VirtualResultTable
+from shared.constants import REVIEW_OUTPUT_FULL, REVIEW_OUTPUT_EXCERPT, REVIEW_OUTPUT_BUNDLE
+
+# 결과 PDF 저장 방식 (콤보박스 표시 문자열)
+REVIEW_MODE_LABELS = {
+    REVIEW_OUTPUT_FULL: "미흡 문서 전체",
+    REVIEW_OUTPUT_EXCERPT: "미흡 페이지만",
+    REVIEW_OUTPUT_BUNDLE: "미흡 페이지를 한 파일로 (목차)",
+}
+
 class ValidationWindow:
     """
     검증 도구의 사용자 인터페이스(View)를 담당하는 클래스.
@@ -30,8 +41,19 @@ class ValidationWindow:
         self.right_photo = None
 
         self._setup_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         self.controller.load_templates() # View가 준비되면 컨트롤러에게 템플릿 로드를 요청
 
+    def _on_close(self):
+        """
+        창을 닫을 때 실행 중인 검증 작업을 취소하도록 컨트롤러에 알리고,
+        예약된 로그/결과 표 갱신을 취소한 뒤 창을 파괴합니다.
+        """
+        self.controller.on_close()
+        self.log_buffer.cancel()
+        self.result_table.cancel_refresh()
+        self.root.destroy()
+
     def _setup_ui(self):
         main_frame = ttk.Frame(self.root, padding="10")
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -58,6 +80,13 @@ class ValidationWindow:
         self.template_combo.grid(row=1, column=1, sticky=tk.EW, padx=5, pady=5)
         self.template_combo.bind('<<ComboboxSelected>>', lambda e: self.controller.on_template_selected())
         ttk.Button(control_frame, text="새로고침", command=self.controller.load_templates).grid(row=1, column=2, padx=5, pady=5)
+        self.auto_identify_var = tk.BooleanVar(value=False)
+        self.auto_identify_check = ttk.Checkbutton(
+            control_frame, text="자동 인식", variable=self.auto_identify_var, command=self._on_auto_identify_toggle
+        )
+        self.auto_identify_check.grid(row=1, column=3, padx=5, pady=5)
+        if self.controller.template_index is None:
+            self.auto_identify_check.config(state=tk.DISABLED)
 
         # 검사 대상 경로 선택
         self.target_label = ttk.Label(control_frame, text="검사 대상 파일:")
@@ -66,10 +95,35 @@ class ValidationWindow:
         ttk.Entry(control_frame, textvariable=self.path_var, state="readonly").grid(row=2, column=1, sticky=tk.EW, padx=5, pady=5)
         self.browse_btn = ttk.Button(control_frame, text="파일 찾기", command=self.controller.browse_target)
         self.browse_btn.grid(row=2, column=2, padx=5, pady=5)
+        self.split_batches_var = tk.BooleanVar(value=False)
+        self.split_batches_check = ttk.Checkbutton(
+            control_frame, text="다중 양식 분할", variable=self.split_batches_var,
+            command=lambda: self.controller.set_split_batches(self.split_batches_var.get())
+        )
+        self.split_batches_check.grid(row=2, column=3, padx=5, pady=5)
+        self._update_split_check_state()
 
-        # --- 2. Action Frame: 실행 버튼 ---
-        self.validate_btn = ttk.Button(main_frame, text="검사 실행", command=self.controller.run_validation, state=tk.DISABLED)
-        self.validate_btn.grid(row=1, column=0, pady=10)
+        # 결과 PDF 저장 방식 (폴더 모드)
+        ttk.Label(control_frame, text="결과 PDF:").grid(row=3, column=0, sticky=tk.W, pady=5)
+        self.review_mode_var = tk.StringVar(value=REVIEW_MODE_LABELS[self.controller.review_mode])
+        self.review_mode_combo = ttk.Combobox(
+            control_frame, textvariable=self.review_mode_var, values=list(REVIEW_MODE_LABELS.values()),
+            state=tk.DISABLED, width=30
+        )
+        self.review_mode_combo.grid(row=3, column=1, sticky=tk.W, padx=5, pady=5)
+        self.review_mode_combo.bind('<<ComboboxSelected>>', lambda e: self.controller.set_review_mode(
+            next(mode for mode, label in REVIEW_MODE_LABELS.items() if label == self.review_mode_var.get())
+        ))
+
+        # --- 2. Action Frame: 실행/일시정지/취소 버튼 ---
+        action_frame = ttk.Frame(main_frame)
+        action_frame.grid(row=1, column=0, pady=10)
+        self.validate_btn = ttk.Button(action_frame, text="검사 실행", command=self.controller.run_validation, state=tk.DISABLED)
+        self.validate_btn.pack(side=tk.LEFT, padx=5)
+        self.pause_btn = ttk.Button(action_frame, text="일시정지", command=self.controller.toggle_pause, state=tk.DISABLED)
+        self.pause_btn.pack(side=tk.LEFT, padx=5)
+        self.cancel_btn = ttk.Button(action_frame, text="취소", command=self.controller.cancel_validation, state=tk.DISABLED)
+        self.cancel_btn.pack(side=tk.LEFT, padx=5)
 
         # --- 3. Viewer Frame: PDF 비교 뷰어 ---
         self.viewer_frame = ttk.Frame(main_frame)
@@ -83,6 +137,7 @@ class ValidationWindow:
         left_viewer = ttk.LabelFrame(viewer_pane, text="원본 템플릿", padding=5)
         self.left_canvas = tk.Canvas(left_viewer, bg="lightgrey")
         self.left_canvas.pack(fill=tk.BOTH, expand=True)
+        self.left_canvas.bind('<Configure>', lambda e: self.controller.on_viewer_resize())
         viewer_pane.add(left_viewer, weight=1)
 
         right_viewer = ttk.LabelFrame(viewer_pane, text="검증된 문서 (주석)", padding=5)
@@ -100,6 +155,15 @@ class ValidationWindow:
         self.next_page_btn = ttk.Button(nav_frame, text="다음 ▶", command=self.controller.next_page, state=tk.DISABLED)
         self.next_page_btn.pack(side=tk.LEFT)
 
+        # --- 3-1. Results Frame: 폴더 검증 결과 표 (폴더 모드에서만 표시) ---
+        self.results_frame = ttk.LabelFrame(main_frame, text="일괄 검증 결과", padding=5)
+        self.results_frame.grid(row=2, column=0, sticky="nsew", padx=5)
+        self.results_frame.rowconfigure(0, weight=1)
+        self.results_frame.columnconfigure(0, weight=1)
+        self.result_table = VirtualResultTable(self.results_frame, self.controller.result_store)
+        self.result_table.grid(row=0, column=0, sticky="nsew")
+        self.results_frame.grid_remove()
+
         # --- 4. Log Frame: 진행 상황 로그 ---
         log_frame = ttk.LabelFrame(main_frame, text="진행 상황 로그", padding=5, height=150)
         log_frame.grid(row=3, column=0, sticky="ew", padx=5, pady=5)
@@ -108,6 +172,7 @@ class ValidationWindow:
         self.log_text.pack(fill=tk.BOTH, expand=True, pady=(0, 3))
         self.progress_bar = ttk.Progressbar(log_frame, mode='determinate')
         self.progress_bar.pack(fill=tk.X)
+        self.log_buffer = ThrottledLog(self.root, self.log_text)
 
     def _on_mode_switch(self):
         """사용자가 '파일/폴더' 모드를 변경했을 때 호출되는 이벤트 핸들러."""
@@ -118,10 +183,27 @@ class ValidationWindow:
             self.target_label.config(text="검사 대상 파일:")
             self.browse_btn.config(text="파일 찾기")
             self.viewer_frame.grid() # 파일 모드에서는 뷰어 보이기
+            self.results_frame.grid_remove()
+            self.review_mode_combo.config(state=tk.DISABLED) # 파일 모드는 결과 PDF를 저장하지 않음
         else: # 폴더 모드
             self.target_label.config(text="검사 대상 폴더:")
             self.browse_btn.config(text="폴더 찾기")
             self.viewer_frame.grid_remove() # 폴더 모드에서는 뷰어 숨기기
+            self.results_frame.grid() # 대신 결과 표 보이기
+            self.review_mode_combo.config(state="readonly")
+        self._update_split_check_state()
+
+    def _on_auto_identify_toggle(self):
+        """'자동 인식' 체크 시 템플릿 콤보박스를 비활성화하고 컨트롤러에 알립니다."""
+        enabled = self.auto_identify_var.get()
+        self.template_combo.config(state=tk.DISABLED if enabled else "readonly")
+        self.controller.set_auto_identify(enabled)
+        self._update_split_check_state()
+
+    def _update_split_check_state(self):
+        """'다중 양식 분할'은 폴더 모드에서 자동 인식을 켰을 때만 선택할 수 있습니다."""
+        available = self.mode_var.get() == "폴더" and self.auto_identify_var.get()
+        self.split_batches_check.config(state=tk.NORMAL if available else tk.DISABLED)
 
     # --- 아래는 Controller가 View를 제어하기 위해 호출하는 메서드들 ---
 
@@ -133,18 +215,30 @@ class ValidationWindow:
         """'검사 실행' 버튼의 활성화/비활성화 상태를 업데이트합니다."""
         self.validate_btn.config(state=tk.NORMAL if is_ready else tk.DISABLED)
 
+    def set_job_running(self, running):
+        """백그라운드 검증 작업 실행 여부에 따라 실행/일시정지/취소 버튼 상태를 바꿉니다."""
+        self.validate_btn.config(state=tk.DISABLED if running else tk.NORMAL)
+        self.pause_btn.config(state=tk.NORMAL if running else tk.DISABLED, text="일시정지")
+        self.cancel_btn.config(state=tk.NORMAL if running else tk.DISABLED)
+
+    def set_paused(self, paused):
+        """일시정지 버튼의 표시 문구를 바꿉니다."""
+        self.pause_btn.config(text="재개" if paused else "일시정지")
+
     def log(self, message):
         """로그 창에 메시지를 추가합니다."""
         # Tkinter는 다른 스레드에서 UI를 직접 업데이트할 수 없으므로,
-        # after를 사용하여 메인 스레드에서 실행되도록 예약할 수 있습니다.
-        # 여기서는 Controller가 메인 스레드에서 호출되므로 직접 업데이트합니다.
-        self.log_text.insert(tk.END, message + "\n")
-        self.log_text.see(tk.END) # 스크롤을 항상 맨 아래로 이동
-        self.root.update_idletasks() # UI 즉시 갱신
+        # 검증 작업 스레드의 메시지는 Controller가 root.after로 메인 스레드에서 전달합니다.
+        # 위젯 삽입은 링 버퍼에 모았다가 최대 10Hz로만 반영합니다.
+        self.log_buffer.append(message)
 
     def clear_log(self):
         """로그 창의 모든 내용을 지웁니다."""
-        self.log_text.delete('1.0', tk.END)
+        self.log_buffer.clear()
+
+    def refresh_results(self):
+        """결과 표 갱신을 요청합니다 (여러 번 호출되어도 주기당 한 번만 그림)."""
+        self.result_table.schedule_refresh()
 
     def update_progress(self, value, maximum):
         """진행 상태 바를 업데이트합니다."""
@@ -0,0 +1,2 @@
+# 파일 경로: benchmarks/__init__.py
+"""검증 처리량 벤치마크 (합성 보험 청구서 코퍼스 생성 및 측정)"""
@@ -0,0 +1,226 @@
+# 파일 경로: benchmarks/corpus.py
+"""
+Synthetic Corpus
+벤치마크용 합성 보험 청구서 PDF와 그에 맞는 템플릿(templates.json 형식)을 생성합니다.
+
+변형(variant):
+    filled   모든 칸이 채워진 문서
+    blank    아무것도 채우지 않은 문서
+    shifted  채워진 문서를 수 pt 평행 이동 (인쇄/스캔 여백 차이)
+    rotated  채워진 문서를 약간 회전 (벡터 그대로)
+    scanned  채워진 문서를 래스터화하고 잡음을 더한 이미지 전용 PDF
+
+외부 글꼴이나 네트워크 없이 PyMuPDF 기본 글꼴(helv)만 사용합니다.
+"""
+import json
+import os
+import random
+from dataclasses import dataclass, field, asdict
+
+import fitz
+import numpy as np
+
+from shared.constants import DEFAULT_OCR_THRESHOLD, DEFAULT_CONTOUR_THRESHOLD
+
+VARIANTS = ("filled", "blank", "shifted", "rotated", "scanned")
+
+PAGE_WIDTH, PAGE_HEIGHT = 595, 842  # A4 (pt)
+FIELD_LEFT, FIELD_RIGHT = 200, 520
+TOP_MARGIN, BOTTOM_MARGIN = 110, 40
+
+_NAMES = ("Kim Minjun", "Lee Seoyeon", "Park Jihoon", "Choi Yuna", "Jung Hyunwoo", "Kang Soyeon")
+_WORDS = ("Seoul", "Busan", "Outpatient", "Inpatient", "Fracture", "Dental", "Approved", "Pending")
+
+
+@dataclass
+class CorpusSpec:
+    """
+    합성 코퍼스 구성
+
+    Attributes:
+        pages: 문서당 페이지 수
+        rois_per_page: 페이지당 입력 칸(ROI) 수
+        documents_per_variant: 변형별 문서 수
+        variants: 생성할 변형 목록
+        method: 템플릿 ROI 검증 방식 ("contour" 또는 "ocr")
+        shift: shifted 변형의 평행 이동량 (pt)
+        rotation: rotated 변형의 회전 각도 (도)
+        scan_dpi: scanned 변형의 래스터 해상도
+        seed: 난수 시드 (같은 시드면 같은 코퍼스)
+    """
+    pages: int = 2
+    rois_per_page: int = 10
+    documents_per_variant: int = 5
+    variants: tuple = VARIANTS
+    method: str = "contour"
+    shift: tuple = (6.0, 4.0)
+    rotation: float = 1.5
+    scan_dpi: int = 150
+    seed: int = 0
+
+
+@dataclass
+class Corpus:
+    """생성된 코퍼스의 경로 정보"""
+    root: str
+    template_name: str
+    template_file: str
+    template: dict
+    documents: dict = field(default_factory=dict)  # variant -> [pdf 경로]
+    spec: CorpusSpec = None
+
+    @property
+    def documents_dir(self):
+        return os.path.join(self.root, "documents")
+
+    def all_documents(self):
+        return [path for variant in self.documents for path in self.documents[variant]]
+
+
+def field_rects(spec):
+    """페이지 하나의 입력 칸 좌표 목록 (PDF 좌표계, pt)"""
+    spacing = min(60.0, (PAGE_HEIGHT - TOP_MARGIN - BOTTOM_MARGIN) / max(1, spec.rois_per_page))
+    height = min(20.0, spacing * 0.6)
+    return [
+        fitz.Rect(FIELD_LEFT, TOP_MARGIN + i * spacing, FIELD_RIGHT, TOP_MARGIN + i * spacing + height)
+        for i in range(spec.rois_per_page)
+    ]
+
+
+def build_template(spec, original_pdf_path):
+    """양식 PDF에 맞는 템플릿 dict (템플릿 편집기가 저장하는 형식과 동일)"""
+    threshold = DEFAULT_OCR_THRESHOLD if spec.method == "ocr" else DEFAULT_CONTOUR_THRESHOLD
+    rois = {}
+    for page_num in range(spec.pages):
+        for i, rect in enumerate(field_rects(spec)):
+            rois[f"p{page_num + 1}_field{i + 1:02d}"] = {
+                "page": page_num,
+                "coords": [rect.x0 + 2, rect.y0 + 2, rect.x1 - 2, rect.y1 - 2],
+                "anchor_coords": [40, rect.y0 - 4, FIELD_LEFT - 5, rect.y1 + 4],
+                "method": spec.method,
+                "threshold": threshold,
+            }
+    return {"original_pdf_path": os.path.abspath(original_pdf_path), "rois": rois}
+
+
+def _draw_form(page, spec, page_num):
+    """빈 양식: 제목, 항목 이름, 입력 칸 테두리"""
+    page.insert_text((40, 50), "INSURANCE CLAIM FORM", fontname="helv", fontsize=16)
+    page.insert_text((40, 70), f"Form No. BM-2024-{page_num + 1:02d}  /  Page {page_num + 1} of {spec.pages}",
+                     fontname="helv", fontsize=9)
+    page.draw_line((40, 80), (PAGE_WIDTH - 40, 80), width=1.0)
+    for i, rect in enumerate(field_rects(spec)):
+        page.insert_text((45, rect.y1 - 5), f"{page_num + 1}.{i + 1} Field {i + 1}", fontname="helv", fontsize=10)
+        page.draw_rect(rect, color=(0, 0, 0), width=0.8)
+
+
+def _fill_form(page, spec, rng):
+    """입력 칸마다 이름/날짜/금액/단어 중 하나를 채움"""
+    for rect in field_rects(spec):
+        kind = rng.randrange(4)
+        if kind == 0:
+            text = rng.choice(_NAMES)
+        elif kind == 1:
+            text = f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        elif kind == 2:
+            text = f"KRW {rng.randint(10, 9999) * 1000:,}"
+        else:
+            text = " ".join(rng.choice(_WORDS) for _ in range(2))
+        fontsize = min(11.0, rect.height * 0.6)
+        page.insert_text((rect.x0 + 6, rect.y1 - (rect.height - fontsize) / 2 - 1), text,
+                         fontname="helv", fontsize=fontsize)
+
+
+def _new_form(spec, rng=None):
+    doc = fitz.open()
+    for page_num in range(spec.pages):
+        page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+        _draw_form(page, spec, page_num)
+        if rng is not None:
+            _fill_form(page, spec, rng)
+    return doc
+
+
+def _place(source, transform_rect=None, rotate=0):
+    """source의 각 페이지를 새 문서에 옮겨 그림 (평행 이동/회전)"""
+    doc = fitz.open()
+    for page_num in range(len(source)):
+        page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+        rect = transform_rect(page.rect) if transform_rect else page.rect
+        page.show_pdf_page(rect, source, page_num, rotate=rotate)
+    return doc
+
+
+def _scan(source, spec, np_rng):
+    """래스터화 + 회색조 잡음으로 스캔 문서를 흉내 냄 (텍스트 레이어 없음)"""
+    doc = fitz.open()
+    for src_page in source:
+        pix = src_page.get_pixmap(dpi=spec.scan_dpi, colorspace=fitz.csGRAY)
+        pixels = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width).astype(np.int16)
+        pixels = np.clip(pixels + np_rng.normal(0, 8, pixels.shape), 0, 255).astype(np.uint8)
+        noisy = fitz.Pixmap(fitz.csGRAY, pix.width, pix.height, pixels.tobytes(), False)
+        page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+        page.insert_image(page.rect, pixmap=noisy)
+    return doc
+
+
+def _make_variant(variant, spec, rng, np_rng):
+    if variant == "blank":
+        return _new_form(spec)
+    filled = _new_form(spec, rng)
+    if variant == "filled":
+        return filled
+    try:
+        if variant == "shifted":
+            dx, dy = spec.shift
+            return _place(filled, lambda r: r + (dx, dy, dx, dy))
+        if variant == "rotated":
+            return _place(filled, rotate=spec.rotation)
+        if variant == "scanned":
+            return _scan(filled, spec, np_rng)
+    finally:
+        filled.close()
+    raise ValueError(f"알 수 없는 변형: {variant}")
+
+
+def build_corpus(output_dir, spec=None, template_name="benchmark_form"):
+    """
+    output_dir 아래에 코퍼스를 생성합니다.
+        template/original.pdf        템플릿 원본 (빈 양식)
+        templates.json               템플릿 (templates.json 형식)
+        documents/<variant>_NNN.pdf  대상 문서
+        corpus.json                  생성 조건
+    """
+    spec = spec or CorpusSpec()
+    rng = random.Random(spec.seed)
+    np_rng = np.random.default_rng(spec.seed)
+
+    template_dir = os.path.join(output_dir, "template")
+    documents_dir = os.path.join(output_dir, "documents")
+    os.makedirs(template_dir, exist_ok=True)
+    os.makedirs(documents_dir, exist_ok=True)
+
+    original_pdf_path = os.path.join(template_dir, "original.pdf")
+    original = _new_form(spec)
+    original.save(original_pdf_path)
+    original.close()
+
+    template = build_template(spec, original_pdf_path)
+    template_file = os.path.join(output_dir, "templates.json")
+    with open(template_file, 'w', encoding='utf-8') as f:
+        json.dump({template_name: template}, f, ensure_ascii=False, indent=2)
+
+    corpus = Corpus(os.path.abspath(output_dir), template_name, template_file, template, spec=spec)
+    for variant in spec.variants:
+        paths = []
+        for i in range(spec.documents_per_variant):
+            doc = _make_variant(variant, spec, rng, np_rng)
+            path = os.path.join(documents_dir, f"{variant}_{i + 1:03d}.pdf")
+            doc.save(path, garbage=3, deflate=True)
+            doc.close()
+            paths.append(path)
+        corpus.documents[variant] = paths
+
+    with open(os.path.join(output_dir, "corpus.json"), 'w', encoding='utf-8') as f:
+        json.dump(asdict(spec), f, ensure_ascii=False, indent=2)
+    return corpus
@@ -0,0 +1,299 @@
+# 파일 경로: benchmarks/regression.py
+"""
+Performance Regression Gate
+고정된 합성 작업량을 ValidationService로 처리하여 단계별 처리 시간의 중앙값을
+tests/performance/baseline.json과 비교합니다. 허용 범위를 넘은 단계가 있으면 표로 보여 주고 실패합니다.
+
+공유 CPU 러너에서도 흔들리지 않도록:
+    - 벽시계 대신 스레드 CPU 시간(time.thread_time)을 StageTimer에 주입하고,
+      문서를 한 스레드에서 처리하며 OpenCV 내부 스레드도 1개로 제한합니다.
+    - 워밍업 1회 후 여러 번 반복하여 시행별 합계의 중앙값을 씁니다.
+CPU 시간은 머신마다 다르므로 기준선에는 고정 보정 작업(CalibrationTask)의 CPU 시간도 함께 기록하고,
+검사할 때 같은 보정 작업을 시행 사이사이에 다시 재어, 러너가 더 느리면 그 비율만큼 기준선을 늘립니다.
+따라서 기준선을 만든 머신과 다른 러너(CI, 다른 개발자 머신)에서도 검사가 그대로 동작합니다
+(기준선에 기록된 환경과 다르면 보고서에 표시됩니다).
+
+사용 예:
+    python -m benchmarks.regression check              # 회귀 시 종료 코드 1
+    python -m benchmarks.regression check --tolerance 0.5
+    python -m benchmarks.regression update             # 기준선 갱신 (의도한 변경 후)
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter
+from dataclasses import dataclass, asdict
+
+import cv2
+
+from benchmarks.corpus import CorpusSpec, build_corpus
+from benchmarks.run_benchmarks import environment_info
+from shared.constants import TIMING_STAGES
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             "tests", "performance", "baseline.json")
+DEFAULT_TRIALS = 5
+CALIBRATION_ROUNDS_PER_TRIAL = 3  # 시행마다 번갈아 재는 머신 속도 보정 작업 횟수 (전체 중앙값 사용)
+CALIBRATION_NOISE = 0.15      # 보정값 비율이 1 + 이 값 이하면 같은 속도의 러너로 보고 환산하지 않음 (보정값 자체의 흔들림)
+DEFAULT_TOLERANCE = 0.35      # 기준 대비 허용 증가율 (같은 러너에서 반복 측정 시 흔들림 ±15% 정도)
+MIN_REGRESSION_MS = 2.0       # 이보다 작은 증가는 측정 잡음으로 보고 무시 (ms)
+TOTAL_STAGE = "total"
+
+# 회귀 검사용 고정 작업량 (바꾸면 기준선도 갱신해야 함)
+WORKLOAD = CorpusSpec(
+    pages=2, rois_per_page=8, documents_per_variant=2,
+    variants=("filled", "shifted", "scanned"), method="contour", seed=0
+)
+
+
+@dataclass
+class StageComparison:
+    """단계 하나의 기준선 대비 비교 결과 (초)"""
+    stage: str
+    baseline: float
+    current: float
+    tolerance: float
+    regressed: bool
+
+    @property
+    def change(self):
+        return (self.current - self.baseline) / self.baseline if self.baseline > 0 else 0.0
+
+
+def measure(corpus, trials=DEFAULT_TRIALS, clock=time.thread_time, calibration=None):
+    """
+    코퍼스 전체를 trials번 검증하여 단계별 (시행 합계의) 중앙값을 초 단위로 반환합니다.
+    문서는 현재 스레드에서 순서대로 처리하므로 clock은 스레드 CPU 시간이어도 됩니다.
+    calibration(CalibrationTask)이 주어지면 워밍업 뒤 시행마다 보정 작업을 번갈아 재어
+    작업량과 같은 프로세스 상태/시간대의 머신 속도를 기록합니다 (calibration.median()).
+    """
+    from domain.services.validation_service import ValidationService
+    from infrastructure.repositories.file_document_repository import FileDocumentRepository
+    from infrastructure.services.validation_vision_service import ValidationVisionService
+
+    service = ValidationService(
+        FileDocumentRepository(), ValidationVisionService(clock=clock), max_workers=1, clock=clock
+    )
+    documents = corpus.all_documents()
+
+    def run_once():
+        totals = Counter()
+        for path in documents:
+            for result in service.validate_document(corpus.template, path, streaming=True):
+                totals.update(result.get("timings", {}))
+                totals[TOTAL_STAGE] += result.get("processing_time", 0.0)
+        return totals
+
+    run_once()  # 워밍업 (원본 기울기 캐시, 모듈 초기화)
+    if calibration is not None:
+        calibration.run(1)  # 워밍업
+    runs = []
+    for _ in range(trials):
+        if calibration is not None:
+            calibration.run(CALIBRATION_ROUNDS_PER_TRIAL)
+        runs.append(run_once())
+    stages = [stage for stage in TIMING_STAGES + (TOTAL_STAGE,) if any(stage in run for run in runs)]
+    return {stage: statistics.median(run.get(stage, 0.0) for run in runs) for stage in stages}
+
+
+class CalibrationTask:
+    """
+    머신 속도 보정 작업: 검증 파이프라인과 비슷한 고정 연산(PDF 래스터화, OpenCV 이진화/필터/연결 요소, 리사이즈).
+    기준선과 현재 러너의 CPU 시간 중앙값 비율로 단계별 기준 시간을 환산합니다.
+    """
+
+    def __init__(self, clock=time.thread_time):
+        import fitz
+
+        self.clock = clock
+        self.samples = []
+        self._doc = fitz.open()
+        self._page = self._doc.new_page()
+        for i in range(20):
+            self._page.insert_text((60, 80 + i * 34), f"Line {i:02d}  insured name / policy number ______",
+                                   fontname="helv")
+            self._page.draw_rect(fitz.Rect(300, 70 + i * 34, 540, 90 + i * 34))
+
+    def run(self, rounds):
+        """보정 작업을 rounds번 재어 samples에 더합니다 (OpenCV 스레드 수는 호출한 쪽에서 1로 고정)."""
+        import fitz
+        import numpy as np
+
+        for _ in range(rounds):
+            started = self.clock()
+            pix = self._page.get_pixmap(matrix=fitz.Matrix(2, 2), alpha=False)
+            gray = cv2.cvtColor(np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, pix.n),
+                                cv2.COLOR_RGB2GRAY)
+            for _ in range(3):
+                _, binary = cv2.threshold(cv2.GaussianBlur(gray, (5, 5), 0), 127, 255, cv2.THRESH_BINARY_INV)
+                cv2.connectedComponentsWithStats(cv2.dilate(binary, np.ones((5, 5), np.uint8)))
+                cv2.resize(gray, (gray.shape[1] // 2, gray.shape[0] // 2), interpolation=cv2.INTER_AREA)
+            self.samples.append(self.clock() - started)
+
+    def median(self):
+        return statistics.median(self.samples) if self.samples else None
+
+    def close(self):
+        self._doc.close()
+
+
+def scale_baseline(baseline, calibration):
+    """
+    기준선의 단계별 시간을 현재 러너의 보정값 비율만큼 늘린 사본.
+    느린 러너에서 거짓 회귀를 막는 용도이므로 기준선을 줄이지는 않으며 (빠른 러너는 그대로 비교),
+    보정값이 없는 기준선이나 비율이 보정 잡음(CALIBRATION_NOISE) 이내인 러너도 그대로 비교합니다.
+    """
+    reference = baseline.get("calibration")
+    if not reference or not calibration:
+        return baseline
+    factor = calibration / reference
+    if factor <= 1 + CALIBRATION_NOISE:
+        return baseline
+    stages = {stage: seconds * factor for stage, seconds in baseline["stages"].items()}
+    return dict(baseline, stages=stages, speed_factor=factor)
+
+
+def run_workload(work_dir, workload=WORKLOAD, trials=DEFAULT_TRIALS, clock=time.thread_time):
+    """고정 작업량을 만들고 측정하여 기준선 형식의 dict를 반환합니다."""
+    previous_threads = cv2.getNumThreads()
+    cv2.setNumThreads(1)
+    calibration = CalibrationTask(clock)
+    try:
+        corpus = build_corpus(work_dir, workload)
+        stages = measure(corpus, trials, clock, calibration)
+    finally:
+        calibration.close()
+        cv2.setNumThreads(previous_threads)
+    return {
+        "workload": asdict(workload),
+        "trials": trials,
+        "clock": getattr(clock, "__name__", str(clock)),
+        "environment": environment_info(),
+        "calibration": round(calibration.median(), 6),
+        "stages": {stage: round(seconds, 6) for stage, seconds in stages.items()},
+    }
+
+
+def compare(baseline, current, tolerance=None, min_regression_ms=MIN_REGRESSION_MS):
+    """
+    단계별 중앙값을 비교합니다.
+    허용 증가율은 tolerance 인자 > 기준선의 tolerances[stage] > tolerances["default"] 순으로 정합니다.
+    """
+    tolerances = baseline.get("tolerances", {})
+    comparisons = []
+    for stage, expected in baseline["stages"].items():
+        if stage not in current["stages"]:
+            continue
+        limit = tolerance if tolerance is not None else tolerances.get(stage, tolerances.get("default", DEFAULT_TOLERANCE))
+        measured = current["stages"][stage]
+        regressed = measured > expected * (1 + limit) and (measured - expected) * 1000 > min_regression_ms
+        comparisons.append(StageComparison(stage, expected, measured, limit, regressed))
+    return comparisons
+
+
+def format_report(comparisons, baseline=None, current=None):
+    """단계별 비교 표 (회귀한 단계는 'REGRESSED'로 표시)"""
+    lines = []
+    if baseline is not None and "speed_factor" in baseline:
+        lines.append(f"기준선을 이 러너의 속도로 환산 (보정 작업 시간 비율 x{baseline['speed_factor']:.2f})")
+    lines.append(f"{'stage':<12} {'baseline':>11} {'current':>11} {'change':>8} {'limit':>7}  result")
+    for c in comparisons:
+        if c.regressed:
+            verdict = "REGRESSED"
+        elif c.change < -abs(c.tolerance):
+            verdict = "faster (기준선 갱신 고려)"
+        else:
+            verdict = "ok"
+        lines.append(f"{c.stage:<12} {c.baseline * 1000:>9.2f}ms {c.current * 1000:>9.2f}ms "
+                     f"{c.change:>+7.1%} {c.tolerance:>+6.0%}  {verdict}")
+    if baseline is not None and current is not None:
+        missing = sorted(set(baseline["stages"]) - set(current["stages"]))
+        added = sorted(set(current["stages"]) - set(baseline["stages"]))
+        if missing:
+            lines.append(f"기준선에만 있는 단계: {', '.join(missing)}")
+        if added:
+            lines.append(f"기준선에 없는 새 단계: {', '.join(added)}")
+        base_env, env = baseline.get("environment", {}), current.get("environment", {})
+        changed = [key for key in ("machine", "cpu_count", "python", "pymupdf") if base_env.get(key) != env.get(key)]
+        if changed:
+            lines.append("주의: 기준선과 실행 환경이 다릅니다 ("
+                         + ", ".join(f"{key}: {base_env.get(key)} -> {env.get(key)}" for key in changed)
+                         + "). 속도 차이는 보정값으로 환산하지만, 라이브러리 버전 차이는 환산되지 않습니다.")
+    return "\n".join(lines)
+
+
+def load_baseline(path=BASELINE_PATH):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def workload_from_baseline(baseline):
+    spec = dict(baseline["workload"])
+    for key in ("variants", "shift"):
+        if key in spec:
+            spec[key] = tuple(spec[key])
+    return CorpusSpec(**spec)
+
+
+def check(baseline_path=BASELINE_PATH, trials=None, tolerance=None, work_dir=None):
+    """기준선의 작업량으로 측정하여 (통과 여부, 보고서)를 반환합니다."""
+    baseline = load_baseline(baseline_path)
+    with tempfile.TemporaryDirectory(prefix="pdfdiff-regression-") as tmp:
+        current = run_workload(
+            work_dir or tmp, workload_from_baseline(baseline), trials or baseline.get("trials", DEFAULT_TRIALS)
+        )
+    baseline = scale_baseline(baseline, current.get("calibration"))
+    comparisons = compare(baseline, current, tolerance)
+    report = format_report(comparisons, baseline, current)
+    return not any(c.regressed for c in comparisons), report
+
+
+def update(baseline_path=BASELINE_PATH, trials=DEFAULT_TRIALS, work_dir=None):
+    """현재 코드로 기준선을 다시 측정해 저장합니다 (단계별 허용 범위 설정은 유지)."""
+    tolerances = {"default": DEFAULT_TOLERANCE}
+    if os.path.exists(baseline_path):
+        tolerances = load_baseline(baseline_path).get("tolerances", tolerances)
+    with tempfile.TemporaryDirectory(prefix="pdfdiff-regression-") as tmp:
+        result = run_workload(work_dir or tmp, WORKLOAD, trials)
+    result["tolerances"] = tolerances
+    os.makedirs(os.path.dirname(baseline_path), exist_ok=True)
+    with open(baseline_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="검증 파이프라인 성능 회귀 검사")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    check_parser = sub.add_parser("check", help="기준선과 비교 (회귀 시 종료 코드 1)")
+    check_parser.add_argument("--baseline", default=BASELINE_PATH)
+    check_parser.add_argument("--trials", type=int, default=None, help="반복 횟수 (기본: 기준선과 같게)")
+    check_parser.add_argument("--tolerance", type=float, default=None, help="모든 단계의 허용 증가율 (예: 0.3)")
+    check_parser.add_argument("--work-dir", default=None)
+
+    update_parser = sub.add_parser("update", help="기준선 다시 측정하여 저장")
+    update_parser.add_argument("--baseline", default=BASELINE_PATH)
+    update_parser.add_argument("--trials", type=int, default=DEFAULT_TRIALS)
+    update_parser.add_argument("--work-dir", default=None)
+
+    args = parser.parse_args(argv)
+    if args.command == "update":
+        result = update(args.baseline, args.trials, args.work_dir)
+        stages = ", ".join(f"{stage} {seconds * 1000:.2f}ms" for stage, seconds in result["stages"].items())
+        print(f"기준선 저장: {os.path.abspath(args.baseline)}\n  {stages}")
+        return 0
+
+    passed, report = check(args.baseline, args.trials, args.tolerance, args.work_dir)
+    print(report)
+    print("성능 회귀 없음" if passed else "성능 회귀 발견: 위 표의 REGRESSED 단계를 확인하세요")
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+# 파일 경로: benchmarks/run_benchmarks.py
+"""
+Throughput Benchmarks
+합성 코퍼스로 ValidationService.validate_document와 '폴더' 모드 일괄 검증의 처리량을 측정합니다.
+GUI, 네트워크, GPU 없이 CPU만으로 실행되며 결과는 JSON으로 저장됩니다.
+
+측정 항목 (시나리오별):
+    docs_per_second   초당 문서 수
+    roi_latency_ms    ROI 하나 검증 시간의 백분위 (p50/p90/p99/max)
+    stage_seconds     단계별(render/alignment/anchor/crop_resize/contour/ocr) 처리 시간 합계
+    peak_rss_mb       시나리오 실행 중 최대 RSS
+
+사용 예:
+    python -m benchmarks.run_benchmarks --pages 2 --rois 10 --docs 5 --output benchmark_results.json
+    python -m benchmarks.run_benchmarks --variants filled scanned --no-folder
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import tempfile
+import threading
+import time
+from collections import Counter
+
+import fitz
+import numpy as np
+
+from benchmarks.corpus import CorpusSpec, VARIANTS, build_corpus
+from shared.constants import TIMING_STAGES
+from shared.utils import PerformanceUtils
+
+RSS_SAMPLE_INTERVAL = 0.02  # 초
+
+
+class _TimedVision:
+    """ValidationVisionService를 감싸 validate_roi 호출 시간과 결과를 기록 (나머지 메서드는 그대로 위임)"""
+
+    def __init__(self, vision):
+        self._vision = vision
+        self.latencies = []
+        self.results = []  # ValidationService가 나중에 더하는 페이지 정렬 시간까지 반영되도록 참조를 보관
+
+    def validate_roi(self, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            result = self._vision.validate_roi(*args, **kwargs)
+            self.results.append(result)
+            return result
+        finally:
+            self.latencies.append(time.perf_counter() - started)
+
+    def reset(self):
+        self.latencies.clear()
+        self.results.clear()
+
+    def stage_seconds(self):
+        totals = Counter()
+        for result in self.results:
+            totals.update(result.get("timings", {}))
+        return {stage: round(totals[stage], 4) for stage in TIMING_STAGES if stage in totals}
+
+    def __getattr__(self, name):
+        return getattr(self._vision, name)
+
+
+class _PeakRssSampler:
+    """별도 스레드에서 RSS를 주기적으로 읽어 최댓값을 기록"""
+
+    def __init__(self, interval=RSS_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.peak_mb = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+
+    def __enter__(self):
+        self.peak_mb = PerformanceUtils.get_memory_usage()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak_mb = max(self.peak_mb, PerformanceUtils.get_memory_usage())
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak_mb = max(self.peak_mb, PerformanceUtils.get_memory_usage())
+
+
+@contextlib.contextmanager
+def _working_directory(path):
+    """'폴더' 모드는 현재 디렉터리의 output/ 아래에 결과 PDF를 쓰므로 코퍼스 디렉터리로 옮겨 실행"""
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def percentiles_ms(latencies):
+    if not latencies:
+        return {"p50": None, "p90": None, "p99": None, "max": None}
+    values = np.asarray(latencies) * 1000.0
+    return {
+        "p50": round(float(np.percentile(values, 50)), 3),
+        "p90": round(float(np.percentile(values, 90)), 3),
+        "p99": round(float(np.percentile(values, 99)), 3),
+        "max": round(float(values.max()), 3),
+    }
+
+
+def _scenario_result(name, documents, elapsed, vision, peak_rss_mb, statuses):
+    return {
+        "scenario": name,
+        "documents": documents,
+        "rois": len(vision.latencies),
+        "seconds": round(elapsed, 4),
+        "docs_per_second": round(documents / elapsed, 3) if elapsed > 0 else None,
+        "roi_latency_ms": percentiles_ms(vision.latencies),
+        "stage_seconds": vision.stage_seconds(),
+        "peak_rss_mb": round(peak_rss_mb, 1),
+        "statuses": dict(statuses),
+    }
+
+
+def _new_service(max_workers):
+    from domain.services.validation_service import ValidationService
+    from infrastructure.repositories.file_document_repository import FileDocumentRepository
+    from infrastructure.services.validation_vision_service import ValidationVisionService
+
+    vision = _TimedVision(ValidationVisionService())
+    return ValidationService(FileDocumentRepository(), vision, max_workers=max_workers), vision
+
+
+def bench_validate_document(corpus, variant, max_workers, warmup=True):
+    """변형 하나의 문서들을 차례로 validate_document에 넣어 측정"""
+    service, vision = _new_service(max_workers)
+    paths = corpus.documents[variant]
+    if warmup and paths:
+        service.validate_document(corpus.template, paths[0])
+        vision.reset()
+
+    statuses = Counter()
+    with _PeakRssSampler() as rss:
+        started = time.perf_counter()
+        for path in paths:
+            for result in service.validate_document(corpus.template, path):
+                statuses[result['status']] += 1
+        elapsed = time.perf_counter() - started
+    return _scenario_result(f"validate_document/{variant}", len(paths), elapsed, vision, rss.peak_mb, statuses)
+
+
+def bench_folder_mode(corpus, max_workers, max_concurrent=None):
+    """ValidationController의 '폴더' 모드 일괄 검증(BatchScheduler 포함)을 코퍼스 전체에 대해 측정"""
+    from app.controllers.validation_controller import ValidationController
+    from app.controllers.validation_job import ValidationJob
+    from domain.services.batch_scheduler import BatchScheduler
+    from infrastructure.repositories.file_document_repository import FileDocumentRepository
+
+    service, vision = _new_service(max_workers)
+    scheduler_kwargs = {"max_concurrent": max_concurrent} if max_concurrent else {}
+    controller = ValidationController(
+        view=None, validation_service=service, template_service=None,
+        batch_scheduler=BatchScheduler(FileDocumentRepository(), **scheduler_kwargs)
+    )
+    job = ValidationJob(controller._folder_job)
+    documents = len(os.listdir(corpus.documents_dir))
+
+    with _working_directory(corpus.root), _PeakRssSampler() as rss:
+        started = time.perf_counter()
+        controller._folder_job(job, corpus.template, corpus.documents_dir, corpus.template_name)
+        elapsed = time.perf_counter() - started
+
+    statuses = Counter(
+        payload[0].status for kind, payload in job.drain(job.events.qsize()) if kind == "file_result"
+    )
+    return _scenario_result("folder_mode", documents, elapsed, vision, rss.peak_mb, statuses)
+
+
+def environment_info():
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "pymupdf": fitz.VersionBind,
+        "numpy": np.__version__,
+    }
+
+
+def run(spec, work_dir, max_workers, folder=True, max_concurrent=None, log=print):
+    """코퍼스를 만들고 모든 시나리오를 실행하여 결과 dict를 반환합니다."""
+    started = time.perf_counter()
+    corpus = build_corpus(work_dir, spec)
+    log(f"코퍼스 생성: {len(corpus.all_documents())}개 문서 ({time.perf_counter() - started:.2f}s) -> {corpus.root}")
+
+    scenarios = []
+    for variant in spec.variants:
+        scenarios.append(bench_validate_document(corpus, variant, max_workers))
+        log(_format_row(scenarios[-1]))
+    if folder:
+        scenarios.append(bench_folder_mode(corpus, max_workers, max_concurrent))
+        log(_format_row(scenarios[-1]))
+
+    return {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": environment_info(),
+        "corpus": {
+            "pages": spec.pages, "rois_per_page": spec.rois_per_page,
+            "documents_per_variant": spec.documents_per_variant, "method": spec.method, "seed": spec.seed,
+        },
+        "max_workers": max_workers,
+        "scenarios": scenarios,
+    }
+
+
+def _format_row(result):
+    latency = result["roi_latency_ms"]
+    return (f"{result['scenario']:<28} {result['docs_per_second'] or 0:>8.2f} docs/s  "
+            f"ROI p50 {latency['p50'] or 0:>7.2f}ms  p99 {latency['p99'] or 0:>7.2f}ms  "
+            f"peak RSS {result['peak_rss_mb']:>7.1f}MB")
+
+
+def main(argv=None):
+    from shared.constants import ROI_VALIDATION_WORKERS
+
+    parser = argparse.ArgumentParser(description="합성 코퍼스 기반 검증 처리량 벤치마크")
+    parser.add_argument("--pages", type=int, default=2, help="문서당 페이지 수")
+    parser.add_argument("--rois", type=int, default=10, help="페이지당 ROI 수")
+    parser.add_argument("--docs", type=int, default=5, help="변형별 문서 수")
+    parser.add_argument("--variants", nargs="+", choices=VARIANTS, default=list(VARIANTS))
+    parser.add_argument("--method", choices=("contour", "ocr"), default="contour",
+                        help="ROI 검증 방식 (ocr은 Tesseract 필요)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=ROI_VALIDATION_WORKERS, help="문서 내 페이지 병렬 처리 수")
+    parser.add_argument("--max-concurrent", type=int, default=None, help="'폴더' 모드 동시 처리 문서 수")
+    parser.add_argument("--no-folder", action="store_true", help="'폴더' 모드 측정 생략")
+    parser.add_argument("--work-dir", default=None, help="코퍼스 디렉터리 (기본: 임시 디렉터리)")
+    parser.add_argument("--output", default="benchmark_results.json", help="결과 JSON 경로 ('-'이면 표준 출력)")
+    args = parser.parse_args(argv)
+
+    spec = CorpusSpec(
+        pages=args.pages, rois_per_page=args.rois, documents_per_variant=args.docs,
+        variants=tuple(args.variants), method=args.method, seed=args.seed
+    )
+    with contextlib.ExitStack() as stack:
+        work_dir = args.work_dir or stack.enter_context(tempfile.TemporaryDirectory(prefix="pdfdiff-bench-"))
+        log = print if args.output != "-" else (lambda *a: None)
+        results = run(spec, work_dir, args.workers, folder=not args.no_folder,
+                      max_concurrent=args.max_concurrent, log=log)
+
+    if args.output == "-":
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    else:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {os.path.abspath(args.output)}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
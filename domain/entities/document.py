@@ -2,10 +2,18 @@
 Document Entity
 PDF 문서 정보
 """
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
+from enum import Enum
+
+
+class PageKind(Enum):
+    """페이지 유형 (스캔/디지털 판별 결과)"""
+    DIGITAL = "digital"
+    SCANNED = "scanned"
+    MIXED = "mixed"
 
 
 @dataclass
@@ -79,3 +87,69 @@ class Document:
             return str(Path(self.file_path).relative_to(base_path))
         except ValueError:
             return self.file_path
+
+
+@dataclass
+class DocumentProbe:
+    """
+    문서를 렌더링하지 않고 읽은 메타데이터 (메모리 사용량 추정용)
+    
+    Attributes:
+        file_path: 파일 경로
+        page_count: 페이지 수
+        page_sizes: 페이지별 (너비, 높이) - PDF 포인트 단위
+        file_size: 파일 크기 (bytes)
+    """
+    file_path: str
+    page_count: int = 0
+    page_sizes: List[Tuple[float, float]] = field(default_factory=list)
+    file_size: int = 0
+    
+    def raster_bytes(self, scale: float, channels: int) -> List[int]:
+        """페이지별 래스터 이미지 크기 (bytes) 추정"""
+        return [int(w * scale) * int(h * scale) * channels for w, h in self.page_sizes]
+
+
+@dataclass
+class PageClassification:
+    """
+    페이지 단위 스캔/디지털 판별 결과
+    
+    Attributes:
+        page: 페이지 번호 (0부터 시작)
+        kind: 페이지 유형
+        image_coverage: 페이지 면적 대비 이미지 면적 비율 (0.0 ~ 1.0)
+        text_span_count: 텍스트 span 개수
+        font_count: 페이지가 참조하는 폰트 개수
+    """
+    page: int
+    kind: PageKind
+    image_coverage: float = 0.0
+    text_span_count: int = 0
+    font_count: int = 0
+    
+    @property
+    def is_scanned(self) -> bool:
+        """래스터 처리가 필요한 페이지 여부 (스캔 또는 혼합)"""
+        return self.kind in (PageKind.SCANNED, PageKind.MIXED)
+    
+    def to_dict(self) -> dict:
+        """딕셔너리로 변환 (저장용)"""
+        return {
+            "page": self.page,
+            "kind": self.kind.value,
+            "image_coverage": round(self.image_coverage, 4),
+            "text_span_count": self.text_span_count,
+            "font_count": self.font_count
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PageClassification':
+        """딕셔너리에서 판별 결과 생성"""
+        return cls(
+            page=data["page"],
+            kind=PageKind(data["kind"]),
+            image_coverage=data.get("image_coverage", 0.0),
+            text_span_count=data.get("text_span_count", 0),
+            font_count=data.get("font_count", 0)
+        )
@@ -8,7 +8,8 @@ from enum import Enum
 from datetime import datetime
 
 from domain.entities.roi import ROI
-from domain.entities.document import Document
+from domain.entities.document import Document, PageClassification
+from shared.constants import TIMING_STAGES
 
 
 class ValidationStatus(Enum):
@@ -45,6 +46,26 @@ class ROIValidationResult:
     def is_failure(self) -> bool:
         """실패 여부"""
         return self.status in [ValidationStatus.DEFICIENT, ValidationStatus.ERROR]
+    
+    @property
+    def stage_timings(self) -> Dict[str, float]:
+        """단계별 처리 시간 (초)"""
+        return self.details.get("timings", {})
+    
+    @classmethod
+    def from_dict(cls, result: Dict[str, Any]) -> "ROIValidationResult":
+        """검증 파이프라인(ValidationService)이 반환하는 결과 딕셔너리로부터 생성"""
+        details = {
+            key: value for key, value in result.items()
+            if key not in ("field_name", "status", "message", "processing_time")
+        }
+        return cls(
+            roi_name=result["field_name"],
+            status=ValidationStatus(result["status"]),
+            message=result.get("message", ""),
+            details=details,
+            processing_time=result.get("processing_time")
+        )
 
 
 @dataclass
@@ -59,6 +80,7 @@ class ValidationResult:
         total_processing_time: 총 처리 시간
         validated_at: 검증 수행 시간
         debug_info: 디버깅 정보
+        page_classifications: 페이지별 스캔/디지털 판별 결과
     """
     document: Document
     template_name: str
@@ -66,12 +88,24 @@ class ValidationResult:
     total_processing_time: Optional[float] = None
     validated_at: Optional[datetime] = None
     debug_info: Optional[Dict[str, Any]] = None
+    page_classifications: Dict[int, PageClassification] = field(default_factory=dict)
     
     def __post_init__(self):
         """기본값 설정"""
         if not self.validated_at:
             self.validated_at = datetime.now()
     
+    @classmethod
+    def from_results(cls, document: Document, template_name: str, results: List[Dict[str, Any]],
+                     total_processing_time: Optional[float] = None) -> "ValidationResult":
+        """ValidationService.validate_document의 결과 목록으로부터 문서 단위 결과를 생성"""
+        return cls(
+            document=document,
+            template_name=template_name,
+            roi_results=[ROIValidationResult.from_dict(result) for result in results],
+            total_processing_time=total_processing_time
+        )
+    
     @property
     def total_count(self) -> int:
         """총 ROI 개수"""
@@ -120,6 +154,37 @@ class ValidationResult:
                 return result
         return None
     
+    @property
+    def scanned_page_count(self) -> int:
+        """스캔(또는 혼합) 페이지 개수"""
+        return sum(1 for c in self.page_classifications.values() if c.is_scanned)
+    
+    @property
+    def has_scanned_pages(self) -> bool:
+        """스캔(또는 혼합) 페이지가 있는지 여부 (페이지 판별 결과가 없으면 ROI 결과의 page_kind로 판단)"""
+        if self.page_classifications:
+            return self.scanned_page_count > 0
+        return any(r.details.get("page_kind") in ("scanned", "mixed") for r in self.roi_results)
+    
+    @property
+    def roi_processing_time(self) -> float:
+        """ROI별 처리 시간의 합 (병렬 처리 시 총 처리 시간보다 클 수 있음)"""
+        return sum(r.processing_time or 0.0 for r in self.roi_results)
+    
+    def get_stage_timings(self) -> Dict[str, float]:
+        """단계별 처리 시간 합계 (초), TIMING_STAGES 순서"""
+        totals: Dict[str, float] = {}
+        for result in self.roi_results:
+            for stage, seconds in result.stage_timings.items():
+                totals[stage] = totals.get(stage, 0.0) + seconds
+        ordered = [stage for stage in TIMING_STAGES if stage in totals] + sorted(set(totals) - set(TIMING_STAGES))
+        return {stage: round(totals[stage], 4) for stage in ordered}
+    
+    def get_slowest_rois(self, limit: int = 3) -> List[ROIValidationResult]:
+        """처리 시간이 가장 긴 ROI들"""
+        timed = [r for r in self.roi_results if r.processing_time is not None]
+        return sorted(timed, key=lambda r: r.processing_time, reverse=True)[:limit]
+    
     def add_roi_result(self, result: ROIValidationResult) -> None:
         """ROI 결과 추가"""
         self.roi_results.append(result)
@@ -138,7 +203,10 @@ class ValidationResult:
             "success_rate": round(self.success_rate * 100, 1),
             "is_overall_success": self.is_overall_success,
             "processing_time": self.total_processing_time,
-            "failed_rois": self.get_failed_roi_names()
+            "roi_processing_time": round(self.roi_processing_time, 4),
+            "stage_timings": self.get_stage_timings(),
+            "failed_rois": self.get_failed_roi_names(),
+            "scanned_page_count": self.scanned_page_count
         }
     
     def to_dict(self) -> Dict[str, Any]:
@@ -155,5 +223,8 @@ class ValidationResult:
                 }
                 for result in self.roi_results
             ],
+            "page_classifications": [
+                c.to_dict() for _, c in sorted(self.page_classifications.items())
+            ],
             "debug_info": self.debug_info
         }
@@ -3,10 +3,10 @@ Document Repository Interface
 문서 접근 계층 인터페이스
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from pathlib import Path
 
-from domain.entities.document import Document
+from domain.entities.document import Document, DocumentProbe, PageClassification
 
 
 class DocumentRepository(ABC):
@@ -36,3 +36,29 @@ class DocumentRepository(ABC):
     def get_file_info(self, file_path: str) -> Optional[dict]:
         """파일 메타데이터 조회"""
         pass
+    
+    @abstractmethod
+    def load_pdf(self, file_path: str, page_range: Optional[range] = None):
+        """PDF 문서 열기 (fitz.Document 반환). page_range가 있으면 그 페이지만 0번부터 다시 번호를 매겨 엽니다."""
+        pass
+    
+    @abstractmethod
+    def load_pdf_from_bytes(self, data: bytes):
+        """메모리상의 PDF 바이트로 문서 열기"""
+        pass
+    
+    @abstractmethod
+    def get_document_hash(self, file_path: str) -> str:
+        """문서 내용 해시 조회"""
+        pass
+    
+    @abstractmethod
+    def probe_document(self, file_path: str, page_range: Optional[range] = None) -> DocumentProbe:
+        """렌더링 없이 페이지 수/크기 등 메타데이터만 조회 (page_range가 있으면 그 구간만)"""
+        pass
+    
+    @abstractmethod
+    def classify_pages(self, file_path: str, pages: Optional[Iterable[int]] = None,
+                       doc=None, page_range: Optional[range] = None) -> Dict[int, PageClassification]:
+        """페이지별 스캔/디지털 판별 (문서 해시 + 원본 페이지 단위로 캐시)"""
+        pass
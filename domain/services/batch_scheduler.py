@@ -0,0 +1,152 @@
+# 파일 경로: domain/services/batch_scheduler.py
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from shared.constants import (
+    BATCH_MEMORY_BUDGET_MB, BATCH_RENDER_CHANNELS, BATCH_DOCUMENT_OVERHEAD_MB, BATCH_ADMISSION_POLL_SECONDS,
+    MAX_CONCURRENT_VALIDATIONS, LAYOUT_DETECTION_SCALE, ROI_VALIDATION_WORKERS
+)
+from shared.utils import PerformanceUtils
+from shared.metrics import registry
+from shared.tracing import tracer
+
+_PENDING = registry.gauge("batch_pending_documents", "일괄 검증 대기 중 문서 수")
+_RUNNING = registry.gauge("batch_running_documents", "일괄 검증 처리 중 문서 수")
+_STREAMING = registry.counter("batch_streaming_documents_total", "스트리밍 모드로 투입된 문서 수")
+
+# Domain Layer (Service)
+# 역할: 일괄 검증 시 문서별 래스터 메모리 사용량을 미리 추정하고,
+#       예상 RSS가 예산을 넘지 않는 범위에서만 다음 문서를 투입(admission)합니다.
+#       - 큰 문서가 몰리면 동시 처리 수를 자동으로 낮춥니다.
+#       - 혼자서도 예산을 넘는 거대한 문서는 페이지를 하나씩 처리하는 스트리밍 모드로 돌립니다.
+
+
+@dataclass
+class DocumentAdmission:
+    """
+    문서 하나의 메모리 추정 및 실행 방식
+
+    Attributes:
+        index: 입력 목록에서의 순번 (0부터 시작)
+        file_path: 파일 경로
+        estimated_mb: 처리 중 최대 추가 메모리 추정치 (MB)
+        streaming: 페이지를 하나씩 처리할지 여부
+        page_count: 페이지 수 (메타데이터를 읽지 못했으면 0)
+        page_range: 여러 양식이 이어 붙은 묶음 파일에서 이 항목이 맡은 페이지 구간 (파일 전체면 None)
+    """
+    index: int
+    file_path: str
+    estimated_mb: float
+    streaming: bool = False
+    page_count: int = 0
+    page_range: Optional[range] = None
+
+
+@dataclass
+class BatchOutcome:
+    """스케줄러가 완료 순서대로 돌려주는 문서별 처리 결과 (result 또는 error 중 하나)"""
+    admission: DocumentAdmission
+    result: Any = None
+    error: Optional[BaseException] = None
+
+
+class BatchScheduler:
+    def __init__(self, document_repository, memory_budget_mb=BATCH_MEMORY_BUDGET_MB,
+                 max_concurrent=MAX_CONCURRENT_VALIDATIONS, render_scale=LAYOUT_DETECTION_SCALE,
+                 channels=BATCH_RENDER_CHANNELS, page_workers=ROI_VALIDATION_WORKERS,
+                 memory_probe=PerformanceUtils.get_memory_usage):
+        self.doc_repo = document_repository
+        self.memory_budget_mb = memory_budget_mb
+        self.max_concurrent = max(1, max_concurrent)
+        self.render_scale = render_scale
+        self.channels = channels
+        self.page_workers = max(1, page_workers)
+        self.memory_probe = memory_probe
+        self._baseline_mb = 0.0
+
+    def estimate(self, index, file_path, baseline_mb=None, page_range=None):
+        """
+        페이지 크기 × 배율² × 채널 수로 문서 처리 중 최대 메모리를 추정합니다.
+        페이지마다 원본/대상 두 장을 래스터화하고, 페이지 병렬 처리 시에는 가장 큰 페이지들이 동시에 올라간다고 봅니다.
+        page_range가 있으면 그 구간의 페이지만 봅니다.
+        """
+        if baseline_mb is None:
+            baseline_mb = self.memory_probe()
+        try:
+            probe = self.doc_repo.probe_document(file_path, page_range)
+        except Exception:
+            # 메타데이터를 읽지 못하는 파일은 실제 처리 단계에서 오류로 보고되도록 기본값으로 투입
+            return DocumentAdmission(index, file_path, BATCH_DOCUMENT_OVERHEAD_MB, page_range=page_range)
+
+        page_bytes = sorted(probe.raster_bytes(self.render_scale, self.channels), reverse=True)
+        to_mb = lambda b: 2 * b / (1024 * 1024) + BATCH_DOCUMENT_OVERHEAD_MB
+        parallel_mb = to_mb(sum(page_bytes[:self.page_workers]))
+        streaming_mb = to_mb(page_bytes[0] if page_bytes else 0)
+
+        if baseline_mb + parallel_mb > self.memory_budget_mb and streaming_mb < parallel_mb:
+            return DocumentAdmission(index, file_path, streaming_mb, streaming=True, page_count=probe.page_count,
+                                     page_range=page_range)
+        return DocumentAdmission(index, file_path, parallel_mb, page_count=probe.page_count, page_range=page_range)
+
+    def run(self, file_paths, process, checkpoint=None, page_ranges=None):
+        """
+        process(admission)를 스레드 풀에서 실행하고 BatchOutcome을 완료 순서대로 생성합니다.
+        문서는 입력 순서대로 투입되며, 예상 RSS가 예산을 넘으면 실행 중인 문서가 끝날 때까지 기다립니다.
+        checkpoint가 주어지면 새 문서를 투입하기 직전에 호출됩니다 (일시정지/취소).
+        page_ranges가 주어지면 file_paths와 같은 순서의 페이지 구간 목록으로, 같은 파일을 구간별로 나눠 투입합니다.
+        """
+        self._baseline_mb = self.memory_probe()
+        if page_ranges is None:
+            page_ranges = [None] * len(file_paths)
+        pending = list(enumerate(zip(file_paths, page_ranges)))
+        running = {}  # future -> DocumentAdmission
+        next_admission = None
+
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix="batch-document")
+        try:
+            while pending or running or next_admission:
+                # 1. 예산이 허락하는 만큼 입력 순서대로 투입
+                while pending or next_admission:
+                    if next_admission is None:
+                        index, (file_path, page_range) = pending.pop(0)
+                        next_admission = self.estimate(index, file_path, self._baseline_mb, page_range)
+                    if not self._can_admit(next_admission, running.values()):
+                        break
+                    if checkpoint:
+                        checkpoint()
+                    future = executor.submit(process, next_admission)
+                    running[future] = next_admission
+                    if next_admission.streaming:
+                        _STREAMING.inc()
+                    next_admission = None
+                _PENDING.set(len(pending) + (next_admission is not None))
+                _RUNNING.set(len(running))
+                tracer.counter("batch_documents", running=len(running),
+                               pending=len(pending) + (next_admission is not None))
+
+                # 2. 하나 이상 끝날 때까지 대기 (메모리 여유가 생겼는지 주기적으로 재확인)
+                done, _ = wait(list(running), timeout=BATCH_ADMISSION_POLL_SECONDS, return_when=FIRST_COMPLETED)
+                for future in done:
+                    admission = running.pop(future)
+                    _RUNNING.set(len(running))
+                    error = future.exception()
+                    yield BatchOutcome(admission, None if error else future.result(), error)
+        finally:
+            for future in running:
+                future.cancel()
+            executor.shutdown(wait=True)
+            _PENDING.set(0)
+            _RUNNING.set(0)
+
+    def _can_admit(self, admission, running):
+        running = list(running)
+        if not running:
+            return True  # 실행 중인 문서가 없으면 항상 진행 (예산을 넘는 문서는 이미 스트리밍 모드)
+        if len(running) >= self.max_concurrent:
+            return False
+
+        # 아직 메모리를 다 쓰지 않은 실행 중 문서도 있으므로 실측 RSS와 예약량 중 큰 값을 기준으로 판단
+        reserved = sum(a.estimated_mb for a in running)
+        projected = max(self.memory_probe(), self._baseline_mb + reserved) + admission.estimated_mb
+        return projected <= self.memory_budget_mb
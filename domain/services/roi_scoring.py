@@ -0,0 +1,132 @@
+# 파일 경로: domain/services/roi_scoring.py
+"""
+ROI Scoring
+ROI 하나의 측정값(measurements)을 템플릿 임계값과 비교해 검증 상태를 정합니다.
+
+렌더링/정렬/OCR/윤곽 분석으로 얻는 측정값과 그 측정값을 판정하는 비교를 분리해 두어,
+검증 파이프라인(ValidationVisionService)과 완료된 일괄 검증의 재채점(batch_rescorer)이
+같은 판정을 씁니다. 임계값만 바뀌면 PDF를 다시 처리하지 않고 저장된 측정값으로 다시 판정할 수 있습니다.
+
+Contour ROI의 잉크 면적 판정은 CONTOUR_SCORING_ENABLED(기본 꺼짐)로 켭니다. 꺼져 있으면 이전처럼 항상 OK이고
+측정값만 남으므로, 재채점 명령의 --contour-scoring으로 켰을 때 바뀔 문서를 먼저 확인하고 임계값을 맞출 수 있습니다.
+
+측정값 (ValidationVisionService가 결과의 "measurements"에 기록):
+    method, threshold        측정 당시의 검증 방식과 임계값
+    char_count, text         OCR로 읽은 글자 수와 (공백/기호를 뺀) 텍스트 (method가 ocr일 때만)
+    ink_density              ROI에서 잉크(어두운 픽셀)가 차지하는 비율
+    contour_count            양식에 없던 잉크 덩어리 수 (양식 괘선 제외)
+    contour_area             그 덩어리들의 전체 면적 (렌더링 픽셀)
+    largest_contour          가장 큰 덩어리의 면적 (렌더링 픽셀)
+    rotation, offset         페이지 기울기 보정 각도(도)와 ROI 좌표 이동량 (pt)
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from shared.constants import CONTOUR_SCORING_ENABLED, DEFAULT_CONTOUR_THRESHOLD, DEFAULT_OCR_THRESHOLD
+
+# 검증 방식별 판정에 쓰는 측정값 (없으면 그 방식으로 재채점할 수 없음)
+SCORED_MEASUREMENT = {"ocr": "char_count", "contour": "contour_area"}
+
+
+def default_threshold(method: str):
+    """ROI에 임계값이 없을 때 쓰는 검증 방식별 기본 임계값"""
+    return DEFAULT_CONTOUR_THRESHOLD if method == "contour" else DEFAULT_OCR_THRESHOLD
+
+
+def score_roi(method: str, threshold, measurements: dict,
+              contour_scoring: bool = CONTOUR_SCORING_ENABLED) -> Optional[Tuple[str, str]]:
+    """
+    측정값을 임계값과 비교하여 (상태, 메시지)를 반환합니다.
+    판정에 필요한 측정값이 없으면 None (예: 측정 당시 OCR을 하지 않은 ROI를 OCR 방식으로 바꾼 경우).
+    contour_scoring이 꺼져 있으면 Contour ROI는 측정값과 관계없이 OK입니다.
+    """
+    if method == "contour" and not contour_scoring:
+        return "OK", (f"Contour not scored (area {measurements.get('contour_area')}px, "
+                      f"{measurements.get('contour_count', 0)} marks)")
+    key = SCORED_MEASUREMENT.get(method)
+    value = measurements.get(key) if key else None
+    if value is None:
+        return None
+    if method == "ocr":
+        if value < threshold:
+            return "DEFICIENT", f"OCR insufficient ({value} chars)"
+        return "OK", f"OCR OK: '{measurements.get('text', '')[:20]}...'"
+    if value < threshold:
+        return "DEFICIENT", f"Contour insufficient (area {value}px)"
+    return "OK", f"Contour OK (area {value}px, {measurements.get('contour_count', 0)} marks)"
+
+
+def document_status(statuses) -> str:
+    """ROI 상태 목록으로 문서 상태를 정합니다 (미흡 항목이 모두 ERROR면 ERROR)."""
+    failed = [status for status in statuses if status != "OK"]
+    if not failed:
+        return "OK"
+    return "ERROR" if all(status == "ERROR" for status in failed) else "DEFICIENT"
+
+
+@dataclass
+class ROIRescore:
+    """재채점으로 상태가 바뀐 ROI 하나"""
+    roi_name: str
+    old_status: str
+    new_status: str
+    method: str
+    value: float
+    threshold: float
+    old_threshold: Optional[float] = None
+
+
+@dataclass
+class DocumentRescore:
+    """
+    문서 하나의 재채점 결과
+
+    Attributes:
+        old_status: 검증 당시 문서 상태
+        status: 새 임계값으로 다시 판정한 문서 상태
+        changes: 상태가 바뀐 ROI
+        unmeasured: 측정값이 없어 검증 당시 상태를 그대로 쓴 ROI (새로 추가되었거나 방식이 바뀐 ROI 등)
+        removed: 템플릿에서 지워져 판정에서 뺀 ROI
+    """
+    old_status: str
+    status: str
+    changes: List[ROIRescore] = field(default_factory=list)
+    unmeasured: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    @property
+    def flipped(self) -> bool:
+        return self.status != self.old_status
+
+
+def rescore_document(old_status: str, measurements: Dict[str, dict], rois: Dict[str, dict],
+                     overrides: Optional[Dict[str, float]] = None,
+                     contour_scoring: bool = CONTOUR_SCORING_ENABLED) -> DocumentRescore:
+    """
+    저장된 ROI별 측정값(measurements: ROI 이름 -> 측정값)을 템플릿 ROI 설정(rois)의 임계값으로 다시 판정합니다.
+    overrides(ROI 이름 -> 임계값)가 있으면 템플릿 값 대신 씁니다 (가정 분석용).
+    측정 당시 ERROR였던 ROI는 측정값이 없으므로 ERROR로 남습니다.
+    """
+    overrides = overrides or {}
+    statuses, changes, unmeasured = [], [], []
+    removed = [name for name in measurements if name not in rois]
+    for name, roi in rois.items():
+        measured = measurements.get(name)
+        if measured is None:
+            unmeasured.append(name)
+            continue
+        method = roi.get("method", "ocr")
+        threshold = overrides.get(name, roi.get("threshold", default_threshold(method)))
+        old = measured.get("status", "OK")
+        scored = score_roi(method, threshold, measured, contour_scoring) if old != "ERROR" else None
+        if scored is None:
+            if old != "ERROR":
+                unmeasured.append(name)
+            statuses.append(old)
+            continue
+        status = scored[0]
+        statuses.append(status)
+        if status != old:
+            changes.append(ROIRescore(name, old, status, method, measured[SCORED_MEASUREMENT[method]], threshold,
+                                      measured.get("threshold")))
+    return DocumentRescore(old_status, document_status(statuses), changes, unmeasured, removed)
@@ -1,31 +1,274 @@
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import fitz # PyMuPDF
 from PIL import Image
 
+from shared.constants import ROI_VALIDATION_WORKERS, REVIEW_SOURCE_LINK_HEIGHT
+from shared.exceptions import ComputerVisionServiceError
+from shared.metrics import registry
+from shared.tracing import tracer, document_label
+
+_DOCUMENTS = registry.counter("validation_documents_total", "검증을 마친 문서 수")
+_DOCUMENT_SECONDS = registry.histogram("validation_document_seconds", "문서 하나의 검증 시간 (초)")
+_ROIS = registry.counter("validation_rois_total", "검증한 ROI 수", labels=("status",))
+_STAGE_SECONDS = registry.histogram("validation_stage_seconds", "ROI 검증 단계별 처리 시간 (초)", labels=("stage",))
+
+logger = logging.getLogger(__name__)
+
 class ValidationService:
-    def __init__(self, document_repository, vision_service):
+    def __init__(self, document_repository, vision_service, max_workers=ROI_VALIDATION_WORKERS,
+                 clock=time.perf_counter):
         self.doc_repo = document_repository
         self.vision = vision_service
+        self.max_workers = max(1, max_workers)
+        self.clock = clock # 페이지 정렬 시간 측정 시계 (VisionService의 단계별 시계와 맞춤)
 
-    def validate_document(self, template, target_pdf_path, progress_callback=None):
-        original_doc = self.doc_repo.load_pdf(template['original_pdf_path'])
-        target_doc = self.doc_repo.load_pdf(target_pdf_path)
+    def validate_document(self, template, target_pdf_path, progress_callback=None, checkpoint=None, streaming=False,
+                          page_range=None):
+        """
+        템플릿의 모든 ROI를 대상 문서에서 검증합니다.
+        ROI는 페이지 단위로 묶어 스레드 풀에서 병렬로 처리하며, fitz 문서는 스레드 간
+        공유가 안전하지 않으므로 작업 스레드마다 문서를 따로 엽니다.
+        progress_callback은 호출한 스레드에서 ROI가 완료되는 순서대로(개수는 단조 증가) 호출되고,
+        결과 목록은 템플릿의 ROI 순서를 유지합니다.
+        checkpoint가 주어지면 각 ROI 검증 직전에 호출되며, 일시정지 대기나
+        ValidationCancelledError 발생으로 작업을 중단할 수 있습니다.
+        streaming=True이면 페이지를 하나씩 순서대로 처리하여 메모리 사용량을 최소화합니다 (거대한 문서용).
+        page_range가 있으면 대상 문서의 그 구간(여러 양식이 이어 붙은 묶음의 한 양식)을 템플릿 0페이지부터에 대응시키고,
+        결과의 'page'는 구간 안의 번호, 'source_page'는 원본 묶음의 페이지 번호입니다.
+        """
+        started = time.perf_counter()
+        with tracer.span("document", document=document_label(target_pdf_path), streaming=streaming,
+                         first_page=page_range.start if page_range is not None else None):
+            original_path = template['original_pdf_path']
+            target_doc = self.doc_repo.load_pdf(target_pdf_path, page_range)
+            try:
+                rois = template['rois']
 
-        results = []
-        rois = template['rois']
+                # 대상 문서의 페이지 유형(스캔/디지털)을 판별하여 결과와 함께 저장
+                pages = {}
+                for field_name, roi_info in rois.items():
+                    pages.setdefault(roi_info.get('page', 0), []).append(field_name)
+                page_kinds = self.doc_repo.classify_pages(
+                    target_pdf_path, pages=pages.keys(), doc=target_doc, page_range=page_range
+                )
+
+                workers = 1 if streaming else min(self.max_workers, len(pages))
+                if workers <= 1:
+                    # 페이지가 하나뿐이면 스레드 없이 현재 스레드에서 처리
+                    page_results = self._validate_pages_inline(
+                        original_path, target_doc, pages, rois, page_kinds, progress_callback, checkpoint
+                    )
+                else:
+                    target_doc.close() # 작업 스레드마다 따로 열므로 미리 닫아 메모리 확보
+                    page_results = self._validate_pages_parallel(
+                        original_path, target_pdf_path, pages, rois, page_kinds,
+                        workers, progress_callback, checkpoint, page_range
+                    )
+            finally:
+                if not target_doc.is_closed:
+                    target_doc.close()
+
+        _DOCUMENTS.inc()
+        _DOCUMENT_SECONDS.observe(time.perf_counter() - started)
+        results = [page_results[field_name] for field_name in rois]
+        if page_range is not None:
+            for result in results:
+                if 0 <= result.get('page', 0) < len(page_range):
+                    result['source_page'] = page_range[result['page']]
+        return results
+
+    def _validate_pages_inline(self, original_path, target_doc, pages, rois, page_kinds, progress_callback, checkpoint):
+        """현재 스레드에서 페이지를 차례로 검증합니다. 원본 문서는 취소/오류로 중단되어도 닫습니다."""
         total = len(rois)
+        done = 0
 
-        for i, (field_name, roi_info) in enumerate(rois.items()):
+        def on_roi_done(field_name):
+            nonlocal done
+            done += 1
             if progress_callback:
-                progress_callback(f"'{field_name}' 검증 중...", i + 1, total)
+                progress_callback(f"'{field_name}' 검증 완료", done, total)
 
-            # 복잡한 이미지 처리와 분석은 Infrastructure의 VisionService에 위임
-            result = self.vision.validate_roi(original_doc, target_doc, field_name, roi_info)
-            results.append(result)
+        original_doc = self.doc_repo.load_pdf(original_path)
+        try:
+            page_results = {}
+            for page_num, names in pages.items():
+                page_results.update(self._validate_page(
+                    original_doc, target_doc, page_num, names, rois,
+                    page_kinds.get(page_num), checkpoint, on_roi_done
+                ))
+            return page_results
+        finally:
+            original_doc.close()
+
+    def _validate_pages_parallel(self, original_path, target_path, pages, rois, page_kinds,
+                                 workers, progress_callback, checkpoint, page_range=None):
+        """페이지별 작업을 스레드 풀에 제출하고, 완료된 ROI마다 호출 스레드에서 진행률을 보고합니다."""
+        local = threading.local()
+        opened_docs = []
+        opened_lock = threading.Lock()
+        done_queue = queue.Queue()
+
+        def thread_docs():
+            # 스레드마다 한 번만 문서를 열어 같은 스레드의 다음 페이지 작업에서 재사용
+            if not hasattr(local, 'docs'):
+                local.docs = (self.doc_repo.load_pdf(original_path), self.doc_repo.load_pdf(target_path, page_range))
+                with opened_lock:
+                    opened_docs.extend(local.docs)
+            return local.docs
+
+        def run_page(page_num, names):
+            original_doc, target_doc = thread_docs()
+            return self._validate_page(
+                original_doc, target_doc, page_num, names, rois,
+                page_kinds.get(page_num), checkpoint, done_queue.put
+            )
 
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="roi-validation")
+        futures = []
+        try:
+            futures = [executor.submit(run_page, page_num, names) for page_num, names in pages.items()]
+            done = 0
+            total = len(rois)
+            while done < total:
+                try:
+                    field_name = done_queue.get(timeout=0.1)
+                except queue.Empty:
+                    # 작업 중 예외(취소 포함)가 발생했다면 즉시 전달
+                    failed = next((f for f in futures if f.done() and f.exception()), None)
+                    if failed:
+                        raise failed.exception()
+                    continue
+                done += 1
+                if progress_callback:
+                    progress_callback(f"'{field_name}' 검증 완료", done, total)
+
+            page_results = {}
+            for future in futures:
+                page_results.update(future.result())
+            return page_results
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+            for doc in opened_docs:
+                doc.close()
+
+    def _validate_page(self, original_doc, target_doc, page_num, names, rois, page_kind, checkpoint, on_roi_done):
+        """
+        한 페이지에 속한 ROI들을 검증합니다. 레이아웃 보정은 페이지당 한 번만 계산하며,
+        그 시간은 해당 페이지 ROI들의 'alignment' 단계에 균등하게 나누어 더합니다.
+        """
+        document = document_label(target_doc.name)
+        started = self.clock()
+        with tracer.span("align_page", document=document, page=page_num,
+                         scanned=page_kind.is_scanned if page_kind else None):
+            layout, corrected = self._prepare_page_layout(original_doc, target_doc, page_num, rois, page_kind)
+        alignment_share = (self.clock() - started) / max(1, len(names))
+
+        results = {}
+        for field_name in names:
+            if checkpoint:
+                checkpoint()
+
+            # 복잡한 이미지 처리와 분석은 Infrastructure의 VisionService에 위임
+            with tracer.span("roi", document=document, page=page_num, roi=field_name) as span:
+                result = self.vision.validate_roi(
+                    original_doc, target_doc, field_name, rois[field_name],
+                    layout_offset=layout, corrected_coords=corrected.get(field_name)
+                )
+                span.set(status=result['status'])
+            result['page_kind'] = page_kind.kind.value if page_kind else None
+            timings = result.setdefault('timings', {})
+            timings['alignment'] = round(timings.get('alignment', 0.0) + alignment_share, 6)
+            result['processing_time'] = round(result.get('processing_time', 0.0) + alignment_share, 6)
+            _ROIS.inc(status=result['status'])
+            for stage, seconds in timings.items():
+                _STAGE_SECONDS.observe(seconds, stage=stage)
+            results[field_name] = result
+            on_roi_done(field_name)
         return results
 
-    def create_annotated_pdf(self, target_pdf_path, validation_results):
-        target_doc = self.doc_repo.load_pdf(target_pdf_path)
+    def _prepare_page_layout(self, original_doc, target_doc, page_num, rois, page_kind):
+        """
+        한 페이지의 레이아웃 변환을 추정하고, 해당 페이지 ROI 좌표 전체를 한 번에 보정합니다.
+        디지털 페이지는 스캔 왜곡이 없으므로 추정을 건너뜁니다.
+        레이아웃 추정이나 좌표 변환이 실패하면 경고를 남기고 (None, {})를 반환하여 ROI 단위 처리(및 오류 보고)에 맡깁니다.
+        """
+        try:
+            if page_kind is not None and not page_kind.is_scanned:
+                layout = self.vision.identity_layout()
+            else:
+                layout = self.vision.estimate_page_layout(original_doc, target_doc, page_num)
+
+            names = [name for name, info in rois.items()
+                     if info.get('page', 0) == page_num and info.get('coords')]
+            corrected = self.vision.transform_rois([rois[name]['coords'] for name in names], layout)
+            return layout, dict(zip(names, corrected))
+        except (ComputerVisionServiceError, ValueError, IndexError) as e:
+            logger.warning("페이지 레이아웃 보정 실패 (%s, 페이지 %d): %s", document_label(target_doc.name), page_num + 1, e)
+            return None, {}
+
+    def create_annotated_pdf(self, target_pdf_path, validation_results, page_range=None):
+        """
+        미흡 항목을 강조 표시한 결과 PDF (bytes).
+        page_range가 있으면 그 구간만 담고, 페이지 라벨을 원본 묶음의 페이지 번호로 붙여 뷰어에서 원래 위치를 알 수 있게 합니다.
+        """
+        target_doc = self.doc_repo.load_pdf(target_pdf_path, page_range)
+        try:
+            with tracer.span("annotate", document=document_label(target_pdf_path)):
+                self._highlight_failures(target_doc, validation_results)
+
+                if page_range is None:
+                    return target_doc.tobytes()
+                target_doc.set_page_labels([{"startpage": 0, "prefix": "", "style": "D", "firstpagenum": page_range.start + 1}])
+                # select로 빠진 페이지의 이미지 등이 남지 않도록 참조되지 않는 객체 정리
+                return target_doc.tobytes(garbage=3, deflate=True)
+        finally:
+            target_doc.close()
+
+    def create_review_excerpt(self, target_pdf_path, validation_results, page_range=None):
+        """
+        미흡 ROI가 있는 페이지만 담은 결과 PDF (bytes, 미흡 페이지가 없으면 None).
+        연속한 페이지 구간 단위로 insert_pdf로 복사하므로 다시 렌더링하지 않으며, 강조 표시도 그대로 옮겨집니다.
+        각 페이지 위쪽에 원본 파일의 해당 페이지로 가는 링크를 달고, 페이지 라벨은 원본 페이지 번호를 따릅니다.
+        """
+        target_doc = self.doc_repo.load_pdf(target_pdf_path, page_range)
+        try:
+            with tracer.span("annotate", document=document_label(target_pdf_path), excerpt=True) as span:
+                self._highlight_failures(target_doc, validation_results)
+                pages = sorted({result["page"] for result in validation_results
+                                if result["status"] != "OK" and 0 <= result["page"] < target_doc.page_count})
+                span.set(pages=len(pages))
+                if not pages:
+                    return None
+
+                with fitz.open() as excerpt:
+                    run_start = pages[0]
+                    for previous, page_num in zip(pages, pages[1:] + [None]):
+                        if page_num != previous + 1:
+                            excerpt.insert_pdf(target_doc, from_page=run_start, to_page=previous)
+                            run_start = page_num
+
+                    source_path = os.path.abspath(target_pdf_path)
+                    labels = []
+                    for excerpt_page, page_num in zip(excerpt, pages):
+                        source_page = page_range[page_num] if page_range is not None else page_num
+                        self._add_source_link(excerpt_page, source_path, source_page)
+                        labels.append({"startpage": excerpt_page.number, "prefix": "", "style": "D",
+                                       "firstpagenum": source_page + 1})
+                    excerpt.set_page_labels(labels)
+                    return excerpt.tobytes(garbage=3, deflate=True)
+        finally:
+            target_doc.close()
+
+    @staticmethod
+    def _highlight_failures(target_doc, validation_results):
         for result in validation_results:
             if result["status"] != "OK":
                 page = target_doc[result["page"]]
@@ -35,7 +278,14 @@ class ValidationService:
                 highlight.set_colors({"stroke": color})
                 highlight.update()
 
-        return target_doc.tobytes()
+    @staticmethod
+    def _add_source_link(page, source_path, source_page):
+        """페이지 왼쪽 위에 'source p.N' 표시와 원본 PDF의 그 페이지로 가는 링크(GoToR)를 답니다."""
+        rect = fitz.Rect(page.rect.x0 + 4, page.rect.y0 + 2, page.rect.x0 + 160, page.rect.y0 + 2 + REVIEW_SOURCE_LINK_HEIGHT)
+        page.insert_text((rect.x0 + 2, rect.y1 - 3), f"source: p.{source_page + 1} (open original)",
+                         fontname="helv", fontsize=7, color=(0, 0, 0.8))
+        page.insert_link({"kind": fitz.LINK_GOTOR, "from": rect, "file": source_path,
+                          "page": source_page, "to": fitz.Point(0, 0)})
 
     # --- Viewer Helper Methods ---
     def load_docs_for_viewer(self, original_path, annotated_bytes):
@@ -41,6 +41,9 @@ class UISettings:
     remember_window_size: bool = True
     theme: str = "default"
     language: str = "ko"
+    prewarm_on_startup: bool = True  # 메뉴 창 표시 후 도구 창에 필요한 모듈을 백그라운드에서 미리 import
+    preview_cache_enabled: bool = PREVIEW_CACHE_ENABLED  # 검증 뷰어 페이지 이미지를 디스크에도 보관
+    preview_cache_max_mb: int = PREVIEW_CACHE_MAX_MB  # 디스크 미리보기 캐시 크기 상한 (MB)
 
 
 @dataclass
@@ -52,6 +55,14 @@ class ValidationSettings:
     max_concurrent_validations: int = MAX_CONCURRENT_VALIDATIONS
     enable_debug_mode: bool = False
     save_debug_images: bool = True
+    batch_memory_budget_mb: int = BATCH_MEMORY_BUDGET_MB  # 일괄 검증 시 예상 메모리 상한
+    use_validation_server: bool = False  # 로컬 검증 서버에 검증을 맡길지 여부
+    server_host: str = VALIDATION_SERVER_HOST
+    server_port: int = VALIDATION_SERVER_PORT
+    use_worker_pool: bool = False  # 상주 작업자 풀에서 검증할지 여부
+    worker_pool_size: int = WORKER_POOL_SIZE
+    worker_max_jobs: int = WORKER_MAX_JOBS  # 작업자 하나가 교체되기 전까지 처리할 문서 수
+    enable_metrics: bool = METRICS_ENABLED  # 처리량/캐시/큐 메트릭 기록 및 일괄 검증 종료 시 내보내기
 
 
 @dataclass
@@ -63,6 +74,9 @@ class StorageSettings:
     resources_directory: str = DEFAULT_RESOURCES_DIR
     auto_backup: bool = AUTO_BACKUP_ENABLED
     backup_retention_days: int = BACKUP_RETENTION_DAYS
+    review_output_mode: str = REVIEW_OUTPUT_MODE  # 미흡 문서 결과 PDF: full(문서 전체) / excerpt(미흡 페이지만) / bundle(한 파일로 묶기)
+    batch_report_formats: tuple = BATCH_REPORT_FORMATS  # 일괄 검증 보고서 형식 ("jsonl", "csv" 중 선택, 비우면 만들지 않음)
+    batch_report_include_rois: bool = BATCH_REPORT_INCLUDE_ROIS  # 보고서에 ROI별 행도 기록
 
 
 class Settings:
@@ -117,6 +131,9 @@ class Settings:
                 self.ui.remember_window_size = ui_config.get("remember_window_size", True)
                 self.ui.theme = ui_config.get("theme", "default")
                 self.ui.language = ui_config.get("language", "ko")
+                self.ui.prewarm_on_startup = ui_config.get("prewarm_on_startup", True)
+                self.ui.preview_cache_enabled = ui_config.get("preview_cache_enabled", PREVIEW_CACHE_ENABLED)
+                self.ui.preview_cache_max_mb = ui_config.get("preview_cache_max_mb", PREVIEW_CACHE_MAX_MB)
             
             # 검증 설정
             if "validation" in config:
@@ -127,6 +144,14 @@ class Settings:
                 self.validation.max_concurrent_validations = v_config.get("max_concurrent_validations", MAX_CONCURRENT_VALIDATIONS)
                 self.validation.enable_debug_mode = v_config.get("enable_debug_mode", False)
                 self.validation.save_debug_images = v_config.get("save_debug_images", True)
+                self.validation.batch_memory_budget_mb = v_config.get("batch_memory_budget_mb", BATCH_MEMORY_BUDGET_MB)
+                self.validation.use_validation_server = v_config.get("use_validation_server", False)
+                self.validation.server_host = v_config.get("server_host", VALIDATION_SERVER_HOST)
+                self.validation.server_port = v_config.get("server_port", VALIDATION_SERVER_PORT)
+                self.validation.use_worker_pool = v_config.get("use_worker_pool", False)
+                self.validation.worker_pool_size = v_config.get("worker_pool_size", WORKER_POOL_SIZE)
+                self.validation.worker_max_jobs = v_config.get("worker_max_jobs", WORKER_MAX_JOBS)
+                self.validation.enable_metrics = v_config.get("enable_metrics", METRICS_ENABLED)
             
             # 저장소 설정
             if "storage" in config:
@@ -137,6 +162,9 @@ class Settings:
                 self.storage.resources_directory = s_config.get("resources_directory", DEFAULT_RESOURCES_DIR)
                 self.storage.auto_backup = s_config.get("auto_backup", AUTO_BACKUP_ENABLED)
                 self.storage.backup_retention_days = s_config.get("backup_retention_days", BACKUP_RETENTION_DAYS)
+                self.storage.review_output_mode = s_config.get("review_output_mode", REVIEW_OUTPUT_MODE)
+                self.storage.batch_report_formats = tuple(s_config.get("batch_report_formats", BATCH_REPORT_FORMATS))
+                self.storage.batch_report_include_rois = s_config.get("batch_report_include_rois", BATCH_REPORT_INCLUDE_ROIS)
             
             # 기타 설정
             self.debug_enabled = config.get("debug_enabled", False)
@@ -167,7 +195,10 @@ class Settings:
                     "min_window_height": self.ui.min_window_height,
                     "remember_window_size": self.ui.remember_window_size,
                     "theme": self.ui.theme,
-                    "language": self.ui.language
+                    "language": self.ui.language,
+                    "prewarm_on_startup": self.ui.prewarm_on_startup,
+                    "preview_cache_enabled": self.ui.preview_cache_enabled,
+                    "preview_cache_max_mb": self.ui.preview_cache_max_mb
                 },
                 "validation": {
                     "max_processing_time": self.validation.max_processing_time,
@@ -175,7 +206,15 @@ class Settings:
                     "layout_detection_scale": self.validation.layout_detection_scale,
                     "max_concurrent_validations": self.validation.max_concurrent_validations,
                     "enable_debug_mode": self.validation.enable_debug_mode,
-                    "save_debug_images": self.validation.save_debug_images
+                    "save_debug_images": self.validation.save_debug_images,
+                    "batch_memory_budget_mb": self.validation.batch_memory_budget_mb,
+                    "use_validation_server": self.validation.use_validation_server,
+                    "server_host": self.validation.server_host,
+                    "server_port": self.validation.server_port,
+                    "use_worker_pool": self.validation.use_worker_pool,
+                    "worker_pool_size": self.validation.worker_pool_size,
+                    "worker_max_jobs": self.validation.worker_max_jobs,
+                    "enable_metrics": self.validation.enable_metrics
                 },
                 "storage": {
                     "templates_file": self.storage.templates_file,
@@ -183,7 +222,10 @@ class Settings:
                     "input_directory": self.storage.input_directory,
                     "resources_directory": self.storage.resources_directory,
                     "auto_backup": self.storage.auto_backup,
-                    "backup_retention_days": self.storage.backup_retention_days
+                    "backup_retention_days": self.storage.backup_retention_days,
+                    "review_output_mode": self.storage.review_output_mode,
+                    "batch_report_formats": list(self.storage.batch_report_formats),
+                    "batch_report_include_rois": self.storage.batch_report_include_rois
                 }
             }
             
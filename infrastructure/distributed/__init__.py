@@ -0,0 +1,4 @@
+"""
+Distributed Batch
+공유 디렉터리 기반 분산 일괄 검증
+"""
@@ -0,0 +1,301 @@
+# 파일 경로: infrastructure/distributed/lease_work_queue.py
+"""
+Lease Work Queue
+공유 디렉터리(NFS/SMB 등)의 lease 파일을 작업 큐로 사용하는 분산 일괄 검증
+
+디렉터리 구조:
+    <queue>/template.json          모든 작업자가 사용하는 템플릿
+    <queue>/jobs/<id>.json         작업 명세 (id = 절대 경로의 sha1)
+    <queue>/leases/<id>.lease      작업 점유 표시 (O_CREAT|O_EXCL로 원자적 생성, mtime = heartbeat)
+    <queue>/results/<id>.json      결과 (임시 파일 + os.replace, 존재하면 완료)
+    <queue>/output/                미흡 문서의 결과 PDF
+
+작업자가 죽으면 heartbeat가 멈추고, LEASE_TIMEOUT_SECONDS가 지난 lease는 다른 작업자가
+원자적 rename으로 회수한 뒤 다시 점유합니다. 결과는 같은 이름으로 통째로 교체되므로
+같은 문서가 두 번 처리되더라도 결과는 하나만 남습니다.
+"""
+import hashlib
+import json
+import os
+import random
+import socket
+import threading
+import time
+import uuid
+
+from shared.constants import LEASE_TIMEOUT_SECONDS, LEASE_HEARTBEAT_SECONDS, WORK_QUEUE_POLL_SECONDS
+
+
+def job_id_for(pdf_path):
+    """문서 경로로부터 작업 ID 생성 (같은 문서는 어느 호스트에서 넣어도 같은 ID)"""
+    return hashlib.sha1(os.path.abspath(pdf_path).encode('utf-8')).hexdigest()
+
+
+def write_json_atomic(path, data):
+    """임시 파일에 쓴 뒤 os.replace로 교체하여, 읽는 쪽이 절반만 쓰인 파일을 보지 않게 합니다."""
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class Lease:
+    """작업자가 점유한 작업 하나"""
+
+    def __init__(self, queue, job_id, job, token):
+        self.queue = queue
+        self.job_id = job_id
+        self.job = job
+        self.token = token
+        self.lost = False  # heartbeat 중 다른 작업자가 회수한 것이 확인되면 True
+
+    def heartbeat(self):
+        """lease mtime 갱신. 이미 다른 작업자에게 넘어갔다면 False를 반환합니다."""
+        if self.lost or not self.queue.owns(self.job_id, self.token):
+            self.lost = True
+            return False
+        try:
+            os.utime(self.queue.lease_path(self.job_id))
+        except FileNotFoundError:
+            self.lost = True
+            return False
+        return True
+
+    def release(self):
+        if not self.lost and self.queue.owns(self.job_id, self.token):
+            try:
+                os.remove(self.queue.lease_path(self.job_id))
+            except FileNotFoundError:
+                pass
+
+
+class LeaseWorkQueue:
+    def __init__(self, queue_dir, lease_timeout=LEASE_TIMEOUT_SECONDS):
+        self.queue_dir = os.path.abspath(queue_dir)
+        self.lease_timeout = lease_timeout
+        self.jobs_dir = os.path.join(self.queue_dir, "jobs")
+        self.leases_dir = os.path.join(self.queue_dir, "leases")
+        self.results_dir = os.path.join(self.queue_dir, "results")
+        self.output_dir = os.path.join(self.queue_dir, "output")
+        for directory in (self.jobs_dir, self.leases_dir, self.results_dir, self.output_dir):
+            os.makedirs(directory, exist_ok=True)
+
+    # --- 경로 ---
+    def job_path(self, job_id):
+        return os.path.join(self.jobs_dir, f"{job_id}.json")
+
+    def lease_path(self, job_id):
+        return os.path.join(self.leases_dir, f"{job_id}.lease")
+
+    def result_path(self, job_id):
+        return os.path.join(self.results_dir, f"{job_id}.json")
+
+    # --- 작업 등록 ---
+    def set_template(self, template):
+        write_json_atomic(os.path.join(self.queue_dir, "template.json"), template)
+
+    def load_template(self):
+        with open(os.path.join(self.queue_dir, "template.json"), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def enqueue(self, pdf_paths):
+        """문서들을 작업으로 등록합니다. 이미 등록된 문서는 건너뛰므로 여러 번 호출해도 안전합니다."""
+        added = 0
+        for pdf_path in pdf_paths:
+            job_id = job_id_for(pdf_path)
+            if os.path.exists(self.job_path(job_id)):
+                continue
+            write_json_atomic(self.job_path(job_id), {"job_id": job_id, "pdf_path": os.path.abspath(pdf_path)})
+            added += 1
+        return added
+
+    def job_ids(self):
+        return [name[:-5] for name in os.listdir(self.jobs_dir) if name.endswith(".json")]
+
+    def is_done(self, job_id):
+        return os.path.exists(self.result_path(job_id))
+
+    # --- 점유 (lease) ---
+    def try_claim(self, job_id, worker_id):
+        """작업 점유를 시도합니다. 성공하면 Lease, 실패하면 None."""
+        if self.is_done(job_id):
+            return None
+
+        lease = self._create_lease(job_id, worker_id)
+        if lease is None and self._reclaim_if_expired(job_id):
+            lease = self._create_lease(job_id, worker_id)
+        if lease is None:
+            return None
+
+        # lease 생성 직전에 다른 작업자가 완료했을 수 있음
+        if self.is_done(job_id):
+            lease.release()
+            return None
+        return lease
+
+    def owns(self, job_id, token):
+        try:
+            with open(self.lease_path(job_id), 'r', encoding='utf-8') as f:
+                return json.load(f).get("token") == token
+        except (FileNotFoundError, ValueError):
+            return False
+
+    def _create_lease(self, job_id, worker_id):
+        token = uuid.uuid4().hex
+        payload = json.dumps({
+            "token": token, "worker_id": worker_id, "host": socket.gethostname(),
+            "pid": os.getpid(), "claimed_at": time.time(),
+        }).encode('utf-8')
+        try:
+            fd = os.open(self.lease_path(job_id), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            return None
+        try:
+            os.write(fd, payload)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+        with open(self.job_path(job_id), 'r', encoding='utf-8') as f:
+            job = json.load(f)
+        return Lease(self, job_id, job, token)
+
+    def _reclaim_if_expired(self, job_id):
+        """
+        만료된 lease를 원자적 rename으로 치웁니다. 여러 작업자가 동시에 시도해도 한 명만 성공합니다.
+        만료를 확인한 뒤 rename하기 전에 다른 작업자가 먼저 회수하고 새 lease를 만들었다면
+        옮겨진 것은 그 새 lease이므로, 토큰/mtime으로 이를 확인하고 되돌립니다.
+        """
+        path = self.lease_path(job_id)
+        moved = f"{path}.expired.{uuid.uuid4().hex}"
+        try:
+            observed = self._read_token(path)
+            if time.time() - os.path.getmtime(path) < self.lease_timeout:
+                return False
+            os.rename(path, moved)
+        except FileNotFoundError:
+            return True  # 그 사이에 lease가 풀림 (완료 또는 다른 작업자가 회수)
+        if self._read_token(moved) != observed or time.time() - os.path.getmtime(moved) < self.lease_timeout:
+            self._restore_lease(moved, path)
+            return False
+        os.remove(moved)
+        return True
+
+    @staticmethod
+    def _read_token(path):
+        """lease 파일의 토큰 (내용을 쓰는 중이면 None)"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f).get("token")
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _restore_lease(moved, path):
+        """잘못 옮긴 lease를 제자리로 되돌립니다. 그 사이 새 lease가 생겼다면 덮어쓰지 않습니다 (link는 대상이 있으면 실패)."""
+        try:
+            os.link(moved, path)
+        except FileExistsError:
+            pass  # 옮겨진 lease의 주인은 다음 heartbeat에서 lease를 잃었음을 알게 됨
+        os.remove(moved)
+
+    def claim_next(self, worker_id, job_ids=None):
+        """남은 작업 하나를 점유합니다. 작업자끼리 부딪히지 않도록 무작위 순서로 훑습니다."""
+        job_ids = list(job_ids if job_ids is not None else self.job_ids())
+        random.shuffle(job_ids)
+        for job_id in job_ids:
+            lease = self.try_claim(job_id, worker_id)
+            if lease is not None:
+                return lease
+        return None
+
+    # --- 결과 ---
+    def write_result(self, lease, result):
+        """결과를 원자적으로 기록하고 lease를 해제합니다. 같은 작업을 다시 기록해도 결과 파일은 하나입니다."""
+        write_json_atomic(self.result_path(lease.job_id), result)
+        lease.release()
+
+    def load_result(self, job_id):
+        with open(self.result_path(job_id), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def status(self):
+        """전체/완료/점유 중 작업 수"""
+        job_ids = self.job_ids()
+        done = sum(1 for job_id in job_ids if self.is_done(job_id))
+        leased = sum(1 for name in os.listdir(self.leases_dir) if name.endswith(".lease"))
+        return {"total": len(job_ids), "done": done, "leased": leased, "pending": len(job_ids) - done}
+
+
+class LeaseWorker:
+    """
+    큐가 빌 때까지 작업을 점유하여 처리하는 헤드리스 작업자.
+    process(template, job)는 결과 dict를 반환하며, 예외는 ERROR 결과로 기록됩니다.
+    """
+
+    def __init__(self, queue, process, worker_id=None, heartbeat_interval=LEASE_HEARTBEAT_SECONDS,
+                 poll_interval=WORK_QUEUE_POLL_SECONDS, log=print):
+        self.queue = queue
+        self.process = process
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.heartbeat_interval = heartbeat_interval
+        self.poll_interval = poll_interval
+        self.log = log
+        self.processed = 0
+
+    def run(self, max_jobs=None):
+        """처리할 작업이 더 없으면(모두 완료) 반환합니다. 다른 작업자가 점유 중인 작업은 만료를 기다립니다."""
+        template = self.queue.load_template()
+        job_ids = self.queue.job_ids()
+
+        while max_jobs is None or self.processed < max_jobs:
+            job_ids = [job_id for job_id in job_ids if not self.queue.is_done(job_id)]
+            if not job_ids:
+                break
+
+            lease = self.queue.claim_next(self.worker_id, job_ids)
+            if lease is None:
+                time.sleep(self.poll_interval) # 남은 작업이 모두 점유 중: 완료 또는 lease 만료 대기
+                continue
+
+            self._run_leased(template, lease)
+            self.processed += 1
+        return self.processed
+
+    def _run_leased(self, template, lease):
+        stop = threading.Event()
+
+        def heartbeat():
+            while not stop.wait(self.heartbeat_interval):
+                if not lease.heartbeat():
+                    self.log(f"[{self.worker_id}] lease를 잃었습니다: {lease.job['pdf_path']}")
+                    return
+
+        beat = threading.Thread(target=heartbeat, name=f"lease-heartbeat-{lease.job_id[:8]}", daemon=True)
+        beat.start()
+        started = time.time()
+        try:
+            try:
+                result = dict(self.process(template, lease.job))
+            except Exception as e:
+                result = {"status": "ERROR", "error": str(e)}
+        finally:
+            stop.set()
+            beat.join()
+
+        result.update({
+            "job_id": lease.job_id,
+            "pdf_path": lease.job["pdf_path"],
+            "worker_id": self.worker_id,
+            "host": socket.gethostname(),
+            "elapsed": round(time.time() - started, 3),
+            "finished_at": time.time(),
+        })
+        if lease.lost:
+            # 다른 작업자가 이미 회수하여 처리 중: 결과는 같으므로 기록만 하고 lease는 건드리지 않음
+            write_json_atomic(self.queue.result_path(lease.job_id), result)
+        else:
+            self.queue.write_result(lease, result)
+        self.log(f"[{self.worker_id}] {result['status']}: {os.path.basename(lease.job['pdf_path'])}")
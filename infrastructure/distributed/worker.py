@@ -0,0 +1,191 @@
+# 파일 경로: infrastructure/distributed/worker.py
+"""
+Headless Batch Worker
+공유 디렉터리 작업 큐용 명령행 도구 (GUI 없이 여러 호스트에서 실행)
+
+사용 예:
+    # 1. 큐 생성: 템플릿과 대상 폴더의 PDF를 등록 (여러 번 실행해도 중복 등록되지 않음)
+    python -m infrastructure.distributed.worker enqueue --queue /mnt/shared/q --template 보험금청구서 --input /mnt/shared/pdfs
+
+    # 2. 각 호스트에서 작업자 실행 (여러 개 실행 가능)
+    python -m infrastructure.distributed.worker work --queue /mnt/shared/q
+
+    # 프로파일링: 처음 3개 문서의 pstats/접힌 스택을 <queue>/output/profiles에 저장
+    python -m infrastructure.distributed.worker work --queue /mnt/shared/q --profile --profile-max 3
+
+    # 미흡 문서는 미흡 페이지만 발췌하여 저장 (기본: 문서 전체 사본)
+    python -m infrastructure.distributed.worker work --queue /mnt/shared/q --review excerpt
+
+    # 구간 추적: 작업자별 <queue>/traces/worker-<id>.json 저장 후 하나로 합쳐 Perfetto에서 열기
+    python -m infrastructure.distributed.worker work --queue /mnt/shared/q --trace
+    python -m infrastructure.distributed.worker merge-traces --queue /mnt/shared/q
+
+    # 3. 진행 상황 확인
+    python -m infrastructure.distributed.worker status --queue /mnt/shared/q
+"""
+import argparse
+import glob
+import itertools
+import os
+import time
+import uuid
+
+from infrastructure.distributed.lease_work_queue import LeaseWorkQueue, LeaseWorker
+from shared.constants import (
+    DEFAULT_TEMPLATE_FILE, LEASE_TIMEOUT_SECONDS, LEASE_HEARTBEAT_SECONDS, REVIEW_OUTPUT_FULL, REVIEW_OUTPUT_EXCERPT
+)
+from shared.profiling import add_profiling_arguments, options_from_args, profile_document
+from shared.tracing import tracer, document_label, merge_trace_files
+
+
+def build_validation_process(output_dir, profiling=None, review_mode=REVIEW_OUTPUT_FULL):
+    """
+    ValidationService로 문서를 검증하고, 미흡 문서는 결과 PDF를 저장하는 처리 함수를 만듭니다.
+    profiling(ProfilingOptions)이 켜져 있으면 이 작업자가 처리하는 문서 중 일부를 프로파일링합니다.
+    review_mode가 REVIEW_OUTPUT_EXCERPT이면 결과 PDF에 미흡 ROI가 있는 페이지만 담습니다.
+    """
+    from infrastructure.repositories.file_document_repository import FileDocumentRepository
+    from infrastructure.services.validation_vision_service import ValidationVisionService
+    from domain.entities.document import Document
+    from domain.entities.validation_result import ValidationResult
+    from domain.services.validation_service import ValidationService
+
+    service = ValidationService(FileDocumentRepository(), ValidationVisionService())
+    processed = itertools.count()
+
+    def process(template, job):
+        pdf_path = job["pdf_path"]
+        started = time.perf_counter()
+        label = f"{os.path.splitext(os.path.basename(pdf_path))[0]}_{job['job_id'][:8]}"
+        with profile_document(profiling, label, output_dir, next(processed)) as session:
+            results = service.validate_document(template, pdf_path, streaming=session is not None)
+        summary = ValidationResult.from_results(
+            Document(pdf_path), "", results, time.perf_counter() - started
+        ).get_summary()
+        deficient = [r for r in results if r['status'] != 'OK']
+        output_path = None
+        if deficient:
+            # 결과 PDF 이름을 작업 ID로 고정하여 재처리 시에도 파일이 하나만 남도록 함
+            stem = os.path.splitext(os.path.basename(pdf_path))[0]
+            output_path = os.path.join(output_dir, f"review_{stem}_{job['job_id'][:8]}.pdf")
+            tmp_path = f"{output_path}.{uuid.uuid4().hex}.tmp"
+            annotated_pdf_bytes = None
+            if review_mode == REVIEW_OUTPUT_EXCERPT:
+                annotated_pdf_bytes = service.create_review_excerpt(pdf_path, results)
+            if annotated_pdf_bytes is None:  # 발췌할 페이지가 없으면 (ROI 페이지 정보 없음) 문서 전체
+                annotated_pdf_bytes = service.create_annotated_pdf(pdf_path, results)
+            with tracer.span("write", document=document_label(pdf_path), size=len(annotated_pdf_bytes)):
+                with open(tmp_path, "wb") as f:
+                    f.write(annotated_pdf_bytes)
+                os.replace(tmp_path, output_path)
+
+        if not deficient:
+            status = "OK"
+        elif all(r['status'] == 'ERROR' for r in deficient):
+            status = "ERROR"
+        else:
+            status = "DEFICIENT"
+        return {
+            "status": status,
+            "deficient_count": len(deficient),
+            "output_path": output_path,
+            "processing_time": round(summary["processing_time"], 4),
+            "stage_timings": summary["stage_timings"],
+            "profile_paths": session.paths if session is not None else [],
+            "results": results,
+        }
+
+    return process
+
+
+def _enqueue(args):
+    from infrastructure.repositories.json_template_repository import JsonTemplateRepository
+    from domain.services.template_service import TemplateService
+
+    template = TemplateService(JsonTemplateRepository(args.templates), vision_service=None).load_template(args.template)
+    template = {**template, 'original_pdf_path': os.path.abspath(template['original_pdf_path'])}
+
+    queue = LeaseWorkQueue(args.queue)
+    queue.set_template(template)
+    pdf_paths = [
+        os.path.join(args.input, name) for name in sorted(os.listdir(args.input))
+        if name.lower().endswith('.pdf')
+    ]
+    added = queue.enqueue(pdf_paths)
+    print(f"작업 {added}개 등록 (전체 {len(pdf_paths)}개 중 신규)")
+
+
+def _work(args):
+    queue = LeaseWorkQueue(args.queue, lease_timeout=args.lease_timeout)
+    worker = LeaseWorker(
+        queue, build_validation_process(queue.output_dir, profiling=options_from_args(args), review_mode=args.review),
+        worker_id=args.worker_id, heartbeat_interval=args.heartbeat
+    )
+    tracer.enabled = args.trace
+    tracer.process_name = f"worker-{worker.worker_id}"
+    try:
+        processed = worker.run(max_jobs=args.max_jobs)
+        print(f"[{worker.worker_id}] 처리 완료: {processed}개")
+    finally:
+        if args.trace:
+            trace_path = tracer.export(os.path.join(queue.queue_dir, "traces", f"worker-{worker.worker_id}.json"))
+            print(f"[{worker.worker_id}] 추적 저장: {trace_path}")
+
+    # 작업자별 메트릭 (공유 디렉터리에 모아 textfile collector나 스크립트로 합산)
+    from shared.metrics import registry
+    registry.export(os.path.join(queue.queue_dir, "metrics"), prefix=f"worker-{worker.worker_id}")
+
+
+def _merge_traces(args):
+    paths = sorted(glob.glob(os.path.join(args.queue, "traces", "worker-*.json")))
+    if not paths:
+        print("합칠 추적 파일이 없습니다")
+        return
+    output_path = args.output or os.path.join(args.queue, "trace.json")
+    count = merge_trace_files(paths, output_path)
+    print(f"작업자 {len(paths)}개의 이벤트 {count}개 -> {output_path}")
+
+
+def _status(args):
+    status = LeaseWorkQueue(args.queue).status()
+    print(f"전체 {status['total']} | 완료 {status['done']} | 처리 중 {status['leased']} | 남음 {status['pending']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="공유 디렉터리 기반 분산 일괄 검증")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    enqueue = sub.add_parser("enqueue", help="템플릿과 PDF 폴더를 큐에 등록")
+    enqueue.add_argument("--queue", required=True, help="공유 큐 디렉터리")
+    enqueue.add_argument("--template", required=True, help="템플릿 이름")
+    enqueue.add_argument("--input", required=True, help="검증할 PDF 폴더")
+    enqueue.add_argument("--templates", default=DEFAULT_TEMPLATE_FILE, help="템플릿 JSON 파일 경로")
+    enqueue.set_defaults(func=_enqueue)
+
+    work = sub.add_parser("work", help="큐의 작업을 처리하는 작업자 실행")
+    work.add_argument("--queue", required=True, help="공유 큐 디렉터리")
+    work.add_argument("--worker-id", default=None)
+    work.add_argument("--max-jobs", type=int, default=None, help="처리할 최대 문서 수")
+    work.add_argument("--lease-timeout", type=float, default=LEASE_TIMEOUT_SECONDS)
+    work.add_argument("--heartbeat", type=float, default=LEASE_HEARTBEAT_SECONDS)
+    work.add_argument("--trace", action="store_true", help="구간 추적 기록 (<queue>/traces/worker-<id>.json)")
+    work.add_argument("--review", choices=(REVIEW_OUTPUT_FULL, REVIEW_OUTPUT_EXCERPT), default=REVIEW_OUTPUT_FULL,
+                      help="미흡 문서 결과 PDF: 문서 전체(full) 또는 미흡 페이지만(excerpt)")
+    add_profiling_arguments(work)
+    work.set_defaults(func=_work)
+
+    merge = sub.add_parser("merge-traces", help="작업자별 추적 파일을 하나의 Chrome trace JSON으로 합치기")
+    merge.add_argument("--queue", required=True, help="공유 큐 디렉터리")
+    merge.add_argument("--output", default=None, help="출력 경로 (기본: <queue>/trace.json)")
+    merge.set_defaults(func=_merge_traces)
+
+    status = sub.add_parser("status", help="큐 진행 상황 출력")
+    status.add_argument("--queue", required=True, help="공유 큐 디렉터리")
+    status.set_defaults(func=_status)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,21 +3,129 @@ File Document Repository Implementation
 파일 시스템 기반 문서 저장소 구현
 """
 import os
-from typing import List, Optional, Dict
+import threading
+from typing import Iterable, List, Optional, Dict, Tuple
 from pathlib import Path
 
 from domain.repositories.document_repository import DocumentRepository
-from domain.entities.document import Document
-from shared.utils import FileUtils
+from domain.entities.document import Document, DocumentProbe, PageClassification
+from shared.utils import FileUtils, HashUtils
 from shared.exceptions import *
 from shared.constants import *
+from shared.metrics import registry
+from shared.tracing import tracer, document_label
+
+_CACHE_REQUESTS = registry.counter(
+    "document_cache_requests_total", "문서 해시/페이지 판별 캐시 조회 수", labels=("cache", "result")
+)
 
 
 class FileDocumentRepository(DocumentRepository):
     """파일 시스템 기반 문서 저장소"""
     
     def __init__(self):
-        pass
+        # 페이지 판별 결과 캐시: (문서 해시, 페이지) -> PageClassification
+        self._page_class_cache: Dict[Tuple[str, int], PageClassification] = {}
+        # 문서 해시 캐시: (절대 경로, 크기, 수정시각) -> 해시
+        self._hash_cache: Dict[Tuple[str, int, float], str] = {}
+        self._cache_lock = threading.Lock()
+        self._page_classifier = None
+    
+    def load_pdf(self, file_path: str, page_range: Optional[range] = None):
+        """
+        PDF 문서 열기.
+        page_range가 있으면 열린 문서에서 그 페이지만 남겨(select) 0번부터 다시 번호를 매깁니다.
+        여러 양식이 이어 붙은 스캔 묶음의 한 구간을 중간 PDF 파일 없이 독립 문서처럼 검증할 때 씁니다.
+        """
+        import fitz  # PyMuPDF
+        if not os.path.exists(file_path):
+            raise DocumentNotFoundError(file_path)
+        try:
+            with tracer.span("open", document=document_label(file_path)):
+                doc = fitz.open(file_path)
+                if page_range is not None:
+                    doc.select([page for page in page_range if 0 <= page < doc.page_count])
+                return doc
+        except Exception as e:
+            raise PDFServiceError(f"PDF 열기 실패: {str(e)}")
+    
+    def load_pdf_from_bytes(self, data: bytes):
+        """메모리상의 PDF 바이트로 문서 열기"""
+        import fitz  # PyMuPDF
+        try:
+            with tracer.span("open", document="<memory>", size=len(data)):
+                return fitz.open(stream=data, filetype="pdf")
+        except Exception as e:
+            raise PDFServiceError(f"PDF 열기 실패: {str(e)}")
+    
+    def probe_document(self, file_path: str, page_range: Optional[range] = None) -> DocumentProbe:
+        """렌더링 없이 페이지 크기만 읽어 메모리 사용량 추정에 사용"""
+        doc = self.load_pdf(file_path, page_range)
+        try:
+            page_sizes = [(page.rect.width, page.rect.height) for page in doc]
+        finally:
+            doc.close()
+        return DocumentProbe(
+            file_path=file_path,
+            page_count=len(page_sizes),
+            page_sizes=page_sizes,
+            file_size=os.path.getsize(file_path)
+        )
+    
+    def get_document_hash(self, file_path: str) -> str:
+        """문서 내용 해시 조회 (파일이 바뀌지 않았다면 다시 읽지 않음)"""
+        stat = os.stat(file_path)
+        key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime)
+        with self._cache_lock:
+            cached = self._hash_cache.get(key)
+        _CACHE_REQUESTS.inc(cache="document_hash", result="hit" if cached else "miss")
+        if cached:
+            return cached
+        
+        doc_hash = HashUtils.calculate_file_hash(file_path)
+        with self._cache_lock:
+            self._hash_cache[key] = doc_hash
+        return doc_hash
+    
+    def classify_pages(self, file_path: str, pages: Optional[Iterable[int]] = None,
+                       doc=None, page_range: Optional[range] = None) -> Dict[int, PageClassification]:
+        """
+        페이지별 스캔/디지털 판별.
+        렌더링 없이 PDF 구조만 확인하며, 결과는 (문서 해시, 원본 페이지) 단위로 캐시됩니다.
+        이미 열려 있는 문서(doc)를 넘기면 파일을 다시 열지 않습니다.
+        page_range로 연 문서라면 pages와 반환 키는 구간 안의 페이지 번호입니다.
+        """
+        doc_hash = self.get_document_hash(file_path)
+        
+        own_doc = doc is None
+        if own_doc:
+            doc = self.load_pdf(file_path, page_range)
+        
+        try:
+            page_numbers = range(doc.page_count) if pages is None else sorted(set(pages))
+            classifications = {}
+            for page_num in page_numbers:
+                if not 0 <= page_num < doc.page_count:
+                    continue
+                key = (doc_hash, page_range[page_num] if page_range is not None else page_num)
+                with self._cache_lock:
+                    cached = self._page_class_cache.get(key)
+                _CACHE_REQUESTS.inc(cache="page_class", result="miss" if cached is None else "hit")
+                if cached is None:
+                    cached = self._get_page_classifier().classify(doc[page_num], key[1])
+                    with self._cache_lock:
+                        self._page_class_cache[key] = cached
+                classifications[page_num] = cached
+            return classifications
+        finally:
+            if own_doc:
+                doc.close()
+    
+    def _get_page_classifier(self):
+        if self._page_classifier is None:
+            from infrastructure.services.page_classifier import PageClassifier
+            self._page_classifier = PageClassifier()
+        return self._page_classifier
     
     def load_document(self, file_path: str) -> Optional[Document]:
         """문서 로드"""
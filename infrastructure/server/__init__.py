@@ -0,0 +1,4 @@
+"""
+Local Server
+로컬 검증 서버 (localhost 전용)
+"""
@@ -0,0 +1,510 @@
+# 파일 경로: infrastructure/server/validation_server.py
+"""
+Local Validation Server
+여러 작업자가 공유하는 로컬 검증 데몬 (asyncio 기반 HTTP, localhost 전용)
+
+한 프로세스에서 OpenCV/Tesseract와 템플릿을 미리 올려 둔 ValidationService 하나를 공유하며,
+제출된 작업은 우선순위 큐에 쌓였다가 동시 실행 한도 안에서 스레드 풀로 처리됩니다.
+
+엔드포인트:
+    GET  /health                 서버 상태 (대기/실행 중 작업 수)
+    GET  /metrics                메트릭 (Prometheus 텍스트 형식)
+    POST /jobs                   작업 제출 {template_name | template, pdf_path | pdf_base64, priority, streaming}
+    GET  /jobs/{id}              작업 상태 및 (완료 시) 결과
+    GET  /jobs/{id}/events       작업 이벤트 스트림 (NDJSON, 완료 시 연결 종료)
+    POST /jobs/{id}/cancel       작업 취소
+                                 (일시정지 API는 없음: 클라이언트의 일시정지는 이벤트 수신만 멈추고 작업은 계속 진행)
+
+POST는 Content-Type: application/json만 받고, Origin 헤더가 루프백이 아닌 요청은 모두 거부합니다.
+(브라우저의 웹 페이지가 127.0.0.1로 text/plain POST를 보내 작업을 제출/취소하지 못하게 함)
+
+실행:
+    python -m infrastructure.server.validation_server --port 8765
+"""
+import argparse
+import asyncio
+import base64
+import binascii
+import ipaddress
+import itertools
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from shared.constants import (
+    VALIDATION_SERVER_HOST, VALIDATION_SERVER_PORT, MAX_CONCURRENT_VALIDATIONS,
+    SERVER_MAX_BODY_MB, SERVER_JOB_RETENTION, DEFAULT_TEMPLATE_FILE, VERSION
+)
+from shared.exceptions import ValidationCancelledError
+from shared.metrics import registry
+
+_QUEUE_DEPTH = registry.gauge("server_queue_depth", "검증 서버 대기 중 작업 수")
+_RUNNING_JOBS = registry.gauge("server_running_jobs", "검증 서버 실행 중 작업 수")
+_JOBS = registry.counter("server_jobs_total", "검증 서버 작업 완료 수", labels=("status",))
+
+_STATUS_TEXT = {
+    200: "OK", 202: "Accepted", 400: "Bad Request", 403: "Forbidden", 404: "Not Found",
+    405: "Method Not Allowed", 409: "Conflict", 413: "Payload Too Large", 415: "Unsupported Media Type",
+    500: "Internal Server Error",
+}
+_FINISHED_STATUSES = ("done", "error", "cancelled")
+
+
+class _HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class ServerJob:
+    """서버에 제출된 검증 작업 하나의 상태와 이벤트 기록"""
+
+    def __init__(self, job_id, priority, template, template_name, pdf_path, temp_path=None, streaming=False):
+        self.id = job_id
+        self.priority = priority
+        self.template = template
+        self.template_name = template_name
+        self.pdf_path = pdf_path
+        self.temp_path = temp_path  # pdf_base64로 제출된 경우 서버가 만든 임시 파일
+        self.streaming = streaming
+        self.status = "queued"
+        self.progress = (0, len(template.get('rois', {})))
+        self.results = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.events = []  # 스트림 구독자는 처음부터 재생하므로 늦게 연결해도 누락이 없음
+        self.cancel_event = threading.Event()
+        self.wakeup = asyncio.Event()
+
+    @property
+    def is_finished(self):
+        return self.status in _FINISHED_STATUSES
+
+    def to_dict(self, include_results=True):
+        data = {
+            "id": self.id,
+            "status": self.status,
+            "priority": self.priority,
+            "template_name": self.template_name,
+            "pdf_path": self.pdf_path if self.temp_path is None else None,
+            "progress": {"current": self.progress[0], "total": self.progress[1]},
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+        }
+        if include_results:
+            data["results"] = self.results
+        return data
+
+
+class ValidationServer:
+    """ValidationService를 감싸는 asyncio HTTP 서버"""
+
+    def __init__(self, validation_service, template_service=None, host=VALIDATION_SERVER_HOST,
+                 port=VALIDATION_SERVER_PORT, max_concurrent=MAX_CONCURRENT_VALIDATIONS,
+                 templates_file=DEFAULT_TEMPLATE_FILE):
+        if not self._is_loopback(host):
+            raise ValueError(f"검증 서버는 localhost에서만 실행할 수 있습니다: {host}")
+
+        self.validation_service = validation_service
+        self.template_service = template_service
+        self.host = host
+        self.port = port
+        self.max_concurrent = max(1, max_concurrent)
+        self.templates_file = templates_file
+
+        self._jobs = OrderedDict()
+        self._sequence = itertools.count()
+        self._template_cache = {}
+        self._template_cache_mtime = None
+        self._server = None
+        self._loop = None
+        self._queue = None
+        self._dispatchers = []
+        self._clients = set()
+        self._executor = None
+
+    # --- 수명 주기 ---
+    async def start(self):
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.PriorityQueue()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix="server-job")
+        self._dispatchers = [asyncio.create_task(self._dispatch()) for _ in range(self.max_concurrent)]
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]  # port=0이면 실제 할당된 포트
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        for job in self._jobs.values():
+            job.cancel_event.set()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for task in self._dispatchers + list(self._clients):
+            task.cancel()
+        await asyncio.gather(*self._dispatchers, *self._clients, return_exceptions=True)
+        if self._executor is not None:
+            # 실행 중인 작업이 취소 지점에 닿을 때까지 이벤트 루프를 막지 않고 기다림
+            await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+
+    # --- HTTP 처리 ---
+    async def _handle_client(self, reader, writer):
+        task = asyncio.current_task()
+        self._clients.add(task)
+        try:
+            method, path, headers, body = await self._read_request(reader)
+            self._check_origin(method, headers)
+            await self._route(method, path, body, writer)
+        except _HttpError as e:
+            await self._send_json(writer, e.status, {"error": e.message})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception as e:
+            await self._send_json(writer, 500, {"error": str(e)})
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+            self._clients.discard(task)
+
+    async def _read_request(self, reader):
+        request_line = (await reader.readline()).decode('latin-1').strip()
+        parts = request_line.split()
+        if len(parts) != 3:
+            raise _HttpError(400, "잘못된 요청 형식입니다")
+        method, target, _ = parts
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            key, _, value = line.decode('latin-1').partition(':')
+            headers[key.strip().lower()] = value.strip()
+
+        length = int(headers.get('content-length') or 0)
+        if length > SERVER_MAX_BODY_MB * 1024 * 1024:
+            raise _HttpError(413, "요청 본문이 너무 큽니다")
+        body = await reader.readexactly(length) if length else b''
+        return method.upper(), urlsplit(target).path.rstrip('/') or '/', headers, body
+
+    @staticmethod
+    def _check_origin(method, headers):
+        """브라우저에서 온 교차 출처 요청과 JSON이 아닌 POST를 거부합니다."""
+        origin = headers.get('origin')
+        if origin is not None and not ValidationServer._is_loopback(urlsplit(origin).hostname or ""):
+            raise _HttpError(403, f"허용되지 않은 출처입니다: {origin}")
+        if method == 'POST':
+            content_type = headers.get('content-type', '').split(';')[0].strip().lower()
+            if content_type != 'application/json':
+                raise _HttpError(415, "POST 요청은 Content-Type: application/json이어야 합니다")
+
+    async def _route(self, method, path, body, writer):
+        parts = path.strip('/').split('/')
+
+        if parts == ['health']:
+            self._require_method(method, 'GET')
+            await self._send_json(writer, 200, self._health())
+        elif parts == ['metrics']:
+            self._require_method(method, 'GET')
+            body = registry.to_prometheus().encode('utf-8')
+            writer.write(self._response_head(200, "text/plain; version=0.0.4", len(body)) + body)
+            await writer.drain()
+        elif parts == ['jobs']:
+            self._require_method(method, 'POST')
+            job = self._submit(self._parse_json(body))
+            await self._send_json(writer, 202, job.to_dict(include_results=False))
+        elif len(parts) == 2 and parts[0] == 'jobs':
+            self._require_method(method, 'GET')
+            await self._send_json(writer, 200, self._get_job(parts[1]).to_dict())
+        elif len(parts) == 3 and parts[0] == 'jobs' and parts[2] == 'events':
+            self._require_method(method, 'GET')
+            await self._stream_events(self._get_job(parts[1]), writer)
+        elif len(parts) == 3 and parts[0] == 'jobs' and parts[2] == 'cancel':
+            self._require_method(method, 'POST')
+            job = self._get_job(parts[1])
+            self._cancel(job)
+            await self._send_json(writer, 200, job.to_dict(include_results=False))
+        else:
+            raise _HttpError(404, f"알 수 없는 경로입니다: {path}")
+
+    async def _stream_events(self, job, writer):
+        """작업 이벤트를 한 줄에 하나씩(JSON) 보내고, 작업이 끝나면 연결을 닫습니다."""
+        writer.write(self._response_head(200, "application/x-ndjson"))
+        sent = 0
+        while True:
+            while sent < len(job.events):
+                writer.write(self._encode(job.events[sent]) + b"\n")
+                sent += 1
+            await writer.drain()
+            if job.is_finished:
+                return
+            waiter = job.wakeup
+            await waiter.wait()
+
+    async def _send_json(self, writer, status, payload):
+        body = self._encode(payload)
+        writer.write(self._response_head(status, "application/json", len(body)) + body)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+    @staticmethod
+    def _response_head(status, content_type, length=None):
+        lines = [f"HTTP/1.1 {status} {_STATUS_TEXT.get(status, '')}", f"Content-Type: {content_type}; charset=utf-8"]
+        if length is not None:
+            lines.append(f"Content-Length: {length}")
+        lines += ["Cache-Control: no-cache", "Connection: close", "", ""]
+        return "\r\n".join(lines).encode('latin-1')
+
+    @staticmethod
+    def _encode(payload):
+        return json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+
+    @staticmethod
+    def _parse_json(body):
+        try:
+            payload = json.loads(body.decode('utf-8') or '{}')
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise _HttpError(400, "본문이 올바른 JSON이 아닙니다")
+        if not isinstance(payload, dict):
+            raise _HttpError(400, "본문은 JSON 객체여야 합니다")
+        return payload
+
+    @staticmethod
+    def _require_method(method, expected):
+        if method != expected:
+            raise _HttpError(405, f"{expected} 요청만 허용됩니다")
+
+    @staticmethod
+    def _is_loopback(host):
+        if host == "localhost":
+            return True
+        try:
+            return ipaddress.ip_address(host).is_loopback
+        except ValueError:
+            return False
+
+    # --- 작업 관리 (이벤트 루프 스레드에서만 호출) ---
+    def _health(self):
+        statuses = [job.status for job in self._jobs.values()]
+        return {
+            "status": "ok",
+            "version": VERSION,
+            "queued": statuses.count("queued"),
+            "running": statuses.count("running"),
+            "max_concurrent": self.max_concurrent,
+        }
+
+    def _submit(self, payload):
+        template_name = payload.get('template_name')
+        template = payload.get('template')
+        if template is None:
+            if not template_name:
+                raise _HttpError(400, "template_name 또는 template이 필요합니다")
+            template = self._resolve_template(template_name)
+        if not isinstance(template, dict) or 'rois' not in template or 'original_pdf_path' not in template:
+            raise _HttpError(400, "template 형식이 올바르지 않습니다")
+
+        try:
+            priority = int(payload.get('priority', 0))
+        except (TypeError, ValueError):
+            raise _HttpError(400, "priority는 정수여야 합니다")
+
+        temp_path = None
+        if payload.get('pdf_base64'):
+            try:
+                data = base64.b64decode(payload['pdf_base64'], validate=True)
+            except (binascii.Error, ValueError):
+                raise _HttpError(400, "pdf_base64를 해석할 수 없습니다")
+            fd, temp_path = tempfile.mkstemp(prefix="validation_job_", suffix=".pdf")
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            pdf_path = temp_path
+        elif payload.get('pdf_path'):
+            pdf_path = payload['pdf_path']
+            if not os.path.isfile(pdf_path):
+                raise _HttpError(400, f"PDF 파일을 찾을 수 없습니다: {pdf_path}")
+        else:
+            raise _HttpError(400, "pdf_path 또는 pdf_base64가 필요합니다")
+
+        job = ServerJob(
+            uuid.uuid4().hex, priority, template, template_name, pdf_path, temp_path,
+            streaming=bool(payload.get('streaming', False))
+        )
+        self._jobs[job.id] = job
+        self._emit(job, {"type": "status", "status": job.status})
+        # 우선순위가 높을수록 먼저, 같으면 먼저 제출된 순서대로
+        self._queue.put_nowait((-priority, next(self._sequence), job))
+        _QUEUE_DEPTH.set(self._queue.qsize())
+        return job
+
+    def _resolve_template(self, template_name):
+        """템플릿을 메모리에 보관해 두고, 템플릿 파일이 바뀌었을 때만 다시 읽습니다."""
+        if self.template_service is None:
+            raise _HttpError(400, "이 서버는 템플릿 이름으로 제출할 수 없습니다 (template을 직접 전달하세요)")
+        try:
+            mtime = os.path.getmtime(self.templates_file)
+        except OSError:
+            mtime = None
+        if mtime != self._template_cache_mtime:
+            self._template_cache.clear()
+            self._template_cache_mtime = mtime
+
+        if template_name not in self._template_cache:
+            try:
+                template = self.template_service.load_template(template_name)
+            except (KeyError, FileNotFoundError) as e:
+                raise _HttpError(404, str(e))
+            template = {**template, 'original_pdf_path': os.path.abspath(template['original_pdf_path'])}
+            self._template_cache[template_name] = template
+        return self._template_cache[template_name]
+
+    def _get_job(self, job_id):
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise _HttpError(404, f"작업을 찾을 수 없습니다: {job_id}")
+        return job
+
+    def _cancel(self, job):
+        if job.is_finished:
+            return
+        job.cancel_event.set()
+        if job.status == "queued":
+            # 대기 중이면 바로 취소 처리 (큐에서 꺼낼 때 건너뜀)
+            self._finish(job, "cancelled")
+
+    def _emit(self, job, event):
+        """이벤트를 기록하고 스트림 구독자를 깨웁니다."""
+        if event["type"] == "progress":
+            job.progress = (event["current"], event["total"])
+        job.events.append(event)
+        job.wakeup.set()
+        job.wakeup = asyncio.Event()
+
+    def _set_status(self, job, status):
+        job.status = status
+        self._emit(job, {"type": "status", "status": status})
+
+    def _finish(self, job, status, error=None):
+        if job.is_finished:
+            return
+        _JOBS.inc(status=status)
+        job.error = error
+        job.finished_at = time.time()
+        self._remove_temp_file(job)
+        if error:
+            self._emit(job, {"type": "error", "message": error})
+        self._set_status(job, status)
+        self._prune_jobs()
+
+    def _prune_jobs(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.is_finished]
+        for job_id in finished[:max(0, len(finished) - SERVER_JOB_RETENTION)]:
+            del self._jobs[job_id]
+
+    @staticmethod
+    def _remove_temp_file(job):
+        if job.temp_path and os.path.exists(job.temp_path):
+            try:
+                os.remove(job.temp_path)
+            except OSError:
+                pass
+
+    async def _dispatch(self):
+        """큐에서 작업을 꺼내 스레드 풀에서 실행합니다. 동시 실행 수는 디스패처 수로 제한됩니다."""
+        while True:
+            _, _, job = await self._queue.get()
+            _QUEUE_DEPTH.set(self._queue.qsize())
+            if job.is_finished:
+                continue  # 대기 중 취소된 작업
+
+            job.started_at = time.time()
+            self._set_status(job, "running")
+            _RUNNING_JOBS.inc()
+            try:
+                results = await self._loop.run_in_executor(self._executor, self._run_job, job)
+            except ValidationCancelledError:
+                self._finish(job, "cancelled")
+            except Exception as e:
+                self._finish(job, "error", error=str(e))
+            else:
+                job.results = results
+                self._emit(job, {"type": "result", "results": results})
+                self._finish(job, "done")
+            finally:
+                _RUNNING_JOBS.dec()
+
+    def _run_job(self, job):
+        """작업 스레드에서 실행. 진행 상황은 이벤트 루프로 넘겨 기록합니다."""
+        def progress_callback(message, current, total):
+            self._loop.call_soon_threadsafe(
+                self._emit, job, {"type": "progress", "message": message, "current": current, "total": total}
+            )
+
+        def checkpoint():
+            if job.cancel_event.is_set():
+                raise ValidationCancelledError()
+
+        return self.validation_service.validate_document(
+            job.template, job.pdf_path, progress_callback=progress_callback, checkpoint=checkpoint,
+            streaming=job.streaming
+        )
+
+
+def main(argv=None):
+    """검증 서버 실행 진입점"""
+    parser = argparse.ArgumentParser(description="로컬 PDF 검증 서버")
+    parser.add_argument("--host", default=VALIDATION_SERVER_HOST)
+    parser.add_argument("--port", type=int, default=VALIDATION_SERVER_PORT)
+    parser.add_argument("--workers", type=int, default=MAX_CONCURRENT_VALIDATIONS, help="동시에 처리할 문서 수")
+    parser.add_argument("--templates", default=DEFAULT_TEMPLATE_FILE, help="템플릿 JSON 파일 경로")
+    args = parser.parse_args(argv)
+
+    from infrastructure.repositories.file_document_repository import FileDocumentRepository
+    from infrastructure.repositories.json_template_repository import JsonTemplateRepository
+    from infrastructure.services.validation_vision_service import ValidationVisionService
+    from domain.services.template_service import TemplateService
+    from domain.services.validation_service import ValidationService
+
+    validation_service = ValidationService(FileDocumentRepository(), ValidationVisionService())
+    template_service = TemplateService(JsonTemplateRepository(args.templates), vision_service=None)
+    server = ValidationServer(
+        validation_service, template_service, host=args.host, port=args.port,
+        max_concurrent=args.workers, templates_file=args.templates
+    )
+
+    async def run():
+        await server.start()
+        print(f"검증 서버 시작: http://{server.host}:{server.port} (동시 처리 {server.max_concurrent}개)")
+        try:
+            await server.serve_forever()
+        finally:
+            await server.stop()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
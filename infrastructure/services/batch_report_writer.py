@@ -0,0 +1,241 @@
+# 파일 경로: infrastructure/services/batch_report_writer.py
+"""
+Batch Report Writer
+일괄 검증 결과를 문서가 끝날 때마다 JSONL/CSV 파일에 한 줄씩 덧붙이는 스트리밍 보고서 작성기
+
+- 행은 쓰자마자 버리고 집계는 누적값(개수/합계/Welford 분산/로그 구간 히스토그램)으로만 유지하므로
+  문서 10만 개 일괄 검증에서도 메모리 사용량이 늘지 않습니다.
+- flush_rows 행 또는 flush_seconds 초마다 파일을 flush하고 요약(<이름>.summary.json)을 다시 써서,
+  작업이 중간에 멈춰도 그때까지의 보고서와 집계가 남습니다.
+- 파일: <이름>.jsonl (문서 행, include_rois이면 ROI 행도), <이름>.csv (문서 행),
+  <이름>_rois.csv (include_rois일 때 ROI 행), <이름>.summary.json (집계)
+
+사용 예:
+    report = BatchReportWriter("output", "report_20240101_120000", include_rois=True)
+    report.write_document({"index": 1, "file_name": "a.pdf", "status": "OK", ...}, roi_rows)
+    summary = report.close()
+"""
+import csv
+import json
+import math
+import os
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+from shared.constants import (
+    BATCH_REPORT_FORMATS, BATCH_REPORT_FLUSH_ROWS, BATCH_REPORT_FLUSH_SECONDS, TIMING_STAGES
+)
+
+# CSV 열 (JSONL에는 행의 모든 키가 그대로 들어감)
+DOCUMENT_COLUMNS = (
+    "index", "file_name", "template_name", "status", "deficient_count", "error_count", "roi_count",
+    "processing_time", "scanned_page_count", "first_page", "last_page", "failed_rois", "message",
+    "output_path", "file_path", "validated_at",
+) + tuple(f"{stage}_seconds" for stage in TIMING_STAGES)
+# ROI 행의 측정값 중 CSV에 넣는 값 (전체 측정값은 JSONL에)
+ROI_MEASUREMENT_COLUMNS = ("threshold", "char_count", "ink_density", "contour_count", "contour_area")
+ROI_COLUMNS = (
+    "document_index", "file_name", "roi_name", "status", "page", "source_page", "processing_time", "message",
+    *ROI_MEASUREMENT_COLUMNS,
+)
+
+
+class RunningStats:
+    """
+    값 목록을 보관하지 않는 누적 통계 (개수/합계/최소/최대/평균/표준편차, 분위수 근사)
+    분위수는 비율 bucket_ratio의 로그 구간 히스토그램으로 추정하므로 상대 오차가 구간 폭 이내입니다.
+    """
+
+    def __init__(self, min_value: float = 1e-3, bucket_ratio: float = 1.05):
+        self.min_value = min_value
+        self._log_ratio = math.log(bucket_ratio)
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._buckets: Dict[int, int] = {}  # 구간 번호 -> 개수 (값의 범위에만 비례, 개수와 무관)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+        bucket = self._bucket(value)
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+
+    @property
+    def mean(self) -> float:
+        return self._mean if self.count else 0.0
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def quantile(self, q: float) -> float:
+        """q (0~1) 분위수 근사값 (해당 구간의 기하 중앙값, 최소/최대값으로 제한)"""
+        if not self.count:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen > rank:
+                if bucket < 0:
+                    return self.minimum
+                estimate = self.min_value * math.exp((bucket + 0.5) * self._log_ratio)
+                return min(max(estimate, self.minimum), self.maximum)
+        return self.maximum
+
+    def to_dict(self, digits: int = 4) -> dict:
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count, "total": round(self.total, digits), "mean": round(self.mean, digits),
+            "stddev": round(self.stddev, digits), "min": round(self.minimum, digits), "max": round(self.maximum, digits),
+            "p50": round(self.quantile(0.5), digits), "p95": round(self.quantile(0.95), digits),
+            "p99": round(self.quantile(0.99), digits),
+        }
+
+    def _bucket(self, value: float) -> int:
+        if value < self.min_value:
+            return -1
+        return int(math.log(value / self.min_value) / self._log_ratio)
+
+
+class BatchReportWriter:
+    def __init__(self, directory: str, name: str, formats: Iterable[str] = BATCH_REPORT_FORMATS,
+                 include_rois: bool = False, flush_rows: int = BATCH_REPORT_FLUSH_ROWS,
+                 flush_seconds: float = BATCH_REPORT_FLUSH_SECONDS, clock=time.monotonic):
+        self.formats = tuple(fmt for fmt in formats if fmt in ("jsonl", "csv"))
+        self.include_rois = include_rois
+        self.flush_rows = max(1, flush_rows)
+        self.flush_seconds = flush_seconds
+        self.clock = clock
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, name)
+        self.summary_path = f"{base}.summary.json"
+        self.paths: Dict[str, str] = {"summary": self.summary_path}
+
+        # 집계
+        self.started_at = time.strftime("%Y-%m-%dT%H:%M:%S")
+        self.documents = 0
+        self.document_status = Counter()
+        self.roi_status = Counter()
+        self.templates = Counter()
+        self.failed_rois = Counter()  # ROI 이름 수는 템플릿에 따라 정해지므로 문서 수와 무관
+        self.processing_time = RunningStats()
+        self.stage_seconds = Counter()
+
+        self._lock = threading.Lock()
+        self._files = []
+        self._jsonl = self._document_csv = self._roi_csv = None
+        if "jsonl" in self.formats:
+            self._jsonl = self._open("jsonl", f"{base}.jsonl")
+        if "csv" in self.formats:
+            self._document_csv = csv.DictWriter(self._open("csv", f"{base}.csv"), DOCUMENT_COLUMNS,
+                                                extrasaction="ignore")
+            self._document_csv.writeheader()
+            if include_rois:
+                self._roi_csv = csv.DictWriter(self._open("roi_csv", f"{base}_rois.csv"), ROI_COLUMNS,
+                                               extrasaction="ignore")
+                self._roi_csv.writeheader()
+        self._pending = 0
+        self._last_flush = self.clock()
+
+    def _open(self, key, path):
+        # CSV는 엑셀에서 한글이 깨지지 않도록 BOM 포함 UTF-8
+        f = open(path, "w", encoding="utf-8-sig" if key != "jsonl" else "utf-8", newline="")
+        self.paths[key] = path
+        self._files.append(f)
+        return f
+
+    def write_document(self, record: dict, rois: Optional[List[dict]] = None) -> None:
+        """
+        문서 한 행(과 include_rois이면 ROI 행들)을 덧붙이고 집계를 갱신합니다.
+        record의 stage_timings(dict)는 CSV에서 '<단계>_seconds' 열로 펼칩니다.
+        """
+        with self._lock:
+            self._accumulate(record, rois or [])
+            if self._jsonl is not None:
+                self._jsonl.write(json.dumps({"type": "document", **record}, ensure_ascii=False, default=str) + "\n")
+                if self.include_rois:
+                    for roi in rois or []:
+                        self._jsonl.write(json.dumps({"type": "roi", "document_index": record.get("index"), **roi},
+                                                     ensure_ascii=False, default=str) + "\n")
+            if self._document_csv is not None:
+                self._document_csv.writerow(self._csv_row(record))
+            if self._roi_csv is not None:
+                for roi in rois or []:
+                    self._roi_csv.writerow({"document_index": record.get("index"),
+                                            "file_name": record.get("file_name"), **roi})
+            self._pending += 1
+            if self._pending >= self.flush_rows or self.clock() - self._last_flush >= self.flush_seconds:
+                self._flush()
+
+    def summary(self) -> dict:
+        """지금까지의 집계"""
+        return {
+            "started_at": self.started_at,
+            "updated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "documents": self.documents,
+            "document_status": dict(self.document_status),
+            "roi_status": dict(self.roi_status),
+            "templates": dict(self.templates.most_common()),
+            "processing_time": self.processing_time.to_dict(),
+            "stage_seconds": {stage: round(seconds, 4) for stage, seconds in self.stage_seconds.items()},
+            "most_failed_rois": dict(self.failed_rois.most_common(20)),
+            "files": dict(self.paths),
+        }
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def close(self) -> dict:
+        """남은 행을 쓰고 파일을 닫습니다. 최종 집계를 반환합니다."""
+        with self._lock:
+            self._flush()
+            for f in self._files:
+                f.close()
+            self._files = []
+            return self.summary()
+
+    # --- 내부 ---
+    def _accumulate(self, record, rois):
+        self.documents += 1
+        self.document_status[record.get("status", "")] += 1
+        if record.get("template_name"):
+            self.templates[record["template_name"]] += 1
+        if record.get("processing_time") is not None:
+            self.processing_time.add(float(record["processing_time"]))
+        self.stage_seconds.update(record.get("stage_timings") or {})
+        if rois:
+            for roi in rois:
+                self.roi_status[roi.get("status", "")] += 1
+        self.failed_rois.update(record.get("failed_rois") or [])
+
+    @staticmethod
+    def _csv_row(record):
+        row = dict(record)
+        for stage, seconds in (record.get("stage_timings") or {}).items():
+            row[f"{stage}_seconds"] = seconds
+        if isinstance(row.get("failed_rois"), (list, tuple)):
+            row["failed_rois"] = ";".join(row["failed_rois"])
+        return row
+
+    def _flush(self):
+        for f in self._files:
+            f.flush()
+        tmp_path = f"{self.summary_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.summary_path)
+        self._pending = 0
+        self._last_flush = self.clock()
@@ -0,0 +1,183 @@
+# 파일 경로: infrastructure/services/batch_rescorer.py
+"""
+Batch Rescorer
+끝난 일괄 검증을 PDF 없이 다시 판정합니다.
+
+일괄 검증 보고서(report_<시각>.jsonl, BatchReportWriter)의 문서 행에는 ROI별 측정값(글자 수, 잉크 면적 등)이
+남아 있으므로, templates.json의 임계값만 바꾼 경우 렌더링/정렬/OCR을 다시 하지 않고
+측정값을 새 임계값과 비교해(domain.services.roi_scoring) 상태가 바뀌는 문서만 찾을 수 있습니다.
+보고서를 한 줄씩 읽으므로 문서 수와 관계없이 메모리 사용량이 일정합니다.
+
+- 측정값이 없는 문서(오류로 끝난 문서, 측정값 저장 이전의 보고서)는 건너뜁니다.
+- 템플릿에 새로 추가된 ROI나 측정 당시 하지 않은 방식(예: contour -> ocr)으로 바꾼 ROI는 판정할 수 없어
+  검증 당시 상태를 그대로 쓰고 "측정값 없음"으로 보고합니다.
+
+사용 예:
+    # 현재 templates.json 기준으로 다시 판정
+    python -m infrastructure.services.batch_rescorer output/report_20240101_120000.jsonl
+
+    # templates.json을 고치지 않고 가정 분석 (모든 템플릿의 p1_field01, 특정 템플릿의 서명 칸)
+    python -m infrastructure.services.batch_rescorer output/report_20240101_120000.jsonl \\
+        --set p1_field01=5 --set 보험금청구서/서명=200
+
+    # Contour 잉크 면적 판정을 켰을 때 바뀔 문서 확인 (임계값 조정용)
+    python -m infrastructure.services.batch_rescorer output/report_20240101_120000.jsonl --contour-scoring
+
+    # 상태가 바뀐 문서 목록을 CSV로 저장
+    python -m infrastructure.services.batch_rescorer output/report_20240101_120000.jsonl --output flips.csv
+"""
+import argparse
+import csv
+import json
+import time
+from collections import Counter
+from typing import Callable, Dict, Optional
+
+from domain.services.roi_scoring import DocumentRescore, rescore_document
+from shared.constants import CONTOUR_SCORING_ENABLED, DEFAULT_TEMPLATE_FILE
+
+FLIP_COLUMNS = ("index", "file_name", "template_name", "old_status", "new_status", "changed_rois", "unmeasured_rois",
+                "file_path")
+
+
+def parse_overrides(values) -> Dict[Optional[str], Dict[str, float]]:
+    """'ROI=값' 또는 '템플릿/ROI=값' 목록을 {템플릿 이름 또는 None(모든 템플릿): {ROI: 임계값}}으로 바꿉니다."""
+    overrides: Dict[Optional[str], Dict[str, float]] = {}
+    for value in values or []:
+        target, _, threshold = value.partition("=")
+        if not threshold:
+            raise ValueError(f"임계값 지정 형식은 ROI=값 또는 템플릿/ROI=값입니다: {value}")
+        template_name, _, roi_name = target.rpartition("/")
+        number = float(threshold)
+        overrides.setdefault(template_name or None, {})[roi_name] = int(number) if number.is_integer() else number
+    return overrides
+
+
+def describe_change(change) -> str:
+    """'p1_field01 OK->DEFICIENT (4 < 5)' 형식"""
+    relation = "<" if change.value < change.threshold else ">="
+    return f"{change.roi_name} {change.old_status}->{change.new_status} ({change.value} {relation} {change.threshold})"
+
+
+class BatchRescorer:
+    def __init__(self, template_repository, overrides: Optional[Dict[Optional[str], Dict[str, float]]] = None,
+                 contour_scoring: bool = CONTOUR_SCORING_ENABLED):
+        self.template_repository = template_repository
+        self.overrides = overrides or {}
+        self.contour_scoring = contour_scoring
+        self._rois: Dict[str, Optional[dict]] = {}  # 템플릿 이름 -> ROI 설정 (없는 템플릿은 None)
+
+    def rescore_record(self, record: dict) -> Optional[DocumentRescore]:
+        """보고서 문서 행 하나를 다시 판정합니다. 측정값이나 템플릿이 없으면 None."""
+        measurements = record.get("measurements")
+        rois = self._template_rois(record.get("template_name"))
+        if not measurements or rois is None:
+            return None
+        overrides = {**self.overrides.get(None, {}), **self.overrides.get(record["template_name"], {})}
+        return rescore_document(record.get("status", "OK"), measurements, rois, overrides, self.contour_scoring)
+
+    def run(self, report_path: str, on_flip: Optional[Callable[[dict, DocumentRescore], None]] = None) -> dict:
+        """
+        보고서 전체를 다시 판정하고 집계를 반환합니다.
+        상태가 바뀐 문서마다 on_flip(문서 행, DocumentRescore)을 호출합니다.
+        """
+        started = time.perf_counter()
+        documents, skipped = 0, 0
+        flips, statuses, unmeasured, missing_templates = Counter(), Counter(), Counter(), set()
+        with open(report_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record.get("type", "document") != "document":
+                    continue
+                documents += 1
+                rescore = self.rescore_record(record)
+                if rescore is None:
+                    skipped += 1
+                    if record.get("measurements") and record.get("template_name"):
+                        missing_templates.add(record["template_name"])
+                    continue
+                statuses[rescore.status] += 1
+                unmeasured.update(rescore.unmeasured)
+                if rescore.flipped:
+                    flips[f"{rescore.old_status}->{rescore.status}"] += 1
+                    if on_flip is not None:
+                        on_flip(record, rescore)
+        return {
+            "documents": documents,
+            "rescored": documents - skipped,
+            "skipped": skipped,
+            "flipped": sum(flips.values()),
+            "flips": dict(flips.most_common()),
+            "status": dict(statuses),
+            "unmeasured_rois": dict(unmeasured.most_common()),
+            "missing_templates": sorted(missing_templates),
+            "seconds": round(time.perf_counter() - started, 3),
+        }
+
+    def _template_rois(self, template_name):
+        if not template_name:
+            return None
+        if template_name not in self._rois:
+            try:
+                self._rois[template_name] = self.template_repository.load(template_name).get("rois", {})
+            except KeyError:
+                self._rois[template_name] = None
+        return self._rois[template_name]
+
+
+def main(argv=None):
+    from infrastructure.repositories.json_template_repository import JsonTemplateRepository
+
+    parser = argparse.ArgumentParser(description="저장된 ROI 측정값으로 일괄 검증 결과를 다시 판정")
+    parser.add_argument("report", help="일괄 검증 보고서 (report_<시각>.jsonl)")
+    parser.add_argument("--templates", default=DEFAULT_TEMPLATE_FILE, help="임계값을 읽을 템플릿 파일")
+    parser.add_argument("--set", action="append", default=[], metavar="[템플릿/]ROI=값",
+                        help="템플릿 파일 대신 쓸 임계값 (여러 번 지정 가능)")
+    parser.add_argument("--contour-scoring", action="store_true", default=CONTOUR_SCORING_ENABLED,
+                        help="Contour ROI를 잉크 면적으로 판정 (기본값은 CONTOUR_SCORING_ENABLED)")
+    parser.add_argument("--output", help="상태가 바뀐 문서 목록을 저장할 CSV 경로")
+    args = parser.parse_args(argv)
+
+    rescorer = BatchRescorer(JsonTemplateRepository(args.templates), parse_overrides(args.set), args.contour_scoring)
+    output = open(args.output, "w", encoding="utf-8-sig", newline="") if args.output else None
+    writer = csv.DictWriter(output, FLIP_COLUMNS) if output else None
+    if writer:
+        writer.writeheader()
+
+    def on_flip(record, rescore):
+        changed = "; ".join(describe_change(change) for change in rescore.changes)
+        print(f"  {record.get('file_name')} [{record.get('template_name')}] "
+              f"{rescore.old_status} -> {rescore.status}: {changed}")
+        if writer:
+            writer.writerow({
+                "index": record.get("index"), "file_name": record.get("file_name"),
+                "template_name": record.get("template_name"), "old_status": rescore.old_status,
+                "new_status": rescore.status, "changed_rois": changed,
+                "unmeasured_rois": ";".join(rescore.unmeasured), "file_path": record.get("file_path"),
+            })
+
+    try:
+        summary = rescorer.run(args.report, on_flip)
+    finally:
+        if output:
+            output.close()
+
+    print(f"문서 {summary['documents']}개 중 {summary['rescored']}개 재판정, "
+          f"상태 변경 {summary['flipped']}개 ({summary['seconds']:.2f}초)")
+    for transition, count in summary["flips"].items():
+        print(f"  {transition}: {count}")
+    print("새 상태: " + ", ".join(f"{status} {count}" for status, count in summary["status"].items()))
+    if summary["skipped"]:
+        print(f"측정값/템플릿이 없어 건너뜀: {summary['skipped']}개"
+              + (f" (없는 템플릿: {', '.join(summary['missing_templates'])})" if summary["missing_templates"] else ""))
+    if summary["unmeasured_rois"]:
+        print("측정값이 없어 이전 상태를 쓴 ROI: "
+              + ", ".join(f"{name} {count}" for name, count in summary["unmeasured_rois"].items()))
+    if args.output:
+        print(f"상태가 바뀐 문서 목록: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
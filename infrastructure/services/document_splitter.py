@@ -0,0 +1,145 @@
+# 파일 경로: infrastructure/services/document_splitter.py
+"""
+Document Splitter
+여러 양식을 한 PDF로 이어 스캔한 묶음을 템플릿 지문(TemplateFingerprintIndex)으로 나눕니다.
+
+문서의 모든 페이지를 저해상도로 해시하여 모든 템플릿의 모든 페이지와 비교한 뒤,
+"양식 하나 = 그 템플릿의 페이지 수만큼 연속한 페이지"라는 가정으로 묶음 전체의 점수가 가장 높은
+구간 나누기를 동적 계획법으로 찾습니다.
+
+- 구간 점수: 구간의 각 페이지 신뢰도에서 인식 기준(min_confidence)을 뺀 값의 합
+  (기준보다 닮지 않은 페이지는 감점이므로 억지로 양식에 끼워 넣지 않습니다).
+- 어느 양식에도 맞지 않는 페이지는 0점으로 "미인식"이 되고, 연속한 미인식 페이지는 한 구간으로 합칩니다.
+- 묶음 끝에서는 템플릿보다 짧은 (뒷장이 빠진) 양식도 허용합니다.
+
+나눈 구간은 중간 PDF를 만들지 않고 page_range로 그대로 검증합니다 (ValidationService.validate_document 참고).
+
+사용 예:
+    splitter = DocumentSplitter(index)
+    for segment in splitter.split("inbound/batch.pdf"):
+        print(segment.label, segment.template_name, segment.page_range)
+"""
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+from infrastructure.services.template_fingerprint_index import TemplateMatch, document_fingerprints
+
+
+@dataclass
+class DocumentSegment:
+    """
+    묶음 PDF 안의 양식 하나 (연속한 페이지 구간)
+
+    Attributes:
+        index: 묶음 안에서의 순번 (0부터 시작)
+        first_page: 첫 페이지 번호 (0부터 시작)
+        page_count: 페이지 수
+        match: 구간의 템플릿 인식 결과 (미인식 구간은 첫 페이지가 가장 닮은 템플릿과 그 신뢰도)
+        identified: 어떤 양식에도 맞지 않아 미인식으로 남은 구간이면 False
+    """
+    index: int
+    first_page: int
+    page_count: int
+    match: TemplateMatch
+    identified: bool = True
+
+    @property
+    def page_range(self) -> range:
+        return range(self.first_page, self.first_page + self.page_count)
+
+    @property
+    def template_name(self) -> Optional[str]:
+        """자동 배정 기준을 넘은 템플릿 이름 (미인식/모호하면 None)"""
+        return self.match.template_name if self.identified and self.match.is_confident else None
+
+    @property
+    def label(self) -> str:
+        """사람이 읽는 원본 페이지 번호 (1부터): 'p.3' 또는 'p.3-4'"""
+        last = self.first_page + self.page_count
+        return f"p.{self.first_page + 1}" if self.page_count == 1 else f"p.{self.first_page + 1}-{last}"
+
+
+class DocumentSplitter:
+    def __init__(self, template_index):
+        self.index = template_index
+
+    def split(self, pdf_path: str, checkpoint=None) -> List[DocumentSegment]:
+        """PDF를 양식 단위 구간으로 나눕니다. 페이지 해시 계산 중 페이지마다 checkpoint를 호출합니다."""
+        return self.split_hashes(document_fingerprints(pdf_path, None, checkpoint))
+
+    def split_hashes(self, page_hashes) -> List[DocumentSegment]:
+        """페이지 해시 목록을 양식 단위 구간으로 나눕니다 (렌더링 없이 계산만)."""
+        total = len(page_hashes)
+        names, page_counts, confidence, mask = self.index.page_confidences(page_hashes)
+        if total == 0:
+            return []
+
+        min_confidence = self.index.min_confidence
+        gains = np.where(mask[:, :, None], confidence - min_confidence, 0.0)  # (T, P, N)
+        lengths = np.minimum(page_counts[:, None], total - np.arange(total)[None, :])  # (T, N): 끝에서는 잘린 양식
+        # scores[t, i]: 페이지 i부터 템플릿 t 한 부를 놓았을 때의 점수 (템플릿 페이지 j ↔ 문서 페이지 i + j)
+        scores = np.zeros((len(names), total))
+        for page_num in range(gains.shape[1]):
+            if page_num >= total:
+                break
+            inside = page_num < lengths[:, :total - page_num]
+            scores[:, :total - page_num] += np.where(inside, gains[:, page_num, page_num:], 0.0)
+
+        # best[n]: 앞쪽 n페이지를 나누는 최고 점수, back[n]: (구간 시작, 템플릿 행 또는 -1=미인식)
+        best = np.full(total + 1, -np.inf)
+        best[0] = 0.0
+        back = [None] * (total + 1)
+        for start in range(total):
+            if best[start] > best[start + 1]:
+                best[start + 1], back[start + 1] = best[start], (start, -1)
+            # 감점 구간은 미인식 페이지로 채우는 것보다 나을 수 없으므로 점수가 양수인 후보만 확인
+            for row in np.flatnonzero(scores[:, start] > 0):
+                end = start + int(lengths[row, start])
+                if best[start] + scores[row, start] > best[end]:
+                    best[end], back[end] = best[start] + scores[row, start], (start, int(row))
+
+        pieces = []
+        end = total
+        while end > 0:
+            start, row = back[end]
+            if row < 0 and pieces and pieces[-1][2] < 0:
+                pieces[-1] = (start, pieces[-1][1], -1)  # 연속한 미인식 페이지는 한 구간으로
+            else:
+                pieces.append((start, end, row))
+            end = start
+        pieces.reverse()
+
+        return [
+            DocumentSegment(index, start, end - start, self._span_match(names, confidence, mask, start, end, row), row >= 0)
+            for index, (start, end, row) in enumerate(pieces)
+        ]
+
+    def _span_match(self, names, confidence, mask, start, end, row):
+        """
+        구간 [start, end)를 각 템플릿의 0페이지부터 맞대어 본 평균 신뢰도로 TemplateMatch를 만듭니다.
+        양식 구간은 고른 템플릿을, 미인식 구간은 첫 페이지가 가장 닮은 템플릿을 1순위로 보고합니다.
+        """
+        if not names:
+            return TemplateMatch(None, 0.0, min_confidence=self.index.min_confidence)
+        length = min(end - start, confidence.shape[1])
+        if row < 0:
+            length = 1
+        offsets = np.arange(length)
+        valid = mask[:, offsets]                                               # (T, L)
+        compared = valid.sum(axis=1)
+        means = (confidence[:, offsets, start + offsets] * valid).sum(axis=1) / np.maximum(compared, 1)
+
+        order = [int(i) for i in np.argsort(-means, kind="stable")]
+        best = row if row >= 0 else order[0]
+        others = [i for i in order if i != best]
+        runner_up = others[0] if others else None
+        return TemplateMatch(
+            template_name=names[best],
+            confidence=float(means[best]),
+            runner_up=names[runner_up] if runner_up is not None else None,
+            runner_up_confidence=float(means[runner_up]) if runner_up is not None else 0.0,
+            pages_compared=int(compared[best]),
+            min_confidence=self.index.min_confidence,
+        )
@@ -0,0 +1,64 @@
+# 파일 경로: infrastructure/services/page_classifier.py
+import fitz  # PyMuPDF
+
+from domain.entities.document import PageClassification, PageKind
+from shared.constants import (
+    SCANNED_PAGE_IMAGE_COVERAGE,
+    MIXED_PAGE_IMAGE_COVERAGE,
+    MIN_TEXT_SPANS_FOR_DIGITAL,
+)
+
+# Infrastructure Layer (Service Implementation)
+# 역할: 페이지를 렌더링하지 않고 PDF 구조 정보(이미지 배치, 텍스트 span, 폰트)만으로
+#       스캔 페이지인지 디지털 페이지인지 빠르게 판별합니다.
+
+
+class PageClassifier:
+    def classify(self, page, page_num=None):
+        """fitz 페이지 하나를 판별하여 PageClassification을 반환합니다."""
+        page_rect = page.rect
+        page_area = abs(page_rect) or 1.0
+
+        # 1. 이미지 면적 비율 (이미지가 겹치는 경우는 드물어 단순 합산 후 1.0으로 제한)
+        image_area = 0.0
+        for info in page.get_image_info():
+            bbox = fitz.Rect(info["bbox"]) & page_rect
+            if not bbox.is_empty:
+                image_area += abs(bbox)
+        image_coverage = min(image_area / page_area, 1.0)
+
+        # 2. 공백이 아닌 텍스트 span 개수 (flags=0: 이미지 블록은 추출하지 않음)
+        text_span_count = 0
+        for block in page.get_text("dict", flags=0)["blocks"]:
+            for line in block.get("lines", []):
+                for span in line.get("spans", []):
+                    if span.get("text", "").strip():
+                        text_span_count += 1
+
+        # 3. 페이지 리소스가 참조하는 폰트 개수
+        font_count = len(page.get_fonts())
+
+        kind = self._decide_kind(image_coverage, text_span_count, font_count)
+        return PageClassification(
+            page=page.number if page_num is None else page_num,
+            kind=kind,
+            image_coverage=image_coverage,
+            text_span_count=text_span_count,
+            font_count=font_count
+        )
+
+    def _decide_kind(self, image_coverage, text_span_count, font_count):
+        # 페이지 전체를 덮는 이미지는 텍스트 레이어(OCR 결과)가 있어도 스캔본으로 취급
+        if image_coverage >= SCANNED_PAGE_IMAGE_COVERAGE:
+            return PageKind.SCANNED
+
+        has_text = text_span_count >= MIN_TEXT_SPANS_FOR_DIGITAL and font_count > 0
+        if has_text:
+            return PageKind.MIXED if image_coverage >= MIXED_PAGE_IMAGE_COVERAGE else PageKind.DIGITAL
+
+        # 텍스트가 없는 페이지: 이미지가 있으면 스캔/혼합, 벡터 도형뿐이면 디지털
+        if image_coverage >= MIXED_PAGE_IMAGE_COVERAGE:
+            return PageKind.SCANNED
+        if image_coverage > 0:
+            return PageKind.MIXED
+        return PageKind.DIGITAL
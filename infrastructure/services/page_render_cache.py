@@ -0,0 +1,167 @@
+# 파일 경로: infrastructure/services/page_render_cache.py
+import queue
+import threading
+from collections import OrderedDict
+
+from PIL import Image
+
+from shared.constants import VIEWER_CACHE_MAX_MB, VIEWER_RESIZE_TOLERANCE
+from shared.metrics import registry
+
+_CACHE_REQUESTS = registry.counter(
+    "render_cache_requests_total", "페이지 렌더 캐시 조회 수", labels=("cache", "result")
+)
+
+# Infrastructure Layer (Service Implementation)
+# 역할: 렌더링된 페이지 이미지(PIL)를 메모리 상한 안에서 LRU로 보관하고,
+#       인접 페이지를 백그라운드에서 미리 렌더링합니다.
+#       disk_cache(PreviewTileCache)가 있으면 메모리에 없는 페이지를 렌더링하기 전에 디스크 타일을 먼저 찾습니다.
+#       fitz 문서는 스레드 간 동시 접근이 안전하지 않으므로 모든 렌더링은 render_lock 안에서 수행합니다.
+
+
+class PageRenderCache:
+    def __init__(self, max_bytes=VIEWER_CACHE_MAX_MB * 1024 * 1024, resize_tolerance=VIEWER_RESIZE_TOLERANCE,
+                 name="viewer", disk_cache=None):
+        self.name = name  # 메트릭 라벨 (viewer / editor)
+        self.disk_cache = disk_cache  # 2단계 영구 캐시 (PreviewTileCache, 없으면 메모리만)
+        self.max_bytes = max_bytes
+        self.resize_tolerance = resize_tolerance
+        self.render_lock = threading.RLock()
+        self._entries = OrderedDict()  # (doc_id, page_num, (w, h)) -> PIL.Image
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_render(self, doc_id, page_num, size, render_fn, content_key=None):
+        """
+        캐시에서 이미지를 찾고, 없으면 render_fn()으로 렌더링하여 저장합니다.
+        같은 페이지가 비슷한 크기(허용 오차 이내)로 캐시되어 있으면 재렌더링 대신 크기만 조정합니다.
+        content_key(문서 내용 해시)를 주면 디스크 타일을 찾고, 없으면 render_fn(타일 크기)로 렌더링해 디스크에도 남깁니다.
+        """
+        key = (doc_id, page_num, tuple(size))
+        image = self.get(key)
+        if image is not None:
+            return image
+
+        scaled = self._scale_similar(doc_id, page_num, size)
+        if scaled is not None:
+            return scaled
+
+        with self.render_lock:
+            image = self.get(key) # 대기하는 동안 다른 스레드(프리페치)가 렌더링했을 수 있음
+            if image is None:
+                with self._lock:
+                    self.misses += 1
+                _CACHE_REQUESTS.inc(cache=self.name, result="miss")
+                image = self._render(page_num, size, render_fn, content_key)
+                self.put(key, image)
+        return image
+
+    def get(self, key):
+        with self._lock:
+            image = self._entries.get(key)
+            if image is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if image is not None:
+            _CACHE_REQUESTS.inc(cache=self.name, result="hit")
+        return image
+
+    def contains(self, doc_id, page_num, size):
+        with self._lock:
+            return (doc_id, page_num, tuple(size)) in self._entries
+
+    def put(self, key, image):
+        size_bytes = self._image_bytes(image)
+        if size_bytes > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= self._image_bytes(old)
+            self._entries[key] = image
+            self._bytes += size_bytes
+            while self._bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= self._image_bytes(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def size_bytes(self):
+        return self._bytes
+
+    def _scale_similar(self, doc_id, page_num, size):
+        """같은 페이지를 비슷한 목표 크기로 렌더링한 이미지가 있으면 축척만 바꿔 반환합니다."""
+        w, h = size
+        with self._lock:
+            candidates = [
+                (key, image) for key, image in self._entries.items()
+                if key[0] == doc_id and key[1] == page_num
+            ]
+        for (_, _, (cw, ch)), image in candidates:
+            if abs(w - cw) <= cw * self.resize_tolerance and abs(h - ch) <= ch * self.resize_tolerance:
+                with self._lock:
+                    self.hits += 1
+                _CACHE_REQUESTS.inc(cache=self.name, result="scaled")
+                return self._fit(image, (cw, ch), size)
+        return None
+
+    def _render(self, page_num, size, render_fn, content_key):
+        if self.disk_cache is None or content_key is None:
+            return render_fn()
+        tile_size = self.disk_cache.tile_size(size)
+        tile = self.disk_cache.get(content_key, page_num, tile_size)
+        if tile is None:
+            tile = render_fn(tile_size)
+            self.disk_cache.put(content_key, page_num, tile_size, tile)
+        return self._fit(tile, tile_size, size)
+
+    @staticmethod
+    def _fit(image, rendered_size, size):
+        """rendered_size에 맞춰 렌더링한 이미지를 size에 맞게 조정 (렌더링 시와 같은 '화면 맞춤' 배율 공식)"""
+        factor = min(size[0] / rendered_size[0], size[1] / rendered_size[1])
+        new_size = (max(1, round(image.width * factor)), max(1, round(image.height * factor)))
+        return image if new_size == image.size else image.resize(new_size, Image.BILINEAR)
+
+    @staticmethod
+    def _image_bytes(image):
+        return image.width * image.height * len(image.getbands())
+
+
+class PagePrefetcher:
+    """
+    인접 페이지를 백그라운드 스레드 하나에서 미리 렌더링해 PageRenderCache에 채웁니다.
+    새 요청이 오면 아직 시작하지 않은 이전 요청은 버립니다 (빠른 페이지 넘김 시 밀림 방지).
+    """
+    def __init__(self, cache):
+        self.cache = cache
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._worker, name="page-prefetch", daemon=True)
+        self._thread.start()
+
+    def request(self, tasks):
+        """tasks: (doc_id, page_num, size, render_fn[, content_key]) 목록"""
+        self.cancel_pending()
+        for task in tasks:
+            self._queue.put(task)
+
+    def cancel_pending(self):
+        try:
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _worker(self):
+        while True:
+            doc_id, page_num, size, render_fn, *content_key = self._queue.get()
+            try:
+                if not self.cache.contains(doc_id, page_num, size):
+                    self.cache.get_or_render(doc_id, page_num, size, render_fn, *content_key)
+            except Exception:
+                pass # 프리페치 실패는 무시 (실제 이동 시 다시 렌더링됨)
@@ -0,0 +1,228 @@
+# 파일 경로: infrastructure/services/preview_tile_cache.py
+"""
+Preview Tile Cache
+뷰어용 페이지 렌더링 이미지를 디스크에 보관하는 영구 캐시 (PageRenderCache의 2단계)
+
+같은 미흡 문서를 여러 번 열어 보는 검토 작업에서 매번 PDF를 다시 래스터화하지 않도록,
+(문서 내용 해시, 페이지, 배율 단계)마다 렌더링 결과를 WebP(또는 PNG) 파일 하나로 저장합니다.
+
+- 문서 내용 해시: 파일 경로가 아니라 내용으로 구분하므로 같은 파일을 옮기거나 이름을 바꿔도 재사용되고,
+  내용이 바뀌면 새 항목이 됩니다 (file_content_key / content_key).
+- 배율 단계: 뷰어는 창 크기에 맞춰 배율을 정하므로 요청 크기의 각 변을 zoom_step 배 간격의 단계로 올림합니다.
+  같은 단계 안의 창 크기는 같은 타일을 축소해서 씁니다 (tile_size).
+- 용량 상한: 전체 파일 크기 합이 max_bytes를 넘으면 가장 오래 쓰지 않은 타일부터 지웁니다.
+  사용 시각은 파일 수정 시각으로 남기므로 프로그램을 다시 시작해도 LRU 순서가 유지됩니다.
+- 인코딩은 렌더링만큼 오래 걸리므로 저장은 백그라운드 스레드 하나가 합니다 (대기열이 차면 버림).
+  저장을 기다리는 타일도 get()으로 바로 찾을 수 있습니다.
+
+사용 예:
+    tiles = PreviewTileCache("preview_cache", max_bytes=512 * 1024 * 1024)
+    key = file_content_key("input/claim.pdf")
+    image = tiles.get(key, 0, tiles.tile_size((800, 1000)))
+"""
+import hashlib
+import math
+import os
+import queue
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from PIL import Image, features
+
+from shared.constants import (
+    PREVIEW_CACHE_DIR, PREVIEW_CACHE_MAX_MB, PREVIEW_CACHE_FORMAT, PREVIEW_CACHE_QUALITY, PREVIEW_ZOOM_STEP,
+    PREVIEW_CACHE_WRITE_QUEUE
+)
+from shared.metrics import registry
+
+_TILE_REQUESTS = registry.counter("preview_tile_requests_total", "디스크 미리보기 타일 조회 수", labels=("result",))
+_TILE_BYTES = registry.gauge("preview_tile_cache_bytes", "디스크 미리보기 타일 캐시 크기 (바이트)")
+
+
+def file_content_key(path: str) -> str:
+    """파일 내용의 SHA-1 (경로/크기/수정 시각이 같으면 다시 읽지 않음)"""
+    stat = os.stat(path)
+    return _hash_file(os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=256)
+def _hash_file(path, size, mtime_ns):
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def content_key(*parts) -> str:
+    """여러 값(다른 내용 해시, 검증 결과 등)으로부터 파생 문서의 내용 키를 만듭니다."""
+    return hashlib.sha1("\x1f".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+
+
+class PreviewTileCache:
+    def __init__(self, directory: str = PREVIEW_CACHE_DIR, max_bytes: int = PREVIEW_CACHE_MAX_MB * 1024 * 1024,
+                 image_format: str = PREVIEW_CACHE_FORMAT, zoom_step: float = PREVIEW_ZOOM_STEP,
+                 quality: int = PREVIEW_CACHE_QUALITY):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.zoom_step = zoom_step
+        self.quality = quality
+        if image_format == "webp" and not features.check("webp"):
+            image_format = "png"  # WebP 없이 빌드된 Pillow
+        self.image_format = image_format
+        self._entries = OrderedDict()  # 상대 경로 -> 파일 크기 (오래 쓰지 않은 순)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._pending = {}  # 저장 대기 중인 상대 경로 -> 이미지
+        self._writes = queue.Queue(maxsize=PREVIEW_CACHE_WRITE_QUEUE)
+        self._writer = None
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+
+    def tile_size(self, size) -> Tuple[int, int]:
+        """요청 크기를 배율 단계로 올림한 타일 렌더링 크기"""
+        log_step = math.log(self.zoom_step)
+        return tuple(max(1, round(self.zoom_step ** math.ceil(math.log(max(1, v)) / log_step - 1e-9))) for v in size)
+
+    def get(self, key: str, page_num: int, tile_size) -> Optional[Image.Image]:
+        name = self._name(key, page_num, tile_size)
+        with self._lock:
+            pending = self._pending.get(name)
+            known = name in self._entries
+            if known:
+                self._entries.move_to_end(name)
+        if pending is not None:
+            _TILE_REQUESTS.inc(result="hit")
+            return pending.copy()
+        if not known:
+            _TILE_REQUESTS.inc(result="miss")
+            return None
+        path = os.path.join(self.directory, name)
+        try:
+            with Image.open(path) as image:
+                image = image.convert("RGB")
+            os.utime(path)  # 다음 실행에서도 최근 사용으로 보이도록
+        except (OSError, ValueError):
+            self._forget(name)  # 지워졌거나 깨진 파일
+            _TILE_REQUESTS.inc(result="miss")
+            return None
+        _TILE_REQUESTS.inc(result="hit")
+        return image
+
+    def put(self, key: str, page_num: int, tile_size, image: Image.Image) -> None:
+        """타일을 백그라운드에서 저장합니다. 대기열이 가득 차 있으면 저장하지 않습니다."""
+        self._ensure_writer()
+        name, image = self._name(key, page_num, tile_size), image.copy()
+        with self._lock:
+            if name in self._pending:
+                return
+            self._pending[name] = image
+        try:
+            self._writes.put_nowait(name)
+        except queue.Full:
+            with self._lock:
+                self._pending.pop(name, None)
+
+    def flush(self) -> None:
+        """대기 중인 저장이 끝날 때까지 기다립니다."""
+        self._writes.join()
+
+    def clear(self) -> None:
+        self.flush()
+        with self._lock:
+            names = list(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+        for name in names:
+            self._remove_file(name)
+        _TILE_BYTES.set(0)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    # --- 내부 ---
+    def _name(self, key, page_num, tile_size):
+        width, height = tile_size
+        return os.path.join(key[:2], f"{key}_p{page_num:04d}_{width}x{height}.{self.image_format}")
+
+    def _load_index(self):
+        """디렉토리의 기존 타일을 수정 시각(=마지막 사용) 순으로 색인합니다."""
+        found = []
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(".tmp"):
+                    os.remove(entry.path)  # 저장 중 종료된 파일
+                    continue
+                stat = entry.stat()
+                found.append((stat.st_mtime_ns, os.path.join(shard.name, entry.name), stat.st_size))
+        for _, name, size in sorted(found):
+            self._entries[name] = size
+            self._bytes += size
+        self._evict()
+
+    def _ensure_writer(self):
+        if self._writer is None:
+            with self._lock:
+                if self._writer is None:
+                    self._writer = threading.Thread(target=self._write_loop, name="preview-tile-writer", daemon=True)
+                    self._writer.start()
+
+    def _write_loop(self):
+        while True:
+            name = self._writes.get()
+            try:
+                self._write(name, self._pending[name])
+            except OSError:
+                pass  # 디스크 캐시 실패는 무시 (다음에 다시 렌더링됨)
+            finally:
+                with self._lock:
+                    self._pending.pop(name, None)
+                self._writes.task_done()
+
+    def _write(self, name, image):
+        path = os.path.join(self.directory, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        if self.image_format == "webp":
+            image.save(tmp_path, "WEBP", quality=self.quality, method=4)
+        else:
+            image.save(tmp_path, "PNG", compress_level=1)
+        os.replace(tmp_path, path)
+        size = os.path.getsize(path)
+        with self._lock:
+            old = self._entries.pop(name, None)
+            self._bytes += size - (old or 0)
+            self._entries[name] = size
+        self._evict()
+
+    def _evict(self):
+        removed = []
+        with self._lock:
+            while self._bytes > self.max_bytes and self._entries:
+                name, size = self._entries.popitem(last=False)
+                self._bytes -= size
+                removed.append(name)
+            _TILE_BYTES.set(self._bytes)
+        for name in removed:
+            self._remove_file(name)
+
+    def _forget(self, name):
+        with self._lock:
+            size = self._entries.pop(name, None)
+            if size is not None:
+                self._bytes -= size
+        self._remove_file(name)
+
+    def _remove_file(self, name):
+        try:
+            os.remove(os.path.join(self.directory, name))
+        except OSError:
+            pass
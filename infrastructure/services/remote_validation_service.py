@@ -0,0 +1,138 @@
+# 파일 경로: infrastructure/services/remote_validation_service.py
+import http.client
+import json
+import os
+
+from shared.constants import VALIDATION_SERVER_HOST, VALIDATION_SERVER_PORT, SERVER_REQUEST_TIMEOUT
+from shared.exceptions import ValidationCancelledError, ValidationServerError
+
+# Infrastructure Layer (Service Implementation)
+# 역할: 로컬 검증 서버(infrastructure/server/validation_server.py)에 검증을 맡기는 얇은 클라이언트.
+#       ValidationService와 같은 validate_document 시그니처를 제공하므로 컨트롤러는 차이를 알 필요가 없습니다.
+#       결과 PDF 생성과 뷰어 렌더링처럼 가벼운 작업은 로컬 ValidationService에 그대로 위임합니다.
+
+
+class RemoteValidationService:
+    def __init__(self, local_service, host=VALIDATION_SERVER_HOST, port=VALIDATION_SERVER_PORT,
+                 priority=0, timeout=SERVER_REQUEST_TIMEOUT):
+        self.local = local_service
+        self.host = host
+        self.port = port
+        self.priority = priority
+        self.timeout = timeout
+
+    # --- 서버 통신 ---
+    def is_available(self):
+        """서버가 응답하는지 확인합니다."""
+        try:
+            return self._request("GET", "/health").get("status") == "ok"
+        except (OSError, ValidationServerError):
+            return False
+
+    def submit(self, template, target_pdf_path, template_name=None, streaming=False):
+        """작업을 제출하고 작업 ID를 반환합니다. 경로는 서버가 그대로 열 수 있도록 절대 경로로 보냅니다."""
+        template = {**template, 'original_pdf_path': os.path.abspath(template['original_pdf_path'])}
+        payload = {
+            "template": template,
+            "template_name": template_name,
+            "pdf_path": os.path.abspath(target_pdf_path),
+            "priority": self.priority,
+            "streaming": streaming,
+        }
+        return self._request("POST", "/jobs", payload)["id"]
+
+    def get_job(self, job_id):
+        return self._request("GET", f"/jobs/{job_id}")
+
+    def cancel(self, job_id):
+        try:
+            self._request("POST", f"/jobs/{job_id}/cancel")
+        except (OSError, ValidationServerError):
+            pass
+
+    def stream_events(self, job_id):
+        """작업 이벤트를 순서대로 생성합니다. 작업이 끝나면 서버가 연결을 닫습니다."""
+        conn = http.client.HTTPConnection(self.host, self.port, timeout=None)
+        try:
+            conn.request("GET", f"/jobs/{job_id}/events")
+            response = conn.getresponse()
+            if response.status != 200:
+                raise ValidationServerError(self._error_message(response))
+            for line in response:
+                if line.strip():
+                    yield json.loads(line)
+        finally:
+            conn.close()
+
+    # --- ValidationService 호환 인터페이스 ---
+    def validate_document(self, template, target_pdf_path, progress_callback=None, checkpoint=None, streaming=False,
+                          page_range=None):
+        """
+        서버에서 문서를 검증하고 결과 목록을 반환합니다.
+        checkpoint는 이벤트를 받을 때마다 호출되며, 취소되면 서버 작업도 함께 취소합니다.
+        일시정지는 이 클라이언트에만 적용됩니다: checkpoint가 대기하는 동안 이벤트를 읽지 않을 뿐 서버 작업은 계속 진행되며,
+        재개하면 그동안 쌓인 이벤트(진행률/결과)를 이어서 받습니다. 서버 API에는 일시정지가 없습니다.
+        서버 API는 문서 전체 단위이므로 묶음의 한 구간(page_range)은 로컬에서 검증합니다.
+        """
+        if page_range is not None:
+            return self.local.validate_document(
+                template, target_pdf_path, progress_callback=progress_callback,
+                checkpoint=checkpoint, streaming=streaming, page_range=page_range
+            )
+        job_id = self.submit(template, target_pdf_path, streaming=streaming)
+        results = None
+        try:
+            for event in self.stream_events(job_id):
+                if checkpoint:
+                    checkpoint()
+
+                kind = event.get("type")
+                if kind == "progress" and progress_callback:
+                    progress_callback(event["message"], event["current"], event["total"])
+                elif kind == "result":
+                    results = event["results"]
+                elif kind == "error":
+                    raise ValidationServerError(event["message"])
+                elif kind == "status" and event["status"] == "cancelled":
+                    raise ValidationCancelledError()
+        except ValidationCancelledError:
+            self.cancel(job_id)
+            raise
+
+        if results is None:
+            raise ValidationServerError("작업 결과를 받지 못했습니다")
+        return results
+
+    def create_annotated_pdf(self, target_pdf_path, validation_results, page_range=None):
+        return self.local.create_annotated_pdf(target_pdf_path, validation_results, page_range)
+
+    def create_review_excerpt(self, target_pdf_path, validation_results, page_range=None):
+        return self.local.create_review_excerpt(target_pdf_path, validation_results, page_range)
+
+    def load_docs_for_viewer(self, original_path, annotated_bytes):
+        return self.local.load_docs_for_viewer(original_path, annotated_bytes)
+
+    def render_page_to_image(self, doc, page_num, size):
+        return self.local.render_page_to_image(doc, page_num, size)
+
+    # --- 내부 유틸리티 ---
+    def _request(self, method, path, payload=None):
+        conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        try:
+            body = json.dumps(payload, ensure_ascii=False).encode('utf-8') if payload is not None else None
+            # 서버는 JSON이 아닌 POST를 거부하므로 본문이 없는 취소 요청에도 Content-Type을 붙임
+            headers = {"Content-Type": "application/json"} if method == "POST" else {}
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            if response.status >= 400:
+                raise ValidationServerError(self._error_message(response))
+            return json.loads(response.read() or b'{}')
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _error_message(response):
+        try:
+            return json.loads(response.read()).get("error", response.reason)
+        except ValueError:
+            return f"HTTP {response.status} {response.reason}"
@@ -0,0 +1,81 @@
+# 파일 경로: infrastructure/services/review_bundle_writer.py
+"""
+Review Bundle Writer
+일괄 검증 한 번에서 나온 미흡 페이지 발췌 PDF(ValidationService.create_review_excerpt)를
+PDF 하나로 합칩니다.
+
+- 발췌본을 insert_pdf로 통째로 붙이므로 다시 렌더링하지 않고, 강조 표시도 그대로 옮겨집니다.
+- insert_pdf는 다른 파일을 가리키는 링크(GoToR)를 옮기지 않으므로 붙인 뒤 원본 링크를 다시 답니다.
+- 목차: 문서마다 1단계 항목, 그 아래 원본 페이지마다 2단계 항목 (미흡 항목 이름).
+- 페이지 라벨: '<문서 이름> p.<원본 페이지>' 형식이라 뷰어의 페이지 표시만으로 원본 위치를 알 수 있습니다.
+
+작업 스레드 여러 개가 add()를 동시에 호출해도 되며, 문서는 add()가 호출된 순서대로 붙습니다.
+
+사용 예:
+    bundle = ReviewBundleWriter("output/review_bundle_20240101_120000.pdf")
+    bundle.add("claim_001.pdf", excerpt_bytes, ["name, date", "signature"], label_prefix="claim_001")
+    bundle.close()
+"""
+import os
+import threading
+from typing import List, Optional, Sequence
+
+import fitz  # PyMuPDF
+
+
+class ReviewBundleWriter:
+    def __init__(self, path: str):
+        self.path = path
+        self.documents = 0
+        self._doc = fitz.open()
+        self._toc: List[list] = []
+        self._labels: List[dict] = []
+        self._lock = threading.Lock()
+
+    @property
+    def page_count(self) -> int:
+        return self._doc.page_count
+
+    def add(self, title: str, excerpt_bytes: bytes, page_notes: Optional[Sequence[str]] = None,
+            label_prefix: Optional[str] = None) -> int:
+        """
+        발췌 PDF 하나를 뒤에 붙이고 그 첫 페이지 번호(1부터)를 반환합니다.
+        page_notes가 있으면 발췌 페이지 순서대로 목차 2단계 항목에 덧붙입니다.
+        label_prefix는 페이지 라벨의 문서 이름 부분입니다 (기본: title).
+        """
+        prefix = label_prefix or title
+        with fitz.open("pdf", excerpt_bytes) as excerpt:
+            links = [[link for link in page.get_links() if link["kind"] == fitz.LINK_GOTOR] for page in excerpt]
+            source_labels = [page.get_label() or str(page.number + 1) for page in excerpt]
+            with self._lock:
+                if self._doc.is_closed:
+                    raise ValueError(f"이미 저장된 묶음입니다: {self.path}")
+                start = self._doc.page_count
+                self._doc.insert_pdf(excerpt)
+                self._toc.append([1, title, start + 1])
+                for offset, (page_links, label) in enumerate(zip(links, source_labels)):
+                    page = self._doc[start + offset]
+                    for link in page_links:
+                        page.insert_link({key: link[key] for key in ("kind", "from", "file", "page", "to") if key in link})
+                    note = f": {page_notes[offset]}" if page_notes and offset < len(page_notes) else ""
+                    self._toc.append([2, f"p.{label}{note}", start + offset + 1])
+                    self._labels.append({"startpage": start + offset, "prefix": f"{prefix} p.", "style": "D",
+                                         "firstpagenum": int(label) if label.isdigit() else offset + 1})
+                self.documents += 1
+        return start + 1
+
+    def close(self) -> Optional[str]:
+        """목차와 페이지 라벨을 붙여 저장하고 경로를 반환합니다. 붙인 문서가 없으면 파일을 만들지 않고 None."""
+        with self._lock:
+            try:
+                if not self.documents:
+                    return None
+                self._doc.set_toc(self._toc)
+                self._doc.set_page_labels(self._labels)
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._doc.save(self.path, garbage=3, deflate=True)
+                return self.path
+            finally:
+                self._doc.close()
@@ -0,0 +1,291 @@
+# 파일 경로: infrastructure/services/template_fingerprint_index.py
+"""
+Template Fingerprint Index
+템플릿 원본 PDF 앞쪽 페이지의 지각 해시(perceptual hash) 색인
+
+보험사별 양식이 섞인 폴더를 한 번에 검증할 수 있도록, 들어온 문서의 앞쪽 페이지를
+저해상도로 렌더링해 해시를 만들고 모든 템플릿과 비교하여 가장 가까운 템플릿과 신뢰도를 구합니다.
+
+- 해시: 페이지를 회색조 저해상도로 렌더링하고 32x45 격자로 줄여 살짝 흐리게 한 뒤,
+  칸마다 중앙값보다 어두운지를 1비트로 기록합니다 (평균 해시 변형, 페이지당 1440비트).
+  채워 넣은 글자, 스캔 잡음, 수 pt의 평행 이동/약간의 회전에는 거의 변하지 않고
+  표/칸 배치가 다르면 달라집니다. 중앙값 기준이라 비트의 절반이 1이므로 관련 없는 페이지의 일치율은 약 0.5입니다.
+  (dHash/pHash도 시험했으나 제목과 칸 모양이 같은 양식끼리는 구분력이 떨어졌습니다.)
+- 조회: 모든 템플릿 해시를 (템플릿, 페이지, uint64 워드) 배열로 두고 XOR + popcount로
+  해밍 거리를 한 번에 계산하므로 템플릿 수백 개도 1ms 이내입니다 (문서 렌더링 제외).
+- 저장: 템플릿별 원본 PDF 경로/수정 시각/크기/페이지 수와 해시를 JSON으로 저장하고,
+  sync() 때 바뀐 템플릿만 다시 계산합니다. 여러 양식을 이어 붙인 묶음을 나눌 수 있도록
+  해시는 템플릿의 모든 페이지(최대 TEMPLATE_FINGERPRINT_STORED_PAGES)에 대해 저장하며,
+  문서 인식(identify)은 그중 앞쪽 max_pages만 비교합니다.
+
+사용 예:
+    index = TemplateFingerprintIndex(JsonTemplateRepository(), "template_fingerprints.json")
+    index.sync()
+    match = index.identify("inbound/claim_001.pdf")
+    if match.is_confident:
+        print(match.template_name, match.confidence)
+"""
+import json
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import cv2
+import fitz  # PyMuPDF
+import numpy as np
+
+from shared.constants import (
+    TEMPLATE_FINGERPRINT_FILE, TEMPLATE_FINGERPRINT_PAGES, TEMPLATE_FINGERPRINT_RENDER_WIDTH,
+    TEMPLATE_FINGERPRINT_STORED_PAGES, TEMPLATE_MATCH_MIN_CONFIDENCE, TEMPLATE_MATCH_MIN_MARGIN
+)
+
+FINGERPRINT_VERSION = 2
+_GRID_SIZE = (32, 45)                # 해시 격자 (가로, 세로): A4 세로 비율
+_BITS_PER_PAGE = _GRID_SIZE[0] * _GRID_SIZE[1]
+_WORDS_PER_PAGE = -(-_BITS_PER_PAGE // 64)  # uint64 워드 수 (남는 비트는 0으로 채움)
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint16)
+
+
+@dataclass
+class TemplateMatch:
+    """
+    문서 하나의 템플릿 인식 결과
+
+    Attributes:
+        template_name: 가장 가까운 템플릿 (색인이 비어 있으면 None)
+        confidence: 0~1 신뢰도 (해시 일치율을 무작위 일치 수준 0.5 기준으로 환산)
+        runner_up: 두 번째로 가까운 템플릿
+        runner_up_confidence: 두 번째 템플릿의 신뢰도
+        pages_compared: 비교한 페이지 수
+        min_confidence / min_margin: 자동 배정 기준 (신뢰도 하한, 차순위와의 최소 차이)
+    """
+    template_name: Optional[str]
+    confidence: float
+    runner_up: Optional[str] = None
+    runner_up_confidence: float = 0.0
+    pages_compared: int = 0
+    min_confidence: float = TEMPLATE_MATCH_MIN_CONFIDENCE
+    min_margin: float = TEMPLATE_MATCH_MIN_MARGIN
+
+    @property
+    def margin(self) -> float:
+        return self.confidence - self.runner_up_confidence
+
+    @property
+    def is_confident(self) -> bool:
+        """신뢰도가 기준 이상이고 차순위 템플릿과 충분히 구분될 때만 자동 배정합니다."""
+        return (self.template_name is not None and self.confidence >= self.min_confidence
+                and (self.runner_up is None or self.margin >= self.min_margin))
+
+    def describe(self) -> str:
+        if self.template_name is None:
+            return "등록된 템플릿 없음"
+        text = f"{self.template_name} (신뢰도 {self.confidence:.0%}"
+        if self.runner_up:
+            text += f", 차순위 {self.runner_up} {self.runner_up_confidence:.0%}"
+        return text + ")"
+
+
+def page_fingerprint(page, render_width: int = TEMPLATE_FINGERPRINT_RENDER_WIDTH) -> np.ndarray:
+    """fitz 페이지 하나의 해시 (uint64 _WORDS_PER_PAGE개)"""
+    zoom = render_width / max(page.rect.width, 1.0)
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csGRAY, alpha=False)
+    gray = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.stride)[:, :pix.width]
+    return image_fingerprint(gray)
+
+
+def image_fingerprint(gray: np.ndarray) -> np.ndarray:
+    """회색조 이미지의 격자 해시 (uint64 _WORDS_PER_PAGE개)"""
+    small = cv2.resize(gray.astype(np.float32), _GRID_SIZE, interpolation=cv2.INTER_AREA)
+    small = cv2.GaussianBlur(small, (3, 3), 0)
+    bits = np.zeros(_WORDS_PER_PAGE * 64, dtype=bool)
+    bits[:_BITS_PER_PAGE] = (small < np.median(small)).flatten()
+    return np.packbits(bits).view(np.uint64).copy()
+
+
+def hamming_distances(hashes: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """hashes (..., W) uint64 와 query (W,) (또는 브로드캐스트되는 (..., W)) 사이의 해밍 거리 (마지막 축 합산)"""
+    xor = np.bitwise_xor(hashes, query)
+    return _POPCOUNT[xor.view(np.uint8)].reshape(*xor.shape[:-1], -1).sum(axis=-1)
+
+
+def document_fingerprints(pdf_path: str, max_pages: Optional[int] = TEMPLATE_FINGERPRINT_PAGES,
+                          checkpoint=None) -> List[np.ndarray]:
+    """PDF 앞쪽 max_pages 페이지(None이면 전체)의 해시 목록. checkpoint는 페이지마다 호출됩니다."""
+    with fitz.open(pdf_path) as doc:
+        count = len(doc) if max_pages is None else min(max_pages, len(doc))
+        hashes = []
+        for page_num in range(count):
+            if checkpoint:
+                checkpoint()
+            hashes.append(page_fingerprint(doc[page_num]))
+        return hashes
+
+
+def _similarity_to_confidence(similarity):
+    # 관련 없는 두 이미지의 해시 일치율은 약 0.5이므로 0.5 → 0, 1.0 → 1 로 환산
+    return np.clip((similarity - 0.5) / 0.5, 0.0, 1.0)
+
+
+class TemplateFingerprintIndex:
+    def __init__(self, template_repository, index_path: str = TEMPLATE_FINGERPRINT_FILE,
+                 max_pages: int = TEMPLATE_FINGERPRINT_PAGES, min_confidence: float = TEMPLATE_MATCH_MIN_CONFIDENCE):
+        self.repository = template_repository
+        self.index_path = index_path
+        self.max_pages = max_pages
+        self.min_confidence = min_confidence
+        self._entries: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._names: List[str] = []
+        self._hashes = np.zeros((0, max_pages, _WORDS_PER_PAGE), dtype=np.uint64)
+        self._page_mask = np.zeros((0, max_pages), dtype=bool)
+        self._page_counts = np.zeros(0, dtype=np.int64)
+        self._load()
+
+    # --- 색인 관리 ---
+    def sync(self) -> Dict[str, int]:
+        """
+        템플릿 저장소와 색인을 맞춥니다. 원본 PDF의 경로/수정 시각/크기가 바뀐 템플릿만 다시 해시하고,
+        사라진 템플릿은 뺍니다. 바뀐 것이 있으면 파일에 저장합니다.
+        """
+        stats = {"added": 0, "updated": 0, "removed": 0, "skipped": 0}
+        current = {}
+        for name in self.repository.get_all_names():
+            try:
+                pdf_path = self.repository.load(name)['original_pdf_path']
+                stat = os.stat(pdf_path)
+            except (KeyError, OSError):
+                stats["skipped"] += 1
+                continue
+            source = {"pdf_path": os.path.abspath(pdf_path), "mtime": stat.st_mtime, "size": stat.st_size}
+            entry = self._entries.get(name)
+            if entry is not None and all(entry.get(key) == value for key, value in source.items()):
+                current[name] = entry
+                continue
+            try:
+                with fitz.open(pdf_path) as doc:
+                    page_count = len(doc)
+                hashes = document_fingerprints(pdf_path, self.stored_pages)
+            except Exception:
+                stats["skipped"] += 1
+                continue
+            current[name] = {**source, "page_count": page_count, "pages": [h.tobytes().hex() for h in hashes]}
+            stats["updated" if entry is not None else "added"] += 1
+        stats["removed"] = len(set(self._entries) - set(current))
+
+        with self._lock:
+            self._entries = current
+            self._rebuild_arrays()
+        if stats["added"] or stats["updated"] or stats["removed"]:
+            self.save()
+        return stats
+
+    def save(self) -> None:
+        """색인을 JSON으로 저장합니다 (임시 파일 + os.replace)."""
+        data = {
+            "version": FINGERPRINT_VERSION, "max_pages": self.max_pages, "stored_pages": self.stored_pages,
+            "render_width": TEMPLATE_FINGERPRINT_RENDER_WIDTH, "templates": self._entries,
+        }
+        directory = os.path.dirname(self.index_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+    def _load(self) -> None:
+        """저장된 색인을 읽습니다. 형식/설정이 다르거나 읽을 수 없으면 빈 색인으로 시작합니다 (sync 때 재계산)."""
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if (data.get("version") != FINGERPRINT_VERSION or data.get("max_pages") != self.max_pages
+                or data.get("stored_pages") != self.stored_pages
+                or data.get("render_width") != TEMPLATE_FINGERPRINT_RENDER_WIDTH):
+            return
+        self._entries = data.get("templates", {})
+        self._rebuild_arrays()
+
+    @property
+    def stored_pages(self) -> int:
+        """템플릿마다 해시를 저장하는 페이지 수 (인식에 쓰는 max_pages보다 작지 않음)"""
+        return max(self.max_pages, TEMPLATE_FINGERPRINT_STORED_PAGES)
+
+    def _rebuild_arrays(self) -> None:
+        names = sorted(self._entries)
+        width = max([self.max_pages] + [len(self._entries[name]["pages"]) for name in names])
+        hashes = np.zeros((len(names), width, _WORDS_PER_PAGE), dtype=np.uint64)
+        mask = np.zeros((len(names), width), dtype=bool)
+        page_counts = np.zeros(len(names), dtype=np.int64)
+        for row, name in enumerate(names):
+            entry = self._entries[name]
+            for page_num, hex_hash in enumerate(entry["pages"]):
+                hashes[row, page_num] = np.frombuffer(bytes.fromhex(hex_hash), dtype=np.uint64)
+                mask[row, page_num] = True
+            page_counts[row] = entry.get("page_count", len(entry["pages"]))
+        self._names, self._hashes, self._page_mask, self._page_counts = names, hashes, mask, page_counts
+
+    @property
+    def template_names(self) -> List[str]:
+        return list(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    # --- 조회 ---
+    def match(self, page_hashes: Sequence[np.ndarray]) -> TemplateMatch:
+        """
+        문서 앞쪽 페이지 해시를 모든 템플릿의 같은 번호 페이지와 비교합니다.
+        템플릿별 점수는 양쪽에 모두 있는 페이지의 평균 일치율입니다.
+        """
+        with self._lock:
+            names, hashes, mask = self._names, self._hashes, self._page_mask
+        pages = min(len(page_hashes), self.max_pages)
+        if not names or pages == 0:
+            return TemplateMatch(None, 0.0, min_confidence=self.min_confidence)
+
+        query = np.stack(page_hashes[:pages])                       # (P, W)
+        distances = hamming_distances(hashes[:, :pages], query)      # (T, P)
+        valid = mask[:, :pages]
+        compared = valid.sum(axis=1)
+        similarity = np.where(valid, 1.0 - distances / _BITS_PER_PAGE, 0.0).sum(axis=1) / np.maximum(compared, 1)
+        confidence = np.where(compared > 0, _similarity_to_confidence(similarity), 0.0)
+
+        order = np.argsort(-confidence, kind="stable")
+        best = int(order[0])
+        runner_up = int(order[1]) if len(order) > 1 else None
+        return TemplateMatch(
+            template_name=names[best],
+            confidence=float(confidence[best]),
+            runner_up=names[runner_up] if runner_up is not None else None,
+            runner_up_confidence=float(confidence[runner_up]) if runner_up is not None else 0.0,
+            pages_compared=int(compared[best]),
+            min_confidence=self.min_confidence,
+        )
+
+    def identify(self, pdf_path: str) -> TemplateMatch:
+        """PDF 파일의 앞쪽 페이지를 렌더링해 가장 가까운 템플릿을 찾습니다."""
+        return self.match(document_fingerprints(pdf_path, self.max_pages))
+
+    def page_confidences(self, page_hashes: Sequence[np.ndarray]):
+        """
+        문서의 모든 페이지를 모든 템플릿의 모든 (저장된) 페이지와 비교합니다.
+
+        Returns:
+            (템플릿 이름 목록, 템플릿별 페이지 수 (T,), 신뢰도 (T, 템플릿 페이지, 문서 페이지), 저장 여부 마스크 (T, 템플릿 페이지))
+            마스크가 False인 칸의 신뢰도는 0입니다.
+        """
+        with self._lock:
+            names, hashes, mask, page_counts = self._names, self._hashes, self._page_mask, self._page_counts
+        if not names or not len(page_hashes):
+            return list(names), page_counts, np.zeros((len(names), hashes.shape[1], len(page_hashes))), mask
+        query = np.stack(page_hashes)                                             # (N, W)
+        confidence = np.zeros((len(names), hashes.shape[1], len(query)))
+        for page_num in range(hashes.shape[1]):
+            # 템플릿 페이지 번호마다 (T, N, W) 만 만들어 거대한 문서에서도 중간 배열을 작게 유지
+            distances = hamming_distances(hashes[:, page_num, None, :], query)  # (T, N)
+            confidence[:, page_num] = _similarity_to_confidence(1.0 - distances / _BITS_PER_PAGE)
+        return list(names), page_counts, np.where(mask[:, :, None], confidence, 0.0), mask
@@ -3,29 +3,120 @@ import cv2
 import numpy as np
 import pytesseract
 import re
+import time
 from skimage.metrics import structural_similarity as ssim
 
+from domain.services.roi_scoring import default_threshold, score_roi
+from infrastructure.services.preview_tile_cache import file_content_key
+from shared.constants import (
+    CONTOUR_SCORING_ENABLED,
+    CONTOUR_INK_LEVEL,
+    CONTOUR_TEMPLATE_TOLERANCE_PX,
+    CONTOUR_LINE_RATIO,
+    CONTOUR_MIN_AREA,
+    SKEW_ESTIMATION_SCALE,
+    SKEW_MAX_DIMENSION,
+    SKEW_MAX_ANGLE,
+    SKEW_COARSE_STEP,
+    SKEW_FINE_STEP,
+    SKEW_MIN_ANGLE,
+    SKEW_MAX_SAMPLE_POINTS,
+)
+from shared.exceptions import ComputerVisionServiceError
+from shared.utils import StageTimer
+from shared.metrics import registry
+from shared.tracing import document_label
+
+_OCR_CALLS = registry.counter("ocr_calls_total", "Tesseract OCR 호출 수")
+
 
 # 이 클래스는 레거시 pdf_validator_gui.py에 있던 DocumentLayoutDetector와
 # _validate_single_roi 함수의 모든 이미지 처리 로직을 포함해야 합니다.
 # 아래 코드는 그 구조를 잡아놓은 것이며, 실제 로직을 채워넣어야 합니다.
 
 class ValidationVisionService:
-    def __init__(self):
+    def __init__(self, clock=time.perf_counter, contour_scoring=CONTOUR_SCORING_ENABLED):
         # Tesseract 설정 등 필요한 초기화를 수행합니다.
         # 예: self.setup_tesseract()
+        self.clock = clock  # 단계별 처리 시간 측정 시계 (성능 회귀 검사는 CPU 시간 사용)
+        self.contour_scoring = contour_scoring  # 꺼져 있으면 Contour ROI는 측정값만 남기고 OK
         self.layout_detector = self._DocumentLayoutDetector()
         self.detectors = [cv2.AKAZE_create(), cv2.ORB_create(nfeatures=2000)]
 
 
-    def validate_roi(self, original_doc, filled_doc, field_name, roi_info):
+    def estimate_page_layout(self, original_doc, filled_doc, page_num):
+        """
+        페이지 단위 레이아웃 변환(기울기 포함)을 한 번만 추정합니다.
+        72 DPI 그레이스케일로 렌더링하며, 원본 페이지의 기울기는 문서 내용/페이지별로 캐시합니다.
+        렌더링이나 기울기 추정이 실패하면 ComputerVisionServiceError를 발생시킵니다.
+        """
+        original_key = self._original_key(original_doc, page_num)
+        try:
+            if original_key and self.layout_detector.has_original_skew(original_key):
+                original_page_img = None
+            else:
+                original_page_img = self._get_full_page_image(original_doc[page_num], SKEW_ESTIMATION_SCALE)
+            filled_page_img = self._get_full_page_image(filled_doc[page_num], SKEW_ESTIMATION_SCALE)
+            return self.layout_detector.detect_layout_offset(
+                original_page_img, filled_page_img, scale=SKEW_ESTIMATION_SCALE, original_key=original_key
+            )
+        except (cv2.error, RuntimeError, ValueError, IndexError) as e:  # fitz 오류는 RuntimeError
+            raise ComputerVisionServiceError(f"페이지 {page_num + 1} 레이아웃 추정 실패: {e}") from e
+
+    def warm_original_page(self, original_doc, page_num):
+        """템플릿 원본 페이지의 기울기를 미리 계산해 캐시합니다 (상주 작업자 예열용)."""
+        original_key = self._original_key(original_doc, page_num)
+        if original_key is None or self.layout_detector.has_original_skew(original_key):
+            return
+        original_page_img = self._get_full_page_image(original_doc[page_num], SKEW_ESTIMATION_SCALE)
+        self.layout_detector.remember_original_skew(
+            original_key, self.layout_detector.estimate_skew(original_page_img)
+        )
+
+    @staticmethod
+    def _original_key(original_doc, page_num):
+        """
+        원본 페이지 기울기 캐시 키. 템플릿 원본 PDF를 같은 경로에 새 파일로 바꿔 넣어도
+        이전 기울기를 쓰지 않도록 경로가 아니라 파일 내용 해시를 씁니다 (파일이 없으면 캐시하지 않음).
+        """
+        if not original_doc.name:
+            return None
+        try:
+            return file_content_key(original_doc.name), page_num
+        except OSError:
+            return None
+
+    def identity_layout(self):
+        """보정이 필요 없는 페이지(디지털 원본 등)를 위한 항등 변환."""
+        return self.layout_detector.build_layout()
+
+    def transform_rois(self, coords_list, layout_offset):
+        """
+        페이지의 모든 ROI 좌표에 2x3 아핀 변환을 한 번에(벡터화) 적용합니다.
+        회전된 사각형은 네 꼭짓점의 외접 사각형으로 변환됩니다.
+        """
+        if not coords_list:
+            return []
+        matrix = np.asarray(self.layout_detector.get_matrix(layout_offset), dtype=np.float64)
+        rects = np.asarray(coords_list, dtype=np.float64).reshape(-1, 4)
+
+        # (N, 4, 2): 좌상, 우상, 우하, 좌하 꼭짓점
+        corners = np.stack([
+            rects[:, [0, 1]], rects[:, [2, 1]], rects[:, [2, 3]], rects[:, [0, 3]]
+        ], axis=1)
+        moved = corners @ matrix[:, :2].T + matrix[:, 2]
+        boxes = np.concatenate([moved.min(axis=1), moved.max(axis=1)], axis=1)
+        return boxes.tolist()
+
+    def validate_roi(self, original_doc, filled_doc, field_name, roi_info, layout_offset=None, corrected_coords=None):
         # 이 메서드는 레거시 `_validate_single_roi` 함수의 로직을 그대로 가져와 구현합니다.
         # 아래는 해당 함수의 구조를 따라 재구성한 코드입니다.
+        # layout_offset/corrected_coords가 주어지면 페이지 단위로 미리 계산된 값을 재사용합니다.
 
         page_num = roi_info.get("page", 0)
         coords = roi_info.get("coords")
         method = roi_info.get("method", "ocr")
-        threshold = roi_info.get("threshold", 3)
+        threshold = roi_info.get("threshold", default_threshold(method))
         anchor_coords = roi_info.get("anchor_coords")
 
         result = {"field_name": field_name, "page": page_num, "coords": coords, "status": "OK", "message": ""}
@@ -34,46 +125,65 @@ class ValidationVisionService:
             result["message"] = "ROI coordinates not found"
             return result
 
+        # 단계별 처리 시간 (render / alignment / anchor / crop_resize / contour|ocr)
+        timer = StageTimer(
+            trace_args={"document": document_label(filled_doc.name), "page": page_num, "roi": field_name},
+            clock=self.clock
+        )
         try:
             render_scale = 2.0  # TODO: DPI 기반으로 변경 고려
-            original_roi_img = self._extract_roi_image(original_doc, page_num, coords, render_scale)
+            with timer.stage("render"):
+                original_roi_img = self._extract_roi_image(original_doc, page_num, coords, render_scale)
 
-            # 1. 레이아웃 오프셋 감지
-            original_page_img = self._get_full_page_image(original_doc[page_num], render_scale)
-            filled_page_img = self._get_full_page_image(filled_doc[page_num], render_scale)
-            layout_offset = self.layout_detector.detect_layout_offset(original_page_img, filled_page_img)
+            with timer.stage("alignment"):
+                # 1. 레이아웃 오프셋 감지 (페이지 단위 결과가 없을 때만)
+                if layout_offset is None:
+                    layout_offset = self.estimate_page_layout(original_doc, filled_doc, page_num)
 
-            # 2. 1차 좌표 보정
-            new_coords = self._apply_layout_correction(coords, layout_offset)
+                # 2. 1차 좌표 보정
+                if corrected_coords is not None:
+                    new_coords = list(corrected_coords)
+                else:
+                    new_coords = self._apply_layout_correction(coords, layout_offset)
 
             # 3. 앵커 기반 미세 조정
             if anchor_coords:
-                anchor_img = self._extract_roi_image(original_doc, page_num, anchor_coords, render_scale, grayscale=True)
-                # ... (앵커 찾는 로직: _find_anchor_template_matching, _find_anchor_affine_robust)
-                # ... (찾은 앵커를 기반으로 new_coords 미세 조정)
-                pass # Placeholder for anchor logic
+                with timer.stage("anchor"):
+                    anchor_img = self._extract_roi_image(original_doc, page_num, anchor_coords, render_scale, grayscale=True)
+                    # ... (앵커 찾는 로직: _find_anchor_template_matching, _find_anchor_affine_robust)
+                    # ... (찾은 앵커를 기반으로 new_coords 미세 조정)
+                    pass # Placeholder for anchor logic
 
             # 4. 최종 ROI 이미지 추출 및 검증
-            filled_roi = self._extract_roi_image(filled_doc, page_num, new_coords, render_scale)
+            with timer.stage("render"):
+                filled_roi = self._extract_roi_image(filled_doc, page_num, new_coords, render_scale)
 
             # 크기 맞춤
-            h, w, _ = original_roi_img.shape
-            filled_roi_resized = cv2.resize(filled_roi, (w, h))
-
-            # 검증 로직 분기
-            if method == "contour":
-                # ... (Contour 검증 로직)
-                result["message"] = "Contour validation logic needs to be implemented."
-            elif method == "ocr":
-                # ... (OCR 검증 로직)
-                ocr_img = cv2.cvtColor(filled_roi_resized, cv2.COLOR_RGB2GRAY)
-                raw_text = pytesseract.image_to_string(ocr_img, lang='kor+eng')
-                clean_text = re.sub(r'[\s\W_]+', '', raw_text)
-                if len(clean_text) < threshold:
-                    result["status"] = "DEFICIENT"
-                    result["message"] = f"OCR insufficient ({len(clean_text)} chars)"
-                else:
-                    result["message"] = f"OCR OK: '{clean_text[:20]}...'"
+            with timer.stage("crop_resize"):
+                h, w, _ = original_roi_img.shape
+                filled_roi_resized = cv2.resize(filled_roi, (w, h))
+
+            # 측정: 판정(임계값 비교)은 score_roi에 맡기고 측정값은 결과에 남겨 재채점에 씁니다.
+            # 잉크/윤곽 측정은 비용이 작아 검증 방식과 관계없이 항상 구합니다 (방식을 contour로 바꿔도 재채점 가능).
+            measurements = {
+                "method": method, "threshold": threshold,
+                "rotation": round(float(layout_offset.get("rotation", 0.0)), 3),
+                "offset": [round(new_coords[0] - coords[0], 2), round(new_coords[1] - coords[1], 2)],
+            }
+            with timer.stage("contour"):
+                measurements.update(self._measure_ink(original_roi_img, filled_roi_resized))
+            if method == "ocr":
+                with timer.stage("ocr"):
+                    ocr_img = cv2.cvtColor(filled_roi_resized, cv2.COLOR_RGB2GRAY)
+                    _OCR_CALLS.inc()
+                    raw_text = pytesseract.image_to_string(ocr_img, lang='kor+eng')
+                    clean_text = re.sub(r'[\s\W_]+', '', raw_text)
+                measurements["char_count"] = len(clean_text)
+                measurements["text"] = clean_text
+            scored = score_roi(method, threshold, measurements, self.contour_scoring)
+            if scored is not None:
+                result["status"], result["message"] = scored
+            result["measurements"] = measurements
 
             result["coords"] = new_coords # 최종 사용된 좌표 업데이트
 
@@ -81,6 +191,8 @@ class ValidationVisionService:
             result["status"] = "ERROR"
             result["message"] = f"Validation error: {e}"
 
+        result["timings"] = timer.as_dict()
+        result["processing_time"] = round(timer.total, 6)
         return result
 
     # --- 아래는 _validate_single_roi가 사용하던 Helper 메서드들 ---
@@ -94,6 +206,42 @@ class ValidationVisionService:
         if grayscale: return cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
         return cv2.cvtColor(img_array, cv2.COLOR_RGBA2RGB) if pix.n == 4 else img_array
 
+    def _measure_ink(self, original_roi_img, filled_roi_img):
+        """
+        채워진 ROI에서 원본 양식에 없던 잉크를 찾아 덩어리 수/면적을 측정합니다.
+        - 원본 양식의 잉크는 CONTOUR_TEMPLATE_TOLERANCE_PX만큼 넓혀서 빼므로 작은 정렬 오차는 무시됩니다.
+        - ROI를 가로지르는 긴 직선(어긋난 칸 테두리 등 양식 괘선)은 기입 내용으로 보지 않습니다.
+        """
+        original_gray = cv2.cvtColor(original_roi_img, cv2.COLOR_RGB2GRAY)
+        filled_gray = cv2.cvtColor(filled_roi_img, cv2.COLOR_RGB2GRAY)
+        _, filled_ink = cv2.threshold(filled_gray, CONTOUR_INK_LEVEL - 1, 255, cv2.THRESH_BINARY_INV)
+        _, template_ink = cv2.threshold(original_gray, CONTOUR_INK_LEVEL - 1, 255, cv2.THRESH_BINARY_INV)
+        kernel = np.ones((CONTOUR_TEMPLATE_TOLERANCE_PX, CONTOUR_TEMPLATE_TOLERANCE_PX), np.uint8)
+        added = cv2.subtract(filled_ink, cv2.dilate(template_ink, kernel))
+
+        # 괘선: 잉크가 너비의 CONTOUR_LINE_RATIO 이상인 행 / 높이의 0.8 이상인 열 (투영이라 긴 커널 열림 연산보다 빠름)
+        h, w = added.shape
+        line_rows = cv2.reduce(added, 1, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel() >= 255 * w * CONTOUR_LINE_RATIO
+        line_cols = cv2.reduce(added, 0, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel() >= 255 * h * 0.8
+        if line_rows.any() or line_cols.any():
+            lines = np.zeros_like(added)
+            lines[line_rows, :] = 255
+            lines[:, line_cols] = 255
+            added = cv2.subtract(added, cv2.dilate(lines, np.ones((3, 3), np.uint8)))
+        added = cv2.morphologyEx(added, cv2.MORPH_OPEN, np.ones((2, 2), np.uint8))
+
+        areas = np.zeros(0, dtype=np.int32)
+        if cv2.countNonZero(added):
+            _, _, stats, _ = cv2.connectedComponentsWithStats(added, connectivity=8)
+            areas = stats[1:, cv2.CC_STAT_AREA]
+            areas = areas[areas >= CONTOUR_MIN_AREA]
+        return {
+            "ink_density": round(cv2.countNonZero(filled_ink) / max(1, filled_ink.size), 4),
+            "contour_count": int(len(areas)),
+            "contour_area": int(areas.sum()),
+            "largest_contour": int(areas.max()) if len(areas) else 0,
+        }
+
     def _get_full_page_image(self, page, scale=2.0):
         # ... (Implementation from legacy code) ...
         mat = fitz.Matrix(scale, scale)
@@ -102,19 +250,111 @@ class ValidationVisionService:
         return cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
 
     def _apply_layout_correction(self, coords, layout_offset):
-        # ... (Implementation from legacy code) ...
-        offset_x = layout_offset.get("offset_x", 0)
-        offset_y = layout_offset.get("offset_y", 0)
-        scale_x = layout_offset.get("scale_x", 1.0)
-        scale_y = layout_offset.get("scale_y", 1.0)
-        return [
-            coords[0] * scale_x + offset_x, coords[1] * scale_y + offset_y,
-            coords[2] * scale_x + offset_x, coords[3] * scale_y + offset_y
-        ]
+        return self.transform_rois([coords], layout_offset)[0]
 
     # --- Nested Class for Layout Detection ---
     class _DocumentLayoutDetector:
-        def detect_layout_offset(self, original_img, scanned_img):
-            # ... (Implementation from legacy code) ...
-            return {"offset_x": 0, "offset_y": 0, "scale_x": 1.0, "scale_y": 1.0, "rotation": 0}
+        def __init__(self):
+            # 템플릿 원본은 배치 내내 동일하므로 원본 페이지의 기울기는 한 번만 계산
+            self._original_skew_cache = {}
+
+        def has_original_skew(self, original_key):
+            return original_key in self._original_skew_cache
+
+        def remember_original_skew(self, original_key, skew):
+            self._original_skew_cache[original_key] = skew
+
+        def detect_layout_offset(self, original_img, scanned_img, scale=1.0, original_key=None):
+            """
+            두 페이지 이미지의 기울기 차이를 추정하여 레이아웃 변환을 반환합니다.
+            scale은 이미지 픽셀과 PDF 좌표의 비율이며, 반환되는 matrix는 PDF 좌표계 기준입니다.
+            original_key가 주어지면 원본 이미지의 기울기를 캐시합니다.
+            """
+            original_skew = self._original_skew_cache.get(original_key) if original_key else None
+            if original_skew is None:
+                original_skew = self.estimate_skew(original_img)
+                if original_key:
+                    self._original_skew_cache[original_key] = original_skew
+
+            rotation = self.estimate_skew(scanned_img) - original_skew
+            if abs(rotation) < SKEW_MIN_ANGLE:
+                rotation = 0.0
+
+            h, w = scanned_img.shape[:2]
+            center = (w / 2.0 / scale, h / 2.0 / scale)
+            return self.build_layout(rotation=rotation, center=center)
+
+        def build_layout(self, offset_x=0.0, offset_y=0.0, scale_x=1.0, scale_y=1.0, rotation=0.0, center=(0.0, 0.0)):
+            """오프셋/스케일/회전(도, 중심점 기준)을 하나의 2x3 아핀 행렬로 합성합니다."""
+            theta = np.deg2rad(rotation)
+            cos_t, sin_t = np.cos(theta), np.sin(theta)
+            rot = np.array([[cos_t, -sin_t], [sin_t, cos_t]])
+            cx, cy = center
+
+            # p' = R((S p + o) - c) + c
+            linear = rot @ np.diag([scale_x, scale_y])
+            translation = rot @ np.array([offset_x - cx, offset_y - cy]) + np.array([cx, cy])
+            matrix = np.hstack([linear, translation.reshape(2, 1)])
+            return {
+                "offset_x": offset_x, "offset_y": offset_y,
+                "scale_x": scale_x, "scale_y": scale_y,
+                "rotation": float(rotation),
+                "matrix": matrix.tolist()
+            }
+
+        def get_matrix(self, layout_offset):
+            """레이아웃 딕셔너리에서 2x3 행렬을 꺼냅니다 (matrix가 없는 이전 형식도 지원)."""
+            if "matrix" in layout_offset:
+                return layout_offset["matrix"]
+            return self.build_layout(
+                offset_x=layout_offset.get("offset_x", 0),
+                offset_y=layout_offset.get("offset_y", 0),
+                scale_x=layout_offset.get("scale_x", 1.0),
+                scale_y=layout_offset.get("scale_y", 1.0)
+            )["matrix"]
+
+        def estimate_skew(self, img):
+            """
+            투영 프로파일(projection profile) 방식으로 텍스트 행의 기울기(도)를 추정합니다.
+            축소 + 이진화한 이미지의 전경 픽셀을 후보 각도별로 회전 투영하고,
+            행 히스토그램이 가장 뾰족해지는(제곱합 최대) 각도를 고릅니다.
+            양수는 화면상 시계 방향(오른쪽으로 갈수록 아래로) 기울기입니다.
+            """
+            h, w = img.shape[:2]
+            factor = min(1.0, SKEW_MAX_DIMENSION / max(h, w))
+            if factor < 1.0:
+                img = cv2.resize(img, (max(1, int(w * factor)), max(1, int(h * factor))), interpolation=cv2.INTER_AREA)
+
+            _, binary = cv2.threshold(img, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+            ys, xs = np.nonzero(binary)
+            if len(xs) < 50:
+                return 0.0
+            if len(xs) > SKEW_MAX_SAMPLE_POINTS:
+                step = len(xs) // SKEW_MAX_SAMPLE_POINTS + 1
+                xs, ys = xs[::step], ys[::step]
+
+            # 정수 픽셀 좌표를 그대로 쓰면 0도에서만 양자화 오차가 사라져 점수가 부풀려지므로
+            # 고정 시드의 서브픽셀 디더링을 더해 모든 각도를 같은 조건에서 비교합니다.
+            rng = np.random.default_rng(0)
+            xs = xs.astype(np.float32) - binary.shape[1] / 2.0 + rng.random(len(xs), dtype=np.float32) - 0.5
+            ys = ys.astype(np.float32) - binary.shape[0] / 2.0 + rng.random(len(ys), dtype=np.float32) - 0.5
+
+            coarse = np.arange(-SKEW_MAX_ANGLE, SKEW_MAX_ANGLE + SKEW_COARSE_STEP / 2, SKEW_COARSE_STEP)
+            best = self._best_projection_angle(xs, ys, coarse)
+            fine = np.arange(best - SKEW_COARSE_STEP, best + SKEW_COARSE_STEP + SKEW_FINE_STEP / 2, SKEW_FINE_STEP)
+            return float(self._best_projection_angle(xs, ys, fine))
+
+        def _best_projection_angle(self, xs, ys, angles):
+            theta = np.deg2rad(angles).astype(np.float32)[:, None]
+            # 각 후보 각도만큼 되돌렸을 때의 y 좌표 (행: 각도, 열: 픽셀)
+            projected = ys[None, :] * np.cos(theta) - xs[None, :] * np.sin(theta)
+            bins = np.floor(projected).astype(np.int64)
+            bins -= bins.min()
+            n_bins = int(bins.max()) + 1
+
+            # 모든 각도의 히스토그램을 bincount 한 번으로 계산
+            flat = (bins + np.arange(len(angles))[:, None] * n_bins).ravel()
+            hist = np.bincount(flat, minlength=len(angles) * n_bins).reshape(len(angles), n_bins)
+            scores = (hist.astype(np.float64) ** 2).sum(axis=1)
+            return angles[int(np.argmax(scores))]
 
@@ -0,0 +1,394 @@
+# 파일 경로: infrastructure/services/warm_worker_pool.py
+import atexit
+import importlib
+import multiprocessing
+import os
+import queue
+import threading
+import time
+
+from shared.constants import (
+    WORKER_POOL_SIZE, WORKER_MAX_JOBS, WORKER_HEALTH_INTERVAL_SECONDS, WORKER_PING_TIMEOUT_SECONDS,
+    WORKER_HEAVY_MODULES, DEFAULT_TEMPLATE_FILE
+)
+from shared.exceptions import ValidationCancelledError, ValidationException, WorkerPoolError
+from shared.metrics import registry
+from shared.tracing import tracer, document_label
+
+_IDLE_WORKERS = registry.gauge("worker_pool_idle_workers", "유휴 상주 작업자 수")
+_WAITING = registry.gauge("worker_pool_waiting_jobs", "유휴 작업자를 기다리는 검증 요청 수")
+_RECYCLED = registry.counter("worker_pool_recycled_total", "교체된 상주 작업자 수")
+
+# Infrastructure Layer (Service Implementation)
+# 역할: 한 번 띄워 두고 계속 재사용하는 검증 작업자 프로세스 풀.
+#       - 작업자는 시작할 때 무거운 모듈(OpenCV, PyMuPDF, Tesseract 등)을 import하고,
+#         템플릿을 읽어 원본 페이지의 기울기까지 미리 계산하며, Tesseract 언어 데이터를 읽어 둡니다.
+#       - 일괄 검증과 단일 파일 검증이 같은 풀을 공유합니다.
+#       - 유휴 작업자는 주기적으로 상태를 점검하고, N개 문서를 처리한 작업자는 새 프로세스로 교체합니다.
+#       - 작업자에서 기록한 메트릭(OCR 호출, 렌더 캐시 등)은 작업마다 증분을 부모로 보내 부모 레지스트리에 합칩니다.
+#       Windows/PyInstaller에서도 동작하도록 spawn 방식을 사용합니다 (main.py의 freeze_support 필요).
+
+
+def _warm_up(config, stats):
+    """작업자 프로세스 예열: 모듈 import, Tesseract 설정, 템플릿 원본 미리 읽기"""
+    for module_name in config["heavy_modules"]:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            pass
+
+    if config.get("tesseract_cmd"):
+        import pytesseract
+        pytesseract.pytesseract.tesseract_cmd = config["tesseract_cmd"]
+    tessdata_path = config.get("tessdata_path")
+    if tessdata_path and os.path.isdir(tessdata_path):
+        os.environ['TESSDATA_PREFIX'] = tessdata_path
+        # 언어 데이터를 한 번 읽어 OS 페이지 캐시에 올려 둠 (첫 OCR 지연 감소)
+        for lang in config.get("languages", "").split("+"):
+            lang_file = os.path.join(tessdata_path, f"{lang}.traineddata")
+            if os.path.exists(lang_file):
+                with open(lang_file, 'rb') as f:
+                    while f.read(1024 * 1024):
+                        pass
+
+    from infrastructure.repositories.file_document_repository import FileDocumentRepository
+    from infrastructure.repositories.json_template_repository import JsonTemplateRepository
+    from infrastructure.services.validation_vision_service import ValidationVisionService
+    from domain.services.validation_service import ValidationService
+
+    doc_repo = FileDocumentRepository()
+    vision = ValidationVisionService()
+    service = ValidationService(doc_repo, vision)
+
+    # 템플릿 원본 페이지의 기울기는 모든 문서에서 재사용되므로 미리 계산
+    templates_file = config.get("templates_file")
+    if templates_file and os.path.exists(templates_file):
+        template_repo = JsonTemplateRepository(templates_file)
+        for name in template_repo.get_all_names():
+            try:
+                template = template_repo.load(name)
+                original_doc = doc_repo.load_pdf(template['original_pdf_path'])
+            except Exception:
+                continue
+            try:
+                for page_num in {roi.get('page', 0) for roi in template.get('rois', {}).values()}:
+                    if 0 <= page_num < len(original_doc):
+                        vision.warm_original_page(original_doc, page_num)
+                stats["templates"] += 1
+            finally:
+                original_doc.close()
+    return service
+
+
+def _worker_main(conn, cancel_event, config):
+    """작업자 프로세스 진입점 (spawn으로 실행되므로 모듈 최상위 함수여야 함)"""
+    started = time.perf_counter()
+    stats = {"pid": os.getpid(), "jobs": 0, "templates": 0}
+    tracer.process_name = f"validation-worker-{os.getpid()}"
+    registry.enabled = config.get("metrics_enabled", registry.enabled)
+    service = _warm_up(config, stats)
+    stats["warm_seconds"] = round(time.perf_counter() - started, 3)
+    conn.send(("ready", dict(stats)))
+
+    def checkpoint():
+        if cancel_event.is_set():
+            raise ValidationCancelledError()
+
+    def progress_callback(message, current, total):
+        conn.send(("progress", message, current, total))
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+
+        kind = message[0]
+        if kind == "stop":
+            break
+        if kind == "ping":
+            from shared.utils import PerformanceUtils
+            conn.send(("pong", dict(stats, rss_mb=round(PerformanceUtils.get_memory_usage(), 1))))
+        elif kind == "validate":
+            _, template, pdf_path, streaming, tracing, page_range = message
+            tracer.enabled = tracing
+            try:
+                reply = ("result", service.validate_document(
+                    template, pdf_path, progress_callback=progress_callback,
+                    checkpoint=checkpoint, streaming=streaming, page_range=page_range
+                ))
+            except ValidationCancelledError:
+                reply = ("cancelled",)
+            except Exception as e:
+                reply = ("error", str(e))
+            if tracing:
+                # 구간 기록은 결과보다 먼저 보내 부모가 같은 작업 안에서 합치도록 함
+                conn.send(("trace", tracer.drain()))
+            if registry.enabled:
+                conn.send(("metrics", registry.drain()))
+            conn.send(reply)
+            stats["jobs"] += 1
+    conn.close()
+
+
+class _WorkerHandle:
+    """부모 프로세스가 보관하는 작업자 프로세스 하나의 연결 정보"""
+
+    def __init__(self, context, config):
+        self.conn, child_conn = context.Pipe()
+        self.cancel_event = context.Event()
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn, self.cancel_event, config),
+            name="validation-worker", daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.jobs = 0
+        self.ready = False
+        self.stats = {}
+
+    @property
+    def is_alive(self):
+        return self.process.is_alive()
+
+    def receive(self, timeout):
+        """메시지 하나를 받습니다. 예열 완료(ready) 메시지는 여기서 처리합니다."""
+        if not self.conn.poll(timeout):
+            return None
+        message = self.conn.recv()
+        if message[0] == "ready":
+            self.ready = True
+            self.stats = message[1]
+        return message
+
+    def ping(self, timeout):
+        """ping/pong으로 응답을 확인합니다. timeout 안에 예열이 끝나지 않으면 살아 있는지만 봅니다."""
+        if not self.is_alive:
+            return False
+        deadline = time.monotonic() + timeout
+        try:
+            while not self.ready:
+                if self.receive(max(0.0, deadline - time.monotonic())) is None:
+                    return self.is_alive  # 아직 예열 중
+            self.conn.send(("ping",))
+            while time.monotonic() < deadline:
+                message = self.receive(0.05)
+                if message and message[0] == "pong":
+                    self.stats = message[1]
+                    return True
+        except (EOFError, OSError):
+            pass
+        return False
+
+    def stop(self, timeout=5):
+        try:
+            self.conn.send(("stop",))
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout)
+        self.conn.close()
+
+
+class WarmWorkerPool:
+    def __init__(self, size=WORKER_POOL_SIZE, max_jobs_per_worker=WORKER_MAX_JOBS,
+                 templates_file=DEFAULT_TEMPLATE_FILE, tesseract_cmd="", tessdata_path="", languages="",
+                 health_interval=WORKER_HEALTH_INTERVAL_SECONDS, heavy_modules=WORKER_HEAVY_MODULES,
+                 metrics_enabled=None):
+        self.size = max(1, size)
+        self.max_jobs_per_worker = max(1, max_jobs_per_worker)
+        self.health_interval = health_interval
+        self._config = {
+            "templates_file": os.path.abspath(templates_file) if templates_file else None,
+            "tesseract_cmd": tesseract_cmd,
+            "tessdata_path": tessdata_path,
+            "languages": languages,
+            "heavy_modules": tuple(heavy_modules),
+            # None이면 부모 레지스트리 설정을 따름 (spawn 작업자는 constants의 기본값으로 시작하므로 명시적으로 넘김)
+            "metrics_enabled": registry.enabled if metrics_enabled is None else metrics_enabled,
+        }
+        self._context = multiprocessing.get_context("spawn")
+        self._idle = queue.Queue()
+        self._workers = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._health_thread = None
+        self.recycled = 0
+
+    # --- 수명 주기 ---
+    def start(self):
+        """작업자를 띄웁니다. 예열은 각 프로세스에서 비동기로 진행되며 첫 작업이 들어오면 끝날 때까지 기다립니다."""
+        with self._lock:
+            if self._workers:
+                return
+            for _ in range(self.size):
+                handle = _WorkerHandle(self._context, self._config)
+                self._workers.append(handle)
+                self._idle.put(handle)
+        self._stop_event.clear()
+        self._health_thread = threading.Thread(target=self._health_loop, name="worker-pool-health", daemon=True)
+        self._health_thread.start()
+
+    def shutdown(self):
+        self._stop_event.set()
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for handle in workers:
+            handle.stop()
+        self._idle = queue.Queue()
+
+    @property
+    def is_running(self):
+        return bool(self._workers)
+
+    # --- 작업 실행 ---
+    def validate(self, template, pdf_path, progress_callback=None, checkpoint=None, streaming=False, page_range=None):
+        """유휴 작업자 하나에서 문서를 검증합니다. 모든 작업자가 바쁘면 빌 때까지 기다립니다."""
+        if not self.is_running:
+            raise WorkerPoolError("작업자 풀이 시작되지 않았습니다")
+
+        _WAITING.inc()
+        try:
+            with tracer.span("pool_wait", document=document_label(pdf_path)):
+                handle = self._idle.get()
+        finally:
+            _WAITING.dec()
+        _IDLE_WORKERS.set(self._idle.qsize())
+        try:
+            if not handle.is_alive:
+                handle = self._replace(handle)
+            with tracer.span("pool_validate", document=document_label(pdf_path), worker_pid=handle.process.pid):
+                return self._run_on(handle, template, pdf_path, progress_callback, checkpoint, streaming, page_range)
+        finally:
+            self._release(handle)
+
+    def _run_on(self, handle, template, pdf_path, progress_callback, checkpoint, streaming, page_range=None):
+        handle.cancel_event.clear()
+        handle.conn.send(("validate", template, pdf_path, streaming, tracer.enabled, page_range))
+
+        cancelled = None
+        while True:
+            if checkpoint and cancelled is None:
+                try:
+                    checkpoint()
+                except ValidationCancelledError as e:
+                    cancelled = e
+                    handle.cancel_event.set() # 작업자는 다음 ROI 직전에 멈추고 'cancelled'를 보냄
+
+            try:
+                message = handle.receive(0.1)
+            except (EOFError, OSError):
+                message = None
+            if message is None:
+                if not handle.is_alive:
+                    raise WorkerPoolError("작업자 프로세스가 비정상 종료되었습니다")
+                continue
+
+            kind = message[0]
+            if kind == "progress":
+                if progress_callback:
+                    progress_callback(*message[1:])
+                continue
+            if kind == "ready":
+                continue
+            if kind == "trace":
+                tracer.add_events(message[1])
+                continue
+            if kind == "metrics":
+                registry.merge(message[1])
+                continue
+
+            handle.jobs += 1
+            if kind == "result":
+                return message[1]
+            if kind == "cancelled":
+                raise cancelled or ValidationCancelledError()
+            raise ValidationException(message[1])
+
+    def _release(self, handle):
+        if not handle.is_alive or handle.jobs >= self.max_jobs_per_worker:
+            handle = self._replace(handle)
+        self._idle.put(handle)
+        _IDLE_WORKERS.set(self._idle.qsize())
+
+    def _replace(self, handle):
+        """작업자를 새 프로세스로 교체합니다 (비정상 종료 또는 처리 문서 수 한도 도달)."""
+        handle.stop(timeout=1)
+        new_handle = _WorkerHandle(self._context, self._config)
+        with self._lock:
+            if handle in self._workers:
+                self._workers[self._workers.index(handle)] = new_handle
+            self.recycled += 1
+        _RECYCLED.inc()
+        return new_handle
+
+    # --- 상태 점검 ---
+    def health_check(self, timeout=WORKER_PING_TIMEOUT_SECONDS):
+        """유휴 작업자에 ping을 보내 응답하지 않으면 교체합니다. 작업 중인 작업자는 건너뜁니다."""
+        checked = []
+        while True:
+            try:
+                checked.append(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+        report = []
+        for handle in checked:
+            healthy = handle.ping(timeout)
+            if not healthy:
+                handle = self._replace(handle)
+            report.append({"healthy": healthy, "jobs": handle.jobs, "ready": handle.ready, **handle.stats})
+            self._idle.put(handle)
+        return report
+
+    def _health_loop(self):
+        while not self._stop_event.wait(self.health_interval):
+            if self.is_running:
+                self.health_check()
+
+
+class PooledValidationService:
+    """
+    ValidationService와 같은 인터페이스로 상주 작업자 풀에 검증을 맡기는 어댑터.
+    결과 PDF 생성과 뷰어 렌더링은 로컬 ValidationService에 위임합니다.
+    """
+
+    def __init__(self, local_service, pool):
+        self.local = local_service
+        self.pool = pool
+
+    def validate_document(self, template, target_pdf_path, progress_callback=None, checkpoint=None, streaming=False,
+                          page_range=None):
+        return self.pool.validate(
+            template, target_pdf_path, progress_callback=progress_callback,
+            checkpoint=checkpoint, streaming=streaming, page_range=page_range
+        )
+
+    def create_annotated_pdf(self, target_pdf_path, validation_results, page_range=None):
+        return self.local.create_annotated_pdf(target_pdf_path, validation_results, page_range)
+
+    def create_review_excerpt(self, target_pdf_path, validation_results, page_range=None):
+        return self.local.create_review_excerpt(target_pdf_path, validation_results, page_range)
+
+    def load_docs_for_viewer(self, original_path, annotated_bytes):
+        return self.local.load_docs_for_viewer(original_path, annotated_bytes)
+
+    def render_page_to_image(self, doc, page_num, size):
+        return self.local.render_page_to_image(doc, page_num, size)
+
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_shared_pool(**kwargs):
+    """프로세스 전체에서 공유하는 작업자 풀 (처음 호출 시 생성/시작, 종료 시 자동 정리)"""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = WarmWorkerPool(**kwargs)
+            _shared_pool.start()
+            atexit.register(_shared_pool.shutdown)
+        return _shared_pool
@@ -1,4 +1,6 @@
+import argparse
 import tkinter as tk
+import multiprocessing
 import sys
 import os
 
@@ -9,28 +11,44 @@ sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 
 from app.gui.main_window import MainWindow
 from app.controllers.main_controller import MainController
+from shared.profiling import add_profiling_arguments, options_from_args
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="PDF 문서 검증 자동화")
+    add_profiling_arguments(parser)
+    parser.add_argument("--trace", action="store_true", help="구간 추적 기록 (traces/에 Chrome trace JSON 저장)")
+    # 그 밖의 인자(--debug 등)는 이전처럼 무시
+    args, _ = parser.parse_known_args(argv)
+    return args
 
 def main():
     """
     애플리케이션의 시작점 (Composition Root).
     모든 최상위 구성요소를 조립하고 GUI 메인 루프를 시작합니다.
     """
+    args = parse_args()
+
     # 1. 애플리케이션의 메인 윈도우(Tkinter 루트) 생성
     root = tk.Tk()
 
     # 2. 메인 컨트롤러 생성.
     #    MainController는 다른 기능 창들(템플릿 편집기, 검증 도구)을
     #    열어주는 '지휘자' 역할을 담당합니다.
-    main_controller = MainController(root)
+    main_controller = MainController(root, profiling=options_from_args(args), tracing=args.trace)
 
     # 3. 메인 뷰(View) 생성.
     #    MainWindow는 사용자가 가장 처음 보게 될 메뉴 화면이며,
     #    모든 사용자 요청(버튼 클릭 등)을 MainController에 전달합니다.
     app = MainWindow(root, main_controller)
 
+    # 메뉴 창이 뜬 뒤 도구 창에 필요한 무거운 모듈(OpenCV, PyMuPDF 등)을 백그라운드에서 미리 import
+    main_controller.start_prewarm()
+
     # 4. Tkinter 이벤트 루프를 시작하여 사용자 입력을 기다립니다.
     root.mainloop()
 
 if __name__ == "__main__":
+    # 상주 작업자 풀은 spawn 방식으로 프로세스를 띄우므로, PyInstaller 실행 파일에서도 동작하도록 필요
+    multiprocessing.freeze_support()
     main()
 
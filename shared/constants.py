@@ -20,13 +20,34 @@ HIGH_QUALITY_DPI = 300
 MIN_ROI_SIZE = 10  # 최소 ROI 크기 (픽셀)
 MAX_ROI_SIZE = 5000  # 최대 ROI 크기 (픽셀)
 DEFAULT_OCR_THRESHOLD = 3  # OCR 기본 임계값
-DEFAULT_CONTOUR_THRESHOLD = 100  # Contour 기본 임계값
+DEFAULT_CONTOUR_THRESHOLD = 100  # Contour 기본 임계값 (양식에 없던 잉크 면적, 렌더링 픽셀)
+CONTOUR_SCORING_ENABLED = False  # Contour ROI를 잉크 면적으로 판정 (끄면 측정값만 남기고 항상 OK, 기존 템플릿의 임계값 조정 전까지)
+
+# Contour 측정 관련 상수 (ValidationVisionService._measure_ink)
+CONTOUR_INK_LEVEL = 128  # 이보다 어두운 픽셀을 잉크로 봄 (0~255 회색조)
+CONTOUR_TEMPLATE_TOLERANCE_PX = 5  # 원본 양식의 잉크를 이 크기(px)만큼 넓혀서 빼, 정렬 오차로 어긋난 인쇄 글자를 무시
+CONTOUR_LINE_RATIO = 0.5  # ROI 너비의 이 비율 이상 이어진 가로선(세로선은 높이의 0.8)은 양식 괘선으로 보고 제외
+CONTOUR_MIN_AREA = 4  # 이보다 작은 잉크 덩어리(px)는 잡음으로 무시
 
 # 검증 관련 상수
 MAX_PROCESSING_TIME = 300  # 최대 처리 시간 (초)
 DEFAULT_SSIM_THRESHOLD = 0.99  # SSIM 임계값
 LAYOUT_DETECTION_SCALE = 2.0  # 레이아웃 감지용 스케일
 
+# 기울기(skew) 추정 관련 상수
+SKEW_ESTIMATION_SCALE = 1.0  # 기울기 추정용 렌더링 스케일 (72 DPI, 레이아웃 감지용 2.0보다 저해상도)
+SKEW_MAX_DIMENSION = 1000  # 추정 전 축소할 최대 이미지 변 길이 (픽셀)
+SKEW_MAX_ANGLE = 5.0  # 탐색할 최대 기울기 (도)
+SKEW_COARSE_STEP = 0.5  # 1차 탐색 간격 (도)
+SKEW_FINE_STEP = 0.05  # 2차 정밀 탐색 간격 (도)
+SKEW_MIN_ANGLE = 0.1  # 이보다 작은 기울기 차이는 무시 (도)
+SKEW_MAX_SAMPLE_POINTS = 20000  # 투영 프로파일 계산에 사용할 최대 전경 픽셀 수
+
+# 페이지 유형(스캔/디지털) 판별 관련 상수
+SCANNED_PAGE_IMAGE_COVERAGE = 0.8  # 이 비율 이상 이미지로 덮이면 스캔 페이지
+MIXED_PAGE_IMAGE_COVERAGE = 0.3  # 이 비율 이상이면 텍스트가 있어도 혼합 페이지
+MIN_TEXT_SPANS_FOR_DIGITAL = 1  # 디지털 페이지로 판단하기 위한 최소 텍스트 span 수
+
 # OCR 관련 상수
 OCR_LANGUAGES = "kor+eng"  # 지원 언어
 OCR_CONFIG_DEFAULT = r"--oem 3 --psm 6"
@@ -45,6 +66,27 @@ DEFAULT_WINDOW_HEIGHT = 900
 MIN_WINDOW_WIDTH = 800
 MIN_WINDOW_HEIGHT = 600
 
+# 시작 속도 관련 상수 (메뉴 창은 가벼운 모듈만 import하고, 도구 창 모듈은 표시 후 백그라운드에서 미리 import)
+STARTUP_PREWARM_DELAY_MS = 300  # 메뉴 창이 그려진 뒤 미리 import를 시작하기까지의 지연
+STARTUP_PREWARM_MODULES = (
+    "numpy", "fitz", "PIL.Image", "cv2", "skimage.metrics", "pytesseract",
+    "app.controllers.validation_controller", "app.gui.validation_window",
+    "app.controllers.template_controller", "app.gui.template_editor_window",
+    "infrastructure.services.validation_vision_service", "infrastructure.services.vision_service",
+    "infrastructure.services.template_fingerprint_index", "infrastructure.services.preview_tile_cache",
+)
+# 메뉴 창을 띄우는 데 필요 없는 무거운 모듈 (시작 import 예산 테스트에서 검사)
+STARTUP_FORBIDDEN_MODULES = ("numpy", "fitz", "pymupdf", "cv2", "PIL", "skimage", "scipy", "pytesseract")
+
+# 백그라운드 검증 작업 관련 상수
+JOB_POLL_INTERVAL_MS = 50  # View가 작업 이벤트 큐를 비우는 주기 (ms)
+JOB_MAX_EVENTS_PER_TICK = 500  # 한 번의 주기에서 처리할 최대 이벤트 수 (UI 응답성 유지)
+
+# 로그/결과 표 갱신 관련 상수
+LOG_MAX_LINES = 2000  # 로그 창에 유지할 최대 줄 수 (링 버퍼)
+LOG_FLUSH_INTERVAL_MS = 100  # 로그 창 갱신 주기 (최대 10Hz)
+RESULT_TABLE_REFRESH_MS = 100  # 결과 표 갱신 주기 (최대 10Hz)
+
 # 색상 상수 (RGB)
 COLOR_ROI_OCR = (0, 0, 255)  # 파란색
 COLOR_ROI_CONTOUR = (255, 0, 0)  # 빨간색
@@ -61,14 +103,98 @@ LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 CACHE_MAX_SIZE = 100  # 최대 캐시 크기
 CACHE_TTL_SECONDS = 3600  # 캐시 TTL (1시간)
 
+# 뷰어 렌더링 캐시 관련 상수
+VIEWER_CACHE_MAX_MB = 256  # 렌더링된 페이지 이미지 캐시 최대 크기 (MB)
+VIEWER_RESIZE_TOLERANCE = 0.1  # 캐시 이미지를 재렌더링 없이 확대/축소해 쓸 수 있는 크기 변화 비율
+VIEWER_RESIZE_DEBOUNCE_MS = 150  # 창 크기 변경 후 다시 그리기까지 대기 시간 (ms)
+PREVIEW_CACHE_ENABLED = True  # 뷰어 페이지 이미지를 디스크에도 보관 (같은 문서를 다시 열 때 재렌더링 생략)
+PREVIEW_CACHE_DIR = "preview_cache"  # 디스크 미리보기 타일 저장 위치
+PREVIEW_CACHE_MAX_MB = 512  # 디스크 미리보기 타일 전체 크기 상한 (MB, 넘으면 오래 쓰지 않은 타일부터 삭제)
+PREVIEW_CACHE_FORMAT = "webp"  # 타일 형식 (webp / png, WebP를 지원하지 않는 Pillow에서는 png)
+PREVIEW_CACHE_QUALITY = 85  # WebP 품질
+PREVIEW_CACHE_WRITE_QUEUE = 32  # 저장 대기 타일 수 상한 (넘으면 버림)
+PREVIEW_ZOOM_STEP = 1 + VIEWER_RESIZE_TOLERANCE  # 타일 배율 단계 간격 (같은 단계의 창 크기는 같은 타일을 축소해서 사용)
+PREVIEW_PREWARM_PAGES = 2  # 단일 파일 검증 중 뷰어용으로 미리 렌더링해 둘 앞쪽 페이지 수
+EDITOR_ZOOM_BUCKET = 0.05  # 템플릿 편집기 배율 단위 (이 단위로 내림하여 같은 구간은 같은 렌더링을 재사용)
+SPATIAL_INDEX_CELL_SIZE = 48.0  # 템플릿 편집기 ROI 공간 색인(균일 격자)의 칸 크기 (PDF pt)
+ROI_CLICK_TOLERANCE_PX = 8  # 클릭 위치에 ROI가 없을 때 가장 가까운 ROI를 선택하는 최대 거리 (화면 픽셀)
+
 # 성능 관련 상수
 MAX_CONCURRENT_VALIDATIONS = 5  # 최대 동시 검증 수
+ROI_VALIDATION_WORKERS = 4  # 문서 하나의 ROI 검증에 사용하는 스레드 수 (페이지 단위 병렬 처리)
 MEMORY_WARNING_THRESHOLD_MB = 1000  # 메모리 경고 임계값 (MB)
+BATCH_MEMORY_BUDGET_MB = MEMORY_WARNING_THRESHOLD_MB  # 일괄 검증 시 예상 RSS 상한 (MB)
+BATCH_RENDER_CHANNELS = 3  # 메모리 추정 시 페이지 래스터 채널 수 (RGB)
+BATCH_DOCUMENT_OVERHEAD_MB = 30  # 문서 하나를 여는 데 드는 기본 메모리 (MB)
+BATCH_ADMISSION_POLL_SECONDS = 0.1  # 메모리 여유를 기다릴 때 재확인 주기 (초)
+
+# 메트릭 관련 상수 (shared/metrics.py)
+METRICS_ENABLED = True  # 비활성화 시 기록 호출은 플래그 확인만 하고 반환
+METRICS_OUTPUT_DIR = "metrics"  # 일괄 검증 종료 시 Prometheus 텍스트/JSON 스냅샷 저장 위치
+METRICS_FILE_PREFIX = "validation"
+METRICS_DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)  # 초
+
+# 프로파일링 관련 상수 (shared/profiling.py)
+PROFILE_OUTPUT_SUBDIR = "profiles"  # 결과 폴더 아래 프로파일 저장 위치
+PROFILE_SAMPLE_INTERVAL = 0.005  # 스택 샘플링 간격 (초)
+PROFILE_MAX_DOCUMENTS = 5  # 일괄 검증에서 프로파일링할 최대 문서 수
+PROFILE_MEMORY_TOP = 25  # tracemalloc 상위 할당 위치 개수
+
+# 구간 추적 관련 상수 (shared/tracing.py)
+TRACING_ENABLED = False  # 켜면 문서/페이지/ROI 단계 구간을 Chrome trace-event 형식으로 기록
+TRACE_OUTPUT_DIR = "traces"  # 검증 작업이 끝날 때마다 trace_<시각>.json 저장 위치 (Perfetto에서 열기)
+TRACE_MAX_EVENTS = 500_000  # 내보내기 전까지 보관하는 최대 이벤트 수 (초과분은 버리고 개수만 기록)
+
+# 검증 파이프라인 단계 (ROI별 처리 시간 계측, 표시 순서)
+TIMING_STAGES = ("render", "alignment", "anchor", "crop_resize", "contour", "ocr")
+
+# 상주 작업자 프로세스 풀 관련 상수
+WORKER_POOL_SIZE = 2  # 상주 검증 프로세스 수
+WORKER_MAX_JOBS = 200  # 작업자 하나가 처리할 최대 문서 수 (이후 새 프로세스로 교체하여 누수 방지)
+WORKER_HEALTH_INTERVAL_SECONDS = 30  # 유휴 작업자 상태 점검 주기
+WORKER_PING_TIMEOUT_SECONDS = 5  # 상태 점검 응답 대기 시간
+WORKER_HEAVY_MODULES = ("numpy", "cv2", "fitz", "PIL.Image", "skimage.metrics", "pytesseract")  # 작업자 시작 시 미리 import
+
+# 분산 일괄 검증 (공유 디렉터리 lease 작업 큐) 관련 상수
+LEASE_TIMEOUT_SECONDS = 120  # 이 시간 동안 heartbeat가 없으면 작업자가 죽은 것으로 보고 lease를 회수
+LEASE_HEARTBEAT_SECONDS = 15  # lease 파일 mtime 갱신 주기
+WORK_QUEUE_POLL_SECONDS = 2.0  # 남은 작업이 모두 다른 작업자에게 점유되어 있을 때 재확인 주기
+
+# 검증 서버 관련 상수 (localhost 전용)
+VALIDATION_SERVER_HOST = "127.0.0.1"
+VALIDATION_SERVER_PORT = 8765
+SERVER_MAX_BODY_MB = 100  # 요청 본문 최대 크기 (base64 PDF 포함)
+SERVER_JOB_RETENTION = 500  # 완료된 작업을 메모리에 보관하는 최대 개수
+SERVER_REQUEST_TIMEOUT = 30  # 클라이언트 요청 타임아웃 (초, 이벤트 스트림 제외)
+
+# 템플릿 자동 인식 (지각 해시 색인)
+TEMPLATE_FINGERPRINT_FILE = "template_fingerprints.json"  # 템플릿 해시 색인 저장 파일
+TEMPLATE_FINGERPRINT_PAGES = 2  # 비교할 문서 앞쪽 페이지 수
+TEMPLATE_FINGERPRINT_RENDER_WIDTH = 64  # 해시 계산용 렌더링 가로 크기 (px)
+TEMPLATE_MATCH_MIN_CONFIDENCE = 0.7  # 이보다 낮으면 템플릿을 인식하지 못한 것으로 처리 (0~1)
+TEMPLATE_MATCH_MIN_MARGIN = 0.02  # 1, 2순위 템플릿 신뢰도 차이가 이보다 작으면 모호한 것으로 처리
+TEMPLATE_FINGERPRINT_STORED_PAGES = 20  # 묶음 분할용으로 해시를 저장할 템플릿 최대 페이지 수
+
+# 일괄 검증 결과 PDF (미흡 문서) 저장 방식
+REVIEW_OUTPUT_FULL = "full"  # 문서 전체 사본 (review_<문서>_<시각>.pdf)
+REVIEW_OUTPUT_EXCERPT = "excerpt"  # 미흡 ROI가 있는 페이지만 발췌
+REVIEW_OUTPUT_BUNDLE = "bundle"  # 발췌 페이지를 일괄 검증 하나당 PDF 한 개(목차 포함)로 합침
+REVIEW_OUTPUT_MODES = (REVIEW_OUTPUT_FULL, REVIEW_OUTPUT_EXCERPT, REVIEW_OUTPUT_BUNDLE)
+REVIEW_OUTPUT_MODE = REVIEW_OUTPUT_FULL  # 기본 저장 방식
+REVIEW_SOURCE_LINK_HEIGHT = 12  # 발췌 페이지 위쪽 '원본 열기' 링크 영역 높이 (pt)
+
+# 일괄 검증 보고서 (문서마다 한 행씩 덧붙이는 JSONL/CSV)
+BATCH_REPORT_FORMATS = ("jsonl", "csv")  # 기본으로 쓰는 형식 (빈 튜플이면 보고서를 만들지 않음)
+BATCH_REPORT_INCLUDE_ROIS = False  # ROI마다 한 행을 추가로 기록할지 여부
+BATCH_REPORT_FLUSH_ROWS = 200  # 이 행 수마다 파일과 요약을 디스크에 씀
+BATCH_REPORT_FLUSH_SECONDS = 2.0  # 행 수와 관계없이 이 시간(초)이 지나면 씀
 
 # 파일 이름 패턴
 RESULT_FILE_PATTERN = "result_{document_name}_{timestamp}.json"
 DEBUG_FILE_PATTERN = "debug_{document_name}_{timestamp}.json"
 ANNOTATED_PDF_PATTERN = "annotated_{document_name}_{timestamp}.pdf"
+REVIEW_BUNDLE_PATTERN = "review_bundle_{timestamp}.pdf"
+BATCH_REPORT_PATTERN = "report_{timestamp}"  # 확장자(.jsonl/.csv/.summary.json)는 형식별로 붙음
 
 # 디렉토리 구조
 COMPANY_FOLDERS = [
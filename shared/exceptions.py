@@ -39,6 +39,15 @@ class InvalidTemplateError(TemplateException):
         self.reason = reason
 
 
+class TemplateNotIdentifiedError(TemplateException):
+    """문서에 맞는 템플릿을 자동 인식하지 못함"""
+
+    def __init__(self, file_path: str, detail: str):
+        super().__init__(f"'{file_path}'의 템플릿을 자동 인식하지 못했습니다: {detail}")
+        self.file_path = file_path
+        self.detail = detail
+
+
 class DocumentException(PDFValidatorException):
     """문서 관련 예외"""
     pass
@@ -89,6 +98,13 @@ class ValidationProcessError(ValidationException):
         self.roi_name = roi_name
 
 
+class ValidationCancelledError(ValidationException):
+    """사용자에 의한 검증 취소"""
+    
+    def __init__(self):
+        super().__init__("사용자에 의해 검증이 취소되었습니다")
+
+
 class ROIException(PDFValidatorException):
     """ROI 관련 예외"""
     pass
@@ -137,6 +153,20 @@ class ComputerVisionServiceError(ServiceException):
         super().__init__(f"컴퓨터 비전 서비스 오류: {message}")
 
 
+class ValidationServerError(ServiceException):
+    """로컬 검증 서버 통신/처리 오류"""
+    
+    def __init__(self, message: str):
+        super().__init__(f"검증 서버 오류: {message}")
+
+
+class WorkerPoolError(ServiceException):
+    """상주 작업자 프로세스 풀 오류"""
+    
+    def __init__(self, message: str):
+        super().__init__(f"작업자 풀 오류: {message}")
+
+
 class RepositoryException(PDFValidatorException):
     """저장소 관련 예외"""
     pass
@@ -0,0 +1,337 @@
+"""
+Metrics Registry
+프로세스 내 경량 메트릭 저장소 (카운터 / 게이지 / 고정 구간 히스토그램)
+
+- 비활성화하면 기록 메서드는 플래그 하나만 확인하고 바로 반환합니다.
+- Prometheus 텍스트 형식(node_exporter textfile collector 호환)과 JSON 스냅샷으로 내보냅니다.
+
+사용 예:
+    from shared.metrics import registry
+
+    documents = registry.counter("validation_documents_total", "검증한 문서 수", labels=("status",))
+    documents.inc(status="OK")
+
+    with registry.timer("ocr_seconds"):
+        ...
+
+    @registry.timed("template_load_seconds")
+    def load_template(...):
+        ...
+
+    registry.export("metrics")  # metrics/validation.prom, metrics/validation.json
+
+다른 프로세스(상주 작업자)의 카운터/히스토그램은 drain()으로 꺼낸 증분을 부모에서 merge()로 합칩니다.
+게이지는 프로세스별 현재 값이므로 합치지 않습니다.
+"""
+import bisect
+import functools
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Iterable, Optional, Tuple
+
+from shared.constants import METRICS_ENABLED, METRICS_DEFAULT_BUCKETS, METRICS_FILE_PREFIX
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, registry: "MetricsRegistry", name: str, help_text: str, label_names: Tuple[str, ...]):
+        self._registry = registry
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(label_names)
+        self._values: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def _label_dict(self, key) -> Dict[str, str]:
+        return dict(zip(self.label_names, key))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def _take(self) -> Dict[Tuple[str, ...], object]:
+        """지금까지의 값을 꺼내고 비웁니다."""
+        with self._lock:
+            values, self._values = self._values, {}
+        return values
+
+
+class Counter(_Metric):
+    """단조 증가 값"""
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        if not self._registry.enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self):
+        return [(self.name, self._label_dict(key), value) for key, value in sorted(self._values.items())]
+
+    def _snapshot(self):
+        return [{"labels": self._label_dict(key), "value": value} for key, value in sorted(self._values.items())]
+
+    def _merge(self, values) -> None:
+        with self._lock:
+            for key, value in values.items():
+                self._values[key] = self._values.get(key, 0) + value
+
+
+class Gauge(Counter):
+    """현재 값 (큐 길이, 처리율 등)"""
+    kind = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        if not self._registry.enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    """고정 구간 히스토그램 (구간별 개수, 합계, 개수)"""
+    kind = "histogram"
+
+    def __init__(self, registry, name, help_text, label_names, buckets: Iterable[float]):
+        super().__init__(registry, name, help_text, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        if not self._registry.enabled:
+            return
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """블록 실행 시간(초)을 기록합니다."""
+        if not self._registry.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def _merge(self, values) -> None:
+        with self._lock:
+            for key, (counts, total, count) in values.items():
+                state = self._values.get(key)
+                if state is None:
+                    state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+                state[0] = [a + b for a, b in zip(state[0], counts)]
+                state[1] += total
+                state[2] += count
+
+    def count(self, **labels) -> int:
+        state = self._values.get(self._key(labels))
+        return state[2] if state else 0
+
+    def sum(self, **labels) -> float:
+        state = self._values.get(self._key(labels))
+        return state[1] if state else 0.0
+
+    def _samples(self):
+        samples = []
+        for key, (counts, total, count) in sorted(self._values.items()):
+            labels = self._label_dict(key)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else _format_number(bound)
+                samples.append((f"{self.name}_bucket", dict(labels, le=le), cumulative))
+            samples.append((f"{self.name}_sum", labels, total))
+            samples.append((f"{self.name}_count", labels, count))
+        return samples
+
+    def _snapshot(self):
+        return [
+            {
+                "labels": self._label_dict(key),
+                "buckets": dict(zip([_format_number(b) for b in self.buckets] + ["+Inf"], counts)),
+                "sum": round(total, 6),
+                "count": count,
+            }
+            for key, (counts, total, count) in sorted(self._values.items())
+        ]
+
+
+class MetricsRegistry:
+    def __init__(self, enabled: bool = METRICS_ENABLED):
+        self.enabled = enabled
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    # --- 메트릭 등록 (같은 이름이면 기존 객체 반환) ---
+    def counter(self, name: str, help_text: str = "", labels: Iterable[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help_text, labels)
+
+    def gauge(self, name: str, help_text: str = "", labels: Iterable[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, help_text, labels)
+
+    def histogram(self, name: str, help_text: str = "", labels: Iterable[str] = (),
+                  buckets: Iterable[float] = METRICS_DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, help_text, labels, buckets=buckets)
+
+    def _get_or_create(self, cls, name, help_text, labels, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(self, name, help_text, tuple(labels), **kwargs)
+            elif type(metric) is not cls:
+                raise ValueError(f"메트릭 '{name}'은(는) 이미 {metric.kind}(으)로 등록되어 있습니다")
+            return metric
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    # --- 시간 측정 ---
+    def timer(self, name: str, help_text: str = "", **labels):
+        """실행 시간(초)을 히스토그램에 기록하는 컨텍스트 매니저"""
+        return self.histogram(name, help_text, labels=tuple(labels)).time(**labels)
+
+    def timed(self, name: str, help_text: str = "", **labels):
+        """함수 실행 시간(초)을 히스토그램에 기록하는 데코레이터"""
+        histogram = self.histogram(name, help_text, labels=tuple(labels))
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with histogram.time(**labels):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    # --- 내보내기 ---
+    def snapshot(self) -> Dict[str, object]:
+        """모든 메트릭의 현재 값 (JSON 직렬화 가능)"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {
+            "timestamp": time.time(),
+            "metrics": {
+                metric.name: {"type": metric.kind, "help": metric.help, "values": metric._snapshot()}
+                for metric in metrics
+            },
+        }
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            if metric.help:
+                lines.append(f"# HELP {metric.name} {_escape_help(metric.help)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for sample_name, labels, value in metric._samples():
+                lines.append(f"{sample_name}{_format_labels(labels)} {_format_number(value)}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, directory: str, prefix: str = METRICS_FILE_PREFIX) -> Tuple[str, str]:
+        """
+        <directory>/<prefix>.prom 과 <prefix>.json 을 원자적으로 교체하여 씁니다.
+        textfile collector가 절반만 쓰인 파일을 읽지 않도록 임시 파일 + os.replace를 사용합니다.
+        """
+        os.makedirs(directory, exist_ok=True)
+        prom_path = os.path.join(directory, f"{prefix}.prom")
+        json_path = os.path.join(directory, f"{prefix}.json")
+        _write_atomic(prom_path, self.to_prometheus())
+        _write_atomic(json_path, json.dumps(self.snapshot(), ensure_ascii=False, indent=2))
+        return prom_path, json_path
+
+    # --- 프로세스 간 합치기 ---
+    def drain(self) -> Dict[str, tuple]:
+        """
+        카운터/히스토그램의 누적값을 꺼내고 비웁니다 (pickle 가능한 증분).
+        상주 작업자가 작업마다 부모로 보내고, 부모는 merge()로 자기 레지스트리에 더합니다.
+        """
+        with self._lock:
+            metrics = [m for m in self._metrics.values() if m.kind in ("counter", "histogram")]
+        delta = {}
+        for metric in metrics:
+            values = metric._take()
+            if values:
+                delta[metric.name] = (metric.kind, metric.help, metric.label_names,
+                                      getattr(metric, "buckets", None), values)
+        return delta
+
+    def merge(self, delta: Dict[str, tuple]) -> None:
+        """drain()으로 받은 증분을 더합니다. 구간이 다른 히스토그램은 건너뜁니다."""
+        if not self.enabled:
+            return
+        for name, (kind, help_text, label_names, buckets, values) in delta.items():
+            if kind == "histogram":
+                metric = self.histogram(name, help_text, label_names, buckets)
+                if metric.buckets != tuple(buckets):
+                    continue
+            else:
+                metric = self.counter(name, help_text, label_names)
+            metric._merge(values)
+
+    def reset(self) -> None:
+        """값만 지웁니다 (등록된 메트릭 객체는 유지)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+
+def _format_number(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value)) if abs(value) < 1e15 else repr(value)
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = []
+    for name, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def _write_atomic(path: str, text: str) -> None:
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+# 프로세스 전역 레지스트리
+registry = MetricsRegistry()
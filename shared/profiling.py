@@ -0,0 +1,199 @@
+"""
+Profiling
+문서 검증 프로파일링 (cProfile + 스택 샘플링 + 선택적 tracemalloc)
+
+출력 파일 (<output_dir>/<label>.*):
+    .pstats          cProfile 결과 (python -m pstats, snakeviz 등)
+    .collapsed       접힌 스택 (flamegraph.pl, speedscope, inferno에서 바로 열 수 있음)
+    .alloc.txt       tracemalloc 상위 할당 위치 (trace_memory=True일 때)
+
+꺼져 있을 때(ProfilingOptions.enabled=False)는 profile_document가 nullcontext를 반환하므로
+검증 경로에 추가 비용이 없습니다.
+"""
+import cProfile
+import os
+import re
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Optional
+
+from shared.constants import (
+    PROFILE_OUTPUT_SUBDIR, PROFILE_SAMPLE_INTERVAL, PROFILE_MAX_DOCUMENTS, PROFILE_MEMORY_TOP
+)
+
+
+@dataclass
+class ProfilingOptions:
+    """
+    프로파일링 설정
+
+    Attributes:
+        enabled: 프로파일링 여부 (기본 꺼짐)
+        output_dir: 결과 디렉터리 (None이면 호출하는 쪽의 결과 폴더 아래 profiles/)
+        sample_every: 일괄 검증에서 N번째 문서마다 하나씩 프로파일링
+        max_documents: 일괄 검증에서 프로파일링할 최대 문서 수 (None이면 제한 없음)
+        trace_memory: tracemalloc으로 상위 메모리 할당 위치 기록
+        sample_interval: 스택 샘플링 간격 (초)
+    """
+    enabled: bool = False
+    output_dir: Optional[str] = None
+    sample_every: int = 1
+    max_documents: Optional[int] = PROFILE_MAX_DOCUMENTS
+    trace_memory: bool = False
+    sample_interval: float = PROFILE_SAMPLE_INTERVAL
+
+    def should_profile(self, index: int = 0) -> bool:
+        """일괄 검증의 index번째(0부터) 문서를 프로파일링할지 여부"""
+        if not self.enabled:
+            return False
+        every = max(1, self.sample_every)
+        if index % every:
+            return False
+        return self.max_documents is None or index // every < self.max_documents
+
+    def resolve_dir(self, default_parent: str) -> str:
+        return self.output_dir or os.path.join(default_parent, PROFILE_OUTPUT_SUBDIR)
+
+
+class StackSampler:
+    """
+    대상 스레드의 호출 스택을 주기적으로 읽어 접힌 스택(collapsed stack) 개수를 셉니다.
+    cProfile과 달리 호출 경로 전체가 남으므로 flamegraph로 그릴 수 있습니다.
+    """
+
+    def __init__(self, thread_ident: int, interval: float = PROFILE_SAMPLE_INTERVAL):
+        self.thread_ident = thread_ident
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_ident)
+            if frame is None:
+                continue
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(names))] += 1
+
+    def write(self, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class ProfileSession:
+    """
+    with 블록 하나(문서 하나의 검증)를 현재 스레드에서 프로파일링합니다.
+    cProfile은 호출한 스레드만 기록하므로 호출하는 쪽은 문서를 한 스레드에서 처리해야 합니다
+    (ValidationService.validate_document(..., streaming=True)).
+    """
+    _memory_lock = threading.Lock()
+    _memory_users = 0
+
+    def __init__(self, output_dir: str, label: str, sample_interval: float = PROFILE_SAMPLE_INTERVAL,
+                 trace_memory: bool = False, memory_top: int = PROFILE_MEMORY_TOP):
+        self.output_dir = output_dir
+        self.label = _safe_label(label)
+        self.sample_interval = sample_interval
+        self.trace_memory = trace_memory
+        self.memory_top = memory_top
+        self.paths = []
+        self._profiler = None
+        self._sampler = None
+
+    def __enter__(self):
+        if self.trace_memory:
+            # tracemalloc은 프로세스 전역이므로 동시에 여러 세션이 있어도 한 번만 시작/중지
+            with ProfileSession._memory_lock:
+                if ProfileSession._memory_users == 0 and not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                ProfileSession._memory_users += 1
+        self._sampler = StackSampler(threading.get_ident(), self.sample_interval)
+        self._sampler.start()
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+        return self
+
+    def __exit__(self, *exc):
+        self._profiler.disable()
+        self._sampler.stop()
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(self.output_dir, self.label)
+        self._profiler.dump_stats(f"{base}.pstats")
+        self._sampler.write(f"{base}.collapsed")
+        self.paths = [f"{base}.pstats", f"{base}.collapsed"]
+
+        if self.trace_memory:
+            snapshot = tracemalloc.take_snapshot()
+            with ProfileSession._memory_lock:
+                ProfileSession._memory_users -= 1
+                if ProfileSession._memory_users == 0:
+                    tracemalloc.stop()
+            self._write_allocations(snapshot, f"{base}.alloc.txt")
+            self.paths.append(f"{base}.alloc.txt")
+        return False
+
+    def _write_allocations(self, snapshot, path):
+        stats = snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ]).statistics('lineno')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"상위 {self.memory_top}개 할당 위치 (현재 살아 있는 메모리 기준)\n")
+            for stat in stats[:self.memory_top]:
+                frame = stat.traceback[0]
+                f.write(f"{stat.size / 1024:10.1f} KiB  {stat.count:7d}회  {frame.filename}:{frame.lineno}\n")
+
+
+def profile_document(options: Optional[ProfilingOptions], label: str, default_parent: str, index: int = 0):
+    """
+    프로파일링 대상이면 ProfileSession을, 아니면 nullcontext(None)을 반환합니다.
+
+    사용 예:
+        with profile_document(options, "claim_001", output_dir, index) as session:
+            results = service.validate_document(..., streaming=session is not None)
+    """
+    if options is None or not options.should_profile(index):
+        return nullcontext()
+    return ProfileSession(
+        options.resolve_dir(default_parent), label,
+        sample_interval=options.sample_interval, trace_memory=options.trace_memory
+    )
+
+
+def add_profiling_arguments(parser) -> None:
+    """명령행 도구(main.py, 분산 작업자)에 공통 프로파일링 옵션을 추가합니다."""
+    group = parser.add_argument_group("프로파일링")
+    group.add_argument("--profile", action="store_true", help="validate_document 프로파일링 (pstats + 접힌 스택)")
+    group.add_argument("--profile-dir", default=None, help="프로파일 저장 디렉터리 (기본: 결과 폴더/profiles)")
+    group.add_argument("--profile-every", type=int, default=1, help="일괄 검증에서 N번째 문서마다 프로파일링")
+    group.add_argument("--profile-max", type=int, default=PROFILE_MAX_DOCUMENTS, help="프로파일링할 최대 문서 수")
+    group.add_argument("--profile-memory", action="store_true", help="tracemalloc 상위 할당 위치 기록")
+
+
+def options_from_args(args) -> ProfilingOptions:
+    return ProfilingOptions(
+        enabled=args.profile, output_dir=args.profile_dir, sample_every=args.profile_every,
+        max_documents=args.profile_max, trace_memory=args.profile_memory
+    )
+
+
+def _safe_label(label: str) -> str:
+    return re.sub(r'[^\w.-]+', '_', label).strip('_') or "profile"
@@ -0,0 +1,180 @@
+"""
+Spatial Index
+사각형용 균일 격자(uniform grid) 공간 색인
+
+ROI가 수백 개인 템플릿에서도 클릭 위치 찾기, 겹침 검사, 가장 가까운 ROI 찾기를
+전체를 훑지 않고 주변 칸만 확인하여 처리합니다. 추가/삭제는 해당 사각형이 걸친 칸만 갱신합니다.
+
+사용 예:
+    index = GridIndex(cell_size=48)
+    index.insert("name", (100, 100, 300, 120))
+    index.query_point(150, 110)        # ["name"]
+    index.query_rect((0, 0, 200, 200)) # ["name"]
+    index.nearest(90, 110)             # ("name", 10.0)
+"""
+import math
+from typing import Dict, Hashable, Iterator, List, Optional, Set, Tuple
+
+from shared.constants import SPATIAL_INDEX_CELL_SIZE
+
+Rect = Tuple[float, float, float, float]
+
+
+def normalize_rect(rect) -> Rect:
+    x0, y0, x1, y1 = (float(v) for v in rect)
+    return min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)
+
+
+def rect_area(rect: Rect) -> float:
+    return (rect[2] - rect[0]) * (rect[3] - rect[1])
+
+
+def intersection_area(a: Rect, b: Rect) -> float:
+    width = min(a[2], b[2]) - max(a[0], b[0])
+    height = min(a[3], b[3]) - max(a[1], b[1])
+    return width * height if width > 0 and height > 0 else 0.0
+
+
+def point_distance(rect: Rect, x: float, y: float) -> float:
+    """점과 사각형 사이의 거리 (안쪽이면 0)"""
+    dx = max(rect[0] - x, 0.0, x - rect[2])
+    dy = max(rect[1] - y, 0.0, y - rect[3])
+    return math.hypot(dx, dy)
+
+
+class GridIndex:
+    """키 → 사각형 (x0, y0, x1, y1) 색인. 사각형은 걸치는 모든 칸에 등록됩니다."""
+
+    def __init__(self, cell_size: float = SPATIAL_INDEX_CELL_SIZE):
+        if cell_size <= 0:
+            raise ValueError("cell_size는 0보다 커야 합니다")
+        self.cell_size = float(cell_size)
+        self._rects: Dict[Hashable, Rect] = {}
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = {}
+
+    # --- 갱신 ---
+    def insert(self, key: Hashable, rect) -> None:
+        """사각형을 등록합니다. 같은 키가 있으면 교체합니다."""
+        if key in self._rects:
+            self.remove(key)
+        rect = normalize_rect(rect)
+        self._rects[key] = rect
+        for cell in self._cells_for(rect):
+            self._cells.setdefault(cell, set()).add(key)
+
+    def remove(self, key: Hashable) -> bool:
+        rect = self._rects.pop(key, None)
+        if rect is None:
+            return False
+        for cell in self._cells_for(rect):
+            keys = self._cells.get(cell)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._cells[cell]
+        return True
+
+    def clear(self) -> None:
+        self._rects.clear()
+        self._cells.clear()
+
+    # --- 조회 ---
+    def rect(self, key: Hashable) -> Optional[Rect]:
+        return self._rects.get(key)
+
+    def keys(self):
+        return self._rects.keys()
+
+    def items(self):
+        return self._rects.items()
+
+    def __contains__(self, key) -> bool:
+        return key in self._rects
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._rects)
+
+    def query_point(self, x: float, y: float) -> List[Hashable]:
+        """점을 포함하는 사각형의 키 목록 (면적이 작은 순: 겹쳐 있으면 안쪽 ROI가 먼저)"""
+        keys = self._cells.get(self._cell_of(x, y), ())
+        hits = [key for key in keys if _contains(self._rects[key], x, y)]
+        return sorted(hits, key=lambda key: (rect_area(self._rects[key]), str(key)))
+
+    def query_rect(self, rect) -> List[Hashable]:
+        """사각형과 닿거나 겹치는 사각형의 키 목록"""
+        rect = normalize_rect(rect)
+        candidates = set()
+        for cell in self._cells_for(rect):
+            candidates.update(self._cells.get(cell, ()))
+        return [key for key in candidates if _touches(self._rects[key], rect)]
+
+    def overlapping(self, key: Hashable, min_area: float = 0.0) -> List[Hashable]:
+        """key의 사각형과 면적 min_area 초과로 겹치는 다른 키 목록"""
+        rect = self._rects[key]
+        return [other for other in self.query_rect(rect)
+                if other != key and intersection_area(rect, self._rects[other]) > min_area]
+
+    def nearest(self, x: float, y: float, max_distance: Optional[float] = None) -> Optional[Tuple[Hashable, float]]:
+        """
+        가장 가까운 사각형 (키, 거리). 점이 있는 칸에서 시작해 고리(ring) 단위로 넓혀 가며,
+        다음 고리의 최소 거리가 지금까지의 최단 거리보다 크면 멈춥니다.
+        """
+        if not self._cells:
+            return None
+        cx, cy = self._cell_of(x, y)
+        xs = [cell[0] for cell in self._cells]
+        ys = [cell[1] for cell in self._cells]
+        max_ring = max(abs(cx - min(xs)), abs(cx - max(xs)), abs(cy - min(ys)), abs(cy - max(ys)))
+
+        best_key, best_distance = None, math.inf
+        seen = set()
+        for ring in range(max_ring + 1):
+            # ring 밖의 칸은 점에서 최소 ring * cell_size 떨어져 있음
+            lower_bound = max(0.0, (ring - 1) * self.cell_size)
+            if lower_bound > best_distance or (max_distance is not None and lower_bound > max_distance):
+                break
+            for cell in _ring_cells(cx, cy, ring):
+                for key in self._cells.get(cell, ()):
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    distance = point_distance(self._rects[key], x, y)
+                    if distance < best_distance or (distance == best_distance and str(key) < str(best_key)):
+                        best_key, best_distance = key, distance
+        if best_key is None or (max_distance is not None and best_distance > max_distance):
+            return None
+        return best_key, best_distance
+
+    # --- 내부 ---
+    def _cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def _cells_for(self, rect: Rect):
+        x0, y0 = self._cell_of(rect[0], rect[1])
+        x1, y1 = self._cell_of(rect[2], rect[3])
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                yield cx, cy
+
+
+def _contains(rect: Rect, x: float, y: float) -> bool:
+    return rect[0] <= x <= rect[2] and rect[1] <= y <= rect[3]
+
+
+def _touches(a: Rect, b: Rect) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def _ring_cells(cx: int, cy: int, ring: int):
+    if ring == 0:
+        yield cx, cy
+        return
+    for dx in range(-ring, ring + 1):
+        yield cx + dx, cy - ring
+        yield cx + dx, cy + ring
+    for dy in range(-ring + 1, ring):
+        yield cx - ring, cy + dy
+        yield cx + ring, cy + dy
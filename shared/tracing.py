@@ -0,0 +1,208 @@
+"""
+Tracing
+검증 파이프라인 구간 추적 (Chrome trace-event JSON, Perfetto / chrome://tracing 호환)
+
+문서 열기(open), 렌더링(render), 정렬(align_page/alignment), OCR(ocr), 주석(annotate),
+결과 저장(write) 등의 구간을 스레드/프로세스별로 기록하여 일괄 검증의 동시성과 대기 구간을 봅니다.
+구간에는 document / page / roi 속성이 붙습니다.
+
+- 꺼져 있으면(기본) span()은 공유 no-op 객체를 반환하므로 플래그 확인 외의 비용이 없습니다.
+- 시각은 프로세스 시작 시의 벽시계 + perf_counter 경과로 계산하므로, 같은 호스트의
+  작업자 프로세스 이벤트를 합쳐도 한 타임라인에 정렬됩니다.
+
+사용 예:
+    from shared.tracing import tracer
+
+    with tracer.span("render", document="a.pdf", page=0, roi="name"):
+        ...
+
+    tracer.export("traces/trace.json")  # https://ui.perfetto.dev 에서 열기
+"""
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from shared.constants import TRACING_ENABLED, TRACE_MAX_EVENTS
+
+
+class _NullSpan:
+    """추적이 꺼져 있을 때 반환되는 공유 no-op 구간"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **args) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("_tracer", "name", "category", "args", "_start_us")
+
+    def __init__(self, tracer: "Tracer", name: str, category: str, args: Dict[str, object]):
+        self._tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self._start_us = 0.0
+
+    def __enter__(self):
+        self._start_us = self._tracer.now_us()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        end_us = self._tracer.now_us()
+        self._tracer.complete(self.name, self._start_us, end_us - self._start_us, self.category, self.args)
+        return False
+
+    def set(self, **args) -> None:
+        """구간이 끝나기 전에 알게 된 속성(검증 상태 등)을 추가합니다."""
+        self.args.update(args)
+
+
+class Tracer:
+    def __init__(self, enabled: bool = TRACING_ENABLED, max_events: int = TRACE_MAX_EVENTS):
+        self.enabled = enabled
+        self.max_events = max_events
+        self.process_name = None
+        self._events: List[dict] = []
+        self._named_threads = set()
+        self._dropped = 0
+        self._lock = threading.Lock()
+        self._origin_us = time.time_ns() / 1000.0
+        self._origin_perf = time.perf_counter()
+
+    def now_us(self) -> float:
+        return self._origin_us + (time.perf_counter() - self._origin_perf) * 1e6
+
+    # --- 기록 ---
+    def span(self, name: str, category: str = "validation", **args):
+        """with 블록 하나를 완료 이벤트(ph="X")로 기록하는 컨텍스트 매니저"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, args)
+
+    def instant(self, name: str, category: str = "validation", **args) -> None:
+        """시점 이벤트(ph="i") 하나를 기록합니다."""
+        if not self.enabled:
+            return
+        self._append({"name": name, "cat": category, "ph": "i", "s": "t", "ts": self.now_us(), "args": args})
+
+    def counter(self, name: str, category: str = "validation", **values) -> None:
+        """카운터 이벤트(ph="C"): 실행 중 문서 수 같은 값을 타임라인 그래프로 표시합니다."""
+        if not self.enabled:
+            return
+        self._append({"name": name, "cat": category, "ph": "C", "ts": self.now_us(), "args": values})
+
+    def complete(self, name: str, start_us: float, duration_us: float,
+                 category: str = "validation", args: Optional[Dict[str, object]] = None) -> None:
+        if not self.enabled:
+            return
+        self._append({
+            "name": name, "cat": category, "ph": "X",
+            "ts": round(start_us, 3), "dur": round(max(0.0, duration_us), 3), "args": args or {},
+        })
+
+    def _append(self, event: dict) -> None:
+        thread = threading.current_thread()
+        event["pid"] = os.getpid()
+        event["tid"] = thread.ident
+        with self._lock:
+            if len(self._events) >= self.max_events:
+                self._dropped += 1
+                return
+            key = (event["pid"], event["tid"])
+            if key not in self._named_threads:
+                # Perfetto에서 스레드 이름(roi-validation_0 등)으로 트랙을 표시
+                if self.process_name and not self._named_threads:
+                    self._events.append(_metadata("process_name", event["pid"], 0, self.process_name))
+                self._named_threads.add(key)
+                self._events.append(_metadata("thread_name", event["pid"], event["tid"], thread.name))
+            self._events.append(event)
+
+    # --- 다른 프로세스와 이벤트 주고받기 ---
+    def drain(self) -> List[dict]:
+        """지금까지의 이벤트를 꺼내고 비웁니다 (작업자 프로세스 → 부모 전달용)."""
+        with self._lock:
+            events, self._events = self._events, []
+            self._named_threads.clear()
+        return events
+
+    def add_events(self, events: Iterable[dict]) -> None:
+        """다른 프로세스에서 받은 이벤트를 합칩니다."""
+        if not self.enabled:
+            return
+        with self._lock:
+            for event in events:
+                if len(self._events) >= self.max_events:
+                    self._dropped += 1
+                    continue
+                self._events.append(event)
+
+    # --- 내보내기 ---
+    def export(self, path: str, reset: bool = True) -> str:
+        """Chrome trace-event JSON 파일로 저장합니다 (임시 파일 + os.replace)."""
+        with self._lock:
+            events = list(self._events)
+            dropped = self._dropped
+            if reset:
+                self._events.clear()
+                self._named_threads.clear()
+                self._dropped = 0
+        write_trace(path, events, {"dropped_events": dropped} if dropped else None)
+        return path
+
+    def reset(self) -> None:
+        with self._lock:
+            self._events.clear()
+            self._named_threads.clear()
+            self._dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+
+def _metadata(name: str, pid: int, tid: int, value: str) -> dict:
+    return {"name": name, "ph": "M", "pid": pid, "tid": tid, "args": {"name": value}}
+
+
+def write_trace(path: str, events: List[dict], metadata: Optional[Dict[str, object]] = None) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    document = {"traceEvents": events, "displayTimeUnit": "ms"}
+    if metadata:
+        document["otherData"] = metadata
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def merge_trace_files(paths: Iterable[str], output_path: str) -> int:
+    """여러 작업자가 저장한 trace 파일을 하나로 합쳐 저장하고 이벤트 수를 반환합니다."""
+    events = []
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        events.extend(data.get("traceEvents", data) if isinstance(data, dict) else data)
+    write_trace(output_path, events)
+    return len(events)
+
+
+def document_label(path: Optional[str]) -> str:
+    """구간 속성에 쓰는 문서 이름 (파일 이름만)"""
+    return os.path.basename(path) if path else ""
+
+
+# 프로세스 전역 추적기
+tracer = Tracer()
@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union, Tuple
 import time
+from contextlib import contextmanager
 
 from shared.constants import *
 from shared.types import *
@@ -264,19 +265,14 @@ class PerformanceUtils:
     
     @staticmethod
     def measure_time(func):
-        """함수 실행 시간 측정 데코레이터"""
-        def wrapper(*args, **kwargs):
-            start_time = time.time()
-            try:
-                result = func(*args, **kwargs)
-                execution_time = time.time() - start_time
-                print(f"{func.__name__} 실행 시간: {TimeUtils.format_duration(execution_time)}")
-                return result
-            except Exception as e:
-                execution_time = time.time() - start_time
-                print(f"{func.__name__} 실행 시간 (오류): {TimeUtils.format_duration(execution_time)}")
-                raise
-        return wrapper
+        """
+        함수 실행 시간 측정 데코레이터.
+        출력 대신 메트릭 레지스트리의 function_duration_seconds{function=...} 히스토그램에 기록합니다.
+        """
+        from shared.metrics import registry
+        return registry.timed(
+            "function_duration_seconds", "함수 실행 시간 (초)", function=func.__qualname__
+        )(func)
     
     @staticmethod
     def get_memory_usage() -> float:
@@ -295,6 +291,47 @@ class PerformanceUtils:
         return current_usage > MEMORY_WARNING_THRESHOLD_MB
 
 
+class StageTimer:
+    """
+    단계별 처리 시간을 모노토닉 시계(time.perf_counter)로 누적하는 타이머
+
+    사용 예:
+        timer = StageTimer()
+        with timer.stage("render"):
+            ...
+        timer.as_dict()  # {"render": 0.0123}
+
+    trace_args가 주어지면 추적(shared.tracing)이 켜져 있을 때 단계마다 같은 이름의 구간을 남깁니다.
+    clock으로 다른 시계(예: 성능 회귀 검사의 time.thread_time)를 주입할 수 있습니다.
+    """
+
+    def __init__(self, trace_args: Optional[Dict[str, Any]] = None, clock=time.perf_counter):
+        self.timings: Dict[str, float] = {}
+        self.trace_args = trace_args or {}
+        self.clock = clock
+
+    @contextmanager
+    def stage(self, name: str):
+        from shared.tracing import tracer
+
+        started = self.clock()
+        try:
+            with tracer.span(name, **self.trace_args):
+                yield
+        finally:
+            self.add(name, self.clock() - started)
+
+    def add(self, name: str, seconds: float) -> None:
+        self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+    @property
+    def total(self) -> float:
+        return sum(self.timings.values())
+
+    def as_dict(self, digits: int = 6) -> Dict[str, float]:
+        return {name: round(seconds, digits) for name, seconds in self.timings.items()}
+
+
 class ConfigUtils:
     """설정 관련 유틸리티"""
     
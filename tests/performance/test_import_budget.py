@@ -0,0 +1,77 @@
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from shared.constants import STARTUP_FORBIDDEN_MODULES
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+STARTUP_IMPORT_BUDGET_SECONDS = 0.5  # 현재 약 0.07초 (공유 러너의 흔들림을 감안한 상한)
+
+# 메뉴 창을 띄우기까지 실행되는 코드 (Tk 창 생성 제외)
+STARTUP_SNIPPET = """
+import main
+from app.controllers.main_controller import MainController
+MainController(None)
+"""
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def _startup_imports():
+    """새 프로세스에서 시작 코드를 -X importtime으로 실행하여 (모듈, 자체 시간 us, 깊이) 목록을 반환합니다."""
+    with tempfile.TemporaryDirectory() as tmp:  # settings.json을 임시 디렉터리에 생성
+        env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", STARTUP_SNIPPET],
+            cwd=tmp, env=env, capture_output=True, text=True, timeout=120
+        )
+    if proc.returncode != 0:
+        raise AssertionError(f"시작 코드 실행 실패:\n{proc.stderr[-2000:]}")
+    entries = []
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            entries.append((match.group(4), int(match.group(1)), len(match.group(3)) // 2))
+    return entries
+
+
+def _import_chain(entries, index):
+    """importtime 출력은 자식이 부모보다 먼저 나오므로, 뒤쪽에서 더 얕은 항목을 따라가 import 경로를 만듭니다."""
+    chain = [entries[index][0]]
+    depth = entries[index][2]
+    for name, _, entry_depth in entries[index + 1:]:
+        if entry_depth < depth:
+            chain.append(name)
+            depth = entry_depth
+    return " <- ".join(chain)
+
+
+class TestStartupImportBudget(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.entries = _startup_imports()
+
+    def test_menu_window_does_not_import_heavy_modules(self):
+        offenders = [
+            _import_chain(self.entries, i) for i, (name, _, _) in enumerate(self.entries)
+            if name.split(".")[0] in STARTUP_FORBIDDEN_MODULES
+            and not any(parent.split(".")[0] in STARTUP_FORBIDDEN_MODULES
+                        for parent in _import_chain(self.entries, i).split(" <- ")[1:])
+        ]
+        self.assertFalse(offenders, "메뉴 창 시작 시 무거운 모듈이 import됩니다:\n" + "\n".join(offenders))
+
+    def test_startup_import_time_within_budget(self):
+        total = sum(self_us for _, self_us, _ in self.entries) / 1e6
+        slowest = sorted(self.entries, key=lambda entry: entry[1], reverse=True)[:10]
+        detail = "\n".join(f"  {name}: {self_us / 1000:.1f}ms" for name, self_us, _ in slowest)
+        self.assertLessEqual(
+            total, STARTUP_IMPORT_BUDGET_SECONDS,
+            f"시작 import 시간 {total:.3f}초가 예산 {STARTUP_IMPORT_BUDGET_SECONDS}초를 넘었습니다. 가장 느린 모듈:\n{detail}"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
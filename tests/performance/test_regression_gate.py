@@ -0,0 +1,68 @@
+import os
+import unittest
+
+from benchmarks import regression
+
+
+def _result(stages, **environment):
+    return {"stages": stages, "environment": dict({"machine": "x86_64", "cpu_count": 4}, **environment)}
+
+
+class TestRegressionComparison(unittest.TestCase):
+    def test_flags_only_stages_beyond_tolerance(self):
+        baseline = dict(_result({"render": 0.100, "alignment": 0.050, "contour": 0.0003}),
+                        tolerances={"default": 0.3, "alignment": 1.0})
+        current = _result({"render": 0.140, "alignment": 0.090, "contour": 0.0009})
+
+        comparisons = {c.stage: c for c in regression.compare(baseline, current)}
+        self.assertTrue(comparisons["render"].regressed)
+        self.assertFalse(comparisons["alignment"].regressed)  # 단계별 허용 범위 100%
+        self.assertFalse(comparisons["contour"].regressed)    # 3배지만 증가량이 잡음 하한(2ms) 미만
+
+        report = regression.format_report(list(comparisons.values()), baseline, current)
+        render_line = next(line for line in report.splitlines() if line.startswith("render"))
+        self.assertIn("+40.0%", render_line)
+        self.assertIn("REGRESSED", render_line)
+        self.assertNotIn("REGRESSED", report.replace(render_line, ""))
+
+    def test_report_mentions_missing_stages_and_environment_change(self):
+        baseline = _result({"render": 0.1, "ocr": 0.2})
+        current = _result({"render": 0.1}, cpu_count=8)
+        report = regression.format_report(regression.compare(baseline, current, tolerance=0.1), baseline, current)
+        self.assertIn("ocr", report)
+        self.assertIn("cpu_count: 4 -> 8", report)
+
+
+    def test_baseline_is_scaled_to_runner_speed(self):
+        baseline = dict(_result({"render": 0.100, "ocr": 0.200}), calibration=0.050)
+        slower = regression.scale_baseline(baseline, 0.075)  # 1.5배 느린 러너
+        self.assertAlmostEqual(slower["stages"]["render"], 0.150)
+        self.assertAlmostEqual(slower["speed_factor"], 1.5)
+        self.assertEqual(baseline["stages"]["render"], 0.100)  # 원본은 그대로
+
+        current = _result({"render": 0.160, "ocr": 0.290})
+        self.assertFalse(any(c.regressed for c in regression.compare(slower, current)))
+        self.assertTrue(any(c.regressed for c in regression.compare(baseline, current)))
+        self.assertIn("x1.50", regression.format_report(regression.compare(slower, current), slower, current))
+
+        self.assertIs(regression.scale_baseline(baseline, 0.053), baseline)  # 보정 잡음 범위: 같은 속도로 봄
+        self.assertIs(regression.scale_baseline(baseline, 0.030), baseline)  # 빠른 러너: 기준선을 줄이지 않음
+        self.assertIs(regression.scale_baseline(_result({"render": 0.1}), 0.075)["stages"]["render"], 0.1)
+
+
+class TestRegressionGate(unittest.TestCase):
+    """
+    tests/performance/baseline.json 대비 단계별 CPU 시간 회귀 검사.
+    기준선은 러너 속도로 환산되므로 어느 머신에서나 실행됩니다 (SKIP_PERF_GATE=1로만 생략).
+    """
+
+    def test_no_stage_regressed(self):
+        if os.environ.get("SKIP_PERF_GATE") == "1":
+            self.skipTest("SKIP_PERF_GATE=1")
+
+        passed, report = regression.check()
+        self.assertTrue(passed, "\n성능 회귀:\n" + report)
+
+
+if __name__ == "__main__":
+    unittest.main()
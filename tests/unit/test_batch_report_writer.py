@@ -0,0 +1,94 @@
+import csv
+import json
+import random
+import statistics
+import tempfile
+import unittest
+
+from infrastructure.services.batch_report_writer import BatchReportWriter, RunningStats
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _record(index, status="OK", seconds=0.5, failed=()):
+    return {"index": index, "file_name": f"doc_{index}.pdf", "template_name": "form_a", "status": status,
+            "processing_time": seconds, "failed_rois": list(failed), "stage_timings": {"render": 0.1, "ocr": 0.2}}
+
+
+class TestBatchReportWriter(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_rows_are_written_per_document_and_summary_aggregates(self):
+        report = BatchReportWriter(self.root, "report", include_rois=True)
+        report.write_document(_record(1), [{"roi_name": "name", "status": "OK", "page": 0}])
+        report.write_document(_record(2, "DEFICIENT", 1.5, ["sign"]),
+                              [{"roi_name": "sign", "status": "DEFICIENT", "page": 1}])
+        report.write_document({"index": 3, "file_name": "doc_3.pdf", "status": "ERROR", "message": "broken"})
+        summary = report.close()
+
+        with open(report.paths["jsonl"], encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual([line["type"] for line in lines], ["document", "roi", "document", "roi", "document"])
+        with open(report.paths["csv"], encoding="utf-8-sig", newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual([row["status"] for row in rows], ["OK", "DEFICIENT", "ERROR"])
+        self.assertEqual((rows[1]["failed_rois"], rows[1]["ocr_seconds"]), ("sign", "0.2"))
+        with open(report.paths["roi_csv"], encoding="utf-8-sig", newline="") as f:
+            self.assertEqual([row["document_index"] for row in csv.DictReader(f)], ["1", "2"])
+
+        self.assertEqual(summary["document_status"], {"OK": 1, "DEFICIENT": 1, "ERROR": 1})
+        self.assertEqual(summary["roi_status"], {"OK": 1, "DEFICIENT": 1})
+        self.assertEqual(summary["most_failed_rois"], {"sign": 1})
+        self.assertEqual(summary["processing_time"]["count"], 2)
+        self.assertAlmostEqual(summary["stage_seconds"]["ocr"], 0.4)
+        with open(report.summary_path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["documents"], 3)
+
+    def test_flushes_by_row_count_and_elapsed_time(self):
+        clock = FakeClock()
+        report = BatchReportWriter(self.root, "report", formats=("csv",), flush_rows=3, flush_seconds=10, clock=clock)
+        self.assertNotIn("jsonl", report.paths)
+
+        def flushed_documents():
+            with open(report.summary_path, encoding="utf-8") as f:
+                return json.load(f)["documents"]
+
+        for index in range(3):
+            report.write_document(_record(index))
+        self.assertEqual(flushed_documents(), 3)
+        report.write_document(_record(3))
+        self.assertEqual(flushed_documents(), 3)
+        clock.now = 11
+        report.write_document(_record(4))
+        self.assertEqual(flushed_documents(), 5)
+        report.close()
+
+    def test_running_stats_match_exact_statistics(self):
+        rng = random.Random(0)
+        values = [rng.lognormvariate(-1, 0.8) for _ in range(5000)]
+        stats = RunningStats()
+        for value in values:
+            stats.add(value)
+
+        self.assertAlmostEqual(stats.mean, statistics.mean(values), places=9)
+        self.assertAlmostEqual(stats.stddev, statistics.stdev(values), places=9)
+        ordered = sorted(values)
+        for q in (0.5, 0.95, 0.99):
+            exact = ordered[int(q * (len(values) - 1))]
+            self.assertAlmostEqual(stats.quantile(q) / exact, 1.0, delta=0.05)
+        self.assertLess(len(stats._buckets), 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
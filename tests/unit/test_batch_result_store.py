@@ -0,0 +1,64 @@
+import unittest
+
+from app.controllers.batch_result_store import BatchResultRow, BatchResultStore
+
+
+def _row(index, status="OK", file_name=None, deficient_count=0, processing_time=None):
+    return BatchResultRow(index, file_name or f"doc_{index}.pdf", status, deficient_count,
+                          processing_time=processing_time)
+
+
+class TestBatchResultStore(unittest.TestCase):
+    def setUp(self):
+        self.store = BatchResultStore()
+        self.store.add(_row(1, "OK", "b.pdf", processing_time=0.5))
+        self.store.add(_row(2, "DEFICIENT", "A.pdf", deficient_count=3, processing_time=1.5))
+        self.store.add(_row(3, "ERROR", "c.pdf"))
+        self.store.add(_row(4, "DEFICIENT", "d.pdf", deficient_count=1, processing_time=0.2))
+
+    def _indices(self):
+        return [row.index for row in self.store.get_rows(0, self.store.visible_count())]
+
+    def test_filter_by_status(self):
+        self.store.set_filter("DEFICIENT")
+        self.assertEqual(self._indices(), [2, 4])
+        self.assertEqual(self.store.total_count, 4)
+        self.assertEqual(self.store.status_counts(), {"OK": 1, "DEFICIENT": 2, "ERROR": 1})
+
+        self.store.set_filter(None)
+        self.assertEqual(self._indices(), [1, 2, 3, 4])
+
+    def test_toggle_sort_switches_direction(self):
+        self.store.toggle_sort("file_name")  # 대소문자 구분 없이
+        self.assertEqual(self._indices(), [2, 1, 3, 4])
+        self.store.toggle_sort("file_name")
+        self.assertEqual(self.store.sort_state, ("file_name", True))
+        self.assertEqual(self._indices(), [4, 3, 1, 2])
+
+        self.store.toggle_sort("processing_time")  # 다른 열은 오름차순부터, 시간이 없으면 0
+        self.assertEqual(self._indices(), [3, 4, 1, 2])
+        self.store.toggle_sort("unknown")
+        self.assertEqual(self.store.sort_state, ("processing_time", False))
+
+    def test_add_updates_cached_view(self):
+        self.store.set_filter("DEFICIENT")
+        self.assertEqual(self.store.visible_count(), 2)
+        self.store.add(_row(5, "DEFICIENT"))
+        self.store.add(_row(6, "OK"))
+        self.assertEqual(self._indices(), [2, 4, 5])
+
+        self.store.toggle_sort("deficient_count")
+        self.assertEqual(self._indices(), [5, 4, 2])
+        self.store.add(_row(7, "DEFICIENT", deficient_count=2))  # 정렬 중 추가하면 보기를 다시 계산
+        self.assertEqual(self._indices(), [5, 4, 7, 2])
+
+    def test_get_rows_returns_window(self):
+        self.assertEqual([row.index for row in self.store.get_rows(1, 2)], [2, 3])
+        self.assertEqual(self.store.get_rows(10, 5), [])
+
+        self.store.clear()
+        self.assertEqual((self.store.total_count, self.store.visible_count()), (0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import threading
+import time
+import unittest
+
+from domain.entities.document import DocumentProbe
+from domain.services.batch_scheduler import BatchScheduler
+
+
+class _FakeRepository:
+    """파일 이름에 따라 페이지 크기가 다른 가짜 문서 저장소"""
+    SIZES = {"small": (595, 842), "large": (2384, 3370)}  # A4, A0 (pt)
+
+    def probe_document(self, file_path, page_range=None):
+        kind, pages = file_path.split("-")
+        return DocumentProbe(file_path, int(pages), [self.SIZES[kind]] * int(pages))
+
+
+class TestBatchScheduler(unittest.TestCase):
+    def setUp(self):
+        self.running = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def _process(self, admission):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(0.05)
+        with self.lock:
+            self.running -= 1
+        return admission.streaming
+
+    def _scheduler(self, budget_mb):
+        return BatchScheduler(
+            _FakeRepository(), memory_budget_mb=budget_mb, max_concurrent=4,
+            render_scale=2.0, channels=3, page_workers=4, memory_probe=lambda: 100.0
+        )
+
+    def test_small_documents_run_concurrently(self):
+        outcomes = list(self._scheduler(1000).run(["small-2"] * 8, self._process))
+        self.assertEqual(len(outcomes), 8)
+        self.assertEqual(self.peak, 4)
+        self.assertFalse(any(o.result for o in outcomes))
+
+    def test_large_documents_lower_concurrency(self):
+        # A0 한 쪽은 2배율 RGB로 약 92MB, 원본/대상 두 장이면 약 184MB
+        scheduler = self._scheduler(600)
+        self.assertGreater(scheduler.estimate(0, "large-1", 100.0).estimated_mb, 200)
+
+        outcomes = list(scheduler.run(["large-1"] * 4, self._process))
+        self.assertEqual(len(outcomes), 4)
+        self.assertLess(self.peak, 4)
+
+    def test_giant_document_falls_back_to_streaming(self):
+        scheduler = self._scheduler(600)
+        admission = scheduler.estimate(0, "large-8", 100.0)
+        self.assertTrue(admission.streaming)
+
+        outcomes = list(scheduler.run(["large-8", "small-1"], self._process))
+        self.assertEqual(sorted(o.admission.index for o in outcomes), [0, 1])
+        self.assertTrue(next(o.result for o in outcomes if o.admission.index == 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import json
+import os
+import tempfile
+import unittest
+
+import fitz
+
+from benchmarks.corpus import CorpusSpec, build_corpus
+from domain.services.validation_service import ValidationService
+from infrastructure.repositories.file_document_repository import FileDocumentRepository
+from infrastructure.repositories.json_template_repository import JsonTemplateRepository
+from infrastructure.services.document_splitter import DocumentSplitter
+from infrastructure.services.template_fingerprint_index import TemplateFingerprintIndex, document_fingerprints
+from infrastructure.services.validation_vision_service import ValidationVisionService
+
+FORMS = {"form_a": (2, 10), "form_b": (2, 6), "form_c": (1, 14)}
+# 묶음 구성: (템플릿, 변형). None은 어느 양식에도 속하지 않는 빈 페이지
+BATCH = [("form_a", "scanned"), (None, None), ("form_c", "filled"), ("form_b", "blank"), ("form_a", "filled"),
+         ("form_b", "scanned")]
+
+
+class TestDocumentSplitter(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        root = cls._tmp.name
+        cls.corpora, templates = {}, {}
+        for seed, (name, (pages, rois)) in enumerate(FORMS.items()):
+            corpus = build_corpus(os.path.join(root, name), CorpusSpec(
+                pages=pages, rois_per_page=rois, documents_per_variant=1,
+                variants=("filled", "scanned", "blank"), seed=seed
+            ), template_name=name)
+            cls.corpora[name] = corpus
+            templates[name] = corpus.template
+        templates_file = os.path.join(root, "templates.json")
+        with open(templates_file, 'w', encoding='utf-8') as f:
+            json.dump(templates, f)
+        cls.index = TemplateFingerprintIndex(JsonTemplateRepository(templates_file), os.path.join(root, "index.json"))
+        cls.index.sync()
+
+        cls.batch_path = os.path.join(root, "batch.pdf")
+        cls.expected = []  # (첫 페이지, 페이지 수, 템플릿)
+        with fitz.open() as batch:
+            for name, variant in BATCH:
+                first = batch.page_count
+                if name is None:
+                    batch.new_page(width=595, height=842)
+                else:
+                    with fitz.open(cls.corpora[name].documents[variant][0]) as part:
+                        batch.insert_pdf(part)
+                cls.expected.append((first, batch.page_count - first, name))
+            batch.save(cls.batch_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def test_splits_concatenated_forms_at_template_boundaries(self):
+        segments = DocumentSplitter(self.index).split(self.batch_path)
+        found = [(s.first_page, s.page_count, s.template_name) for s in segments]
+        self.assertEqual(found, self.expected, [s.match.describe() for s in segments])
+        self.assertFalse(segments[1].identified)
+        self.assertEqual(segments[2].label, "p.4")
+        self.assertEqual(segments[3].label, "p.5-6")
+
+    def test_truncated_last_form_is_kept(self):
+        hashes = document_fingerprints(self.batch_path, None)[:-1]  # 마지막 form_b의 뒷장이 빠진 묶음
+        last = DocumentSplitter(self.index).split_hashes(hashes)[-1]
+        self.assertEqual((last.page_count, last.template_name), (1, "form_b"))
+
+    def test_segment_is_validated_in_place_with_source_pages(self):
+        service = ValidationService(FileDocumentRepository(), ValidationVisionService(), max_workers=2)
+        template = self.corpora["form_b"].template
+        first, count, _ = self.expected[3]
+        page_range = range(first, first + count)
+
+        results = service.validate_document(template, self.batch_path, page_range=page_range)
+        standalone = service.validate_document(template, self.corpora["form_b"].documents["blank"][0])
+        self.assertEqual([r['status'] for r in results], [r['status'] for r in standalone])
+        self.assertEqual({r['source_page'] for r in results}, set(page_range))
+
+        with fitz.open("pdf", service.create_annotated_pdf(self.batch_path, results, page_range)) as review:
+            self.assertEqual(review.page_count, count)
+            self.assertEqual(review[0].get_label(), str(first + 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import multiprocessing
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from infrastructure.distributed.lease_work_queue import LeaseWorkQueue, LeaseWorker, job_id_for
+
+
+def _process(template, job):
+    time.sleep(0.01)
+    return {"status": "OK", "template": template["name"]}
+
+
+def _run_worker(queue_dir, worker_id):
+    queue = LeaseWorkQueue(queue_dir)
+    LeaseWorker(queue, _process, worker_id=worker_id, heartbeat_interval=0.05,
+                poll_interval=0.05, log=lambda message: None).run()
+
+
+class TestLeaseWorkQueue(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.queue = LeaseWorkQueue(os.path.join(self.temp_dir.name, "queue"), lease_timeout=0.5)
+        self.queue.set_template({"name": "claim-form", "rois": {}})
+        self.pdf_paths = [os.path.join(self.temp_dir.name, f"doc{i}.pdf") for i in range(40)]
+        self.queue.enqueue(self.pdf_paths)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_enqueue_is_idempotent(self):
+        self.assertEqual(self.queue.enqueue(self.pdf_paths), 0)
+        self.assertEqual(self.queue.status()["total"], 40)
+
+    def test_multiple_processes_finish_every_job_once(self):
+        context = multiprocessing.get_context("spawn")
+        workers = [context.Process(target=_run_worker, args=(self.queue.queue_dir, f"w{i}")) for i in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(60)
+            self.assertEqual(worker.exitcode, 0)
+
+        status = self.queue.status()
+        self.assertEqual((status["done"], status["leased"]), (40, 0))
+        result = self.queue.load_result(job_id_for(self.pdf_paths[0]))
+        self.assertEqual(result["status"], "OK")
+        self.assertEqual(result["pdf_path"], os.path.abspath(self.pdf_paths[0]))
+
+    def test_expired_lease_is_reclaimed(self):
+        job_id = job_id_for(self.pdf_paths[0])
+        dead = self.queue.try_claim(job_id, "dead-worker")
+        self.assertIsNotNone(dead)
+        self.assertIsNone(self.queue.try_claim(job_id, "other")) # 아직 유효한 lease
+
+        expired = time.time() - 10
+        os.utime(self.queue.lease_path(job_id), (expired, expired))
+        lease = self.queue.try_claim(job_id, "other")
+        self.assertIsNotNone(lease)
+        self.assertFalse(dead.heartbeat()) # 죽은 줄 알았던 작업자는 lease를 잃었음을 알게 됨
+
+        self.queue.write_result(lease, {"status": "OK"})
+        self.assertTrue(self.queue.is_done(job_id))
+        self.assertIsNone(self.queue.try_claim(job_id, "third"))
+        self.assertEqual(os.listdir(self.queue.leases_dir), [])
+
+    def test_concurrent_reclaimers_do_not_both_claim(self):
+        job_id = job_id_for(self.pdf_paths[0])
+        self.queue.try_claim(job_id, "dead-worker")
+        expired = time.time() - 10
+        os.utime(self.queue.lease_path(job_id), (expired, expired))
+
+        # B가 만료를 확인하고 rename하기 직전에 A가 먼저 회수하여 새 lease를 만듦
+        real_rename, claimed = os.rename, {}
+
+        def interleaved(src, dst):
+            if "A" not in claimed:
+                claimed["A"] = None
+                claimed["A"] = self.queue.try_claim(job_id, "A")
+            real_rename(src, dst)
+
+        with mock.patch("infrastructure.distributed.lease_work_queue.os.rename", side_effect=interleaved):
+            lease_b = self.queue.try_claim(job_id, "B")
+
+        lease_a = claimed["A"]
+        self.assertIsNotNone(lease_a)
+        self.assertIsNone(lease_b)
+        self.assertTrue(lease_a.heartbeat())
+        self.assertEqual(os.listdir(self.queue.leases_dir), [f"{job_id}.lease"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import json
+import os
+import tempfile
+import unittest
+
+from shared.metrics import MetricsRegistry
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry(enabled=True)
+
+    def test_counter_gauge_histogram_prometheus_text(self):
+        counter = self.registry.counter("docs_total", "문서 수", labels=("status",))
+        counter.inc(status="OK")
+        counter.inc(2, status="DEFICIENT")
+        self.registry.gauge("queue_depth").set(3)
+        histogram = self.registry.histogram("latency_seconds", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+
+        text = self.registry.to_prometheus()
+        self.assertIn('docs_total{status="OK"} 1', text)
+        self.assertIn('docs_total{status="DEFICIENT"} 2', text)
+        self.assertIn("queue_depth 3", text)
+        self.assertIn('latency_seconds_bucket{le="0.1"} 2', text)
+        self.assertIn('latency_seconds_bucket{le="1"} 3', text)
+        self.assertIn('latency_seconds_bucket{le="+Inf"} 4', text)
+        self.assertIn("latency_seconds_count 4", text)
+        self.assertIs(self.registry.counter("docs_total"), counter)
+        with self.assertRaises(ValueError):
+            self.registry.gauge("docs_total")
+
+    def test_disabled_registry_records_nothing(self):
+        self.registry.enabled = False
+        counter = self.registry.counter("calls_total")
+        counter.inc()
+
+        @self.registry.timed("work_seconds")
+        def work():
+            return 42
+
+        self.assertEqual(work(), 42)
+        self.assertEqual(counter.value(), 0)
+        self.assertEqual(self.registry.get("work_seconds").count(), 0)
+
+    def test_timed_and_export(self):
+        @self.registry.timed("work_seconds", function="work")
+        def work():
+            return 42
+
+        work()
+        with self.registry.timer("work_seconds", function="block"):
+            pass
+        histogram = self.registry.get("work_seconds")
+        self.assertEqual(histogram.count(function="work"), 1)
+        self.assertEqual(histogram.count(function="block"), 1)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            prom_path, json_path = self.registry.export(temp_dir)
+            with open(json_path, encoding='utf-8') as f:
+                snapshot = json.load(f)
+            self.assertEqual(snapshot["metrics"]["work_seconds"]["type"], "histogram")
+            self.assertTrue(os.path.getsize(prom_path) > 0)
+            self.assertEqual(sorted(os.listdir(temp_dir)), ["validation.json", "validation.prom"])
+
+    def test_drain_and_merge_carry_deltas_between_registries(self):
+        worker = MetricsRegistry(enabled=True)
+        worker.counter("ocr_calls_total").inc(3)
+        worker.gauge("cache_bytes").set(100)
+        worker.histogram("latency_seconds", labels=("stage",), buckets=(0.1, 1.0)).observe(0.5, stage="ocr")
+
+        self.registry.counter("ocr_calls_total").inc()
+        self.registry.merge(worker.drain())
+        self.registry.merge(worker.drain())  # 이미 꺼낸 값은 다시 보내지 않음
+
+        self.assertEqual(self.registry.counter("ocr_calls_total").value(), 4)
+        self.assertIsNone(self.registry.get("cache_bytes"))  # 게이지는 합치지 않음
+        histogram = self.registry.get("latency_seconds")
+        self.assertEqual((histogram.count(stage="ocr"), histogram.sum(stage="ocr")), (1, 0.5))
+        self.assertEqual(worker.counter("ocr_calls_total").value(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
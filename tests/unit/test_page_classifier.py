@@ -0,0 +1,52 @@
+import os
+import tempfile
+import unittest
+
+import fitz
+
+from domain.entities.document import PageKind
+from infrastructure.repositories.file_document_repository import FileDocumentRepository
+
+
+class TestPageClassifier(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.pdf_path = os.path.join(self.temp_dir.name, "mixed.pdf")
+
+        doc = fitz.open()
+        # 0페이지: 텍스트만 있는 디지털 페이지
+        digital = doc.new_page()
+        digital.insert_text((72, 72), "보험금 청구서 Claim Form", fontname="helv")
+        # 1페이지: 페이지 전체를 덮는 이미지만 있는 스캔 페이지
+        scanned = doc.new_page()
+        pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 60, 80), False)
+        pix.clear_with(200)
+        scanned.insert_image(scanned.rect, pixmap=pix)
+        doc.save(self.pdf_path)
+        doc.close()
+
+        self.repo = FileDocumentRepository()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_classifies_digital_and_scanned_pages(self):
+        kinds = self.repo.classify_pages(self.pdf_path)
+
+        self.assertEqual(kinds[0].kind, PageKind.DIGITAL)
+        self.assertGreater(kinds[0].text_span_count, 0)
+        self.assertEqual(kinds[1].kind, PageKind.SCANNED)
+        self.assertGreaterEqual(kinds[1].image_coverage, 0.8)
+
+    def test_results_are_cached_per_document_hash_and_page(self):
+        first = self.repo.classify_pages(self.pdf_path, pages=[1])
+        second = self.repo.classify_pages(self.pdf_path, pages=[1])
+
+        self.assertIs(first[1], second[1])
+        doc_hash = self.repo.get_document_hash(self.pdf_path)
+        self.assertIn((doc_hash, 1), self.repo._page_class_cache)
+        self.assertNotIn((doc_hash, 0), self.repo._page_class_cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
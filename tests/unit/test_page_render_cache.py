@@ -0,0 +1,43 @@
+import unittest
+
+from PIL import Image
+
+from infrastructure.services.page_render_cache import PageRenderCache
+
+
+class TestPageRenderCache(unittest.TestCase):
+    def setUp(self):
+        self.render_count = 0
+
+    def _render(self, size):
+        def render():
+            self.render_count += 1
+            return Image.new("RGB", size)
+        return render
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        cache = PageRenderCache(max_bytes=3 * 100 * 100 * 3)
+        for page in range(3):
+            cache.get_or_render("doc", page, (100, 100), self._render((100, 100)))
+        cache.get_or_render("doc", 0, (100, 100), self._render((100, 100))) # 0페이지를 최근 사용으로 갱신
+        cache.get_or_render("doc", 3, (100, 100), self._render((100, 100)))
+
+        self.assertEqual(self.render_count, 4)
+        self.assertTrue(cache.contains("doc", 0, (100, 100)))
+        self.assertFalse(cache.contains("doc", 1, (100, 100)))
+        self.assertLessEqual(cache.size_bytes, cache.max_bytes)
+
+    def test_small_resize_scales_cached_image(self):
+        cache = PageRenderCache(resize_tolerance=0.1)
+        cache.get_or_render("doc", 0, (600, 800), self._render((540, 720)))
+
+        image = cache.get_or_render("doc", 0, (630, 840), self._render((567, 756)))
+        self.assertEqual(self.render_count, 1) # 재렌더링 없이 확대
+        self.assertEqual(image.size, (567, 756))
+
+        cache.get_or_render("doc", 0, (900, 1200), self._render((810, 1080)))
+        self.assertEqual(self.render_count, 2) # 허용 오차를 넘으면 다시 렌더링
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+import fitz
+
+from domain.services.validation_service import ValidationService
+from infrastructure.repositories.file_document_repository import FileDocumentRepository
+from shared.exceptions import ValidationCancelledError
+
+
+class _SlowVision:
+    """페이지마다 처리 시간이 다른 가짜 VisionService (호출 스레드와 문서 핸들을 기록)"""
+    def __init__(self):
+        self.handles = {}
+        self.lock = threading.Lock()
+
+    def identity_layout(self):
+        return None
+
+    def estimate_page_layout(self, original_doc, filled_doc, page_num):
+        return None
+
+    def transform_rois(self, coords_list, layout_offset):
+        return coords_list
+
+    def validate_roi(self, original_doc, filled_doc, field_name, roi_info, layout_offset=None, corrected_coords=None):
+        with self.lock:
+            self.handles.setdefault(threading.get_ident(), set()).add(id(filled_doc))
+        time.sleep(0.05 if roi_info['page'] == 0 else 0.01)
+        return {"field_name": field_name, "page": roi_info['page'], "status": "OK", "message": ""}
+
+
+class TestParallelValidation(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.pdf_path = os.path.join(self.temp_dir.name, "form.pdf")
+        doc = fitz.open()
+        for _ in range(4):
+            doc.new_page().insert_text((72, 72), "Claim Form", fontname="helv")
+        doc.save(self.pdf_path)
+        doc.close()
+
+        self.template = {
+            "original_pdf_path": self.pdf_path,
+            "rois": {
+                f"p{page}f{i}": {"page": page, "coords": [100, 100, 200, 120], "method": "contour"}
+                for i in range(3) for page in range(4)
+            },
+        }
+        self.vision = _SlowVision()
+        self.service = ValidationService(FileDocumentRepository(), self.vision, max_workers=4)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_results_keep_template_order_and_progress_is_monotonic(self):
+        progress = []
+        caller = threading.get_ident()
+
+        def on_progress(message, current, total):
+            self.assertEqual(threading.get_ident(), caller)
+            progress.append(current)
+
+        results = self.service.validate_document(self.template, self.pdf_path, progress_callback=on_progress)
+
+        self.assertEqual([r['field_name'] for r in results], list(self.template['rois']))
+        self.assertEqual(progress, list(range(1, 13)))
+        # 스레드마다 자신만의 문서 핸들을 사용
+        handles = [h for hs in self.vision.handles.values() for h in hs]
+        self.assertEqual(len(handles), len(set(handles)))
+        self.assertTrue(all(len(hs) == 1 for hs in self.vision.handles.values()))
+
+    def test_cancellation_in_worker_propagates(self):
+        calls = []
+
+        def checkpoint():
+            calls.append(1)
+            if len(calls) > 3:
+                raise ValidationCancelledError()
+
+        with self.assertRaises(ValidationCancelledError):
+            self.service.validate_document(self.template, self.pdf_path, checkpoint=checkpoint)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import time
+import unittest
+
+from PIL import Image
+
+from infrastructure.services.page_render_cache import PageRenderCache
+from infrastructure.services.preview_tile_cache import PreviewTileCache, content_key
+
+
+def _noise(size):
+    """압축해도 크기가 줄지 않는 이미지"""
+    return Image.frombytes("RGB", size, os.urandom(size[0] * size[1] * 3))
+
+
+class TestPreviewTileCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = self._tmp.name
+        self.render_sizes = []
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _render(self, size):
+        self.render_sizes.append(tuple(size))
+        return Image.new("RGB", (size[0] * 9 // 10, size[1] * 9 // 10), "white")
+
+    def test_tile_size_rounds_up_to_zoom_steps(self):
+        tiles = PreviewTileCache(self.directory, zoom_step=1.1)
+        width, height = tiles.tile_size((600, 800))
+        self.assertTrue(600 <= width < 660 and 800 <= height < 880)
+        self.assertEqual(tiles.tile_size((610, 790)), (width, height))
+
+    def test_second_viewer_session_reads_tiles_from_disk(self):
+        key = content_key("doc")
+        first = PageRenderCache(disk_cache=PreviewTileCache(self.directory))
+        first.get_or_render("doc", 0, (600, 800), self._render, key)
+        first.disk_cache.flush()
+
+        # 프로그램을 다시 시작한 것처럼 새 디스크 캐시 색인과 빈 메모리 캐시로 조회
+        second = PageRenderCache(disk_cache=PreviewTileCache(self.directory))
+        image = second.get_or_render("doc", 0, (610, 790), self._render, key)
+        self.assertEqual(len(self.render_sizes), 1)
+        self.assertEqual(self.render_sizes[0], second.disk_cache.tile_size((600, 800)))
+        self.assertLessEqual(image.height, 790)
+
+    def test_pending_tile_is_visible_before_it_is_written(self):
+        tiles = PreviewTileCache(self.directory)
+        tiles.put("ab" * 20, 3, (100, 100), Image.new("RGB", (90, 90)))
+        self.assertIsNotNone(tiles.get("ab" * 20, 3, (100, 100)))
+        tiles.flush()
+        self.assertEqual(len(tiles), 1)
+
+    def test_evicts_least_recently_used_tiles_by_total_bytes(self):
+        tiles = PreviewTileCache(self.directory, image_format="png")
+        keys = [content_key(page) for page in range(3)]
+        for key in keys:
+            tiles.put(key, 0, (64, 64), _noise((64, 64)))
+            tiles.flush()
+            time.sleep(0.01)  # 파일 수정 시각으로 순서를 구분
+        tiles.get(keys[0], 0, (64, 64))  # 0번을 최근 사용으로
+        limit = tiles.size_bytes - 1
+
+        reopened = PreviewTileCache(self.directory, max_bytes=limit, image_format="png")
+        self.assertLessEqual(reopened.size_bytes, limit)
+        self.assertIsNone(reopened.get(keys[1], 0, (64, 64)))
+        self.assertIsNotNone(reopened.get(keys[0], 0, (64, 64)))
+        self.assertIsNotNone(reopened.get(keys[2], 0, (64, 64)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import os
+import pstats
+import tempfile
+import time
+import unittest
+from contextlib import nullcontext
+
+from shared.profiling import ProfilingOptions, ProfileSession, profile_document
+
+
+def _busy(seconds):
+    deadline = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < deadline:
+        total += sum(range(200))
+    return total
+
+
+class TestProfiling(unittest.TestCase):
+    def test_sampling_every_nth_document_up_to_limit(self):
+        options = ProfilingOptions(enabled=True, sample_every=3, max_documents=2)
+        self.assertEqual([i for i in range(12) if options.should_profile(i)], [0, 3])
+        self.assertFalse(ProfilingOptions().should_profile(0))
+
+    def test_disabled_returns_null_context(self):
+        self.assertIsInstance(profile_document(None, "doc", "out"), nullcontext)
+        self.assertIsInstance(profile_document(ProfilingOptions(), "doc", "out"), nullcontext)
+
+    def test_session_writes_pstats_collapsed_and_allocations(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with ProfileSession(tmp, "claim 001.pdf", sample_interval=0.001, trace_memory=True) as session:
+                _busy(0.05)
+                buffers = [bytearray(1024) for _ in range(100)]
+
+            names = sorted(os.path.basename(path) for path in session.paths)
+            self.assertEqual(names, ["claim_001.pdf.alloc.txt", "claim_001.pdf.collapsed", "claim_001.pdf.pstats"])
+            stats = pstats.Stats(os.path.join(tmp, "claim_001.pdf.pstats"))
+            self.assertTrue(any(func[2] == "_busy" for func in stats.stats))
+            with open(os.path.join(tmp, "claim_001.pdf.collapsed"), encoding="utf-8") as f:
+                lines = f.read().splitlines()
+            self.assertTrue(lines)
+            self.assertTrue(any("_busy" in line for line in lines))
+            self.assertTrue(all(line.rsplit(" ", 1)[1].isdigit() for line in lines))
+            del buffers
+
+
+if __name__ == "__main__":
+    unittest.main()
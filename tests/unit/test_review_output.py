@@ -0,0 +1,103 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import fitz
+
+from benchmarks.corpus import CorpusSpec, build_corpus
+from domain.services.validation_service import ValidationService
+from infrastructure.repositories.file_document_repository import FileDocumentRepository
+from infrastructure.services.review_bundle_writer import ReviewBundleWriter
+from infrastructure.services.validation_vision_service import ValidationVisionService
+
+
+def _results(template, deficient_pages):
+    """템플릿 ROI마다 지정한 페이지의 첫 ROI만 미흡인 검증 결과"""
+    results, flagged = [], set()
+    for name, roi in template['rois'].items():
+        page = roi['page']
+        status = "DEFICIENT" if page in deficient_pages and page not in flagged else "OK"
+        flagged.add(page)
+        results.append({"field_name": name, "page": page, "coords": roi['coords'], "status": status})
+    return results
+
+
+class TestReviewOutput(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.root = cls._tmp.name
+        cls.corpus = build_corpus(os.path.join(cls.root, "corpus"), CorpusSpec(
+            pages=4, rois_per_page=3, documents_per_variant=1, variants=("filled",)
+        ))
+        cls.document = cls.corpus.documents["filled"][0]
+        cls.service = ValidationService(FileDocumentRepository(), ValidationVisionService())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def test_excerpt_keeps_only_failed_pages_with_highlight_and_source_link(self):
+        data = self.service.create_review_excerpt(self.document, _results(self.corpus.template, {0, 2, 3}))
+        with fitz.open("pdf", data) as excerpt:
+            self.assertEqual(excerpt.page_count, 3)
+            self.assertEqual([page.get_label() for page in excerpt], ["1", "3", "4"])
+            for page, source_page in zip(excerpt, (0, 2, 3)):
+                self.assertEqual(len(list(page.annots(types=[fitz.PDF_ANNOT_HIGHLIGHT]))), 1)
+                link = next(l for l in page.get_links() if l["kind"] == fitz.LINK_GOTOR)
+                self.assertEqual((os.path.basename(link["file"]), link["page"]), (os.path.basename(self.document), source_page))
+
+    def test_excerpt_of_batch_segment_points_at_batch_pages(self):
+        results = _results(self.corpus.template, {1})
+        data = self.service.create_review_excerpt(self.document, results[:6], page_range=range(2, 4))
+        with fitz.open("pdf", data) as excerpt:
+            self.assertEqual(excerpt.page_count, 1)
+            self.assertEqual(excerpt[0].get_label(), "4")
+            self.assertEqual(excerpt[0].get_links()[0]["page"], 3)
+
+    def test_excerpt_is_none_when_nothing_failed(self):
+        self.assertIsNone(self.service.create_review_excerpt(self.document, _results(self.corpus.template, set())))
+
+    def test_result_pdfs_close_every_document_they_open(self):
+        opened = []
+        fitz_open = fitz.open
+
+        def tracking_open(*args, **kwargs):
+            doc = fitz_open(*args, **kwargs)
+            opened.append(doc)
+            return doc
+
+        results = _results(self.corpus.template, {1})
+        with mock.patch.object(fitz, "open", tracking_open):
+            self.service.create_annotated_pdf(self.document, results)
+            self.service.create_review_excerpt(self.document, results)
+            self.service.create_review_excerpt(self.document, _results(self.corpus.template, set()))
+        self.assertEqual(len(opened), 4)  # 대상 문서 3개 + 발췌본 1개
+        self.assertTrue(all(doc.is_closed for doc in opened))
+
+    def test_bundle_merges_excerpts_with_toc_and_links(self):
+        path = os.path.join(self.root, "bundle", "review_bundle.pdf")
+        bundle = ReviewBundleWriter(path)
+        first = self.service.create_review_excerpt(self.document, _results(self.corpus.template, {0, 2}))
+        second = self.service.create_review_excerpt(self.document, _results(self.corpus.template, {3}))
+        self.assertEqual(bundle.add("a.pdf", first, ["f1", "f2"], label_prefix="a"), 1)
+        self.assertEqual(bundle.add("b.pdf", second), 3)
+        self.assertEqual(bundle.close(), path)
+
+        with fitz.open(path) as merged:
+            self.assertEqual(merged.page_count, 3)
+            self.assertEqual(merged.get_toc(), [[1, "a.pdf", 1], [2, "p.1: f1", 1], [2, "p.3: f2", 2],
+                                                [1, "b.pdf", 3], [2, "p.4", 3]])
+            self.assertEqual([page.get_label() for page in merged], ["a p.1", "a p.3", "b.pdf p.4"])
+            self.assertEqual([page.get_links()[0]["page"] for page in merged], [0, 2, 3])
+            self.assertEqual(len(list(merged[2].annots())), 1)
+
+    def test_empty_bundle_writes_nothing(self):
+        path = os.path.join(self.root, "empty_bundle.pdf")
+        self.assertIsNone(ReviewBundleWriter(path).close())
+        self.assertFalse(os.path.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+import cv2
+import numpy as np
+
+from domain.services.roi_scoring import rescore_document, score_roi
+from infrastructure.services.batch_rescorer import BatchRescorer, main, parse_overrides
+from infrastructure.services.validation_vision_service import ValidationVisionService
+
+
+class FakeTemplateRepository:
+    def __init__(self, templates):
+        self.templates = templates
+        self.loads = 0
+
+    def load(self, name):
+        self.loads += 1
+        return self.templates[name]
+
+
+ROIS = {
+    "name": {"method": "ocr", "threshold": 3},
+    "sign": {"method": "contour", "threshold": 100},
+}
+
+
+def _record(index, status, name_chars, sign_area, template="form_a"):
+    return {
+        "type": "document", "index": index, "file_name": f"doc_{index}.pdf", "template_name": template,
+        "status": status,
+        "measurements": {
+            "name": {"status": "OK" if name_chars >= 3 else "DEFICIENT", "method": "ocr", "threshold": 3,
+                     "char_count": name_chars, "text": "x" * name_chars},
+            "sign": {"status": "OK" if sign_area >= 100 else "DEFICIENT", "method": "contour", "threshold": 100,
+                     "contour_area": sign_area, "contour_count": 1},
+        },
+    }
+
+
+class TestROIScoring(unittest.TestCase):
+    def test_score_roi_compares_measurement_with_threshold(self):
+        self.assertEqual(score_roi("ocr", 3, {"char_count": 2})[0], "DEFICIENT")
+        self.assertEqual(score_roi("ocr", 3, {"char_count": 3, "text": "abc"})[0], "OK")
+        self.assertEqual(score_roi("contour", 100, {"contour_area": 99}, contour_scoring=True)[0], "DEFICIENT")
+        self.assertEqual(score_roi("contour", 100, {"contour_area": 99}, contour_scoring=False)[0], "OK")
+        self.assertIsNone(score_roi("ocr", 3, {"contour_area": 500}))  # 측정 당시 OCR을 하지 않음
+
+    def test_rescore_reports_flipped_rois_and_keeps_errors(self):
+        measurements = _record(0, "OK", 4, 150)["measurements"]
+        rescore = rescore_document("OK", measurements, ROIS, overrides={"sign": 200}, contour_scoring=True)
+        self.assertTrue(rescore.flipped)
+        self.assertEqual(rescore.status, "DEFICIENT")
+        self.assertEqual([(c.roi_name, c.value, c.threshold, c.old_threshold) for c in rescore.changes],
+                         [("sign", 150, 200, 100)])
+
+        # 임계값이 없는 Contour ROI는 OCR 기본값(3)이 아니라 DEFAULT_CONTOUR_THRESHOLD로 판정
+        rescore = rescore_document("OK", measurements, {"sign": {"method": "contour"}}, contour_scoring=True)
+        self.assertEqual([(c.value, c.threshold) for c in rescore.changes], [])
+        measurements["sign"]["contour_area"] = 50
+        rescore = rescore_document("OK", measurements, {"sign": {"method": "contour"}}, contour_scoring=True)
+        self.assertEqual([(c.value, c.threshold) for c in rescore.changes], [(50, 100)])
+
+        measurements["name"] = {"status": "ERROR"}
+        rescore = rescore_document("ERROR", measurements, {**ROIS, "date": {"method": "ocr", "threshold": 1}})
+        self.assertEqual(rescore.status, "ERROR")
+        self.assertEqual(rescore.unmeasured, ["date"])
+
+    def test_ink_measurement_ignores_blank_form_and_counts_marks(self):
+        form = np.full((60, 200, 3), 255, np.uint8)
+        cv2.rectangle(form, (2, 2), (197, 57), (0, 0, 0), 1)
+        shifted = np.roll(form, 3, axis=0)  # 스캔 정렬 오차로 테두리가 어긋난 빈 양식
+        signed = form.copy()
+        cv2.line(signed, (40, 40), (120, 20), (0, 0, 0), 3)
+
+        service = ValidationVisionService.__new__(ValidationVisionService)
+        self.assertEqual(service._measure_ink(form, shifted)["contour_area"], 0)
+        measured = service._measure_ink(form, signed)
+        self.assertGreater(measured["contour_area"], 100)
+        self.assertEqual(measured["contour_count"], 1)
+
+
+class TestBatchRescorer(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.report = os.path.join(self._tmp.name, "report.jsonl")
+        rows = [
+            _record(0, "OK", 5, 300),
+            _record(1, "OK", 3, 120),
+            _record(2, "DEFICIENT", 2, 300),
+            {"type": "roi", "document_index": 2, "roi_name": "name"},
+            {"type": "document", "index": 3, "file_name": "broken.pdf", "status": "ERROR"},
+            _record(4, "OK", 5, 300, template="deleted"),
+        ]
+        with open(self.report, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(row) + "\n" for row in rows)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_new_thresholds_flip_documents_without_reprocessing(self):
+        repository = FakeTemplateRepository({"form_a": {"rois": ROIS}})
+        flipped = []
+        rescorer = BatchRescorer(repository, parse_overrides(["form_a/sign=150", "name=2"]), contour_scoring=True)
+        summary = rescorer.run(self.report, lambda record, rescore: flipped.append(record["index"]))
+
+        self.assertEqual(flipped, [1, 2])
+        self.assertEqual(summary["flips"], {"OK->DEFICIENT": 1, "DEFICIENT->OK": 1})
+        self.assertEqual((summary["documents"], summary["rescored"], summary["skipped"]), (5, 3, 2))
+        self.assertEqual(summary["missing_templates"], ["deleted"])
+        self.assertEqual(repository.loads, 2)  # 템플릿은 이름마다 한 번만 읽음
+
+    def test_cli_writes_flip_list(self):
+        templates = os.path.join(self._tmp.name, "templates.json")
+        with open(templates, "w", encoding="utf-8") as f:
+            json.dump({"form_a": {"rois": {**ROIS, "sign": {"method": "contour", "threshold": 200}}}}, f)
+        output = os.path.join(self._tmp.name, "flips.csv")
+        with redirect_stdout(io.StringIO()) as stdout:
+            main([self.report, "--templates", templates, "--output", output, "--contour-scoring"])
+
+        self.assertIn("sign OK->DEFICIENT (120 < 200)", stdout.getvalue())
+        with open(output, encoding="utf-8-sig") as f:
+            self.assertEqual(len(f.readlines()), 2)  # 헤더 + doc_1
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import tempfile
+import time
+import unittest
+
+import cv2
+import fitz
+import numpy as np
+
+from infrastructure.services.validation_vision_service import ValidationVisionService
+
+
+def _make_form_page(doc):
+    page = doc.new_page()
+    for i in range(20):
+        page.insert_text((60, 80 + i * 34), f"Line {i:02d}  insured name / policy number ______", fontname="helv", fontsize=12)
+    return page
+
+
+def _rotated_scan_pdf(source_doc, path, angle_cv):
+    """원본 페이지를 래스터화한 뒤 OpenCV 각도(반시계 양수)만큼 회전시킨 '스캔' PDF를 만듭니다."""
+    page = source_doc[0]
+    pix = page.get_pixmap(matrix=fitz.Matrix(2, 2), alpha=False)
+    img = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, pix.n)
+    h, w = img.shape[:2]
+    rot = cv2.getRotationMatrix2D((w / 2, h / 2), angle_cv, 1.0)
+    rotated = cv2.warpAffine(img, rot, (w, h), borderValue=(255, 255, 255))
+    ok, png = cv2.imencode(".png", rotated)
+
+    scan = fitz.open()
+    scan_page = scan.new_page(width=page.rect.width, height=page.rect.height)
+    scan_page.insert_image(scan_page.rect, stream=png.tobytes())
+    scan.save(path)
+    scan.close()
+
+
+class TestSkewEstimation(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.original = fitz.open()
+        _make_form_page(self.original)
+        self.vision = ValidationVisionService()
+
+    def tearDown(self):
+        self.original.close()
+        self.temp_dir.cleanup()
+
+    def _estimate(self, angle_cv):
+        path = os.path.join(self.temp_dir.name, f"scan_{angle_cv}.pdf")
+        _rotated_scan_pdf(self.original, path, angle_cv)
+        scan = fitz.open(path)
+        try:
+            return self.vision.estimate_page_layout(self.original, scan, 0)
+        finally:
+            scan.close()
+
+    def test_detects_rotation_of_skewed_scan(self):
+        layout = self._estimate(2.0)
+        # OpenCV의 반시계 2도 회전은 화면상 -2도 기울기
+        self.assertAlmostEqual(layout["rotation"], -2.0, delta=0.2)
+
+    def test_unskewed_scan_gives_identity_transform(self):
+        layout = self._estimate(0.0)
+        self.assertEqual(layout["rotation"], 0.0)
+        np.testing.assert_allclose(layout["matrix"], [[1, 0, 0], [0, 1, 0]], atol=1e-9)
+
+    def test_affine_moves_roi_with_rotated_content(self):
+        layout = self._estimate(3.0)
+        page_rect = self.original[0].rect
+        cx, cy = page_rect.width / 2, page_rect.height / 2
+
+        # 페이지 중심에서 오른쪽으로 200pt 떨어진 점은 반시계 회전 시 위쪽(y 감소)으로 이동해야 함
+        roi = [cx + 195, cy - 5, cx + 205, cy + 5]
+        moved = self.vision.transform_rois([roi, roi], layout)
+        self.assertEqual(len(moved), 2)
+        moved_center_y = (moved[0][1] + moved[0][3]) / 2
+        expected_y = cy - 200 * np.sin(np.deg2rad(3.0))
+        self.assertAlmostEqual(moved_center_y, expected_y, delta=1.5)
+
+    def test_replaced_template_pdf_is_not_served_from_skew_cache(self):
+        template_path = os.path.join(self.temp_dir.name, "template.pdf")
+        scan_path = os.path.join(self.temp_dir.name, "scan.pdf")
+        self.original.save(template_path)
+        _rotated_scan_pdf(self.original, scan_path, 0.0)
+
+        def estimate():
+            with fitz.open(template_path) as template, fitz.open(scan_path) as scan:
+                return self.vision.estimate_page_layout(template, scan, 0)["rotation"]
+
+        self.assertAlmostEqual(estimate(), 0.0, delta=0.2)
+        _rotated_scan_pdf(self.original, template_path, 2.0)  # 같은 경로에 기울어진 원본으로 교체
+        self.assertAlmostEqual(estimate(), 2.0, delta=0.2)
+
+    def test_estimation_is_cheap(self):
+        path = os.path.join(self.temp_dir.name, "scan_timing.pdf")
+        _rotated_scan_pdf(self.original, path, 1.5)
+        scan = fitz.open(path)
+        try:
+            self.vision.estimate_page_layout(self.original, scan, 0)  # 워밍업
+            start = time.perf_counter()
+            self.vision.estimate_page_layout(self.original, scan, 0)
+            elapsed = time.perf_counter() - start
+        finally:
+            scan.close()
+        self.assertLess(elapsed, 0.25)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import random
+import unittest
+
+from shared.spatial_index import GridIndex, intersection_area, point_distance
+
+
+def _random_rect(rng):
+    x, y = rng.uniform(0, 600), rng.uniform(0, 800)
+    return x, y, x + rng.uniform(1, 150), y + rng.uniform(1, 60)
+
+
+class TestGridIndex(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        self.rects = {f"roi{i}": _random_rect(rng) for i in range(300)}
+        self.index = GridIndex(cell_size=48)
+        for key, rect in self.rects.items():
+            self.index.insert(key, rect)
+        self.rng = rng
+
+    def test_queries_match_brute_force(self):
+        for _ in range(200):
+            x, y = self.rng.uniform(-50, 700), self.rng.uniform(-50, 900)
+            expected = {k for k, r in self.rects.items() if r[0] <= x <= r[2] and r[1] <= y <= r[3]}
+            self.assertEqual(set(self.index.query_point(x, y)), expected)
+
+            query = _random_rect(self.rng)
+            expected = {k for k, r in self.rects.items()
+                        if r[0] <= query[2] and query[0] <= r[2] and r[1] <= query[3] and query[1] <= r[3]}
+            self.assertEqual(set(self.index.query_rect(query)), expected)
+
+            key, distance = self.index.nearest(x, y)
+            best = min(point_distance(r, x, y) for r in self.rects.values())
+            self.assertAlmostEqual(distance, best)
+            self.assertAlmostEqual(point_distance(self.rects[key], x, y), best)
+
+    def test_overlapping_excludes_touching_edges(self):
+        for key, rect in list(self.rects.items())[:50]:
+            expected = {k for k, r in self.rects.items() if k != key and intersection_area(rect, r) > 0}
+            self.assertEqual(set(self.index.overlapping(key)), expected)
+
+        index = GridIndex(cell_size=10)
+        index.insert("a", (0, 0, 10, 10))
+        index.insert("b", (10, 0, 20, 10))
+        self.assertEqual(index.overlapping("a"), [])
+
+    def test_incremental_updates(self):
+        self.index.insert("roi0", (1000, 1000, 1010, 1010))  # 같은 키는 교체
+        self.assertEqual(len(self.index), 300)
+        self.assertEqual(self.index.query_point(1005, 1005), ["roi0"])
+        self.assertTrue(self.index.remove("roi0"))
+        self.assertFalse(self.index.remove("roi0"))
+        self.assertEqual(self.index.query_point(1005, 1005), [])
+        self.assertNotIn("roi0", self.index.query_rect(self.rects["roi0"]))
+        self.assertIsNone(GridIndex().nearest(0, 0))
+        self.assertIsNone(self.index.nearest(5000, 5000, max_distance=10))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import os
+import tempfile
+import unittest
+
+import fitz
+
+from domain.entities.document import Document
+from domain.entities.validation_result import ValidationResult, ValidationStatus
+from domain.services.validation_service import ValidationService
+from infrastructure.repositories.file_document_repository import FileDocumentRepository
+from infrastructure.services.validation_vision_service import ValidationVisionService
+from shared.exceptions import ValidationCancelledError
+
+
+class TrackingDocumentRepository(FileDocumentRepository):
+    """연 문서를 기억해 모두 닫혔는지 확인하는 저장소"""
+
+    def __init__(self):
+        super().__init__()
+        self.opened = []
+
+    def load_pdf(self, file_path, page_range=None):
+        doc = super().load_pdf(file_path, page_range)
+        self.opened.append(doc)
+        return doc
+
+
+class TestStageTimings(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.pdf_path = os.path.join(self.temp_dir.name, "form.pdf")
+        doc = fitz.open()
+        for _ in range(2):
+            page = doc.new_page()
+            page.insert_text((72, 72), "Claim Form", fontname="helv")
+            page.draw_rect(fitz.Rect(100, 100, 300, 120))
+        doc.save(self.pdf_path)
+        doc.close()
+
+        self.template = {
+            "original_pdf_path": self.pdf_path,
+            "rois": {
+                f"p{page}f{i}": {
+                    "page": page, "coords": [100, 100, 300, 120], "method": "contour",
+                    "anchor_coords": [60, 95, 98, 125],
+                }
+                for i in range(3) for page in range(2)
+            },
+        }
+        self.service = ValidationService(FileDocumentRepository(), ValidationVisionService(), max_workers=2)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_inline_validation_closes_documents(self):
+        repository = TrackingDocumentRepository()
+        service = ValidationService(repository, ValidationVisionService(), max_workers=1)
+        service.validate_document(self.template, self.pdf_path)
+
+        def cancel():
+            raise ValidationCancelledError()
+
+        with self.assertRaises(ValidationCancelledError):
+            service.validate_document(self.template, self.pdf_path, checkpoint=cancel)
+        self.assertEqual(len(repository.opened), 4)
+        self.assertTrue(all(doc.is_closed for doc in repository.opened))
+
+    def test_layout_failure_is_logged_and_left_to_roi_validation(self):
+        with fitz.open(self.pdf_path) as original, fitz.open(self.pdf_path) as target:
+            with self.assertLogs("domain.services.validation_service", level="WARNING") as logs:
+                layout = self.service._prepare_page_layout(original, target, 5, self.template["rois"], None)
+        self.assertEqual(layout, (None, {}))
+        self.assertIn("페이지 6", logs.output[0])
+
+    def test_each_roi_carries_stage_timings(self):
+        results = self.service.validate_document(self.template, self.pdf_path)
+        for result in results:
+            timings = result["timings"]
+            self.assertTrue({"render", "alignment", "anchor", "crop_resize", "contour"} <= set(timings))
+            self.assertAlmostEqual(result["processing_time"], sum(timings.values()), places=4)
+
+    def test_document_result_aggregates_stages(self):
+        results = self.service.validate_document(self.template, self.pdf_path)
+        document_result = ValidationResult.from_results(Document(self.pdf_path), "form", results, 0.5)
+
+        self.assertEqual(document_result.total_count, 6)
+        self.assertEqual(document_result.roi_results[0].status, ValidationStatus.OK)
+        self.assertIsNotNone(document_result.roi_results[0].processing_time)
+
+        summary = document_result.get_summary()
+        self.assertEqual(list(summary["stage_timings"])[:2], ["render", "alignment"])
+        self.assertAlmostEqual(
+            sum(summary["stage_timings"].values()), summary["roi_processing_time"], places=2
+        )
+        self.assertEqual(summary["processing_time"], 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+
+import fitz
+
+from benchmarks.corpus import CorpusSpec, build_corpus
+from infrastructure.repositories.json_template_repository import JsonTemplateRepository
+from infrastructure.services.template_fingerprint_index import TemplateFingerprintIndex, document_fingerprints
+
+# 칸 수(배치)만 다른 양식 3종: 제목/글꼴이 같아 실제 보험사 양식보다 구분하기 어려운 경우
+FORMS = {"form_a": (2, 10), "form_b": (2, 6), "form_c": (1, 14)}
+
+
+class TestTemplateFingerprintIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.root = cls._tmp.name
+        cls.corpora, templates = {}, {}
+        for seed, (name, (pages, rois)) in enumerate(FORMS.items()):
+            corpus = build_corpus(os.path.join(cls.root, name), CorpusSpec(
+                pages=pages, rois_per_page=rois, documents_per_variant=1,
+                variants=("filled", "shifted", "scanned"), seed=seed
+            ), template_name=name)
+            cls.corpora[name] = corpus
+            templates[name] = corpus.template
+        cls.templates_file = os.path.join(cls.root, "templates.json")
+        with open(cls.templates_file, 'w', encoding='utf-8') as f:
+            json.dump(templates, f)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def _index(self, index_path):
+        return TemplateFingerprintIndex(JsonTemplateRepository(self.templates_file), index_path)
+
+    def test_routes_each_document_to_its_template(self):
+        index = self._index(os.path.join(self.root, "routing.json"))
+        self.assertEqual(index.sync()["added"], len(FORMS))
+        for name, corpus in self.corpora.items():
+            for path in corpus.all_documents():
+                match = index.identify(path)
+                self.assertEqual(match.template_name, name, f"{os.path.basename(path)}: {match.describe()}")
+                self.assertTrue(match.is_confident, match.describe())
+
+    def test_lookup_is_sub_millisecond(self):
+        index = self._index(os.path.join(self.root, "timing.json"))
+        index.sync()
+        hashes = document_fingerprints(self.corpora["form_a"].documents["filled"][0])
+        started = time.perf_counter()
+        for _ in range(100):
+            index.match(hashes)
+        self.assertLess((time.perf_counter() - started) / 100, 0.001)
+
+    def test_blank_page_is_not_identified(self):
+        index = self._index(os.path.join(self.root, "blank.json"))
+        index.sync()
+        path = os.path.join(self.root, "blank.pdf")
+        with fitz.open() as doc:
+            doc.new_page(width=595, height=842)
+            doc.save(path)
+        self.assertFalse(index.identify(path).is_confident)
+
+    def test_persisted_index_is_reused_and_pruned(self):
+        index_path = os.path.join(self.root, "persisted.json")
+        self._index(index_path).sync()
+
+        reloaded = self._index(index_path)
+        self.assertEqual(reloaded.template_names, sorted(FORMS))  # 계산 없이 파일에서 읽음
+        self.assertEqual(reloaded.sync(), {"added": 0, "updated": 0, "removed": 0, "skipped": 0})
+
+        repository = JsonTemplateRepository(os.path.join(self.root, "pruned_templates.json"))
+        repository.save("form_b", self.corpora["form_b"].template["original_pdf_path"], {})
+        pruned = TemplateFingerprintIndex(repository, index_path)
+        self.assertEqual(pruned.sync()["removed"], 2)
+        self.assertEqual(pruned.identify(self.corpora["form_a"].documents["filled"][0]).template_name, "form_b")
+
+
+if __name__ == "__main__":
+    unittest.main()
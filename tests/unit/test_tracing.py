@@ -0,0 +1,63 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from shared.tracing import Tracer, merge_trace_files
+
+
+class TestTracer(unittest.TestCase):
+    def test_disabled_tracer_records_nothing(self):
+        tracer = Tracer(enabled=False)
+        with tracer.span("render", page=0) as span:
+            span.set(status="OK")
+        tracer.counter("batch_documents", running=1)
+        self.assertEqual(len(tracer), 0)
+
+    def test_spans_from_threads_become_complete_events(self):
+        tracer = Tracer(enabled=True)
+        tracer.process_name = "test"
+
+        def work(page):
+            with tracer.span("roi", document="a.pdf", page=page, roi=f"f{page}") as span:
+                span.set(status="OK")
+        threads = [threading.Thread(target=work, args=(page,), name=f"roi-validation_{page}") for page in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        with self.assertRaises(ValueError):
+            with tracer.span("open", document="b.pdf"):
+                raise ValueError("broken")
+
+        events = tracer.drain()
+        spans = [e for e in events if e["ph"] == "X"]
+        self.assertEqual(sorted(e["args"].get("roi", "") for e in spans), ["", "f0", "f1"])
+        self.assertTrue(all(e["dur"] >= 0 and e["args"].get("status", "OK") == "OK" for e in spans if e["name"] == "roi"))
+        self.assertEqual(next(e for e in spans if e["name"] == "open")["args"]["error"], "ValueError")
+        thread_names = {e["args"]["name"] for e in events if e["name"] == "thread_name"}
+        self.assertTrue({"roi-validation_0", "roi-validation_1"} <= thread_names)
+        self.assertEqual(sum(e["name"] == "process_name" for e in events), 1)
+        self.assertEqual(len(tracer), 0)
+
+    def test_export_and_merge_worker_traces(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for worker in range(2):
+                tracer = Tracer(enabled=True)
+                with tracer.span("document", document=f"{worker}.pdf"):
+                    pass
+                paths.append(tracer.export(os.path.join(tmp, "traces", f"worker-{worker}.json")))
+                self.assertEqual(len(tracer), 0)
+
+            merged = os.path.join(tmp, "trace.json")
+            self.assertEqual(merge_trace_files(paths, merged), 4)
+            with open(merged, encoding="utf-8") as f:
+                data = json.load(f)
+            documents = sorted(e["args"]["document"] for e in data["traceEvents"] if e["ph"] == "X")
+            self.assertEqual(documents, ["0.pdf", "1.pdf"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+import threading
+import time
+import unittest
+
+from app.controllers.validation_controller import ValidationController
+from app.controllers.validation_job import ValidationJob
+from shared.constants import JOB_MAX_EVENTS_PER_TICK
+
+
+def _wait_for(job, timeout=5.0):
+    """작업이 끝날 때까지 기다린 뒤 남은 이벤트를 모두 꺼냅니다."""
+    job._thread.join(timeout)
+    events = []
+    while True:
+        batch = job.drain(JOB_MAX_EVENTS_PER_TICK)
+        if not batch:
+            return events
+        events.extend(batch)
+
+
+class TestValidationJob(unittest.TestCase):
+    def test_events_are_drained_per_tick_in_order(self):
+        def target(job, count):
+            for i in range(count):
+                job.post("progress", i)
+
+        job = ValidationJob(target, JOB_MAX_EVENTS_PER_TICK + 10)
+        job.start()
+        job._thread.join(5)
+
+        first = job.drain(JOB_MAX_EVENTS_PER_TICK)
+        self.assertEqual(len(first), JOB_MAX_EVENTS_PER_TICK)
+        self.assertEqual(first[0], ("progress", (0,)))
+        rest = job.drain(JOB_MAX_EVENTS_PER_TICK)
+        self.assertEqual([kind for kind, _ in rest], ["progress"] * 10 + ["done"])
+        self.assertEqual(job.drain(JOB_MAX_EVENTS_PER_TICK), [])
+
+    def test_pause_blocks_at_checkpoint_until_resumed(self):
+        reached, steps = threading.Event(), []
+
+        def target(job):
+            reached.set()
+            job.checkpoint()
+            steps.append("after-checkpoint")
+
+        job = ValidationJob(target)
+        job.pause()
+        self.assertTrue(job.is_paused)
+        job.start()
+        reached.wait(5)
+        time.sleep(0.05)
+        self.assertEqual(steps, [])  # 일시정지 중에는 checkpoint를 넘지 않음
+        self.assertTrue(job.is_running)
+
+        job.resume()
+        events = _wait_for(job)
+        self.assertEqual(steps, ["after-checkpoint"])
+        self.assertEqual([kind for kind, _ in events], ["paused", "resumed", "done"])
+
+    def test_cancel_raises_at_checkpoint_even_while_paused(self):
+        steps = []
+
+        def target(job):
+            job.checkpoint()
+            steps.append("after-checkpoint")
+
+        job = ValidationJob(target)
+        job.pause()
+        job.start()
+        job.cancel()
+        events = _wait_for(job)
+
+        self.assertTrue(job.is_cancelled)
+        self.assertEqual(steps, [])
+        self.assertEqual(events[-1], ("cancelled", ()))
+
+    def test_target_exception_is_posted_as_error(self):
+        def target(job):
+            job.log("starting")
+            raise ValueError("broken pdf")
+
+        job = ValidationJob(target)
+        job.start()
+        events = _wait_for(job)
+
+        self.assertEqual(events[0], ("log", ("starting",)))
+        kind, (error,) = events[-1]
+        self.assertEqual(kind, "error")
+        self.assertIsInstance(error, ValueError)
+
+
+class FakeRoot:
+    """root.after/after_cancel 호출만 기록하는 가짜 Tk 루트"""
+    def __init__(self):
+        self.pending = {}
+        self._next_id = 0
+
+    def after(self, delay, callback):
+        self._next_id += 1
+        after_id = f"after#{self._next_id}"
+        self.pending[after_id] = callback
+        return after_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+
+class FakeView:
+    def __init__(self):
+        self.root = FakeRoot()
+        self.logs = []
+
+    def log(self, message):
+        self.logs.append(message)
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class TestControllerClose(unittest.TestCase):
+    def test_close_cancels_scheduled_poll_and_stops_polling(self):
+        view = FakeView()
+        controller = ValidationController(view, None, None)
+        release = threading.Event()
+
+        def target(job):
+            release.wait(5)
+            job.checkpoint()
+
+        controller.job = ValidationJob(target)
+        controller.job.start()
+        controller._schedule_poll()
+        self.assertEqual(len(view.root.pending), 1)
+
+        controller.on_close()
+        release.set()
+        controller.job._thread.join(5)
+        self.assertEqual(view.root.pending, {})  # 창이 닫힌 뒤에는 폴링이 다시 예약되지 않음
+        self.assertTrue(controller.job.is_cancelled)
+
+        controller._poll_job_events()  # 취소 전에 이미 실행 대기 중이던 콜백
+        self.assertEqual(view.root.pending, {})
+        self.assertEqual(view.logs, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import asyncio
+import http.client
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from infrastructure.server.validation_server import ValidationServer
+from infrastructure.services.remote_validation_service import RemoteValidationService
+from shared.exceptions import ValidationCancelledError, ValidationServerError
+
+
+class _FakeValidationService:
+    """ROI마다 잠깐씩 대기하며 진행 상황을 보고하는 가짜 ValidationService"""
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.started = []
+
+    def validate_document(self, template, target_pdf_path, progress_callback=None, checkpoint=None, streaming=False):
+        self.started.append(target_pdf_path)
+        results = []
+        names = list(template['rois'])
+        for i, name in enumerate(names):
+            if checkpoint:
+                checkpoint()
+            time.sleep(self.delay)
+            progress_callback(f"'{name}' 검증 완료", i + 1, len(names))
+            results.append({"field_name": name, "status": "OK", "message": ""})
+        return results
+
+
+class TestValidationServer(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.pdf_path = os.path.join(self.temp_dir.name, "target.pdf")
+        with open(self.pdf_path, 'wb') as f:
+            f.write(b"%PDF-1.4")
+        self.template = {"original_pdf_path": self.pdf_path, "rois": {f"f{i}": {"page": 0} for i in range(5)}}
+
+        self.service = _FakeValidationService()
+        self.server = ValidationServer(self.service, host="127.0.0.1", port=0, max_concurrent=1)
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self.server.start(), self.loop).result(5)
+        self.client = RemoteValidationService(local_service=None, host="127.0.0.1", port=self.server.port)
+
+    def tearDown(self):
+        asyncio.run_coroutine_threadsafe(self.server.stop(), self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(5)
+        self.loop.close()
+        self.temp_dir.cleanup()
+
+    def test_validate_document_streams_progress_and_results(self):
+        progress = []
+        results = self.client.validate_document(
+            self.template, self.pdf_path, progress_callback=lambda m, c, t: progress.append(c)
+        )
+        self.assertTrue(self.client.is_available())
+        self.assertEqual([r['field_name'] for r in results], list(self.template['rois']))
+        self.assertEqual(progress, [1, 2, 3, 4, 5])
+
+    def test_higher_priority_job_runs_first(self):
+        self.service.delay = 0.05
+        blocker = self.client.submit(self.template, self.pdf_path) # 동시 실행 1개를 점유
+        low = RemoteValidationService(None, port=self.server.port, priority=0)
+        high = RemoteValidationService(None, port=self.server.port, priority=10)
+        other_pdf = os.path.join(self.temp_dir.name, "urgent.pdf")
+        with open(other_pdf, 'wb') as f:
+            f.write(b"%PDF-1.4")
+        low_id = low.submit(self.template, self.pdf_path)
+        high_id = high.submit(self.template, other_pdf)
+
+        for job_id in (blocker, low_id, high_id):
+            list(self.client.stream_events(job_id))
+        self.assertEqual(self.service.started[1], os.path.abspath(other_pdf))
+
+    def test_cancel_and_errors(self):
+        with self.assertRaises(ValidationCancelledError):
+            def checkpoint():
+                raise ValidationCancelledError()
+            self.client.validate_document(self.template, self.pdf_path, checkpoint=checkpoint)
+
+        with self.assertRaises(ValidationServerError):
+            self.client.submit(self.template, os.path.join(self.temp_dir.name, "missing.pdf"))
+
+    def _post(self, path, body, headers):
+        conn = http.client.HTTPConnection("127.0.0.1", self.server.port, timeout=5)
+        try:
+            conn.request("POST", path, body=body, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            return response.status
+        finally:
+            conn.close()
+
+    def test_rejects_non_json_and_cross_origin_posts(self):
+        body = b'{"template": {}, "pdf_path": "x.pdf"}'
+        self.assertEqual(self._post("/jobs", body, {"Content-Type": "text/plain"}), 415)
+        self.assertEqual(self._post("/jobs", body, {
+            "Content-Type": "application/json", "Origin": "http://evil.example"
+        }), 403)
+        self.assertEqual(self._post("/jobs/abc/cancel", b"", {"Origin": "null"}), 403)
+        # 루프백 출처의 JSON 요청은 통과해 본문 검증까지 진행
+        self.assertEqual(self._post("/jobs", b"{}", {
+            "Content-Type": "application/json; charset=utf-8", "Origin": "http://localhost:3000"
+        }), 400)
+        self.assertEqual(self.service.started, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+
+import fitz
+
+from infrastructure.services.warm_worker_pool import WarmWorkerPool
+from shared.exceptions import ValidationException
+from shared.metrics import registry
+
+
+class TestWarmWorkerPool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.pdf_path = os.path.join(cls.temp_dir.name, "form.pdf")
+        doc = fitz.open()
+        for _ in range(2):
+            doc.new_page().insert_text((72, 72), "Claim Form", fontname="helv")
+        doc.save(cls.pdf_path)
+        doc.close()
+
+        cls.template = {
+            "original_pdf_path": cls.pdf_path,
+            "rois": {
+                f"p{page}": {"page": page, "coords": [100, 100, 200, 120], "method": "contour"}
+                for page in range(2)
+            },
+        }
+        cls.pool = WarmWorkerPool(size=1, max_jobs_per_worker=2, templates_file=None, heavy_modules=(),
+                                  metrics_enabled=True)
+        cls.pool.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown()
+        cls.temp_dir.cleanup()
+
+    def test_validates_and_recycles_worker_after_max_jobs(self):
+        progress = []
+        first_pid = self.pool.health_check()[0]["pid"]
+        for _ in range(3):
+            results = self.pool.validate(
+                self.template, self.pdf_path, progress_callback=lambda *args: progress.append(args)
+            )
+            self.assertEqual([r["field_name"] for r in results], ["p0", "p1"])
+
+        self.assertGreaterEqual(self.pool.recycled, 1)
+        self.assertEqual(progress[-1][1:], (2, 2))
+        report = self.pool.health_check()
+        self.assertTrue(report[0]["healthy"])
+        self.assertNotEqual(report[0]["pid"], first_pid)
+
+    def test_worker_error_is_raised_and_worker_stays_usable(self):
+        with self.assertRaises(ValidationException):
+            self.pool.validate(self.template, os.path.join(self.temp_dir.name, "missing.pdf"))
+        self.assertEqual(len(self.pool.validate(self.template, self.pdf_path)), 2)
+
+    def test_worker_metrics_are_merged_into_parent_registry(self):
+        enabled, registry.enabled = registry.enabled, True
+        try:
+            rois = registry.counter("validation_rois_total", labels=("status",))
+            before = sum(rois.value(status=status) for status in ("OK", "DEFICIENT"))
+            self.pool.validate(self.template, self.pdf_path)
+            after = sum(rois.value(status=status) for status in ("OK", "DEFICIENT"))
+        finally:
+            registry.enabled = enabled
+        self.assertEqual(after - before, 2)  # 작업자 프로세스에서 기록한 ROI 2개
+
+
+if __name__ == '__main__':
+    unittest.main()